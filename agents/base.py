@@ -0,0 +1,25 @@
+"""
+Agent helpers shared by the agent wrappers
+"""
+import uuid
+
+from crewai import Agent
+
+
+def clone_agent(template: Agent, **overrides) -> Agent:
+    """
+    Clone a configured agent template for use in one crew
+
+    A shallow pydantic copy skips re-validation and LLM setup, so it is far
+    cheaper than building the agent again (or Agent.copy(), which does).
+    Per-run state such as the agent executor is assigned on the clone and
+    never leaks back into the template.
+
+    Args:
+        template: Fully configured agent
+        **overrides: Fields to change on the copy (e.g. max_iter)
+
+    Returns:
+        Agent: Independent copy with its own id
+    """
+    return template.model_copy(update={**overrides, "id": uuid.uuid4()})
@@ -2,9 +2,26 @@
 Research Agent - Responsible for gathering and analyzing information
 """
 import os
+from typing import TYPE_CHECKING
+
 from crewai import Agent
-from langchain_openai import ChatOpenAI
-from crewai_tools import SerperDevTool, ScrapeWebsiteTool
+
+from agents.base import clone_agent
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+
+# Facets every research summary covers: (title, focus)
+RESEARCH_FACETS = [
+    ("Current trends and developments", "What's happening in this space now"),
+    ("Key concepts and fundamentals", "Core principles and important background"),
+    ("Technical details and methodologies", "How things work, step-by-step explanations"),
+    ("Real-world applications and use cases", "Practical examples and scenarios"),
+    ("Best practices and recommendations", "What works well and why"),
+    ("Challenges and limitations", "Common issues and how to address them"),
+    ("Future outlook", "Where things are heading"),
+]
 
 
 class ResearchAgent:
@@ -12,14 +29,18 @@ class ResearchAgent:
     Research Agent that performs web searches and gathers information
     """
 
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: "ChatOpenAI"):
         self.llm = llm
+        self._template = None
         # Only initialize tools if API keys are available
         self.tools = []
 
         # Check for SERPER_API_KEY before initializing search tools
         if os.getenv("SERPER_API_KEY"):
             try:
+                # crewai_tools takes over a second to import; only load it when used
+                from crewai_tools import SerperDevTool, ScrapeWebsiteTool
+
                 self.search_tool = SerperDevTool()
                 self.scrape_tool = ScrapeWebsiteTool()
                 self.tools = [self.search_tool, self.scrape_tool]
@@ -31,9 +52,31 @@ class ResearchAgent:
         """
         Creates and configures the research agent
 
+        The agent is configured once and cloned for every crew.
+
         Returns:
             Agent: Configured CrewAI agent
         """
+        if self._template is None:
+            self._template = self._build_agent()
+        return clone_agent(self._template)
+
+    def create_merge_agent(self) -> Agent:
+        """
+        Creates the agent for the merge step of map-reduce research
+
+        Merging only condenses notes already in its context, so the clone
+        gets no tools and a short iteration budget.
+
+        Returns:
+            Agent: Configured CrewAI agent
+        """
+        if self._template is None:
+            self._template = self._build_agent()
+        return clone_agent(self._template, tools=[], max_iter=3)
+
+    def _build_agent(self) -> Agent:
+        """Build the research agent template"""
         return Agent(
             role="Senior Research Analyst",
             goal="Conduct comprehensive research on given topics using your knowledge and analytical skills",
@@ -60,21 +103,103 @@ class ResearchAgent:
         Returns:
             str: Task description
         """
+        # The topic goes last so the instructions stay a byte-stable prefix
+        return f"""{ResearchAgent.get_research_instructions()}
+        Topic: {topic}
+        """
+
+    @staticmethod
+    def get_research_instructions() -> str:
+        """
+        Get the topic-independent part of the research task description
+
+        Returns:
+            str: Research instructions
+        """
+        facets = "\n".join(
+            f"        {number}. **{title}** - {focus}"
+            for number, (title, focus) in enumerate(RESEARCH_FACETS, 1)
+        )
         return f"""
-        Conduct comprehensive, original research on the following topic: {topic}
+        Conduct comprehensive, original research on the topic given at the end of this task.
 
         IMPORTANT: Use your extensive knowledge to provide original analysis and insights. All information should be synthesized from your understanding and presented in your own words.
 
         Your research should include:
-        1. **Current trends and developments** - What's happening in this space now
-        2. **Key concepts and fundamentals** - Core principles and important background
-        3. **Technical details and methodologies** - How things work, step-by-step explanations
-        4. **Real-world applications and use cases** - Practical examples and scenarios
-        5. **Best practices and recommendations** - What works well and why
-        6. **Challenges and limitations** - Common issues and how to address them
-        7. **Future outlook** - Where things are heading
+{facets}
 
         Provide a well-structured, comprehensive research summary that can be used to create original, copyright-free content.
 
         Focus on providing deep insights and practical information that will be valuable for creating educational blog content.
+"""
+
+    @staticmethod
+    def get_facet_task_description(topic: str, facet: int) -> str:
+        """
+        Generate task description for researching one facet of a topic
+
+        Args:
+            topic: The topic to research
+            facet: Index into RESEARCH_FACETS
+
+        Returns:
+            str: Task description
+        """
+        return f"""{ResearchAgent.get_facet_instructions(facet)}
+        Topic: {topic}
         """
+
+    @staticmethod
+    def get_facet_instructions(facet: int) -> str:
+        """
+        Get the topic-independent instructions for one research facet
+
+        Args:
+            facet: Index into RESEARCH_FACETS
+
+        Returns:
+            str: Facet research instructions
+        """
+        title, focus = RESEARCH_FACETS[facet]
+        return f"""
+        Research one facet of the topic given at the end of this task: **{title}** - {focus}.
+
+        IMPORTANT: Use your extensive knowledge to provide original analysis and insights. All information should be synthesized from your understanding and presented in your own words.
+
+        Other analysts cover the remaining facets, so go deep on this one only: key findings, concrete examples, figures and practical details.
+
+        Return concise Markdown notes under a single "## {title}" heading.
+"""
+
+    @staticmethod
+    def get_merge_task_description(topic: str) -> str:
+        """
+        Generate task description for merging facet research into one summary
+
+        Args:
+            topic: The researched topic
+
+        Returns:
+            str: Task description
+        """
+        return f"""{ResearchAgent.get_merge_instructions()}
+        Topic: {topic}
+        """
+
+    @staticmethod
+    def get_merge_instructions() -> str:
+        """
+        Get the topic-independent instructions of the merge step
+
+        Returns:
+            str: Merge instructions
+        """
+        sections = ", ".join(title for title, _ in RESEARCH_FACETS)
+        return f"""
+        Merge the facet research notes from your context into one well-structured, comprehensive research summary on the topic given at the end of this task.
+
+        Keep one section per facet, in this order: {sections}.
+        Remove overlap between the notes but keep every concrete finding, example and figure. Do not research further or add new claims.
+
+        The summary will be used to create original, copyright-free educational blog content.
+"""
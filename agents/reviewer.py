@@ -1,8 +1,14 @@
 """
 Reviewer Agent - Responsible for quality assurance and content review
 """
+from typing import TYPE_CHECKING
+
 from crewai import Agent
-from langchain_openai import ChatOpenAI
+
+from agents.base import clone_agent
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 
 class ReviewerAgent:
@@ -10,16 +16,25 @@ class ReviewerAgent:
     Reviewer Agent that ensures content quality and accuracy
     """
 
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: "ChatOpenAI"):
         self.llm = llm
+        self._template = None
 
     def create_agent(self) -> Agent:
         """
         Creates and configures the reviewer agent
 
+        The agent is configured once and cloned for every crew.
+
         Returns:
             Agent: Configured CrewAI agent
         """
+        if self._template is None:
+            self._template = self._build_agent()
+        return clone_agent(self._template)
+
+    def _build_agent(self) -> Agent:
+        """Build the reviewer agent template"""
         return Agent(
             role="Senior Content Reviewer & Quality Assurance Specialist",
             goal="Review content for accuracy, clarity, and quality, providing constructive feedback",
@@ -1,8 +1,14 @@
 """
 Writer Agent - Responsible for creating high-quality content
 """
+from typing import TYPE_CHECKING
+
 from crewai import Agent
-from langchain_openai import ChatOpenAI
+
+from agents.base import clone_agent
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 
 class WriterAgent:
@@ -10,16 +16,25 @@ class WriterAgent:
     Writer Agent that creates engaging and informative content
     """
 
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: "ChatOpenAI"):
         self.llm = llm
+        self._template = None
 
     def create_agent(self) -> Agent:
         """
         Creates and configures the writer agent
 
+        The agent is configured once and cloned for every crew.
+
         Returns:
             Agent: Configured CrewAI agent
         """
+        if self._template is None:
+            self._template = self._build_agent()
+        return clone_agent(self._template)
+
+    def _build_agent(self) -> Agent:
+        """Build the writer agent template"""
         return Agent(
             role="Senior Content Writer",
             goal="Transform research findings into clear, engaging, and well-structured content",
@@ -123,3 +138,56 @@ class WriterAgent:
 
             Output should be in Markdown format.
             """
+
+    @staticmethod
+    def get_outline_task_description() -> str:
+        """
+        Generate the topic-independent task description for a blog post outline
+
+        Returns:
+            str: Task description
+        """
+        return """
+            Based on the research provided, plan a comprehensive, SEO-friendly, COMPLETELY ORIGINAL blog post on the topic given below.
+
+            The post will follow this structure:
+            1. A catchy, SEO-friendly H1 title
+            2. Introduction - hook the reader, explain why the topic matters, preview what they will learn
+            3. Problem / Use Case / Background
+            4. Solution / Methodology / How-To Guide - two to four sections with step-by-step explanations, code and best practices
+            5. Results / Examples / Demo
+            6. Conclusion / Key Takeaways
+            7. References / Further Reading (optional)
+
+            Output ONLY the outline in Markdown, nothing else:
+            - First line: the title as "# Title"
+            - Then one "## Section Heading" line per section, in order, starting with "## Introduction"
+            - Under each heading, one or two "- " bullet lines saying what the section covers
+
+            Use between 5 and 9 sections.
+            """
+
+    @staticmethod
+    def get_section_task_description() -> str:
+        """
+        Generate the topic-independent task description for one blog post section
+
+        Returns:
+            str: Task description
+        """
+        return """
+            You are writing ONE section of a blog post. Other writers are writing the remaining sections of the same outline at the same time, and the sections will be joined in outline order.
+
+            IMPORTANT: You must create entirely original content based on your knowledge and the research. Do NOT copy or reproduce any copyrighted material.
+
+            Rules:
+            - Start with the section's "## Heading" line exactly as given, then write only that section's body
+            - Do not write the post title, other sections, or a closing summary unless your section is the conclusion
+            - Use ### subheadings, bullet points and numbered lists where they help
+            - Include code blocks with proper syntax highlighting (```python) where relevant
+            - Add emphasis with **bold** for important points
+            - Use clear, easy-to-understand language in an informative yet conversational tone
+            - Stay consistent with the outline so the sections read as one post
+
+            **Format:** Output only the section in clean Markdown.
+            """
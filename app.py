@@ -13,7 +13,7 @@ import zipfile
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.crew_manager import CrewManager
+from src.worker_pool import worker_pool
 from src.logger import logger
 from src.blogger_publisher import BloggerPublisher
 
@@ -562,6 +562,13 @@ def main():
                 label_visibility="collapsed"
             )
 
+        stream_output = st.checkbox(
+            "⚡ Stream content as it is written",
+            value=False,
+            help="Show the writer's output live (skips the reviewer stage)",
+            disabled=content_type == "presentation"
+        )
+
         # Execute button with modern styling
         col1, col2, col3 = st.columns([1, 1, 1])
         with col2:
@@ -589,7 +596,7 @@ def main():
                 try:
                     # Initialize crew manager
                     st.write("🔧 Initializing AI agent team...")
-                    manager = CrewManager(
+                    manager = worker_pool.get_manager(
                         model_name=model_name,
                         temperature=temperature,
                         api_key=api_key,
@@ -601,12 +608,29 @@ def main():
                         st.write("👨‍🔬 **Research Agent** gathering information...")
                         st.write("✍️ **Writer Agent** creating content...")
                         st.write("🎨 **Presentation Agent** designing slides...")
-                        result = manager.execute_presentation_workflow(topic)
+                        result = worker_pool.submit(
+                            manager.execute_presentation_workflow, topic
+                        ).result()
+                    elif stream_output:
+                        st.write("👨‍🔬 **Research Agent** analyzing topic...")
+                        st.write("✍️ **Writer Agent** crafting content...")
+                        content = st.write_stream(
+                            manager.stream_research_workflow(topic, content_type)
+                        )
+                        result = {
+                            "success": True,
+                            "topic": topic,
+                            "content_type": content_type,
+                            "result": content,
+                            "message": "Workflow completed successfully"
+                        }
                     else:
                         st.write("👨‍🔬 **Research Agent** analyzing topic...")
                         st.write("✍️ **Writer Agent** crafting content...")
                         st.write("🔍 **Reviewer Agent** checking quality...")
-                        result = manager.execute_research_workflow(topic, content_type)
+                        result = worker_pool.submit(
+                            manager.execute_research_workflow, topic, content_type
+                        ).result()
 
                     st.session_state.execution_result = result
                     status.update(label="✅ Content Generated Successfully!", state="complete")
@@ -3,18 +3,18 @@ Automated Daily Blog Publisher
 Automatically generates and publishes 5 SEO-friendly blog posts daily to Blogger
 """
 import sys
-import io
 import time
 import schedule
 from datetime import datetime
 from typing import List, Dict
 import random
 
-# Fix Windows console encoding issues
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+# Fix Windows console encoding issues (in place: replacing the stream on
+# import would close stdout once another module does the same)
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
-from src.crew_manager import CrewManager
 from src.blogger_publisher import BloggerPublisher
+from src.worker_pool import worker_pool
 from src.logger import logger
 
 
@@ -33,7 +33,9 @@ class AutomatedBlogger:
             model_name: Model to use for content generation
         """
         self.blog_id = blog_id
-        self.crew_manager = CrewManager(
+        # Shared with every other blogger run in this process, so scheduled
+        # batches reuse a warm manager and its LLM clients
+        self.crew_manager = worker_pool.get_manager(
             model_name=model_name,
             use_anthropic=use_anthropic,
             temperature=0.7
@@ -302,6 +304,8 @@ class AutomatedBlogger:
                 time.sleep(60)  # Check every minute
         except KeyboardInterrupt:
             print("\n\n👋 Scheduler stopped by user")
+        finally:
+            worker_pool.shutdown()
 
 
 def main():
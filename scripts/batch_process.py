@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.parallel_crew_manager import ParallelCrewManager, benchmark_parallel_vs_sequential
 from src.presentation_exporter import export_presentation_parallel
+from src.worker_pool import worker_pool
 import json
 from datetime import datetime
 
@@ -34,21 +35,21 @@ def batch_generate_articles():
         print(f"  {i}. {topic}")
     print()
 
-    manager = ParallelCrewManager(max_workers=3)
-    results = manager.execute_batch_research(topics, content_type="blog post")
-
-    # Save results
     output_dir = Path("output/batch_articles")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for topic, result in results.items():
+    # Save each article as soon as it is finished
+    def save(task, result):
         if result['success']:
-            filename = topic.replace(" ", "_").replace("/", "_")[:50] + ".md"
+            filename = task['topic'].replace(" ", "_").replace("/", "_")[:50] + ".md"
             filepath = output_dir / filename
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(str(result['result']))
             print(f"✅ Saved: {filepath}")
 
+    with ParallelCrewManager() as manager:
+        results = manager.execute_batch_research(topics, content_type="blog post", on_result=save)
+
     print(f"\n📁 All articles saved to: {output_dir}")
     return results
 
@@ -71,14 +72,12 @@ def batch_generate_presentations():
         print(f"  {i}. {topic}")
     print()
 
-    manager = ParallelCrewManager(max_workers=2)
-    results = manager.execute_batch_presentations(topics)
-
-    # Save and export each presentation
     output_dir = Path("output/batch_presentations")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for topic, result in results.items():
+    # Save and export each presentation as soon as it is finished
+    def export(task, result):
+        topic = task['topic']
         if result['success']:
             content = str(result['result'])
             filename = topic.replace(" ", "_")[:50]
@@ -113,6 +112,9 @@ def batch_generate_presentations():
                     f.write(exports['pdf'].read())
                 print(f"  ✅ {pdf_file.name}")
 
+    with ParallelCrewManager() as manager:
+        results = manager.execute_batch_presentations(topics, on_result=export)
+
     print(f"\n📁 All presentations saved to: {output_dir}")
     return results
 
@@ -136,22 +138,22 @@ def mixed_batch_processing():
         print(f"  {i}. {task['topic']} ({task['content_type']})")
     print()
 
-    manager = ParallelCrewManager(max_workers=4)
-    results = manager.execute_parallel_workflows(tasks)
-
-    # Save results
     output_dir = Path("output/mixed_batch")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for result in results:
-        if result['success']:
-            topic = result['topic']
-            content_type = result['content_type']
-            filename = f"{topic.replace(' ', '_')}_{content_type}.md"
-            filepath = output_dir / filename
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(str(result['result']))
-            print(f"✅ Saved: {filepath}")
+    # Save results in the order they finish
+    results = []
+    with ParallelCrewManager() as manager:
+        for task, result in manager.iter_workflows(tasks):
+            results.append(result)
+            if result['success']:
+                topic = result['topic']
+                content_type = result['content_type']
+                filename = f"{topic.replace(' ', '_')}_{content_type}.md"
+                filepath = output_dir / filename
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write(str(result['result']))
+                print(f"✅ Saved: {filepath}")
 
     print(f"\n📁 All content saved to: {output_dir}")
     return results
@@ -204,19 +206,23 @@ def main():
 
     choice = input("Enter choice (1-5): ").strip()
 
-    if choice == '1':
-        batch_generate_articles()
-    elif choice == '2':
-        batch_generate_presentations()
-    elif choice == '3':
-        mixed_batch_processing()
-    elif choice == '4':
-        run_benchmark()
-    elif choice == '5':
-        print("\n👋 Goodbye!")
-        return
-    else:
-        print("\n❌ Invalid choice")
+    try:
+        if choice == '1':
+            batch_generate_articles()
+        elif choice == '2':
+            batch_generate_presentations()
+        elif choice == '3':
+            mixed_batch_processing()
+        elif choice == '4':
+            run_benchmark()
+        elif choice == '5':
+            print("\n👋 Goodbye!")
+            return
+        else:
+            print("\n❌ Invalid choice")
+    finally:
+        # Let queued workflows (and their exports) finish before exiting
+        worker_pool.shutdown()
 
     print("\n✅ Done!")
 
@@ -0,0 +1,171 @@
+"""
+Offline micro-benchmarks for the non-LLM hot paths
+Times crew construction, slide parsing and export, Markdown to HTML, tag
+generation and trending page parsing on the saved fixtures in
+scripts/fixtures; no network or API calls are made
+
+Usage:
+    python scripts/benchmark_hot_paths.py [--iterations N] [--output results.json]
+                                          [--only NAME ...] [--compare baseline.json]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.benchmarking import compare_reports, run_benchmark, write_report
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# Topics as they come out of the trending sources
+TOPICS = [
+    "astral-sh / uv: An extremely fast Python package and project manager, written in Rust",
+    "Show HN: I built a vector database in 500 lines of Python",
+    "Kubernetes 1.33 release: sidecar containers and in-place pod resize",
+    "Why AI coding agents still struggle with large web codebases",
+    "The state of cloud security in 2026",
+    "Polars vs Pandas for data engineering workloads",
+    "Deep Learning vs Machine Learning: Complete Guide",
+    "Python Type Hints and Type Checking",
+]
+
+
+def fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+# Each setup builds its fixtures and returns the callable to time
+
+def setup_create_research_crew():
+    os.environ.setdefault("ANTHROPIC_API_KEY", "benchmark-key")
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark-key")
+    from src.crew_manager import CrewManager
+
+    manager = CrewManager(use_anthropic=True, use_semantic_cache=False)
+    return lambda: manager.create_research_crew("Async Python in Production", "blog post")
+
+
+def setup_parse_markdown_slides():
+    from src.presentation_exporter import PresentationExporter
+
+    exporter, markdown = PresentationExporter(), fixture("presentation.md")
+    return lambda: exporter.parse_markdown_slides(markdown)
+
+
+def _export(method: str):
+    from src.presentation_exporter import PresentationExporter
+
+    exporter, markdown = PresentationExporter(), fixture("presentation.md")
+    export = getattr(exporter, method)
+    export(markdown, "Benchmark")  # Surfaces a missing optional dependency before timing
+    return lambda: export(markdown, "Benchmark")
+
+
+def setup_export_html():
+    return _export("export_to_html")
+
+
+def setup_export_powerpoint():
+    return _export("export_to_powerpoint")
+
+
+def setup_export_pdf():
+    return _export("export_to_pdf")
+
+
+def setup_markdown_to_html():
+    from src.blogger_publisher import BloggerPublisher
+
+    # The conversion needs no credentials, so skip the OAuth setup in __init__
+    publisher, markdown = object.__new__(BloggerPublisher), fixture("blog_post.md")
+    return lambda: publisher._markdown_to_html(markdown)
+
+
+def setup_trending_tags():
+    from trending_blogger import TrendingBlogger
+
+    blogger = object.__new__(TrendingBlogger)
+    return lambda: [blogger.generate_seo_tags(topic) for topic in TOPICS]
+
+
+def setup_automated_tags():
+    from automated_blogger import AutomatedBlogger
+
+    blogger = object.__new__(AutomatedBlogger)
+    random.seed(0)
+    return lambda: [blogger.generate_seo_tags(topic, "AI & Machine Learning") for topic in TOPICS]
+
+
+def setup_parse_github_trending():
+    from trending_blogger import TrendingTopicsFinder
+
+    html = (FIXTURES / "github_trending.html").read_bytes()
+    return lambda: TrendingTopicsFinder.parse_github_trending(html)
+
+
+BENCHMARKS = {
+    "create_research_crew": setup_create_research_crew,
+    "parse_markdown_slides": setup_parse_markdown_slides,
+    "export_html": setup_export_html,
+    "export_powerpoint": setup_export_powerpoint,
+    "export_pdf": setup_export_pdf,
+    "markdown_to_html": setup_markdown_to_html,
+    "trending_seo_tags": setup_trending_tags,
+    "automated_seo_tags": setup_automated_tags,
+    "parse_github_trending": setup_parse_github_trending,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline micro-benchmarks for the non-LLM hot paths")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per benchmark")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed calls per benchmark")
+    parser.add_argument("--output", default="./data/benchmarks/hot_paths.json", help="JSON report path")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run")
+    parser.add_argument("--compare", help="Earlier JSON report to compare p50 against")
+    args = parser.parse_args()
+
+    # Read the baseline first: it may be the file this run overwrites
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print("=" * 80)
+    print("HOT PATH MICRO-BENCHMARKS")
+    print("=" * 80)
+    print(f"{'benchmark':<24} {'p50 ms':>10} {'p95 ms':>10} {'ops/sec':>12}")
+    print("-" * 80)
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        result = run_benchmark(
+            name, BENCHMARKS[name], iterations=args.iterations, warmup=args.warmup
+        )
+        results[name] = result
+        if "p50_ms" in result:
+            print(
+                f"{name:<24} {result['p50_ms']:>10.3f} {result['p95_ms']:>10.3f} "
+                f"{result['ops_per_sec']:>12,.1f}"
+            )
+        else:
+            reason = result.get("skipped") or result.get("error")
+            print(f"{name:<24} {'skipped' if 'skipped' in result else 'error'}: {reason}")
+
+    path = write_report(results, args.output, suite="hot_paths")
+    print("-" * 80)
+    print(f"Report written to {path}")
+
+    if baseline is not None:
+        print(f"\np50 vs {args.compare} (< 1.00 = faster)")
+        for name, ratio in compare_reports(baseline, {"results": results}).items():
+            print(f"{name:<24} {'n/a' if ratio is None else f'{ratio:.2f}x'}")
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark per-topic setup cost: fresh clients vs pooled clients
+Runs offline - clients are constructed but no API calls are made
+"""
+import os
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.crew_manager import CrewManager
+from src.llm_pool import llm_pool
+
+
+def setup_topic(use_pool: bool, use_anthropic: bool):
+    """Build everything one topic needs before its crew can start"""
+    if not use_pool:
+        # Old behaviour: every topic gets brand-new clients and agents
+        llm_pool.clear()
+
+    manager = CrewManager(use_anthropic=use_anthropic, use_semantic_cache=False)
+    crew = manager.create_research_crew("Benchmark Topic", "blog post")
+
+    # Native SDK clients are created lazily; force it so both modes pay for
+    # the HTTP client (and TLS context) they would need for the first call
+    for agent in crew.agents:
+        agent.llm.inner
+
+    return crew
+
+
+def measure(use_pool: bool, use_anthropic: bool, runs: int) -> list:
+    """Time setup_topic() over several runs, in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        setup_topic(use_pool, use_anthropic)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    os.environ.setdefault("ANTHROPIC_API_KEY", "benchmark-key")
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark-key")
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    print("=" * 80)
+    print("PER-TOPIC SETUP BENCHMARK")
+    print("=" * 80)
+
+    for provider, use_anthropic in [("Anthropic", True), ("OpenAI", False)]:
+        # Warm up imports so they are not counted
+        setup_topic(False, use_anthropic)
+
+        before = sorted(measure(False, use_anthropic, runs))
+        after = sorted(measure(True, use_anthropic, runs))
+
+        before_p50 = before[len(before) // 2]
+        after_p50 = after[len(after) // 2]
+
+        print(f"\n{provider} ({runs} topics)")
+        print("-" * 80)
+        print(f"Fresh clients per topic:  p50 {before_p50:8.2f} ms   max {before[-1]:8.2f} ms")
+        print(f"Pooled clients/templates: p50 {after_p50:8.2f} ms   max {after[-1]:8.2f} ms")
+        print(f"Speedup: {before_p50 / after_p50:.1f}x")
+
+    print("\n" + "=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,38 @@ Check progress of batch blog publishing
 """
 import os
 import sys
+from datetime import datetime
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+def show_job_queue():
+    """Show today's trending batch from the durable job queue"""
+    # Only the SQLite queue is imported: a status check must not load CrewAI
+    from src.config import config
+    from src.job_queue import get_job_queue
+
+    if not os.path.exists(config.jobs.db_path):
+        return
+
+    batch = f"trending-{datetime.now().strftime('%Y-%m-%d')}"
+    counts = get_job_queue().summary(batch)
+    if not any(counts.values()):
+        print(f"\nJob queue: no jobs for {batch}")
+        return
+
+    print(f"\nJob queue ({batch}):")
+    for state, count in counts.items():
+        print(f"  {state:<11} {count}")
+
 
 def main():
     print("="*80)
     print("BATCH PUBLISHING STATUS")
     print("="*80)
 
+    show_job_queue()
+
     # Check if process is running
     if os.path.exists("batch_publish.pid"):
         with open("batch_publish.pid") as f:
@@ -0,0 +1,78 @@
+"""
+Start-up regression check for the status tools and entry points
+Profiles each command with ``python -X importtime`` in a fresh interpreter
+and fails if it loads CrewAI, LangChain or the Google API client, or takes
+longer than its start-up budget
+
+Usage:
+    python scripts/check_import_time.py [--only NAME ...] [--repeat N]
+                                        [--scale 1.0] [--output report.json]
+"""
+import argparse
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.benchmarking import write_report
+from src.import_time import check_profile, profile_command
+
+# name -> (interpreter arguments, wall-clock budget in ms)
+CHECKS = {
+    "check_batch_progress": (["scripts/check_batch_progress.py"], 200),
+    "load_test --help": (["scripts/load_test.py", "--help"], 200),
+    "benchmark_hot_paths --help": (["scripts/benchmark_hot_paths.py", "--help"], 200),
+    "check_import_time --help": (["scripts/check_import_time.py", "--help"], 200),
+    "job_queue": (["-c", "import src.job_queue"], 200),
+    # Everything app.py imports before Streamlit renders the first page
+    "app imports": (["-c", "import src.worker_pool, src.logger, src.blogger_publisher"], 200),
+    # Entry points that also load the trending sources' HTTP and HTML parsers
+    "trending_blogger": (["-c", "import trending_blogger"], 500),
+    "automated_blogger": (["-c", "import automated_blogger"], 500),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check start-up time of the status tools and entry points")
+    parser.add_argument("--only", nargs="+", choices=sorted(CHECKS), help="Checks to run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per command (the fastest counts)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiply every budget (e.g. 2 on slow CI machines)")
+    parser.add_argument("--output", help="Optional JSON report path")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("START-UP TIME (python -X importtime)")
+    print("=" * 80)
+    print(f"{'command':<28} {'wall ms':>9} {'budget':>8} {'imports ms':>11}  result")
+    print("-" * 80)
+
+    results = {}
+    failed = 0
+    for name in args.only or CHECKS:
+        command, budget_ms = CHECKS[name]
+        budget_ms *= args.scale
+        profile = profile_command(command, repeat=args.repeat)
+        problems = check_profile(profile, budget_ms)
+        results[name] = {**profile, "budget_ms": budget_ms, "problems": problems}
+        failed += bool(problems)
+
+        print(
+            f"{name:<28} {profile['wall_ms']:>9.0f} {budget_ms:>8.0f} "
+            f"{profile['import_ms']:>11.0f}  {'; '.join(problems) or 'ok'}"
+        )
+        if problems and profile["slowest"]:
+            slowest = ", ".join(
+                f"{entry['module']} {entry['cumulative_ms']:.0f} ms" for entry in profile["slowest"][:3]
+            )
+            print(f"{'':<28} slowest: {slowest}")
+
+    print("-" * 80)
+    if args.output:
+        print(f"Report written to {write_report(results, args.output, suite='import_time')}")
+    print(f"{len(results) - failed} of {len(results)} commands within budget")
+    print("=" * 80)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
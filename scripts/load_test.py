@@ -0,0 +1,142 @@
+"""
+End-to-end load test for ParallelCrewManager against the fake LLM provider
+Sweeps worker counts and batch sizes over batch and mixed workloads and
+reports throughput, memory per in-flight crew, threads, error rates and the
+max sustainable posts/hour of this machine
+
+Usage:
+    python scripts/load_test.py [--workers 2,4,8,auto] [--batch-sizes 10,50]
+                                [--workloads batch,mixed] [--time-scale 0.01]
+                                [--max-error-rate 0.01] [--output report.json]
+
+Latency, error and 429 injection come from the FAKE_LLM_* settings; provider
+rate limits are scaled by the same factor as the latency.
+"""
+import argparse
+import contextlib
+import logging
+import os
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+@contextlib.contextmanager
+def silenced_stdout():
+    """
+    Discard everything written to the stdout file descriptor in the block
+
+    CrewAI's console keeps its own handle on stdout, so redirecting
+    sys.stdout is not enough.
+
+    Yields:
+        File object that still writes to the real stdout
+    """
+    sys.stdout.flush()
+    saved = os.dup(1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    real_stdout = os.fdopen(os.dup(saved), "w", buffering=1, encoding="utf-8")
+    try:
+        yield real_stdout
+    finally:
+        sys.stdout.flush()
+        real_stdout.close()
+        os.dup2(saved, 1)
+        os.close(saved)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test ParallelCrewManager offline")
+    parser.add_argument("--workers", default="2,4,8",
+                        help="Comma-separated worker counts ('auto' = shared pool, adaptive with ADAPTIVE_CONCURRENCY)")
+    parser.add_argument("--batch-sizes", default="10,50", help="Comma-separated batch sizes")
+    parser.add_argument("--workloads", default="batch,mixed", help="Comma-separated workloads (batch, mixed)")
+    parser.add_argument("--time-scale", type=float, default=0.01,
+                        help="Fake provider latency multiplier (1.0 = realistic wall-clock latency)")
+    parser.add_argument("--max-error-rate", type=float, default=0.01,
+                        help="Highest error rate a run may have to count as sustainable")
+    parser.add_argument("--memory-limit-mb", type=float, help="Highest peak memory a run may use")
+    parser.add_argument("--output", default="./data/benchmarks/load_test.json", help="JSON report path")
+    parser.add_argument("--verbose", action="store_true", help="Show crew output while running")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # Settings are read at import time, so configure the fake provider first
+    os.environ["FAKE_LLM_MODE"] = os.getenv("FAKE_LLM_MODE", "synthetic")
+    if os.environ["FAKE_LLM_MODE"] not in ("synthetic", "replay"):
+        sys.exit("FAKE_LLM_MODE must be 'synthetic' or 'replay' for load tests")
+    os.environ["FAKE_LLM_TIME_SCALE"] = str(args.time_scale)
+
+    from src.benchmarking import write_report
+    from src.config import config
+    from src.load_testing import WORKLOADS, sustainable_throughput, sweep
+    from src.logger import logger
+
+    # Provider budgets are per minute of real time: compress them like the latency
+    # (before the first limiter is created), or every sweep ends up rate limited
+    for name in ("anthropic_rpm", "anthropic_tpm", "openai_rpm", "openai_tpm"):
+        setattr(config.rate_limit, name, int(getattr(config.rate_limit, name) / args.time_scale))
+
+    workers = [None if value == "auto" else int(value) for value in args.workers.split(",")]
+    batch_sizes = [int(value) for value in args.batch_sizes.split(",")]
+    workloads = args.workloads.split(",")
+    unknown = set(workloads) - set(WORKLOADS)
+    if unknown:
+        sys.exit(f"Unknown workloads: {', '.join(sorted(unknown))} (use {', '.join(WORKLOADS)})")
+
+    print("=" * 100)
+    print(f"LOAD TEST (fake provider latency x{args.time_scale:g})")
+    print("=" * 100)
+    print(
+        f"{'workload':<8} {'batch':>6} {'workers':>8} {'elapsed s':>10} {'posts/h':>10} "
+        f"{'proj posts/h':>13} {'MB/crew':>8} {'threads':>8} {'errors':>7}"
+    )
+    print("-" * 100)
+
+    def show(run, out=sys.stdout):
+        memory = run["memory_per_crew_mb"]
+        workers_label = f"{run['workers']}{'*' if run['adaptive'] else ''}"
+        print(
+            f"{run['workload']:<8} {run['batch_size']:>6} {workers_label:>8} "
+            f"{run['elapsed_seconds']:>10.1f} {run['posts_per_hour']:>10,.0f} "
+            f"{run['projected_posts_per_hour']:>13,.0f} "
+            f"{'n/a' if memory is None else f'{memory:.1f}':>8} "
+            f"{run['peak_threads']:>8} {run['error_rate']:>7.1%}",
+            file=out,
+        )
+
+    # Crews print and log their progress; keep the table readable unless asked
+    if args.verbose:
+        runs = sweep(workers, batch_sizes, workloads, on_run=show)
+    else:
+        logger.setLevel(logging.WARNING)
+        with silenced_stdout() as out:
+            runs = sweep(workers, batch_sizes, workloads, on_run=lambda run: show(run, out))
+            # Crew events are printed from a background loop; let it finish silently
+            from crewai.events.event_bus import crewai_event_bus
+            crewai_event_bus.shutdown(wait=True)
+
+    summary = sustainable_throughput(runs, args.max_error_rate, args.memory_limit_mb)
+    path = write_report(runs, args.output, suite="load_test", summary=summary)
+
+    print("-" * 100)
+    print("* adaptive concurrency (window limit shown)")
+    best = summary["best_run"]
+    if best is None:
+        print(f"No run stayed under {args.max_error_rate:.1%} errors; no sustainable throughput found")
+    else:
+        print(
+            f"Max sustainable: {summary['posts_per_hour']:,.0f} posts/hour at real latency "
+            f"({best['workload']} workload, {best['workers']} workers, batch of {best['batch_size']})"
+        )
+    print(f"Report written to {path}")
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    main()
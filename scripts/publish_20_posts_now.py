@@ -1,6 +1,11 @@
 """
 Publish 20 Blog Posts Immediately
 Builds content base for AdSense approval
+
+Progress is kept in the publishing job queue: if the run is interrupted,
+start it again (with the same batch name) and it resumes where it stopped.
+
+Usage: python scripts/publish_20_posts_now.py [batch-name] [--retry-failed]
 """
 import sys
 from pathlib import Path
@@ -8,8 +13,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from trending_blogger import TrendingBlogger
 from src.blogger_publisher import BloggerPublisher
+from src.job_queue import FAILED, PUBLISHED
 from datetime import datetime
-import time
 
 def main():
     print("="*80)
@@ -67,47 +72,20 @@ def main():
         "Microservices Architecture Explained"
     ]
 
-    print(f"\nStep 3: Publishing {len(topics)} blog posts...")
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    batch = args[0] if args else f"publish-20-{datetime.now().strftime('%Y-%m-%d')}"
+    print(f"\nStep 3: Publishing {len(topics)} blog posts (batch '{batch}')...")
     print("="*80)
 
     start_time = datetime.now()
-    success_count = 0
-    failed_count = 0
-
-    for i, topic in enumerate(topics, 1):
-        print(f"\n[{i}/{len(topics)}] Topic: {topic}")
-        print("-"*80)
-
-        try:
-            # Generate and publish post
-            post_start = datetime.now()
-            success = trending_blogger.generate_and_publish_post(topic, i)
-            post_duration = (datetime.now() - post_start).total_seconds() / 60
-
-            if success:
-                success_count += 1
-                print(f"SUCCESS! Published in {post_duration:.1f} minutes")
-            else:
-                failed_count += 1
-                print(f"FAILED after {post_duration:.1f} minutes")
-
-            # Progress update
-            remaining = len(topics) - i
-            avg_time = (datetime.now() - start_time).total_seconds() / 60 / i
-            est_remaining = remaining * avg_time
-
-            print(f"Progress: {i}/{len(topics)} ({i/len(topics)*100:.0f}%)")
-            print(f"Success: {success_count} | Failed: {failed_count}")
-            print(f"Estimated time remaining: {est_remaining:.0f} minutes")
-
-            # Small delay between posts (30 seconds)
-            if i < len(topics):
-                print("\nWaiting 30 seconds before next post...")
-                time.sleep(30)
-
-        except Exception as e:
-            print(f"ERROR: {str(e)}")
-            failed_count += 1
+
+    # Posts already published in this batch are skipped; interrupted ones
+    # resume from their saved research or content (30 seconds between posts)
+    summary = trending_blogger.run_publish_batch(
+        batch, topics, delay_seconds=30, retry_failed="--retry-failed" in sys.argv
+    )
+    success_count = summary[PUBLISHED]
+    failed_count = summary[FAILED]
 
     # Final summary
     end_time = datetime.now()
@@ -120,6 +98,8 @@ def main():
     print(f"Failed: {failed_count}/{len(topics)}")
     print(f"Total time: {total_duration:.1f} minutes ({total_duration/60:.1f} hours)")
     print(f"Average per post: {total_duration/len(topics):.1f} minutes")
+    if failed_count:
+        print(f"Failed posts keep their generated content; rerun with --retry-failed to resume them")
     print(f"\nYour blog now has {success_count} new posts!")
     print(f"Visit: {blog['url']}")
     print("="*80)
@@ -0,0 +1,170 @@
+"""
+Benchmarking - Timing helpers for offline micro-benchmarks
+Times a callable over many iterations, reports p50/p95 and ops/sec, and
+writes machine-readable JSON reports that can be compared across versions
+"""
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from src.metrics import percentile
+
+
+def time_callable(
+    fn: Callable[[], Any],
+    iterations: int = 200,
+    warmup: int = 5,
+    min_seconds: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Time a callable with no arguments
+
+    The garbage collector is paused while timing so a collection triggered
+    by earlier work does not land in a random sample.
+
+    Args:
+        fn: Code under test
+        iterations: Timed calls (more are made until min_seconds have passed)
+        warmup: Untimed calls made first (imports, caches, lazy clients)
+        min_seconds: Minimum total timed duration
+
+    Returns:
+        Dict with iterations, p50/p95/mean/min/max in milliseconds and ops_per_sec
+    """
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        total = 0.0
+        while len(samples) < iterations or total < min_seconds:
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            samples.append(elapsed)
+            total += elapsed
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return {
+        "iterations": len(samples),
+        "p50_ms": round(percentile(samples, 0.5) * 1000, 4),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 4),
+        "mean_ms": round(total / len(samples) * 1000, 4),
+        "min_ms": round(min(samples) * 1000, 4),
+        "max_ms": round(max(samples) * 1000, 4),
+        "ops_per_sec": round(len(samples) / total, 2) if total else None,
+    }
+
+
+def run_benchmark(
+    name: str, setup: Callable[[], Callable[[], Any]], **timing
+) -> Dict[str, Any]:
+    """
+    Set up and time one benchmark
+
+    A benchmark whose optional dependency is not installed is reported as
+    skipped instead of failing the suite.
+
+    Args:
+        name: Benchmark name
+        setup: Builds the fixtures and returns the callable to time
+        **timing: Passed to time_callable()
+
+    Returns:
+        Dict with the timings, or 'skipped'/'error' and the reason
+    """
+    try:
+        fn = setup()
+        result = time_callable(fn, **timing)
+    except ImportError as e:
+        return {"name": name, "skipped": str(e)}
+    except Exception as e:
+        return {"name": name, "error": f"{type(e).__name__}: {str(e)}"}
+    return {"name": name, **result}
+
+
+def _git_commit() -> Optional[str]:
+    """Commit of the working tree, if it is a git checkout"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+            cwd=Path(__file__).parent.parent,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def environment_info() -> Dict[str, Any]:
+    """Python, platform and commit of the run, stored with every report"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "commit": _git_commit(),
+        "argv": sys.argv[1:],
+    }
+
+
+def write_report(
+    results: Any, path: str, suite: str, summary: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Write benchmark results as JSON
+
+    Args:
+        results: Results keyed by benchmark name (or a list of runs)
+        path: Output file
+        suite: Name of the benchmark suite
+        summary: Conclusions drawn from the results
+
+    Returns:
+        str: Path written
+    """
+    report = {
+        "suite": suite,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment_info(),
+        "results": results,
+    }
+    if summary is not None:
+        report["summary"] = summary
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def compare_reports(
+    baseline: Dict[str, Any], current: Dict[str, Any], metric: str = "p50_ms"
+) -> Dict[str, Optional[float]]:
+    """
+    Compare two reports benchmark by benchmark
+
+    Args:
+        baseline: Report loaded from an earlier run
+        current: Report of this run
+        metric: Timing to compare
+
+    Returns:
+        Dict of benchmark name to current/baseline ratio (< 1.0 = faster);
+        None where either run has no timing
+    """
+    ratios = {}
+    for name, result in current.get("results", {}).items():
+        before = baseline.get("results", {}).get(name, {}).get(metric)
+        after = result.get(metric)
+        ratios[name] = round(after / before, 3) if before and after is not None else None
+    return ratios
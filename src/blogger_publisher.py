@@ -3,13 +3,10 @@ Blogger Publisher - Automatically publish blog posts to Blogger/Blogspot
 """
 import os
 from typing import Dict, Any, Optional
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 import pickle
-from src.logger import logger
+from src.logger import get_logger
+
+logger = get_logger("publisher")
 
 
 class BloggerPublisher:
@@ -39,6 +36,11 @@ class BloggerPublisher:
         Returns:
             bool: True if authentication successful
         """
+        # The Google client libraries are slow to import; only load them here
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+
         # Check if we have saved credentials
         if os.path.exists(self.token_path):
             with open(self.token_path, 'rb') as token:
@@ -77,6 +79,8 @@ class BloggerPublisher:
         if not self.service:
             self.authenticate()
 
+        from googleapiclient.errors import HttpError
+
         try:
             blogs = self.service.blogs().listByUser(userId='self').execute()
             return [
@@ -150,6 +154,8 @@ class BloggerPublisher:
         logger.info(f"   Labels: {post_data.get('labels', 'None')}")
         logger.info(f"   Content length: {len(content)} characters")
 
+        from googleapiclient.errors import HttpError
+
         try:
             if is_draft:
                 # Save as draft
@@ -253,6 +259,8 @@ class BloggerPublisher:
         if not self.service:
             self.authenticate()
 
+        from googleapiclient.errors import HttpError
+
         try:
             # Get existing post
             post = self.service.posts().get(blogId=blog_id, postId=post_id).execute()
@@ -287,6 +295,36 @@ class BloggerPublisher:
                 'message': f"Error updating post: {error}"
             }
 
+    def revert_post(self, blog_id: str, post_id: str) -> Dict[str, Any]:
+        """
+        Unpublish a blog post by reverting it to a draft
+
+        Args:
+            blog_id: The ID of the blog
+            post_id: The ID of the post to unpublish
+
+        Returns:
+            Dict containing success status and message
+        """
+        if not self.service:
+            self.authenticate()
+
+        from googleapiclient.errors import HttpError
+
+        try:
+            self.service.posts().revert(blogId=blog_id, postId=post_id).execute()
+
+            return {
+                'success': True,
+                'message': 'Post reverted to draft successfully!'
+            }
+
+        except HttpError as error:
+            return {
+                'success': False,
+                'message': f"Error reverting post: {error}"
+            }
+
     def delete_post(self, blog_id: str, post_id: str) -> Dict[str, Any]:
         """
         Delete a blog post
@@ -301,6 +339,8 @@ class BloggerPublisher:
         if not self.service:
             self.authenticate()
 
+        from googleapiclient.errors import HttpError
+
         try:
             self.service.posts().delete(blogId=blog_id, postId=post_id).execute()
 
@@ -0,0 +1,238 @@
+"""
+Adaptive Concurrency - AIMD window for in-flight LLM workflows per provider
+The window grows while calls stay fast and error-free and is cut on 429s,
+latency inflation or error bursts, so a batch settles at the provider's
+real throughput ceiling instead of a fixed worker count
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from src.config import config
+from src.logger import logger
+
+
+class AIMDController:
+    """
+    Additive-increase/multiplicative-decrease concurrency limit
+
+    Callers take a slot with acquire() before starting a workflow and give it
+    back with release(). LLM calls report their outcome with record_success(),
+    record_rate_limit() and record_error(). While the window is fully used
+    and latency stays within `latency_tolerance` times the baseline (the median
+    of recent latencies of the same kind of call, since research
+    and writing calls take very different times), every success adds 1/window, so the
+    window grows by about one per round of calls; a rate limit, inflated
+    latency or too many errors multiply it by `backoff`, at most once per
+    cooldown.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.5,
+        max_error_rate: float = 0.2,
+        sample_size: int = 50,
+    ):
+        """
+        Initialize the controller
+
+        Args:
+            name: Name used in logs (usually the provider)
+            initial: Starting window
+            min_limit: Smallest window
+            max_limit: Largest window
+            latency_tolerance: Smoothed latency above baseline * tolerance counts as inflation
+            backoff: Factor the window is multiplied by on congestion
+            max_error_rate: Share of failed calls (rate limits excluded) that counts as congestion
+            sample_size: Recent calls kept for the latency baseline and error rate
+        """
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.max_error_rate = max_error_rate
+
+        self._cond = threading.Condition()
+        self.sample_size = sample_size
+        # Latency history and EWMA per kind of call (agent role or model)
+        self._latencies: Dict[str, deque] = {}
+        self._smoothed: Dict[str, float] = {}
+        self._outcomes: deque = deque(maxlen=sample_size)
+        self._last_decrease = 0.0
+
+        self.in_flight = 0
+        self.successes = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def window(self) -> int:
+        """Current number of workflows allowed in flight"""
+        return int(self.limit)
+
+    # Admission
+
+    def try_acquire(self) -> bool:
+        """Take a slot if the window has room"""
+        with self._cond:
+            if self.in_flight >= self.window:
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the window has room and take a slot
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            bool: True if a slot was taken
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.in_flight < self.window, timeout):
+                return False
+            self.in_flight += 1
+            return True
+
+    async def aacquire(self) -> None:
+        """Async variant of acquire() that sleeps without holding a thread"""
+        while not self.try_acquire():
+            await asyncio.sleep(0.05)
+
+    def release(self) -> None:
+        """Give back a slot taken by acquire()"""
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+    # Signals
+
+    def baseline_latency(self, key: str = "default") -> Optional[float]:
+        """Median of recent latencies of a kind of call (None until 10 samples)"""
+        latencies = self._latencies.get(key, ())
+        if len(latencies) < 10:
+            return None
+        return sorted(latencies)[len(latencies) // 2]
+
+    def record_success(self, latency: float, key: str = "default") -> None:
+        """
+        Report a successful LLM call
+
+        Args:
+            latency: Call duration in seconds
+            key: Kind of call whose latencies are comparable (e.g. agent role)
+        """
+        with self._cond:
+            self.successes += 1
+            self._outcomes.append(True)
+            self._latencies.setdefault(key, deque(maxlen=self.sample_size)).append(latency)
+            previous = self._smoothed.get(key)
+            smoothed = latency if previous is None else 0.8 * previous + 0.2 * latency
+            self._smoothed[key] = smoothed
+
+            baseline = self.baseline_latency(key)
+            if baseline and smoothed > baseline * self.latency_tolerance:
+                self._decrease(f"{key} latency {smoothed:.1f}s vs baseline {baseline:.1f}s")
+            elif self.in_flight >= self.window and self.limit < self.max_limit:
+                # Only grow a window that is actually used
+                previous = self.window
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+                if self.window > previous:
+                    self.increases += 1
+                    self._cond.notify()
+                    logger.debug(f"📈 {self.name} concurrency window raised to {self.window}")
+
+    def record_rate_limit(self) -> None:
+        """Report a 429/overload response"""
+        with self._cond:
+            self.rate_limited += 1
+            self._decrease("rate limited")
+
+    def record_error(self) -> None:
+        """Report a failed LLM call that was not a rate limit"""
+        with self._cond:
+            self.errors += 1
+            self._outcomes.append(False)
+            failures = self._outcomes.count(False)
+            if len(self._outcomes) >= 10 and failures / len(self._outcomes) > self.max_error_rate:
+                self._decrease(f"{failures}/{len(self._outcomes)} recent calls failed")
+
+    def _decrease(self, reason: str) -> None:
+        """Multiplicative decrease (caller holds the lock)"""
+        now = time.monotonic()
+        # Calls started before the last cut still report the old congestion
+        cooldown = max(1.0, max(self._smoothed.values(), default=0.0))
+        if now - self._last_decrease < cooldown:
+            return
+
+        self._last_decrease = now
+        self.limit = max(float(self.min_limit), self.limit * self.backoff)
+        self.decreases += 1
+        # Forget the congested samples so the next round starts clean
+        self._smoothed = {
+            key: baseline for key in self._smoothed
+            if (baseline := self.baseline_latency(key)) is not None
+        }
+        self._outcomes.clear()
+        logger.warning(f"📉 {self.name} concurrency window cut to {self.window} ({reason})")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the current window and signal counters
+
+        Returns:
+            Dict with window, in-flight slots, latencies and counters
+        """
+        with self._cond:
+            return {
+                "name": self.name,
+                "window": self.window,
+                "in_flight": self.in_flight,
+                "baseline_latency": {key: self.baseline_latency(key) for key in self._latencies},
+                "smoothed_latency": dict(self._smoothed),
+                "successes": self.successes,
+                "rate_limited": self.rate_limited,
+                "errors": self.errors,
+                "increases": self.increases,
+                "decreases": self.decreases,
+            }
+
+
+_controllers: Dict[str, AIMDController] = {}
+_controllers_lock = threading.Lock()
+
+
+def get_concurrency_controller(provider: str) -> AIMDController:
+    """
+    Get the process-wide concurrency controller for a provider
+
+    Args:
+        provider: 'anthropic' or 'openai'
+
+    Returns:
+        AIMDController: Controller configured from ConcurrencyConfig
+    """
+    with _controllers_lock:
+        if provider not in _controllers:
+            _controllers[provider] = AIMDController(
+                provider,
+                initial=config.concurrency.initial,
+                min_limit=config.concurrency.min_limit,
+                max_limit=config.concurrency.max_limit,
+                latency_tolerance=config.concurrency.latency_tolerance,
+                backoff=config.concurrency.backoff,
+            )
+        return _controllers[provider]
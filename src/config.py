@@ -28,12 +28,181 @@ class VectorDBConfig:
     )
 
 
+@dataclass
+class CacheConfig:
+    """Configuration for the persistent LLM response cache"""
+
+    # Opt-in: with TEMPERATURE > 0 a replayed response replaces a fresh sample
+    enabled: bool = os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true"
+    path: str = os.getenv("LLM_CACHE_PATH", "./data/llm_cache.sqlite3")
+    ttl_seconds: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    max_entries: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+    prompt_caching: bool = os.getenv("PROMPT_CACHE_ENABLED", "true").lower() == "true"
+    semantic_enabled: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    semantic_model: str = os.getenv("SEMANTIC_CACHE_MODEL", "all-MiniLM-L6-v2")
+    semantic_threshold: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.85"))
+    # Trending research goes stale: reuse it for this long (0 = forever)
+    semantic_max_age_seconds: int = int(os.getenv("SEMANTIC_CACHE_MAX_AGE_SECONDS", str(3 * 24 * 3600)))
+    semantic_max_entries: int = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "2000"))
+
+
+@dataclass
+class RoutingConfig:
+    """Configuration for per-stage model routing (empty = use the main model)"""
+
+    research_model: str = os.getenv("RESEARCH_MODEL", "")
+    review_model: str = os.getenv("REVIEW_MODEL", "")
+    presentation_model: str = os.getenv("PRESENTATION_MODEL", "")
+    fallback_latency_seconds: float = float(os.getenv("MODEL_FALLBACK_LATENCY_SECONDS", "120"))
+    fallback_cooldown_seconds: float = float(os.getenv("MODEL_FALLBACK_COOLDOWN_SECONDS", "300"))
+
+
+@dataclass
+class ResearchConfig:
+    """Configuration for the research stage"""
+
+    # single: one agent covers every facet; map_reduce: one concurrent task per facet, then a merge
+    mode: str = os.getenv("RESEARCH_MODE", "single").lower()
+
+
+@dataclass
+class WritingConfig:
+    """Configuration for the writing stage"""
+
+    # single: one generation per post; sections: outline, then every H2 section concurrently (blog posts)
+    mode: str = os.getenv("WRITING_MODE", "single").lower()
+    section_workers: int = int(os.getenv("WRITING_SECTION_WORKERS", "8"))
+
+
+@dataclass
+class ParallelConfig:
+    """Configuration for batch execution"""
+
+    # Threads of the shared worker pool (0 = CPU count)
+    workers: int = int(os.getenv("PARALLEL_WORKERS", "0"))
+    # thread: workflows share one process; process: warm worker processes, one GIL each
+    executor: str = os.getenv("PARALLEL_EXECUTOR", "thread").lower()
+    process_workers: int = int(os.getenv("PARALLEL_PROCESS_WORKERS", "0"))
+    # Restart a worker after this many workflows (0 = never)
+    worker_max_tasks: int = int(os.getenv("PARALLEL_WORKER_MAX_TASKS", "0"))
+
+
+@dataclass
+class RateLimitConfig:
+    """Opt-in shared per-provider rate limits (set the budgets to your account's tier)"""
+
+    enabled: bool = os.getenv("RATE_LIMIT_ENABLED", "false").lower() == "true"
+    anthropic_rpm: int = int(os.getenv("ANTHROPIC_RPM", "50"))
+    anthropic_tpm: int = int(os.getenv("ANTHROPIC_TPM", "40000"))
+    openai_rpm: int = int(os.getenv("OPENAI_RPM", "500"))
+    openai_tpm: int = int(os.getenv("OPENAI_TPM", "30000"))
+    max_retries: int = int(os.getenv("RATE_LIMIT_MAX_RETRIES", "5"))
+    max_backoff_seconds: float = float(os.getenv("RATE_LIMIT_MAX_BACKOFF_SECONDS", "60"))
+
+
+@dataclass
+class ConcurrencyConfig:
+    """Opt-in adaptive (AIMD) limit on in-flight workflows per provider"""
+
+    adaptive: bool = os.getenv("ADAPTIVE_CONCURRENCY", "false").lower() == "true"
+    initial: int = int(os.getenv("CONCURRENCY_INITIAL", "4"))
+    min_limit: int = int(os.getenv("CONCURRENCY_MIN", "1"))
+    max_limit: int = int(os.getenv("CONCURRENCY_MAX", "32"))
+    latency_tolerance: float = float(os.getenv("CONCURRENCY_LATENCY_TOLERANCE", "2.0"))
+    backoff: float = float(os.getenv("CONCURRENCY_BACKOFF", "0.5"))
+
+
+@dataclass
+class DeadlineConfig:
+    """Deadlines in seconds (0 = none); running crews stop at their next LLM call"""
+
+    workflow_timeout: float = float(os.getenv("WORKFLOW_TIMEOUT_SECONDS", "0"))
+    batch_timeout: float = float(os.getenv("BATCH_TIMEOUT_SECONDS", "0"))
+    research_timeout: float = float(os.getenv("RESEARCH_TIMEOUT_SECONDS", "0"))
+    writing_timeout: float = float(os.getenv("WRITING_TIMEOUT_SECONDS", "0"))
+    review_timeout: float = float(os.getenv("REVIEW_TIMEOUT_SECONDS", "0"))
+    presentation_timeout: float = float(os.getenv("PRESENTATION_TIMEOUT_SECONDS", "0"))
+
+
+@dataclass
+class HedgingConfig:
+    """Opt-in duplicate LLM requests for calls slower than their stage's usual tail"""
+
+    enabled: bool = os.getenv("HEDGE_REQUESTS", "false").lower() == "true"
+    percentile: float = float(os.getenv("HEDGE_PERCENTILE", "0.95"))
+    min_samples: int = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+    min_delay: float = float(os.getenv("HEDGE_MIN_DELAY_SECONDS", "2"))
+    max_ratio: float = float(os.getenv("HEDGE_MAX_RATIO", "0.1"))
+    workers: int = int(os.getenv("HEDGE_WORKERS", "32"))
+
+
+@dataclass
+class FakeLLMConfig:
+    """Offline stand-in provider for benchmarks and load tests"""
+
+    # off, synthetic (generated outputs), replay (cassette) or record (live calls saved to cassette)
+    mode: str = os.getenv("FAKE_LLM_MODE", "off").lower()
+    cassette_path: str = os.getenv("FAKE_LLM_CASSETTE", "./data/cassettes/crew_runs.jsonl")
+    strict: bool = os.getenv("FAKE_LLM_STRICT", "false").lower() == "true"
+    p50_seconds: float = float(os.getenv("FAKE_LLM_P50_SECONDS", "4"))
+    p99_seconds: float = float(os.getenv("FAKE_LLM_P99_SECONDS", "30"))
+    time_scale: float = float(os.getenv("FAKE_LLM_TIME_SCALE", "1.0"))
+    error_rate: float = float(os.getenv("FAKE_LLM_ERROR_RATE", "0"))
+    rate_limit_rate: float = float(os.getenv("FAKE_LLM_RATE_LIMIT_RATE", "0"))
+    max_concurrency: int = int(os.getenv("FAKE_LLM_MAX_CONCURRENCY", "0"))
+    retry_after_seconds: float = float(os.getenv("FAKE_LLM_RETRY_AFTER_SECONDS", "1"))
+    output_words: int = int(os.getenv("FAKE_LLM_OUTPUT_WORDS", "300"))
+
+    @property
+    def enabled(self) -> bool:
+        """Whether agent calls are served by the fake provider"""
+        return self.mode in ("synthetic", "replay")
+
+
+@dataclass
+class ReviewConfig:
+    """Configuration for the reviewer stage"""
+
+    # inline: reviewer runs inside the crew; async: after the writer returns; off: never
+    mode: str = os.getenv("REVIEW_MODE", "inline").lower()
+    sample_rate: float = float(os.getenv("REVIEW_SAMPLE_RATE", "1.0"))
+    workers: int = int(os.getenv("REVIEW_WORKERS", "2"))
+    verdicts_path: str = os.getenv("REVIEW_VERDICTS_PATH", "./data/review_verdicts.jsonl")
+    unpublish_below: float = float(os.getenv("REVIEW_UNPUBLISH_BELOW", "5"))
+
+
+@dataclass
+class JobQueueConfig:
+    """Durable publishing job queue"""
+
+    db_path: str = os.getenv("JOB_QUEUE_PATH", "./data/publish_jobs.sqlite3")
+
+
+@dataclass
+class MetricsConfig:
+    """Configuration for per-stage crew metrics"""
+
+    enabled: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    export_path: str = os.getenv("METRICS_EXPORT_PATH", "./data/metrics.prom")
+
+
 @dataclass
 class LoggingConfig:
     """Configuration for Logging"""
 
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     log_file: str = os.getenv("LOG_FILE", "./logs/app.log")
+    # Hand records to a background writer thread instead of writing in the caller
+    async_enabled: bool = os.getenv("LOG_ASYNC", "true").lower() == "true"
+    queue_size: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    # size (LOG_MAX_BYTES), time (LOG_ROTATE_WHEN) or none
+    rotation: str = os.getenv("LOG_ROTATION", "size").lower()
+    max_bytes: int = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+    rotate_when: str = os.getenv("LOG_ROTATE_WHEN", "midnight")
+    backup_count: int = int(os.getenv("LOG_BACKUP_COUNT", "7"))
+    compress: bool = os.getenv("LOG_COMPRESS", "true").lower() == "true"
+    # Share of INFO/DEBUG records kept per logger, e.g. "ai_multi_agent.publisher=0.1"
+    sample_rates: str = os.getenv("LOG_SAMPLE_RATES", "")
 
 
 @dataclass
@@ -42,6 +211,19 @@ class AppConfig:
 
     llm: LLMConfig = field(default_factory=LLMConfig)
     vector_db: VectorDBConfig = field(default_factory=VectorDBConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    routing: RoutingConfig = field(default_factory=RoutingConfig)
+    research: ResearchConfig = field(default_factory=ResearchConfig)
+    writing: WritingConfig = field(default_factory=WritingConfig)
+    parallel: ParallelConfig = field(default_factory=ParallelConfig)
+    rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+    concurrency: ConcurrencyConfig = field(default_factory=ConcurrencyConfig)
+    deadlines: DeadlineConfig = field(default_factory=DeadlineConfig)
+    hedging: HedgingConfig = field(default_factory=HedgingConfig)
+    fake_llm: FakeLLMConfig = field(default_factory=FakeLLMConfig)
+    review: ReviewConfig = field(default_factory=ReviewConfig)
+    jobs: JobQueueConfig = field(default_factory=JobQueueConfig)
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
 
     def validate(self) -> bool:
@@ -51,7 +233,7 @@ class AppConfig:
         Returns:
             bool: True if configuration is valid
         """
-        if not self.llm.api_key:
+        if not self.llm.api_key and not self.fake_llm.enabled:
             raise ValueError("OPENAI_API_KEY is required")
 
         if self.llm.temperature < 0 or self.llm.temperature > 1:
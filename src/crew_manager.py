@@ -1,17 +1,65 @@
 """
 Crew Manager - Orchestrates the multi-agent system
 """
+import asyncio
 import os
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Callable, Iterator, List, Tuple
 from crewai import Crew, Task, Process
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 from dotenv import load_dotenv
+from functools import lru_cache
 
-from agents.researcher import ResearchAgent
+from agents.researcher import RESEARCH_FACETS, ResearchAgent
 from agents.writer import WriterAgent
 from agents.reviewer import ReviewerAgent
+from agents.base import clone_agent
 from agents.presentation_maker import create_presentation_maker_agent
+from src.concurrency import get_concurrency_controller
+from src.config import config
+from src.deadlines import (
+    CancelToken,
+    WorkflowCancelled,
+    cancel_scope,
+    check_cancelled,
+    find_cancellation,
+    stage_deadline,
+    workflow_token,
+)
+from src.fake_llm import FakeLLM, RecordingLLM, get_cassette, log_fake_mode
+from src.hedging import HedgedLLM
+from src.lazy_imports import LazyImport
+from src.llm_cache import CachedLLM, get_response_cache
+from src.llm_pool import llm_pool
+from src.llm_wrappers import DeadlineLLM, DelegatingLLM, MeteredLLM, usage_scope
+from src.metrics import collect_stage_events, metrics, summarize_stages
+from src.model_router import STAGES, FallbackLLM, model_matches_provider
+from src.prompt_cache import PromptCachingLLM, static_prompt
+from src.rate_limiter import ConcurrencyReportingLLM, RateLimitedLLM, get_rate_limiter
+from src.review_queue import review_queue
+from src.sectioned_writer import SectionedWriter
+from src.semantic_cache import get_semantic_cache
+from src.workflow_result import WorkflowResult
+from src.logger import logger
+
+
+# Only the configured provider's LangChain package is imported (each takes
+# a second or two); module attributes so tests can patch them
+ChatOpenAI = LazyImport("langchain_openai", "ChatOpenAI")
+ChatAnthropic = LazyImport("langchain_anthropic", "ChatAnthropic")
+
+# The full slide format is already in the task description; repeating it
+# here sent the multi-kilobyte spec twice per LLM call
+PRESENTATION_EXPECTED_OUTPUT = (
+    "A complete presentation with 10-15 slides in the EXACT Markdown slide format "
+    "specified in the task: each slide starts with \"# Slide N:\" and slides are "
+    "separated by \"---\" on its own line."
+)
+
+
+@lru_cache(maxsize=None)
+def _load_environment() -> None:
+    """Load .env once per process rather than once per manager"""
+    load_dotenv()
 
 
 class CrewManager:
@@ -25,6 +73,12 @@ class CrewManager:
         temperature: float = 0.7,
         api_key: Optional[str] = None,
         use_anthropic: bool = None,
+        use_cache: Optional[bool] = None,
+        use_semantic_cache: Optional[bool] = None,
+        review_mode: Optional[str] = None,
+        stage_models: Optional[Dict[str, str]] = None,
+        research_mode: Optional[str] = None,
+        writing_mode: Optional[str] = None,
     ):
         """
         Initialize the Crew Manager
@@ -34,8 +88,22 @@ class CrewManager:
             temperature: Temperature setting for the LLM
             api_key: API key (OpenAI or Anthropic, optional, can be set via environment)
             use_anthropic: Whether to use Anthropic Claude (auto-detected if None)
+            use_cache: Serve repeated prompts from the on-disk LLM response cache
+                (defaults to LLM_CACHE_ENABLED)
+            use_semantic_cache: Reuse research from near-duplicate topics
+                (defaults to SEMANTIC_CACHE_ENABLED)
+            review_mode: 'inline' (reviewer in the crew), 'async' (sampled review
+                after the writer output is returned) or 'off' (defaults to REVIEW_MODE)
+            stage_models: Model per stage ('research', 'writing', 'review',
+                'presentation'); unset stages use RESEARCH_MODEL etc. or model_name.
+                Routed stages fall back to model_name on errors or slow calls
+            research_mode: 'single' (one research task) or 'map_reduce' (one
+                concurrent task per research facet plus a merge step; defaults
+                to RESEARCH_MODE)
+            writing_mode: 'single' (one generation) or 'sections' (outline, then
+                concurrent sections; blog posts only; defaults to WRITING_MODE)
         """
-        load_dotenv()
+        _load_environment()
 
         # Determine which provider to use
         if use_anthropic is None:
@@ -44,32 +112,245 @@ class CrewManager:
         # Set up LLM based on provider
         if use_anthropic:
             self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-            if not self.api_key:
+            if not self.api_key and not config.fake_llm.enabled:
                 raise ValueError("ANTHROPIC_API_KEY must be provided or set in environment")
 
-            self.llm = ChatAnthropic(
-                model=model_name,
-                temperature=temperature,
-                api_key=self.api_key,
-                max_tokens=4096
-            )
+            llm_class = ChatAnthropic
+            llm_kwargs = {
+                "model": model_name,
+                "temperature": temperature,
+                "api_key": self.api_key,
+                "max_tokens": 4096,
+            }
         else:
             self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-            if not self.api_key:
+            if not self.api_key and not config.fake_llm.enabled:
                 raise ValueError("OPENAI_API_KEY must be provided or set in environment")
 
-            self.llm = ChatOpenAI(
-                model=model_name, temperature=temperature, api_key=self.api_key
+            llm_class = ChatOpenAI
+            llm_kwargs = {
+                "model": model_name,
+                "temperature": temperature,
+                "api_key": self.api_key,
+            }
+
+        self.provider = "anthropic" if use_anthropic else "openai"
+
+        # Offline mode: same provider and models, answered by the fake provider
+        if config.fake_llm.enabled:
+            llm_class = FakeLLM
+            llm_kwargs = {"model": model_name, "temperature": temperature, "provider": self.provider}
+        self.model_name = model_name
+        self.review_mode = (review_mode or config.review.mode).lower()
+        self.research_mode = (research_mode or config.research.mode).lower()
+        self.writing_mode = (writing_mode or config.writing.mode).lower()
+
+        self.stage_models = self._resolve_stage_models(stage_models)
+
+        # Fake responses must never end up in the real caches
+        if use_cache is None:
+            use_cache = config.cache.enabled and not config.fake_llm.enabled
+
+        # Clients and agent templates are shared by every manager with the
+        # same configuration, so per-topic managers cost almost nothing
+        clients = llm_pool.get(
+            (
+                llm_class, self.provider, model_name, temperature, self.api_key,
+                use_cache, tuple(sorted(self.stage_models.items())),
+            ),
+            lambda: self._create_clients(llm_class, llm_kwargs, use_cache),
+        )
+        self.llm = clients["llm"]
+        self.cache = clients["cache"]
+        self.researcher = clients["researcher"]
+        self.writer = clients["writer"]
+        self.reviewer = clients["reviewer"]
+        self.presentation_maker = clients["presentation_maker"]
+        self.sectioned_writer = clients["sectioned_writer"]
+
+        # Second tier: reuse the research stage for topics that are worded
+        # differently but mean the same thing
+        if use_semantic_cache is None:
+            use_semantic_cache = config.cache.semantic_enabled and not config.fake_llm.enabled
+
+        self.semantic_cache = None
+        if use_semantic_cache:
+            self.semantic_cache = get_semantic_cache(
+                config.vector_db.persist_directory,
+                model_name=config.cache.semantic_model,
+                threshold=config.cache.semantic_threshold,
+                max_age_seconds=config.cache.semantic_max_age_seconds or None,
+                max_entries=config.cache.semantic_max_entries or None,
+            )
+
+    def _resolve_stage_models(
+        self, overrides: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """
+        Work out which model serves each workflow stage
+
+        Args:
+            overrides: Explicit model per stage
+
+        Returns:
+            Dict mapping every stage to a model name
+        """
+        unknown = set(overrides or {}) - set(STAGES)
+        if unknown:
+            raise ValueError(f"Unknown workflow stage(s): {', '.join(sorted(unknown))}")
+
+        stage_models = {stage: self.model_name for stage in STAGES}
+
+        # Configured tiers only apply to the provider they belong to
+        for stage in ("research", "review", "presentation"):
+            model = getattr(config.routing, f"{stage}_model")
+            if model and model_matches_provider(model, self.provider):
+                stage_models[stage] = model
+
+        stage_models.update({stage: model for stage, model in (overrides or {}).items() if model})
+        return stage_models
+
+    def _create_clients(
+        self, llm_class: type, llm_kwargs: Dict[str, Any], use_cache: bool
+    ) -> Dict[str, Any]:
+        """
+        Build the per-stage LLMs and agent templates for one configuration
+
+        Args:
+            llm_class: LangChain chat model class for the provider
+            llm_kwargs: Keyword arguments for the main chat model
+            use_cache: Whether agent calls go through the response cache
+
+        Returns:
+            Dict with the LLM, cache and agent templates
+        """
+        if llm_class is FakeLLM:
+            log_fake_mode()
+
+        main = self._get_stage_llm(llm_class, llm_kwargs, use_cache)
+
+        stage_llms = {}
+        for stage, model in self.stage_models.items():
+            if model == self.model_name:
+                stage_llms[stage] = main["agent_llm"]
+                continue
+
+            # The main model backs up every routed stage
+            tier = self._get_stage_llm(llm_class, {**llm_kwargs, "model": model}, use_cache)
+            stage_llms[stage] = FallbackLLM(
+                tier["agent_llm"],
+                main["agent_llm"],
+                latency_budget=config.routing.fallback_latency_seconds,
+                cooldown_seconds=config.routing.fallback_cooldown_seconds,
+                provider=self.provider,
+                api_key=self.api_key,
+            )
+
+        return {
+            "llm": main["llm"],
+            "cache": main["cache"],
+            "researcher": ResearchAgent(stage_llms["research"]),
+            "writer": WriterAgent(stage_llms["writing"]),
+            "reviewer": ReviewerAgent(stage_llms["review"]),
+            "presentation_maker": create_presentation_maker_agent(stage_llms["presentation"]),
+            "sectioned_writer": SectionedWriter(
+                stage_llms["writing"], max_workers=config.writing.section_workers
+            ),
+        }
+
+    def _get_stage_llm(
+        self, llm_class: type, llm_kwargs: Dict[str, Any], use_cache: bool
+    ) -> Dict[str, Any]:
+        """Get the pooled LLM chain for one model"""
+        return llm_pool.get(
+            ("stage_llm", llm_class, self.provider, tuple(sorted(llm_kwargs.items())), use_cache),
+            lambda: self._create_stage_llm(llm_class, llm_kwargs, use_cache),
+        )
+
+    def _create_stage_llm(
+        self, llm_class: type, llm_kwargs: Dict[str, Any], use_cache: bool
+    ) -> Dict[str, Any]:
+        """
+        Build the LLM client and its CrewAI wrapper chain for one model
+
+        Args:
+            llm_class: LangChain chat model class for the provider
+            llm_kwargs: Keyword arguments for the chat model
+            use_cache: Whether agent calls go through the response cache
+
+        Returns:
+            Dict with the LangChain LLM, the agent LLM and the response cache
+        """
+        llm = llm_class(**llm_kwargs)
+
+        # Static prompt prefixes are cached provider-side (Anthropic cache_control)
+        if config.cache.prompt_caching:
+            agent_llm = PromptCachingLLM(llm, provider=self.provider, api_key=self.api_key)
+        else:
+            agent_llm = DelegatingLLM(llm, provider=self.provider, api_key=self.api_key)
+
+        # Save live responses so load tests can replay them offline
+        if config.fake_llm.mode == "record":
+            agent_llm = RecordingLLM(
+                agent_llm,
+                get_cassette(config.fake_llm.cassette_path),
+                provider=self.provider,
+                api_key=self.api_key,
             )
 
-        # Initialize agents
-        self.researcher = ResearchAgent(self.llm)
-        self.writer = WriterAgent(self.llm)
-        self.reviewer = ReviewerAgent(self.llm)
-        self.presentation_maker = create_presentation_maker_agent(self.llm)
+        # Every call's latency, 429 or error sizes the provider's adaptive
+        # concurrency window, with or without rate limiting
+        if config.concurrency.adaptive:
+            agent_llm = ConcurrencyReportingLLM(
+                agent_llm,
+                get_concurrency_controller(self.provider),
+                provider=self.provider,
+                api_key=self.api_key,
+            )
+
+        # Every CrewManager shares one request/token budget per provider;
+        # cache hits below never reach it
+        if config.rate_limit.enabled:
+            agent_llm = RateLimitedLLM(
+                agent_llm,
+                get_rate_limiter(self.provider),
+                max_retries=config.rate_limit.max_retries,
+                max_backoff=config.rate_limit.max_backoff_seconds,
+                provider=self.provider,
+                api_key=self.api_key,
+            )
+
+        # Calls slower than their stage's p95 get a duplicate request; both
+        # attempts take from the rate budget above, cache hits below never hedge
+        if config.hedging.enabled:
+            agent_llm = HedgedLLM(agent_llm, provider=self.provider, api_key=self.api_key)
+
+        # Route every agent call through the response cache so identical
+        # prompts (same provider, model, temperature and context) are replayed
+        cache = None
+        if use_cache:
+            cache = get_response_cache(
+                config.cache.path,
+                ttl_seconds=config.cache.ttl_seconds,
+                max_entries=config.cache.max_entries,
+            )
+            agent_llm = CachedLLM(agent_llm, cache, provider=self.provider, api_key=self.api_key)
+
+        # Attribute every call's tokens to the crew task that made it
+        if config.metrics.enabled:
+            agent_llm = MeteredLLM(agent_llm, provider=self.provider, api_key=self.api_key)
+
+        # Cancelled or overdue workflows stop before their next call
+        agent_llm = DeadlineLLM(agent_llm, provider=self.provider, api_key=self.api_key)
+
+        return {"llm": llm, "agent_llm": agent_llm, "cache": cache}
 
     def create_research_crew(
-        self, topic: str, content_type: str = "article"
+        self,
+        topic: str,
+        content_type: str = "article",
+        research: Optional[str] = None,
+        include_review: bool = True,
     ) -> Crew:
         """
         Create a crew for research and content creation
@@ -77,231 +358,927 @@ class CrewManager:
         Args:
             topic: The topic to research and write about
             content_type: Type of content to create
+            research: Existing research to write from (skips the research stage)
+            include_review: Whether the reviewer runs as the crew's last task
 
         Returns:
             Crew: Configured crew ready to execute
         """
         # Create agent instances
-        research_agent = self.researcher.create_agent()
         writer_agent = self.writer.create_agent()
-        reviewer_agent = self.reviewer.create_agent()
 
-        # Define tasks
-        research_task = Task(
-            description=ResearchAgent.get_research_task_description(topic),
-            agent=research_agent,
-            expected_output="A comprehensive research summary with key findings, statistics, and credible sources",
-        )
+        if research is None:
+            # Define tasks
+            agents, tasks = self._create_research_tasks(
+                topic,
+                "A comprehensive research summary with key findings, statistics, and credible sources",
+            )
 
-        writing_task = Task(
-            description=WriterAgent.get_writing_task_description(content_type),
-            agent=writer_agent,
-            expected_output=f"A well-structured {content_type} in Markdown format based on the research",
-            context=[research_task],
+            writing_task = Task(
+                name="writing",
+                description=static_prompt(WriterAgent.get_writing_task_description(content_type)),
+                agent=writer_agent,
+                expected_output=f"A well-structured {content_type} in Markdown format based on the research",
+                context=[tasks[-1]],
+            )
+
+            agents.append(writer_agent)
+            tasks.append(writing_task)
+        else:
+            writing_task = Task(
+                name="writing",
+                description=self._get_writing_prompt(topic, content_type, research),
+                agent=writer_agent,
+                expected_output=f"A well-structured {content_type} in Markdown format based on the research",
+            )
+
+            agents = [writer_agent]
+            tasks = [writing_task]
+
+        if include_review:
+            reviewer_agent = self.reviewer.create_agent()
+            review_task = Task(
+                name="review",
+                description=static_prompt(ReviewerAgent.get_review_task_description()),
+                agent=reviewer_agent,
+                expected_output="A detailed review with quality score, strengths, improvements, and final verdict",
+                context=[writing_task],
+            )
+            agents.append(reviewer_agent)
+            tasks.append(review_task)
+
+        # Create and return crew
+        crew = Crew(
+            agents=agents,
+            tasks=tasks,
+            process=Process.sequential,
+            verbose=True,
         )
 
+        return crew
+
+    def create_review_crew(self, topic: str, content: str) -> Crew:
+        """
+        Create a crew that only reviews finished content
+
+        Args:
+            topic: The topic the content is about
+            content: The content to review
+
+        Returns:
+            Crew: Configured crew ready to execute
+        """
+        reviewer_agent = self.reviewer.create_agent()
         review_task = Task(
-            description=ReviewerAgent.get_review_task_description(),
+            name="review",
+            description=f"""{static_prompt(ReviewerAgent.get_review_task_description())}
+
+Topic: {topic}
+
+Content to review:
+
+{content}""",
             agent=reviewer_agent,
             expected_output="A detailed review with quality score, strengths, improvements, and final verdict",
-            context=[writing_task],
         )
 
-        # Create and return crew
-        crew = Crew(
-            agents=[research_agent, writer_agent, reviewer_agent],
-            tasks=[research_task, writing_task, review_task],
+        return Crew(
+            agents=[reviewer_agent],
+            tasks=[review_task],
             process=Process.sequential,
             verbose=True,
         )
 
-        return crew
+    def execute_review(self, topic: str, content_type: str, content: str) -> str:
+        """
+        Review finished content outside the content crew
+
+        Args:
+            topic: The topic the content is about
+            content_type: Type of the content
+            content: The content to review
+
+        Returns:
+            str: The reviewer's output
+        """
+        crew = self.create_review_crew(topic, content)
+        try:
+            result = crew.kickoff()
+        finally:
+            self._record_stage_metrics(crew, topic, content_type)
+        return str(result)
+
+    def submit_review(
+        self,
+        topic: str,
+        content_type: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """
+        Queue a background review on the sampled review queue
+
+        The verdict is appended to the review side channel and handed to the
+        queue's listeners (see src.review_queue).
+
+        Args:
+            topic: The topic the content is about
+            content_type: Type of the content
+            content: The content to review
+            metadata: Extra fields copied into the verdict
+
+        Returns:
+            str: Review ID, or None if the content was not sampled
+        """
+        return review_queue.submit(
+            lambda: self.execute_review(topic, content_type, content),
+            topic,
+            content_type,
+            metadata,
+        )
 
     def execute_research_workflow(
-        self, topic: str, content_type: str = "article"
-    ) -> Dict[str, Any]:
+        self,
+        topic: str,
+        content_type: str = "article",
+        research: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> WorkflowResult:
         """
         Execute the complete research and content creation workflow
 
         Args:
             topic: The topic to research and write about
             content_type: Type of content to create
+            research: Existing research to write from (skips the research stage)
+            timeout: Deadline in seconds (default: the enclosing batch's
+                deadline, else WORKFLOW_TIMEOUT_SECONDS); the crew stops at its
+                next LLM call and the result has status 'timeout'
 
         Returns:
-            Dict containing the results from each stage
+            WorkflowResult: Final content, stage texts and a metrics summary
+                (supports dict-style access)
         """
+        start = time.time()
+        with cancel_scope(workflow_token(timeout)), collect_stage_events() as events:
+            result = self._run_research_workflow(topic, content_type, research)
+        return result.with_metrics(summarize_stages(events, time.time() - start))
+
+    def _run_research_workflow(
+        self, topic: str, content_type: str, research: Optional[str] = None
+    ) -> WorkflowResult:
+        """Run the research workflow (see execute_research_workflow)"""
+        crew = None
         try:
-            crew = self.create_research_crew(topic, content_type)
+            check_cancelled()
+            if self._writes_in_sections(content_type):
+                return self._execute_sectioned_workflow(topic, content_type, research)
+
+            if research is None:
+                research = self._lookup_cached_research(topic)
+            crew = self.create_research_crew(
+                topic, content_type, research=research,
+                include_review=self.review_mode == "inline",
+            )
             result = crew.kickoff()
-
-            # IMPORTANT: Extract the Writer's original content from task outputs
-            # The Writer task is at index 1 (research=0, writer=1, reviewer=2)
-            writer_output = None
-            if hasattr(crew, 'tasks') and len(crew.tasks) >= 2:
-                writer_task = crew.tasks[1]
-                if hasattr(writer_task, 'output'):
-                    # Get the Writer's raw output (original, unmodified content)
-                    writer_output = writer_task.output.raw if hasattr(writer_task.output, 'raw') else writer_task.output
-
-            # Use the Writer's output if available, otherwise fall back to final result
-            final_content = writer_output if writer_output else result
-
-            return {
-                "success": True,
-                "topic": topic,
-                "content_type": content_type,
-                "result": final_content,
-                "message": "Workflow completed successfully",
-            }
+            return self._complete_research_workflow(
+                crew, result, topic, content_type, research
+            )
         except Exception as e:
-            return {
-                "success": False,
-                "topic": topic,
-                "content_type": content_type,
-                "result": None,
-                "message": f"Error during workflow execution: {str(e)}",
-            }
+            return self._research_error(topic, content_type, e, crew)
+        finally:
+            self._record_stage_metrics(crew, topic, content_type)
 
-    def execute_presentation_workflow(
-        self, topic: str, text_content: Optional[str] = None
-    ) -> Dict[str, Any]:
+    async def aexecute_research_workflow(
+        self,
+        topic: str,
+        content_type: str = "article",
+        research: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> WorkflowResult:
         """
-        Execute text-to-presentation workflow
+        Async variant of execute_research_workflow
+
+        Runs the crew with CrewAI's native async kickoff, so many workflows can
+        share one event loop instead of blocking a thread each. At the
+        deadline the workflow's task is cancelled outright.
 
         Args:
-            topic: The presentation topic
-            text_content: Optional existing content to convert (if None, will research first)
+            topic: The topic to research and write about
+            content_type: Type of content to create
+            research: Existing research to write from (skips the research stage)
+            timeout: Deadline in seconds (see execute_research_workflow)
 
         Returns:
-            Dict containing the presentation results
+            WorkflowResult: Final content, stage texts and a metrics summary
         """
+        start = time.time()
+        token = workflow_token(timeout)
+        with cancel_scope(token), collect_stage_events() as events:
+            result = await self._await_with_deadline(
+                self._arun_research_workflow(topic, content_type, research), token, topic, content_type
+            )
+        return result.with_metrics(summarize_stages(events, time.time() - start))
+
+    @staticmethod
+    async def _await_with_deadline(
+        workflow: Any, token: Optional[CancelToken], topic: str, content_type: str
+    ) -> WorkflowResult:
+        """Await a workflow coroutine, cancelling it at the token's deadline"""
+        try:
+            return await asyncio.wait_for(workflow, token.remaining() if token else None)
+        except asyncio.TimeoutError:
+            try:
+                token.check()
+                error = "Workflow deadline exceeded"
+            except WorkflowCancelled as e:
+                error = str(e)
+            logger.warning(f"⏱️  '{topic}' stopped: {error}")
+            return WorkflowResult.interrupted(topic, content_type, "timeout", error)
+
+    async def _arun_research_workflow(
+        self, topic: str, content_type: str, research: Optional[str] = None
+    ) -> WorkflowResult:
+        """Run the research workflow on the event loop"""
+        crew = None
         try:
-            # If no content provided, research first
-            if not text_content:
-                # Research → Write → Convert to Presentation
-                research_agent = self.researcher.create_agent()
-                writer_agent = self.writer.create_agent()
-
-                research_task = Task(
-                    description=ResearchAgent.get_research_task_description(topic),
-                    agent=research_agent,
-                    expected_output="A comprehensive research summary with key findings",
+            check_cancelled()
+            if self._writes_in_sections(content_type):
+                if research is None:
+                    research = await asyncio.to_thread(self.run_research_stage, topic, content_type)
+                content = await self.awrite_in_sections(topic, content_type, research)
+                return await asyncio.to_thread(
+                    self._finish_written_workflow, topic, content_type, research, content
                 )
 
-                writing_task = Task(
-                    description=WriterAgent.get_writing_task_description("article"),
-                    agent=writer_agent,
-                    expected_output="A well-structured article in Markdown format",
-                    context=[research_task],
-                )
+            # Embedding lookups and crew construction are CPU-bound
+            if research is None:
+                research = await asyncio.to_thread(self._lookup_cached_research, topic)
+            crew = self.create_research_crew(
+                topic, content_type, research=research,
+                include_review=self.review_mode == "inline",
+            )
+            result = await crew.akickoff()
+            return await asyncio.to_thread(
+                self._complete_research_workflow,
+                crew, result, topic, content_type, research,
+            )
+        except Exception as e:
+            return self._research_error(topic, content_type, e, crew)
+        finally:
+            self._record_stage_metrics(crew, topic, content_type)
 
-                presentation_task = Task(
-                    description=self._get_presentation_task_description(),
-                    agent=self.presentation_maker,
-                    expected_output="""A complete presentation with 10-15 slides in this EXACT Markdown format:
+    def _complete_research_workflow(
+        self,
+        crew: Crew,
+        result: Any,
+        topic: str,
+        content_type: str,
+        research: Optional[str],
+    ) -> WorkflowResult:
+        """
+        Build the workflow result from a finished research crew
 
-# Slide 1: [Title]
-**[Subtitle]**
-📅 [Date]
+        Args:
+            crew: Crew that has been kicked off
+            result: Return value of the kickoff
+            topic: The topic that was researched
+            content_type: Type of content created
+            research: Cached research the crew was built with, if any
 
----
+        Returns:
+            WorkflowResult: The successful workflow result
+        """
+        # IMPORTANT: Extract the Writer's original content from task outputs
+        # The Writer task comes right before the Reviewer when it runs inline
+        writer_output = self._get_task_output(
+            crew, -2 if self.review_mode == "inline" else -1
+        )
 
-# Slide 2: What We'll Cover
-- [Topic 1]
-- [Topic 2]
-- [Topic 3]
+        # Only fresh research is added to the semantic index
+        if research is None:
+            self._index_research(topic, self._get_research_output(crew))
 
----
+        # Use the Writer's output if available, otherwise fall back to final result
+        final_content = writer_output if writer_output else result
+        self._log_cache_stats(topic)
+        return self._build_workflow_result(
+            topic, content_type, final_content, self._get_stage_texts(crew)
+        )
+
+    def _build_workflow_result(
+        self,
+        topic: str,
+        content_type: str,
+        final_content: Any,
+        stages: Optional[Dict[str, Any]] = None,
+    ) -> WorkflowResult:
+        """Build the successful workflow result and queue its async review"""
+        # The content is returned now; its review (if sampled) finishes later
+        review_id = None
+        if self.review_mode == "async":
+            review_id = self.submit_review(topic, content_type, str(final_content))
+
+        return WorkflowResult.create(
+            True,
+            topic,
+            content_type,
+            final_content,
+            "Workflow completed successfully",
+            stages=stages,
+            review_id=review_id,
+        )
 
-# Slide 3: [Descriptive Title]
-**[Optional context]**
-- [Bullet point 1]
-- [Bullet point 2]
-- [Bullet point 3]
+    def run_research_stage(self, topic: str, content_type: str = "article") -> str:
+        """
+        Run only the research stage for a topic
 
-💡 **Key Insight:** [Takeaway]
+        Args:
+            topic: The topic to research
+            content_type: Type of content the research is for (used in metrics)
 
-[Visual suggestion: Chart/Image]
+        Returns:
+            str: Research findings (reused from a near-duplicate topic if possible)
+        """
+        research = self._lookup_cached_research(topic)
+        if research is not None:
+            return research
 
----
+        agents, tasks = self._create_research_tasks(
+            topic,
+            "A comprehensive research summary with key findings, statistics, and credible sources",
+        )
+        crew = Crew(
+            agents=agents,
+            tasks=tasks,
+            process=Process.sequential,
+            verbose=True,
+        )
+        try:
+            result = crew.kickoff()
+        finally:
+            self._record_stage_metrics(crew, topic, content_type)
 
-[Continue with 7-12 more content slides using the same format]
+        research_output = self._get_research_output(crew) or result
+        self._index_research(topic, research_output)
+        return str(research_output)
 
-CRITICAL: Each slide MUST start with "# Slide N:" and be separated by exactly "---" on its own line.""",
-                    context=[writing_task],
-                )
+    def stream_research_workflow(
+        self,
+        topic: str,
+        content_type: str = "article",
+        on_chunk: Optional[Callable[[str], None]] = None,
+    ) -> Iterator[str]:
+        """
+        Research a topic, then stream the writer's content as it is generated
 
-                crew = Crew(
-                    agents=[research_agent, writer_agent, self.presentation_maker],
-                    tasks=[research_task, writing_task, presentation_task],
-                    process=Process.sequential,
-                    verbose=True,
+        The writer stage uses no tools, so it runs as a single streamed LLM
+        call instead of a crew task. The reviewer never runs inline here; in
+        'async' review mode the finished content is queued for review.
+
+        Args:
+            topic: The topic to research and write about
+            content_type: Type of content to create
+            on_chunk: Optional callback invoked with every text chunk
+
+        Yields:
+            str: Content chunks in generation order
+        """
+        research = self.run_research_stage(topic, content_type)
+
+        messages = [
+            {"role": "system", "content": self._get_writer_system_prompt()},
+            {
+                "role": "user",
+                "content": self._get_writing_prompt(topic, content_type, research),
+            },
+        ]
+
+        logger.info(f"✍️  Streaming {content_type} for '{topic}'")
+        usage = {"llm_calls": 1, "input_tokens": 0, "output_tokens": 0, "cached_tokens": 0}
+        status = "failed"
+        start = time.time()
+        chunks = []
+        try:
+            for chunk in self.writer.llm.stream_text(messages, usage=usage):
+                if on_chunk:
+                    on_chunk(chunk)
+                chunks.append(chunk)
+                yield chunk
+            status = "success"
+        finally:
+            self._record_writing_metrics(topic, content_type, start, usage, status)
+
+        self._log_cache_stats(topic)
+        if self.review_mode == "async":
+            self.submit_review(topic, content_type, "".join(chunks))
+
+    def _writes_in_sections(self, content_type: str) -> bool:
+        """Whether content of this type is written as outline plus sections"""
+        return self.writing_mode == "sections" and content_type.lower() in ("blog post", "blog")
+
+    def _execute_sectioned_workflow(
+        self, topic: str, content_type: str, research: Optional[str] = None
+    ) -> WorkflowResult:
+        """Research, then write the post section by section (see write_in_sections)"""
+        if research is None:
+            research = self.run_research_stage(topic, content_type)
+        try:
+            content = self.write_in_sections(topic, content_type, research)
+        except Exception as e:
+            # Keep the finished research with the timeout result
+            cancelled = find_cancellation(e)
+            if cancelled is None:
+                raise
+            return self._interrupted(topic, content_type, cancelled, {"research": research})
+        return self._finish_written_workflow(topic, content_type, research, content)
+
+    def _finish_written_workflow(
+        self, topic: str, content_type: str, research: str, content: str
+    ) -> WorkflowResult:
+        """Review content written outside a crew and build the workflow result"""
+        stages = {"research": research, "writing": content}
+        if self.review_mode == "inline":
+            stages["review"] = self.execute_review(topic, content_type, content)
+        self._log_cache_stats(topic)
+        return self._build_workflow_result(topic, content_type, content, stages)
+
+    def write_in_sections(self, topic: str, content_type: str, research: str) -> str:
+        """
+        Write a long post as a short outline plus concurrently written sections
+
+        Falls back to a single generation if the outline cannot be parsed.
+        The result has the same Markdown structure (H1 title, H2 sections)
+        as the single-call writer, so publishing is unchanged.
+
+        Args:
+            topic: The topic to write about
+            content_type: Type of content to create
+            research: Research findings to write from
+
+        Returns:
+            str: Markdown content
+        """
+        logger.info(f"✍️  Writing {content_type} for '{topic}' in parallel sections")
+        system = self._get_writer_system_prompt()
+        start = time.time()
+        usage = {"llm_calls": 0, "input_tokens": 0, "output_tokens": 0, "cached_tokens": 0}
+        status = "failed"
+        try:
+            with stage_deadline("writing"):
+                content, usage = self.sectioned_writer.write(system, topic, research)
+            if content is None:
+                logger.warning(f"⚠️  Outline for '{topic}' could not be parsed; writing in one pass")
+                content = self._write_in_one_pass(system, topic, content_type, research, usage)
+            status = "success"
+            return content
+        finally:
+            self._record_writing_metrics(topic, content_type, start, usage, status)
+
+    async def awrite_in_sections(self, topic: str, content_type: str, research: str) -> str:
+        """Async variant of write_in_sections"""
+        logger.info(f"✍️  Writing {content_type} for '{topic}' in parallel sections")
+        system = self._get_writer_system_prompt()
+        start = time.time()
+        usage = {"llm_calls": 0, "input_tokens": 0, "output_tokens": 0, "cached_tokens": 0}
+        status = "failed"
+        try:
+            with stage_deadline("writing"):
+                content, usage = await self.sectioned_writer.awrite(system, topic, research)
+            if content is None:
+                logger.warning(f"⚠️  Outline for '{topic}' could not be parsed; writing in one pass")
+                content = await asyncio.to_thread(
+                    self._write_in_one_pass, system, topic, content_type, research, usage
                 )
-            else:
-                # Just convert existing content to presentation
-                presentation_task = Task(
-                    description=f"""Convert the following content into a professional presentation:
+            status = "success"
+            return content
+        finally:
+            self._record_writing_metrics(topic, content_type, start, usage, status)
+
+    def _write_in_one_pass(
+        self, system: str, topic: str, content_type: str, research: str, usage: Dict[str, int]
+    ) -> str:
+        """Write the whole post with one LLM call, adding its tokens to usage"""
+        messages = [
+            {"role": "system", "content": system},
+            {"role": "user", "content": self._get_writing_prompt(topic, content_type, research)},
+        ]
+        with usage_scope() as call_usage:
+            content = str(self.writer.llm.call(messages))
+        usage["llm_calls"] += 1
+        for name in ("input_tokens", "output_tokens", "cached_tokens"):
+            usage[name] += call_usage[name]
+        return content
+
+    def _record_writing_metrics(
+        self, topic: str, content_type: str, start: float, usage: Dict[str, int], status: str
+    ) -> None:
+        """Record the writing stage of a workflow that ran outside a crew"""
+        if config.metrics.enabled:
+            metrics.record_stage(
+                "writing", topic, content_type, self.stage_models["writing"],
+                time.time() - start, usage, status, started_at=start,
+            )
+            metrics.export()
 
-{text_content}
+    def _get_writer_system_prompt(self) -> str:
+        """System prompt of the writer agent, for calls made outside a crew"""
+        writer_agent = self.writer.create_agent()
+        return (
+            f"You are {writer_agent.role}. {writer_agent.backstory}\n"
+            f"Your personal goal is: {writer_agent.goal}"
+        )
 
-{self._get_presentation_task_description()}""",
-                    agent=self.presentation_maker,
-                    expected_output="""A complete presentation with 10-15 slides in this EXACT Markdown format:
+    def _create_research_tasks(self, topic: str, expected_output: str) -> Tuple[List, List[Task]]:
+        """
+        Build the research stage's agents and tasks
 
-# Slide 1: [Title]
-**[Subtitle]**
-📅 [Date]
+        In map_reduce mode every research facet is its own async task, so the
+        stage takes as long as the slowest facet rather than all seven in a
+        row; a tool-less merge task then condenses the notes into the single
+        summary the writer expects. The task named 'research' is always last.
 
----
+        Args:
+            topic: The topic to research
+            expected_output: Expected output of the research summary
 
-# Slide 2: What We'll Cover
-- [Topic 1]
-- [Topic 2]
-- [Topic 3]
+        Returns:
+            Tuple of (agents, tasks)
+        """
+        if self.research_mode != "map_reduce":
+            research_agent = self.researcher.create_agent()
+            research_task = Task(
+                name="research",
+                description=self._get_research_description(topic),
+                agent=research_agent,
+                expected_output=expected_output,
+            )
+            return [research_agent], [research_task]
+
+        agents, facet_tasks = [], []
+        for facet, (title, _) in enumerate(RESEARCH_FACETS):
+            facet_agent = self.researcher.create_agent()
+            static_prompt(ResearchAgent.get_facet_instructions(facet))
+            facet_tasks.append(
+                Task(
+                    name="research_facet",
+                    description=ResearchAgent.get_facet_task_description(topic, facet),
+                    agent=facet_agent,
+                    expected_output=f"Markdown research notes under a '## {title}' heading",
+                    async_execution=True,
+                )
+            )
+            agents.append(facet_agent)
 
----
+        merge_agent = self.researcher.create_merge_agent()
+        static_prompt(ResearchAgent.get_merge_instructions())
+        research_task = Task(
+            name="research",
+            description=ResearchAgent.get_merge_task_description(topic),
+            agent=merge_agent,
+            expected_output=expected_output,
+            context=facet_tasks,
+        )
+        return [*agents, merge_agent], [*facet_tasks, research_task]
+
+    @staticmethod
+    def _get_research_description(topic: str) -> str:
+        """Get the research task description with its instructions marked static"""
+        static_prompt(ResearchAgent.get_research_instructions())
+        return ResearchAgent.get_research_task_description(topic)
+
+    @staticmethod
+    def _get_writing_prompt(topic: str, content_type: str, research: str) -> str:
+        """Get the writing task description with the research inlined"""
+        # Static instructions first, so they are a cacheable prompt prefix
+        return f"""{static_prompt(WriterAgent.get_writing_task_description(content_type))}
+
+Topic: {topic}
+
+Research findings:
+
+{research}"""
+
+    @classmethod
+    def _research_error(
+        cls, topic: str, content_type: str, error: Exception, crew: Optional[Crew] = None
+    ) -> WorkflowResult:
+        """Build the failed (or timed out) research workflow result"""
+        cancelled = find_cancellation(error)
+        if cancelled is not None:
+            return cls._interrupted(
+                topic, content_type, cancelled, cls._get_stage_texts(crew) if crew else None
+            )
+        return WorkflowResult.failed(
+            topic,
+            content_type,
+            f"Error during workflow execution: {str(error)}",
+            error=str(error),
+        )
 
-# Slide 3: [Descriptive Title]
-**[Optional context]**
-- [Bullet point 1]
-- [Bullet point 2]
-- [Bullet point 3]
+    def create_presentation_crew(
+        self, topic: str, text_content: Optional[str] = None
+    ) -> Crew:
+        """
+        Create a crew for text-to-presentation conversion
 
-💡 **Key Insight:** [Takeaway]
+        Args:
+            topic: The presentation topic
+            text_content: Optional existing content to convert (if None, will research first)
 
-[Visual suggestion: Chart/Image]
+        Returns:
+            Crew: Configured crew ready to execute
+        """
+        # The shared template must not run in two crews at once
+        presentation_maker = clone_agent(self.presentation_maker)
+
+        # If no content provided, research first
+        if not text_content:
+            # Research → Write → Convert to Presentation
+            agents, tasks = self._create_research_tasks(
+                topic, "A comprehensive research summary with key findings"
+            )
+            writer_agent = self.writer.create_agent()
+
+            writing_task = Task(
+                name="writing",
+                description=static_prompt(WriterAgent.get_writing_task_description("article")),
+                agent=writer_agent,
+                expected_output="A well-structured article in Markdown format",
+                context=[tasks[-1]],
+            )
 
----
+            presentation_task = Task(
+                name="presentation",
+                description=static_prompt(self._get_presentation_task_description()),
+                agent=presentation_maker,
+                expected_output=PRESENTATION_EXPECTED_OUTPUT,
+                context=[writing_task],
+            )
+
+            crew = Crew(
+                agents=[*agents, writer_agent, presentation_maker],
+                tasks=[*tasks, writing_task, presentation_task],
+                process=Process.sequential,
+                verbose=True,
+            )
+        else:
+            # Just convert existing content to presentation
+            presentation_task = Task(
+                name="presentation",
+                description=f"""{static_prompt(self._get_presentation_task_description())}
 
-[Continue with 7-12 more content slides using the same format]
+Convert the following content into a professional presentation:
 
-CRITICAL: Each slide MUST start with "# Slide N:" and be separated by exactly "---" on its own line.""",
-                )
+{text_content}""",
+                agent=presentation_maker,
+                expected_output=PRESENTATION_EXPECTED_OUTPUT,
+            )
 
-                crew = Crew(
-                    agents=[self.presentation_maker],
-                    tasks=[presentation_task],
-                    process=Process.sequential,
-                    verbose=True,
-                )
+            crew = Crew(
+                agents=[presentation_maker],
+                tasks=[presentation_task],
+                process=Process.sequential,
+                verbose=True,
+            )
 
+        return crew
+
+    def execute_presentation_workflow(
+        self,
+        topic: str,
+        text_content: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> WorkflowResult:
+        """
+        Execute text-to-presentation workflow
+
+        Args:
+            topic: The presentation topic
+            text_content: Optional existing content to convert (if None, will research first)
+            timeout: Deadline in seconds (see execute_research_workflow)
+
+        Returns:
+            WorkflowResult: The presentation, stage texts and a metrics summary
+        """
+        start = time.time()
+        with cancel_scope(workflow_token(timeout)), collect_stage_events() as events:
+            result = self._run_presentation_workflow(topic, text_content)
+        return result.with_metrics(summarize_stages(events, time.time() - start))
+
+    def _run_presentation_workflow(
+        self, topic: str, text_content: Optional[str]
+    ) -> WorkflowResult:
+        """Run the presentation workflow (see execute_presentation_workflow)"""
+        crew = None
+        try:
+            check_cancelled()
+            crew = self.create_presentation_crew(topic, text_content)
             result = crew.kickoff()
+            self._log_cache_stats(topic)
+            return self._presentation_success(topic, result, self._get_stage_texts(crew))
+        except Exception as e:
+            return self._presentation_error(topic, e, crew)
+        finally:
+            self._record_stage_metrics(crew, topic, "presentation")
 
-            return {
-                "success": True,
-                "topic": topic,
-                "content_type": "presentation",
-                "result": result,
-                "message": "Presentation created successfully",
-            }
+    async def aexecute_presentation_workflow(
+        self,
+        topic: str,
+        text_content: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> WorkflowResult:
+        """
+        Async variant of execute_presentation_workflow
+
+        Args:
+            topic: The presentation topic
+            text_content: Optional existing content to convert (if None, will research first)
+            timeout: Deadline in seconds (see aexecute_research_workflow)
+
+        Returns:
+            WorkflowResult: The presentation, stage texts and a metrics summary
+        """
+        start = time.time()
+        token = workflow_token(timeout)
+        with cancel_scope(token), collect_stage_events() as events:
+            result = await self._await_with_deadline(
+                self._arun_presentation_workflow(topic, text_content), token, topic, "presentation"
+            )
+        return result.with_metrics(summarize_stages(events, time.time() - start))
+
+    async def _arun_presentation_workflow(
+        self, topic: str, text_content: Optional[str]
+    ) -> WorkflowResult:
+        """Run the presentation workflow on the event loop"""
+        crew = None
+        try:
+            check_cancelled()
+            crew = self.create_presentation_crew(topic, text_content)
+            result = await crew.akickoff()
+            await asyncio.to_thread(self._log_cache_stats, topic)
+            return self._presentation_success(topic, result, self._get_stage_texts(crew))
         except Exception as e:
-            return {
-                "success": False,
-                "topic": topic,
-                "content_type": "presentation",
-                "result": None,
-                "message": f"Error during presentation creation: {str(e)}",
-            }
+            return self._presentation_error(topic, e, crew)
+        finally:
+            self._record_stage_metrics(crew, topic, "presentation")
+
+    @staticmethod
+    def _presentation_success(
+        topic: str, result: Any, stages: Optional[Dict[str, Any]] = None
+    ) -> WorkflowResult:
+        """Build the successful presentation workflow result"""
+        return WorkflowResult.create(
+            True,
+            topic,
+            "presentation",
+            result,
+            "Presentation created successfully",
+            stages=stages,
+        )
+
+    @classmethod
+    def _presentation_error(
+        cls, topic: str, error: Exception, crew: Optional[Crew] = None
+    ) -> WorkflowResult:
+        """Build the failed (or timed out) presentation workflow result"""
+        cancelled = find_cancellation(error)
+        if cancelled is not None:
+            return cls._interrupted(
+                topic, "presentation", cancelled, cls._get_stage_texts(crew) if crew else None
+            )
+        return WorkflowResult.failed(
+            topic,
+            "presentation",
+            f"Error during presentation creation: {str(error)}",
+            error=str(error),
+        )
+
+    @staticmethod
+    def _interrupted(
+        topic: str,
+        content_type: str,
+        cancelled: WorkflowCancelled,
+        stages: Optional[Dict[str, Any]] = None,
+    ) -> WorkflowResult:
+        """Build the result of a workflow stopped by its deadline or a cancel"""
+        finished = ", ".join(name for name, text in (stages or {}).items() if text)
+        logger.warning(
+            f"⏱️  '{topic}' stopped ({cancelled.status}): {cancelled}"
+            + (f"; keeping finished stages: {finished}" if finished else "")
+        )
+        return WorkflowResult.interrupted(
+            topic, content_type, cancelled.status, str(cancelled), stages
+        )
+
+    def _lookup_cached_research(self, topic: str) -> Optional[str]:
+        """
+        Find reusable research for a near-duplicate topic
+
+        Args:
+            topic: The topic about to be researched
+
+        Returns:
+            Cached research text, or None if the research stage must run
+        """
+        if not self.semantic_cache:
+            return None
+
+        try:
+            match = self.semantic_cache.lookup(topic)
+        except Exception as e:
+            logger.warning(f"⚠️  Semantic cache lookup failed: {str(e)}")
+            return None
+
+        if not match:
+            return None
+
+        logger.info(
+            f"🧠 Reusing research from '{match['topic']}' for '{topic}' "
+            f"(similarity {match['similarity']:.2f})"
+        )
+        return match["research"]
+
+    def _index_research(self, topic: str, research: Optional[Any]) -> None:
+        """Add fresh research to the semantic index (best effort)"""
+        if not research or not self.semantic_cache:
+            return
+
+        try:
+            self.semantic_cache.store(topic, str(research))
+        except Exception as e:
+            logger.warning(f"⚠️  Could not index research: {str(e)}")
+
+    @classmethod
+    def _get_research_output(cls, crew: Crew) -> Optional[Any]:
+        """Get the raw output of the crew's (merged) research task"""
+        tasks = getattr(crew, "tasks", None)
+        if not isinstance(tasks, list):
+            return None
+
+        for index, task in enumerate(tasks):
+            if getattr(task, "name", None) == "research":
+                return cls._get_task_output(crew, index)
+        return None
+
+    @classmethod
+    def _get_stage_texts(cls, crew: Crew) -> Dict[str, Any]:
+        """Get the raw output of each named stage task (facet notes are skipped)"""
+        tasks = getattr(crew, "tasks", None)
+        if not isinstance(tasks, list):
+            return {}
+
+        stages = {}
+        for index, task in enumerate(tasks):
+            name = getattr(task, "name", None)
+            if name in STAGES:
+                stages[name] = cls._get_task_output(crew, index)
+        return stages
+
+    @staticmethod
+    def _get_task_output(crew: Crew, index: int) -> Optional[Any]:
+        """
+        Get the raw output of one of the crew's tasks
+
+        Args:
+            crew: Crew that has been kicked off
+            index: Task index (negative indexes count from the end)
+
+        Returns:
+            The task's raw output, or None if unavailable
+        """
+        tasks = getattr(crew, "tasks", None)
+        if not isinstance(tasks, list) or not -len(tasks) <= index < len(tasks):
+            return None
+
+        output = getattr(tasks[index], "output", None)
+        if output is None:
+            return None
+        return output.raw if hasattr(output, "raw") else output
+
+    def _record_stage_metrics(
+        self, crew: Optional[Crew], topic: str, content_type: str
+    ) -> None:
+        """Record latency, tokens and cost for each task of a finished crew"""
+        if crew is None or not config.metrics.enabled:
+            return
+
+        try:
+            metrics.record_crew(crew, topic, content_type, model=self.model_name)
+        except Exception as e:
+            logger.warning(f"⚠️  Could not record stage metrics: {str(e)}")
+
+    def _log_cache_stats(self, topic: str) -> None:
+        """Log LLM response cache hit/miss counters after a workflow"""
+        if not self.cache:
+            return
+
+        stats = self.cache.stats()
+        logger.info(
+            f"💾 LLM cache after '{topic}': {stats['hits']} hits, "
+            f"{stats['misses']} misses ({stats['hit_rate']:.0%} hit rate), "
+            f"{stats['entries']} entries, {stats['evictions']} evictions"
+        )
 
     def _get_presentation_task_description(self) -> str:
         """Get the task description for presentation creation"""
@@ -0,0 +1,228 @@
+"""
+Deadlines - Workflow, stage and batch deadlines with cooperative cancellation
+A CancelToken is active for the code running a workflow; every agent LLM
+call checks it (and the deadline of its stage) first, so a stuck or
+cancelled crew stops at its next call instead of holding a worker forever
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from src.config import config
+from src.lazy_imports import moved_attributes
+
+
+class WorkflowCancelled(Exception):
+    """A workflow was cancelled before it finished"""
+
+    status = "cancelled"
+
+
+class WorkflowTimeout(WorkflowCancelled):
+    """A workflow, stage or batch ran past its deadline"""
+
+    status = "timeout"
+
+
+class CancelToken:
+    """
+    Cancellation flag with an optional deadline
+
+    Tokens form a tree: a workflow token is the child of its batch token,
+    so cancelling or timing out the batch stops every workflow in it.
+    Deadlines use time.monotonic().
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        parent: Optional["CancelToken"] = None,
+        label: str = "workflow",
+    ):
+        """
+        Initialize the token
+
+        Args:
+            timeout: Seconds until the deadline (None = no deadline of its own)
+            parent: Token whose cancellation and deadline also apply
+            label: Name used in timeout messages ('workflow', 'batch', ...)
+        """
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.parent = parent
+        self.label = label
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Cancel the token and every child token"""
+        self.reason = reason
+        self._event.set()
+
+    @property
+    def expired(self) -> bool:
+        """Whether this token's own deadline has passed"""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether work under this token must stop (cancelled or past a deadline)"""
+        if self._event.is_set() or self.expired:
+            return True
+        return self.parent is not None and self.parent.cancelled
+
+    def remaining(self) -> Optional[float]:
+        """
+        Seconds left until the nearest deadline of the token or its parents
+
+        Returns:
+            float: Seconds (0 once passed), or None without any deadline
+        """
+        remaining = None if self.deadline is None else max(0.0, self.deadline - time.monotonic())
+        if self.parent is not None:
+            parent_remaining = self.parent.remaining()
+            if parent_remaining is not None:
+                remaining = parent_remaining if remaining is None else min(remaining, parent_remaining)
+        return remaining
+
+    def check(self) -> None:
+        """
+        Raise if work under this token must stop
+
+        Raises:
+            WorkflowTimeout: If this token or a parent is past its deadline
+            WorkflowCancelled: If this token or a parent was cancelled
+        """
+        if self.parent is not None:
+            self.parent.check()
+        if self._event.is_set():
+            raise WorkflowCancelled(f"{self.label.capitalize()} {self.reason}")
+        if self.expired:
+            raise WorkflowTimeout(f"{self.label.capitalize()} deadline of {self.timeout:g}s exceeded")
+
+    def child(self, timeout: Optional[float] = None, label: str = "workflow") -> "CancelToken":
+        """Create a token that is cancelled with this one (and may expire sooner)"""
+        return CancelToken(timeout, parent=self, label=label)
+
+
+# Token of the workflow running in the current thread/task
+_active: ContextVar[Optional[CancelToken]] = ContextVar("cancel_token", default=None)
+
+
+def current_token() -> Optional[CancelToken]:
+    """Token of the workflow running in the current context, if any"""
+    return _active.get()
+
+
+@contextmanager
+def cancel_scope(token: Optional[CancelToken]) -> Iterator[Optional[CancelToken]]:
+    """
+    Make a token the active one for the block (None leaves the active token)
+
+    The token follows asyncio tasks and asyncio.to_thread; plain threads
+    need contextvars.copy_context() to see it.
+    """
+    if token is None:
+        yield current_token()
+        return
+
+    reset = _active.set(token)
+    try:
+        yield token
+    finally:
+        _active.reset(reset)
+
+
+def workflow_token(timeout: Optional[float] = None) -> Optional[CancelToken]:
+    """
+    Token for a workflow about to start in the current context
+
+    A workflow started inside a batch uses the batch's workflow token;
+    otherwise it gets WORKFLOW_TIMEOUT_SECONDS.
+
+    Args:
+        timeout: Deadline in seconds (overrides the default)
+
+    Returns:
+        CancelToken, or None if there is no deadline at all
+    """
+    parent = current_token()
+    if timeout is None:
+        if parent is not None:
+            return parent
+        timeout = config.deadlines.workflow_timeout
+    if not timeout and parent is None:
+        return None
+    return CancelToken(timeout or None, parent=parent)
+
+
+def stage_timeout(stage: Optional[str]) -> Optional[float]:
+    """Configured deadline of a stage in seconds (None = only the workflow deadline)"""
+    if not stage:
+        return None
+    # Map-reduce facet tasks ('research_facet') share the research deadline
+    return getattr(config.deadlines, f"{stage.split('_')[0]}_timeout", 0) or None
+
+
+@contextmanager
+def stage_deadline(stage: str) -> Iterator[Optional[CancelToken]]:
+    """Apply a stage's deadline to the code in the block"""
+    timeout = stage_timeout(stage)
+    if timeout is None:
+        yield current_token()
+        return
+
+    parent = current_token()
+    token = CancelToken(timeout, parent=parent, label=f"{stage} stage")
+    with cancel_scope(token):
+        yield token
+
+
+def check_cancelled(stage: Optional[str] = None, started: Optional[float] = None) -> None:
+    """
+    Raise if the active workflow or a running stage must stop
+
+    Args:
+        stage: Stage of the caller (its deadline is checked when started is given)
+        started: time.time() the stage started
+
+    Raises:
+        WorkflowCancelled: If the work must stop (WorkflowTimeout for deadlines)
+    """
+    token = current_token()
+    if token is not None:
+        token.check()
+
+    timeout = stage_timeout(stage)
+    if timeout and started is not None and time.time() - started > timeout:
+        raise WorkflowTimeout(f"{stage.capitalize()} stage deadline of {timeout:g}s exceeded")
+
+
+def find_cancellation(error: BaseException) -> Optional[WorkflowCancelled]:
+    """
+    Find the cancellation behind an error
+
+    CrewAI re-raises agent errors wrapped in its own exceptions, so the
+    cause/context chain is searched.
+
+    Returns:
+        WorkflowCancelled, or None if the error is an ordinary failure
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, WorkflowCancelled):
+            return error
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return None
+
+
+def interruption(status: str, message: str) -> WorkflowCancelled:
+    """Exception matching a result status ('timeout' or 'cancelled')"""
+    return WorkflowTimeout(message) if status == WorkflowTimeout.status else WorkflowCancelled(message)
+
+
+# DeadlineLLM subclasses a CrewAI class; it sits with the other LLM layers
+__getattr__ = moved_attributes(__name__, {"DeadlineLLM": "src.llm_wrappers"})
@@ -0,0 +1,506 @@
+"""
+Fake LLM - Offline stand-in provider for benchmarks and load tests
+Replays cassettes recorded from real crew runs or synthesizes outputs of
+the right shape, with configurable latency, error and 429 injection
+"""
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional
+
+from crewai.llms.base_llm import BaseLLM
+
+from src.config import config
+from src.llm_wrappers import DelegatingLLM, usage_scope
+from src.logger import logger
+
+
+class FakeProviderError(Exception):
+    """Synthetic provider failure shaped like the SDK errors"""
+
+    def __init__(self, message: str, status_code: int = 500, retry_after: Optional[float] = None):
+        super().__init__(f"Error code: {status_code} - {message}")
+        self.status_code = status_code
+        headers = {"retry-after": f"{retry_after:g}"} if retry_after is not None else {}
+        self.response = SimpleNamespace(status_code=status_code, headers=headers)
+
+
+class LatencyModel:
+    """
+    Log-normal latency distribution fitted to a median and a 99th percentile
+    """
+
+    # z-score of the 99th percentile of a standard normal distribution
+    _Z99 = 2.3263
+
+    def __init__(self, p50: float, p99: float, time_scale: float = 1.0):
+        """
+        Initialize the latency model
+
+        Args:
+            p50: Median latency in seconds
+            p99: 99th percentile latency in seconds
+            time_scale: Multiplier applied to every sample (e.g. 0.01 for fast runs)
+        """
+        self.p50 = p50
+        self.p99 = max(p99, p50)
+        self.time_scale = time_scale
+        self._mu = math.log(p50) if p50 > 0 else None
+        self._sigma = math.log(self.p99 / p50) / self._Z99 if p50 > 0 else 0.0
+
+    def sample(self) -> float:
+        """Draw one latency in seconds (already scaled)"""
+        if self._mu is None:
+            return 0.0
+        return random.lognormvariate(self._mu, self._sigma) * self.time_scale
+
+
+def prompt_key(messages: Any) -> str:
+    """
+    Hash a prompt the same way before and after prompt caching marks it
+
+    Args:
+        messages: Prompt string or list of role/content message dicts
+
+    Returns:
+        str: Hex digest identifying the prompt
+    """
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+
+    parts = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list):
+            content = "".join(
+                block.get("text", "") if isinstance(block, dict) else str(block)
+                for block in content
+            )
+        parts.append(f"{message.get('role')}\x1f{content}")
+    return hashlib.sha256("\x1e".join(parts).encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """
+    JSONL file of recorded prompt/response pairs
+    """
+
+    def __init__(self, path: str):
+        """
+        Load a cassette (a missing file is an empty cassette)
+
+        Args:
+            path: JSONL file path
+        """
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if Path(path).exists():
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["key"]] = entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, messages: Any) -> Optional[Dict[str, Any]]:
+        """Look up the recorded entry for a prompt"""
+        return self._entries.get(prompt_key(messages))
+
+    def record(
+        self,
+        messages: Any,
+        response: str,
+        model: Optional[str] = None,
+        usage: Optional[Dict[str, int]] = None,
+        latency_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Append a prompt/response pair
+
+        Args:
+            messages: Prompt as sent by the agent
+            response: Text the provider returned
+            model: Model that answered
+            usage: Token usage of the call
+            latency_seconds: Wall-clock time of the call
+        """
+        entry = {
+            "key": prompt_key(messages),
+            "model": model,
+            "response": response,
+            "usage": usage or {},
+            "latency_seconds": latency_seconds,
+        }
+        with self._lock:
+            self._entries[entry["key"]] = entry
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+_cassettes: Dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: str) -> Cassette:
+    """Get the process-wide cassette for a path"""
+    with _cassettes_lock:
+        if path not in _cassettes:
+            _cassettes[path] = Cassette(path)
+        return _cassettes[path]
+
+
+# Calls in flight per simulated provider (for concurrency-limit 429s)
+_in_flight: Dict[str, int] = {}
+_in_flight_lock = threading.Lock()
+
+
+def _detect_stage(messages: Any, from_task: Any = None) -> str:
+    """Work out which workflow stage a prompt belongs to"""
+    name = getattr(from_task, "name", None)
+    if name:
+        return name
+
+    text = (messages if isinstance(messages, str) else json.dumps(messages, default=str)).lower()
+    if "write this section" in text:
+        return "section"
+    if "output only the outline" in text:
+        return "outline"
+    if "# slide" in text or "presentation" in text:
+        return "presentation"
+    if "final verdict" in text or ("review" in text and "score" in text):
+        return "review"
+    if "blog post" in text or "write" in text:
+        return "writing"
+    return "research"
+
+
+def _detect_topic(messages: Any) -> str:
+    text = messages if isinstance(messages, str) else json.dumps(messages, default=str)
+    match = re.search(r"Topic:\s*([^\n\\]+)", text)
+    return match.group(1).strip() if match else "the topic"
+
+
+def _detect_section(messages: Any) -> str:
+    text = messages if isinstance(messages, str) else json.dumps(messages, default=str)
+    match = re.search(r"Write this section[^#]*## ([^\n\\]+)", text)
+    return match.group(1).strip() if match else "Section"
+
+
+def synthesize_response(stage: str, topic: str, words: int = 300) -> str:
+    """
+    Build a plausible stage output with the structure downstream code expects
+
+    Args:
+        stage: 'research', 'writing', 'review' or 'presentation'
+        topic: Topic to mention
+        words: Approximate length of the body text
+
+    Returns:
+        str: Markdown text
+    """
+    filler = (
+        f"{topic} keeps evolving as teams adopt new tools, measure results and "
+        "share what works in production. "
+    )
+    paragraph = (filler * max(1, words // (len(filler.split()) * 4))).strip()
+
+    if stage == "outline":
+        headings = ["Introduction", "Background", "How It Works", "Step-by-Step Guide",
+                    "Results and Examples", "Conclusion"]
+        body = "\n".join(f"## {heading}\n- What the {heading.lower()} covers" for heading in headings)
+        return f"# {topic}: What You Need to Know\n\n{body}"
+
+    if stage == "presentation":
+        slides = [f"# Slide 1: {topic}\n\n{filler.strip()}"]
+        for n, title in enumerate(
+            ["Overview", "Key Concepts", "Applications", "Challenges", "Best Practices",
+             "Outlook", "Key Takeaways", "Questions"], 2
+        ):
+            slides.append(f"# Slide {n}: {title}\n\n- {filler.strip()}\n- Point two\n- Point three")
+        return "\n\n---\n\n".join(slides)
+
+    if stage == "review":
+        return (
+            f"## Review of '{topic}'\n\nThe content is accurate and well structured.\n\n"
+            "Quality score: 8/10\n\nFinal verdict: Approve"
+        )
+
+    if stage == "writing":
+        sections = ["Introduction", "Background", "Key Developments", "Practical Applications",
+                    "Challenges", "Future Outlook", "Conclusion"]
+        body = "\n\n".join(f"## {section}\n\n{paragraph}" for section in sections)
+        return f"# {topic}: What You Need to Know\n\n{body}"
+
+    facets = ["Current Trends", "Fundamentals", "Technical Details", "Applications",
+              "Best Practices", "Challenges", "Future Outlook"]
+    return "\n\n".join(f"## {facet}\n\n- {paragraph}" for facet in facets)
+
+
+class FakeLLM(BaseLLM):
+    """
+    CrewAI LLM that answers without network access
+
+    Replays a cassette when one is configured (falling back to synthesized
+    output on a miss unless strict), otherwise synthesizes outputs. Every
+    call sleeps a sampled latency and may fail with an injected error or
+    429, so the rate limiter and retry paths run as they would live.
+    """
+
+    def __init__(
+        self,
+        model: str = "fake-model",
+        temperature: Optional[float] = None,
+        provider: str = "openai",
+        p50: Optional[float] = None,
+        p99: Optional[float] = None,
+        time_scale: Optional[float] = None,
+        error_rate: Optional[float] = None,
+        rate_limit_rate: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        cassette_path: Optional[str] = None,
+        strict: Optional[bool] = None,
+        output_words: Optional[int] = None,
+        **kwargs,
+    ):
+        """
+        Initialize the fake provider (unset options come from FakeLLMConfig)
+
+        Args:
+            model: Model name reported to CrewAI and the metrics
+            temperature: Ignored; kept for pool keys and metrics
+            provider: Provider being simulated ('anthropic' or 'openai')
+            p50: Median latency in seconds
+            p99: 99th percentile latency in seconds
+            time_scale: Multiplier for every latency
+            error_rate: Fraction of calls failing with a 500
+            rate_limit_rate: Fraction of calls failing with a 429
+            max_concurrency: Calls in flight above this get a 429 (0 = unlimited)
+            retry_after: Retry-After seconds sent with injected 429s
+            cassette_path: JSONL cassette to replay (None = synthesize)
+            strict: Raise on a cassette miss instead of synthesizing
+            output_words: Approximate length of synthesized bodies
+            **kwargs: Extra LangChain-style options (api_key, max_tokens, ...), ignored
+        """
+        super().__init__(model=model, temperature=temperature, provider=provider)
+        settings = config.fake_llm
+
+        def pick(value, default):
+            return default if value is None else value
+
+        self.latency = LatencyModel(
+            pick(p50, settings.p50_seconds),
+            pick(p99, settings.p99_seconds),
+            pick(time_scale, settings.time_scale),
+        )
+        self.error_rate = pick(error_rate, settings.error_rate)
+        self.rate_limit_rate = pick(rate_limit_rate, settings.rate_limit_rate)
+        self.max_concurrency = pick(max_concurrency, settings.max_concurrency)
+        self.retry_after = pick(retry_after, settings.retry_after_seconds)
+        self.strict = pick(strict, settings.strict)
+        self.output_words = pick(output_words, settings.output_words)
+
+        if cassette_path is None and settings.mode == "replay":
+            cassette_path = settings.cassette_path
+        self.cassette = get_cassette(cassette_path) if cassette_path else None
+
+        self.calls = 0
+        self.cassette_hits = 0
+        self.injected_errors = 0
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _enter(self) -> None:
+        """Apply error injection and the simulated concurrency limit"""
+        self._count("calls")
+        with _in_flight_lock:
+            in_flight = _in_flight.get(self.provider, 0)
+            over_limit = bool(self.max_concurrency) and in_flight >= self.max_concurrency
+            if not over_limit:
+                _in_flight[self.provider] = in_flight + 1
+
+        roll = random.random()
+        error = None
+        if over_limit or roll < self.rate_limit_rate:
+            error = FakeProviderError("rate_limit_error", 429, retry_after=self.retry_after)
+        elif roll < self.rate_limit_rate + self.error_rate:
+            error = FakeProviderError("api_error", 500)
+
+        if error is not None:
+            if not over_limit:
+                self._exit()
+            self._count("injected_errors")
+            raise error
+
+    def _exit(self) -> None:
+        with _in_flight_lock:
+            _in_flight[self.provider] -= 1
+
+    def _respond(self, messages: Any, from_task: Any = None) -> Dict[str, Any]:
+        """Pick the response text, usage and latency for a prompt"""
+        entry = self.cassette.get(messages) if self.cassette is not None else None
+        if entry is not None:
+            self._count("cassette_hits")
+            latency = entry.get("latency_seconds")
+            return {
+                "text": entry["response"],
+                "usage": entry.get("usage") or {},
+                "latency": latency * self.latency.time_scale if latency else self.latency.sample(),
+            }
+
+        if self.cassette is not None and self.strict:
+            raise KeyError(f"No cassette entry for prompt {prompt_key(messages)[:12]}")
+
+        stage = _detect_stage(messages, from_task)
+        if stage == "section":
+            text = f"## {_detect_section(messages)}\n\n" + synthesize_response(
+                "research", _detect_topic(messages), self.output_words // 4
+            ).split("\n\n", 2)[1].lstrip("- ")
+        else:
+            text = synthesize_response(stage, _detect_topic(messages), self.output_words)
+        # Agents parse their final answer out of a ReAct-formatted reply
+        if from_task is not None:
+            text = f"Thought: I now know the final answer\nFinal Answer: {text}"
+
+        prompt = messages if isinstance(messages, str) else json.dumps(messages, default=str)
+        return {
+            "text": text,
+            "usage": {"input_tokens": len(prompt) // 4, "output_tokens": len(text) // 4},
+            "latency": self.latency.sample(),
+        }
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        self._enter()
+        try:
+            response = self._respond(messages, from_task)
+            time.sleep(response["latency"])
+        finally:
+            self._exit()
+        self._track_token_usage_internal(response["usage"])
+        return response["text"]
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        self._enter()
+        try:
+            response = self._respond(messages, from_task)
+            await asyncio.sleep(response["latency"])
+        finally:
+            self._exit()
+        self._track_token_usage_internal(response["usage"])
+        return response["text"]
+
+    def stream(self, messages: Any) -> Iterator[SimpleNamespace]:
+        """
+        Stream a response in LangChain chunk shape (used by stream_text)
+
+        Args:
+            messages: Prompt string or list of role/content message dicts
+
+        Yields:
+            Chunks with 'content' and, on the last one, 'usage_metadata'
+        """
+        self._enter()
+        try:
+            response = self._respond(messages)
+            chunks = re.findall(r"\S+\s*", response["text"]) or [response["text"]]
+            delay = response["latency"] / len(chunks)
+            for chunk in chunks:
+                time.sleep(delay)
+                yield SimpleNamespace(content=chunk, usage_metadata=None)
+        finally:
+            self._exit()
+        yield SimpleNamespace(content="", usage_metadata=dict(response["usage"]))
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def stats(self) -> Dict[str, int]:
+        """Call, cassette hit and injected error counts"""
+        with self._stats_lock:
+            return {
+                "calls": self.calls,
+                "cassette_hits": self.cassette_hits,
+                "injected_errors": self.injected_errors,
+            }
+
+
+class RecordingLLM(DelegatingLLM):
+    """
+    CrewAI LLM layer that records every real response into a cassette
+    """
+
+    def __init__(self, inner: Any, cassette: Cassette, **kwargs):
+        """
+        Initialize the recorder
+
+        Args:
+            inner: LLM to call
+            cassette: Cassette the responses are appended to
+            **kwargs: Passed to DelegatingLLM
+        """
+        super().__init__(inner, **kwargs)
+        self.cassette = cassette
+
+    def _record(self, messages: Any, response: Any, usage: Dict[str, int], start: float) -> None:
+        if isinstance(response, str):
+            self.cassette.record(
+                messages, response, model=self.model, usage=dict(usage),
+                latency_seconds=round(time.monotonic() - start, 3),
+            )
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        start = time.monotonic()
+        with usage_scope() as usage:
+            response = super().call(messages, tools, callbacks, available_functions,
+                                    from_task, from_agent, response_model)
+        self._record(messages, response, usage, start)
+        return response
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        start = time.monotonic()
+        with usage_scope() as usage:
+            response = await super().acall(messages, tools, callbacks, available_functions,
+                                           from_task, from_agent, response_model)
+        self._record(messages, response, usage, start)
+        return response
+
+    def stream_text(
+        self, messages: Any, usage: Optional[Dict[str, int]] = None
+    ) -> Iterator[str]:
+        start = time.monotonic()
+        usage = usage if usage is not None else {"input_tokens": 0, "output_tokens": 0}
+        chunks: List[str] = []
+        for chunk in super().stream_text(messages, usage=usage):
+            chunks.append(chunk)
+            yield chunk
+        self._record(messages, "".join(chunks), usage, start)
+
+
+def log_fake_mode() -> None:
+    """Log that LLM calls are served offline"""
+    settings = config.fake_llm
+    source = f"cassette {settings.cassette_path}" if settings.mode == "replay" else "synthesized output"
+    logger.info(
+        f"🧪 Fake LLM provider: {source}, latency p50={settings.p50_seconds}s "
+        f"p99={settings.p99_seconds}s x{settings.time_scale}, errors={settings.error_rate:.0%}, "
+        f"429s={settings.rate_limit_rate:.0%}"
+    )
@@ -0,0 +1,373 @@
+"""
+Hedged Requests - Duplicate slow LLM calls to cut tail latency
+A call still running after its stage's p95 latency gets a second, identical
+request; the first response wins and the other attempt is cancelled. Both
+attempts go through the layers below (the shared rate limiter included), and
+the metrics compare the tail with and without hedging against the extra spend
+"""
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Dict, Optional, Tuple
+
+from src.config import config
+from src.llm_wrappers import DelegatingLLM, usage_scope
+from src.logger import logger
+from src.metrics import MetricsCollector, metrics, percentile
+from src.worker_pool import WorkerPool
+
+
+class HedgePolicy:
+    """
+    Decides when a call is worth a duplicate request
+
+    Latencies are tracked per (stage, model), since research and writing
+    calls take very different times. A call is hedged once it has been
+    running for the configured percentile of its kind's latency, and at most
+    `max_ratio` of all calls are hedged so a slow provider does not double
+    the load on itself.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        min_delay: float = 2.0,
+        max_ratio: float = 0.1,
+        sample_size: int = 200,
+    ):
+        """
+        Initialize the policy
+
+        Args:
+            percentile: Latency percentile after which a call is hedged
+            min_samples: Calls of a kind needed before its calls are hedged
+            min_delay: Shortest wait before hedging, in seconds
+            max_ratio: Largest share of calls that may be hedged
+            sample_size: Recent latencies kept per kind of call
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.sample_size = sample_size
+        self._lock = threading.Lock()
+        self._latencies: Dict[Tuple[str, str], deque] = {}
+        self.calls = 0
+        self.hedges = 0
+
+    def start_call(self, key: Tuple[str, str]) -> Optional[float]:
+        """
+        Count a call and get how long to wait before hedging it
+
+        Args:
+            key: (stage, model) of the call
+
+        Returns:
+            float: Seconds to wait, or None until the kind has enough samples
+        """
+        with self._lock:
+            self.calls += 1
+            latencies = self._latencies.get(key, ())
+            # A kind with no samples yet has no latency to hedge after (HEDGE_MIN_SAMPLES=0)
+            if not latencies or len(latencies) < self.min_samples:
+                return None
+            return max(self.min_delay, percentile(latencies, self.percentile))
+
+    def try_hedge(self) -> bool:
+        """Take one hedge from the budget (False once max_ratio of calls were hedged)"""
+        with self._lock:
+            if self.hedges + 1 > self.max_ratio * self.calls:
+                return False
+            self.hedges += 1
+            return True
+
+    def record_latency(self, key: Tuple[str, str], latency: float) -> None:
+        """
+        Record how long the first attempt of a call took
+
+        Args:
+            key: (stage, model) of the call
+            latency: Seconds (time until cancellation for cancelled attempts)
+        """
+        with self._lock:
+            self._latencies.setdefault(key, deque(maxlen=self.sample_size)).append(latency)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the hedge budget and current hedge delays
+
+        Returns:
+            Dict with calls, hedges and the delay per 'stage/model'
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hedges": self.hedges,
+                "delays": {
+                    f"{stage}/{model}": percentile(latencies, self.percentile)
+                    for (stage, model), latencies in self._latencies.items()
+                    if len(latencies) >= self.min_samples
+                },
+            }
+
+
+def _first_success(futures: list) -> Tuple[Any, set]:
+    """Wait for the first attempt that succeeds (raises the first error if all fail)"""
+    pending, error = set(futures), None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future, pending
+            error = error or future.exception()
+    raise error
+
+
+async def _afirst_success(tasks: list) -> Tuple[Any, set]:
+    """Async variant of _first_success() for asyncio tasks"""
+    pending, error = set(tasks), None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                return task, pending
+            error = error or task.exception()
+    raise error
+
+
+class _HedgedCall:
+    """Bookkeeping of one call's attempts; the callbacks run as attempts settle"""
+
+    def __init__(self, llm: "HedgedLLM", stage: str):
+        self.llm = llm
+        self.stage = stage
+        self.start = time.monotonic()
+
+    def primary_done(self, future: Any) -> None:
+        """Record the first attempt's latency, even if it lost"""
+        failed = not future.cancelled() and future.exception() is not None
+        if failed:
+            latency = time.monotonic() - self.start
+        else:
+            latency = future.result()[2] if not future.cancelled() else time.monotonic() - self.start
+            self.llm.policy.record_latency((self.stage, self.llm.model), latency)
+        self.llm.collector.record_unhedged_latency(self.stage, self.llm.model, latency)
+
+    def discard(self, future: Any) -> None:
+        """Record the tokens of a losing attempt that still finished"""
+        if not future.cancelled() and future.exception() is None:
+            self.llm.collector.record_hedge_spend(self.stage, self.llm.model, future.result()[1])
+
+    def finish(self, winner: Any, attempts: list, losers: set) -> Any:
+        """Record the call, discard the losers and return the winning response"""
+        hedged = len(attempts) > 1
+        self.llm.collector.record_hedged_call(
+            self.stage, self.llm.model, time.monotonic() - self.start,
+            hedged=hedged, won=winner is not attempts[0],
+        )
+        for loser in losers:
+            loser.add_done_callback(self.discard)
+            loser.cancel()
+
+        response, usage, _ = winner.result()
+        # Only the winner's tokens belong to the calling task
+        with usage_scope() as scope:
+            for name, value in usage.items():
+                scope[name] = scope.get(name, 0) + value
+        return response
+
+
+class HedgedLLM(DelegatingLLM):
+    """
+    CrewAI LLM layer that fires a duplicate request for unusually slow calls
+
+    Sync calls run their first attempt on a thread of its own and the
+    duplicate on a shared thread pool, and the caller returns with whichever
+    answers first. A losing sync attempt that has already started cannot be
+    interrupted, so it finishes in the background and its response is
+    discarded (async losers are cancelled outright). Calls that may execute
+    tools (available_functions) are never duplicated, since the tools would
+    run twice.
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        policy: Optional[HedgePolicy] = None,
+        pool: Optional[WorkerPool] = None,
+        collector: Optional[MetricsCollector] = None,
+        **kwargs,
+    ):
+        """
+        Initialize the hedged LLM
+
+        Args:
+            inner: LLM to call (usually a RateLimitedLLM, so hedges share its budget)
+            policy: Hedge policy (defaults to the process-wide one)
+            pool: Pool for sync duplicates (defaults to the process-wide one)
+            collector: Metrics collector (defaults to the global one)
+            **kwargs: Passed to DelegatingLLM
+        """
+        super().__init__(inner, **kwargs)
+        self._policy = policy
+        self._pool = pool
+        self._collector = collector
+
+    @property
+    def policy(self) -> HedgePolicy:
+        return self._policy or get_hedge_policy()
+
+    @property
+    def pool(self) -> WorkerPool:
+        return self._pool or get_hedge_pool()
+
+    @property
+    def collector(self) -> MetricsCollector:
+        return self._collector or metrics
+
+    @staticmethod
+    def _stage(from_task: Any) -> str:
+        return getattr(from_task, "name", None) or "default"
+
+    def _hedge_delay(self, stage: str, available_functions: Any) -> Optional[float]:
+        """Seconds to wait before hedging, or None to make a plain call"""
+        if available_functions:
+            return None
+        return self.policy.start_call((stage, self.model))
+
+    def _record_plain(self, stage: str, latency: float) -> None:
+        """Record a call that was not eligible for hedging yet"""
+        self.policy.record_latency((stage, self.model), latency)
+        self.collector.record_hedged_call(stage, self.model, latency)
+        self.collector.record_unhedged_latency(stage, self.model, latency)
+
+    def _log_hedge(self, stage: str, delay: float) -> None:
+        logger.debug(f"⚡ Hedging slow {stage} call to {self.model} after {delay:.1f}s")
+
+    def _attempt(self, args: tuple) -> Tuple[Any, Dict[str, int], float]:
+        start = time.monotonic()
+        with usage_scope(detached=True) as usage:
+            response = super().call(*args)
+        return response, usage, time.monotonic() - start
+
+    async def _aattempt(self, args: tuple) -> Tuple[Any, Dict[str, int], float]:
+        start = time.monotonic()
+        with usage_scope(detached=True) as usage:
+            response = await super().acall(*args)
+        return response, usage, time.monotonic() - start
+
+    def _submit(self, args: tuple) -> Any:
+        # Attempts see the caller's cancel token and other context
+        return self.pool.submit(contextvars.copy_context().run, self._attempt, args)
+
+    def _start_primary(self, args: tuple) -> Future:
+        """
+        Run the first attempt of a sync call on a thread of its own
+
+        Every hedge-eligible call has a first attempt, so these do not queue
+        behind HEDGE_WORKERS; the caller stays free to return a duplicate's
+        response while a slow first attempt is still running.
+        """
+        future: Future = Future()
+        context = contextvars.copy_context()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(context.run(self._attempt, args))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name="llm-attempt", daemon=True).start()
+        return future
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        args = (messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+        stage = self._stage(from_task)
+        delay = self._hedge_delay(stage, available_functions)
+        if delay is None:
+            start = time.monotonic()
+            response = super().call(*args)
+            self._record_plain(stage, time.monotonic() - start)
+            return response
+
+        call = _HedgedCall(self, stage)
+        attempts = [self._start_primary(args)]
+        attempts[0].add_done_callback(call.primary_done)
+        if not wait(attempts, timeout=delay).done and self.policy.try_hedge():
+            self._log_hedge(stage, delay)
+            attempts.append(self._submit(args))
+
+        winner, losers = _first_success(attempts)
+        return call.finish(winner, attempts, losers)
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        args = (messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+        stage = self._stage(from_task)
+        delay = self._hedge_delay(stage, available_functions)
+        if delay is None:
+            start = time.monotonic()
+            response = await super().acall(*args)
+            self._record_plain(stage, time.monotonic() - start)
+            return response
+
+        call = _HedgedCall(self, stage)
+        attempts = [asyncio.create_task(self._aattempt(args))]
+        attempts[0].add_done_callback(call.primary_done)
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done and self.policy.try_hedge():
+                self._log_hedge(stage, delay)
+                attempts.append(asyncio.create_task(self._aattempt(args)))
+
+            winner, losers = await _afirst_success(attempts)
+            return call.finish(winner, attempts, losers)
+        finally:
+            # The caller was cancelled (or every attempt failed)
+            for attempt in attempts:
+                attempt.cancel()
+
+
+_policy: Optional[HedgePolicy] = None
+_pool: Optional[WorkerPool] = None
+_lock = threading.Lock()
+
+
+def get_hedge_policy() -> HedgePolicy:
+    """
+    Get the process-wide hedge policy
+
+    Returns:
+        HedgePolicy: Policy configured from HedgingConfig
+    """
+    global _policy
+    with _lock:
+        if _policy is None:
+            _policy = HedgePolicy(
+                percentile=config.hedging.percentile,
+                min_samples=config.hedging.min_samples,
+                min_delay=config.hedging.min_delay,
+                max_ratio=config.hedging.max_ratio,
+            )
+        return _policy
+
+
+def get_hedge_pool() -> WorkerPool:
+    """
+    Get the process-wide pool that runs the duplicates of sync calls
+
+    Returns:
+        WorkerPool: Pool with HEDGE_WORKERS threads
+    """
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = WorkerPool(config.hedging.workers, name="llm-hedge")
+        return _pool
@@ -0,0 +1,144 @@
+"""
+Import Time - Start-up profiling with ``python -X importtime``
+Runs a command in a fresh interpreter, parses the import timings it prints
+and flags heavy dependencies (CrewAI, LangChain, Google API client) that a
+lightweight command should not load
+"""
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# Packages that take (hundreds of) milliseconds to seconds to import
+HEAVY_MODULES = (
+    "crewai",
+    "crewai_tools",
+    "langchain_openai",
+    "langchain_anthropic",
+    "langchain_core",
+    "openai",
+    "anthropic",
+    "litellm",
+    "chromadb",
+    "googleapiclient",
+    "google_auth_oauthlib",
+)
+
+ROOT = Path(__file__).parent.parent
+
+
+def parse_import_time(stderr: str) -> List[Dict[str, Any]]:
+    """
+    Parse the ``-X importtime`` report
+
+    Args:
+        stderr: Standard error of the profiled interpreter
+
+    Returns:
+        List of dicts with module, depth (0 = imported by the command
+        itself), self_us and cumulative_us, in import order
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Header line ('self [us] | cumulative | imported package')
+            continue
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        entries.append({
+            "module": module,
+            "depth": (len(name) - len(module) - 1) // 2,
+            "self_us": int(fields[0]),
+            "cumulative_us": int(fields[1]),
+        })
+    return entries
+
+
+def heavy_imports(entries: List[Dict[str, Any]], heavy: Sequence[str] = HEAVY_MODULES) -> List[str]:
+    """Heavy packages among the imported modules"""
+    found = set()
+    for entry in entries:
+        package = entry["module"].split(".")[0]
+        if package in heavy:
+            found.add(package)
+    return sorted(found)
+
+
+def profile_command(
+    args: Sequence[str],
+    repeat: int = 3,
+    env: Optional[Dict[str, str]] = None,
+    timeout: float = 120.0,
+) -> Dict[str, Any]:
+    """
+    Time a command's start-up in fresh interpreters
+
+    The fastest of the runs is kept, so a cold disk cache or a busy
+    machine does not fail the check.
+
+    Args:
+        args: Interpreter arguments, e.g. ['scripts/load_test.py', '--help']
+            or ['-c', 'import src.job_queue']
+        repeat: Runs to make
+        env: Extra environment variables
+        timeout: Seconds a single run may take
+
+    Returns:
+        Dict with wall_ms (process start to exit), import_ms (sum of the
+        command's own imports), heavy (heavy packages loaded), slowest
+        (top-level imports by cumulative time) and returncode
+    """
+    run_env = {**os.environ, **(env or {})}
+    best = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            cwd=ROOT, env=run_env, capture_output=True, text=True, timeout=timeout,
+        )
+        wall = time.perf_counter() - start
+        if best is None or wall < best[0]:
+            best = (wall, result)
+
+    wall, result = best
+    entries = parse_import_time(result.stderr)
+    top_level = [entry for entry in entries if entry["depth"] == 0]
+    slowest = sorted(top_level, key=lambda entry: entry["cumulative_us"], reverse=True)
+    return {
+        "args": list(args),
+        "returncode": result.returncode,
+        "wall_ms": round(wall * 1000, 1),
+        "import_ms": round(sum(entry["cumulative_us"] for entry in top_level) / 1000, 1),
+        "modules": len(entries),
+        "heavy": heavy_imports(entries),
+        "slowest": [
+            {"module": entry["module"], "cumulative_ms": round(entry["cumulative_us"] / 1000, 1)}
+            for entry in slowest[:10]
+        ],
+    }
+
+
+def check_profile(profile: Dict[str, Any], budget_ms: Optional[float] = None) -> List[str]:
+    """
+    Problems found in a start-up profile
+
+    Args:
+        profile: Result of profile_command()
+        budget_ms: Highest acceptable wall time (None = not checked)
+
+    Returns:
+        List of problem descriptions (empty = passed)
+    """
+    problems = []
+    if profile["returncode"] != 0:
+        problems.append(f"exited with status {profile['returncode']}")
+    if profile["heavy"]:
+        problems.append(f"imports {', '.join(profile['heavy'])}")
+    if budget_ms is not None and profile["wall_ms"] > budget_ms:
+        problems.append(f"took {profile['wall_ms']:.0f} ms (budget {budget_ms:.0f} ms)")
+    return problems
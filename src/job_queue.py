@@ -0,0 +1,352 @@
+"""
+Job Queue - Durable, resumable publishing jobs backed by SQLite
+Each post moves pending -> researched -> written -> published (or failed),
+and the research and content of every stage are stored with the job, so a
+rerun after a crash continues where it stopped without repeating LLM calls
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src.config import config
+from src.deadlines import find_cancellation
+from src.logger import logger
+
+
+PENDING = "pending"
+RESEARCHED = "researched"
+WRITTEN = "written"
+PUBLISHED = "published"
+FAILED = "failed"
+
+# Allowed state changes (any unfinished job can also fail)
+TRANSITIONS = {
+    PENDING: (RESEARCHED,),
+    RESEARCHED: (WRITTEN,),
+    WRITTEN: (PUBLISHED,),
+}
+FINAL_STATES = (PUBLISHED, FAILED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    topic TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    payload TEXT NOT NULL DEFAULT '{}',
+    research TEXT,
+    content TEXT,
+    title TEXT,
+    review_id TEXT,
+    post_id TEXT,
+    url TEXT,
+    error TEXT,
+    publish_started_at REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    UNIQUE (batch, topic)
+);
+CREATE INDEX IF NOT EXISTS jobs_batch_state ON jobs (batch, state);
+"""
+
+# Columns a stage may set when it advances a job
+_STAGE_COLUMNS = ("research", "content", "title", "review_id", "post_id", "url")
+
+
+class PublishJobQueue:
+    """
+    SQLite-backed queue of publishing jobs
+
+    Every state change is a single compare-and-set UPDATE, so a job can
+    only advance from the state the caller saw, and replaying a stage
+    that already completed is a no-op.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the queue
+
+        Args:
+            db_path: SQLite database file (':memory:' for a throwaway queue)
+        """
+        self.db_path = db_path
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        return job
+
+    def enqueue(
+        self,
+        batch: str,
+        topics: List[str],
+        content_type: str = "blog post",
+        payloads: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Add topics to a batch (topics already in the batch are left untouched)
+
+        Args:
+            batch: Batch name, e.g. 'trending-2026-01-31'
+            topics: Topics in publishing order
+            content_type: Type of content to create
+            payloads: Optional JSON-serializable data per topic (refined
+                title, tags, ...) stored with the job
+
+        Returns:
+            List of every job in the batch, in order
+        """
+        now = time.time()
+        payloads = payloads or [{}] * len(topics)
+        with self._lock, self._conn:
+            start = self._conn.execute(
+                "SELECT COALESCE(MAX(position), 0) FROM jobs WHERE batch = ?", (batch,)
+            ).fetchone()[0]
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO jobs "
+                "(batch, position, topic, content_type, payload, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (batch, start + i, topic, content_type, json.dumps(payload), now, now)
+                    for i, (topic, payload) in enumerate(zip(topics, payloads), 1)
+                ],
+            )
+        return self.jobs(batch)
+
+    def jobs(self, batch: str, states: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        List the jobs of a batch
+
+        Args:
+            batch: Batch name
+            states: Only jobs in these states (default: all)
+
+        Returns:
+            List of job dicts in publishing order
+        """
+        query = "SELECT * FROM jobs WHERE batch = ?"
+        params: List[Any] = [batch]
+        if states:
+            query += f" AND state IN ({', '.join('?' * len(states))})"
+            params.extend(states)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY position", params).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def unfinished(self, batch: str) -> List[Dict[str, Any]]:
+        """Jobs of a batch that are neither published nor failed"""
+        return self.jobs(batch, [PENDING, RESEARCHED, WRITTEN])
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def advance(self, job_id: int, from_state: str, to_state: str, **fields) -> bool:
+        """
+        Move a job to its next state and store the stage's output
+
+        Args:
+            job_id: Job to advance
+            from_state: State the job must currently be in
+            to_state: Next state
+            **fields: Stage output ('research', 'content', 'title',
+                'review_id', 'post_id', 'url')
+
+        Returns:
+            bool: True if the job advanced, False if it was no longer in from_state
+
+        Raises:
+            ValueError: If the transition or a field is not allowed
+        """
+        if to_state not in TRANSITIONS.get(from_state, ()):
+            raise ValueError(f"Invalid job transition: {from_state} -> {to_state}")
+        unknown = set(fields) - set(_STAGE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown job fields: {', '.join(sorted(unknown))}")
+
+        columns = "".join(f", {name} = ?" for name in fields)
+        return self._update(
+            f"UPDATE jobs SET state = ?, updated_at = ?{columns} WHERE id = ? AND state = ?",
+            (to_state, time.time(), *fields.values(), job_id, from_state),
+        )
+
+    def start_publish(self, job_id: int) -> bool:
+        """
+        Record that a written job is about to be published
+
+        Returns:
+            bool: False if a publish was already started (its outcome is
+            unknown after a crash, so the post may already be live)
+        """
+        return self._update(
+            "UPDATE jobs SET publish_started_at = ?, updated_at = ? "
+            "WHERE id = ? AND state = ? AND publish_started_at IS NULL",
+            (time.time(), time.time(), job_id, WRITTEN),
+        )
+
+    def fail(self, job_id: int, error: str, publish_unknown: bool = False) -> bool:
+        """
+        Mark an unfinished job as failed (its stored stage output is kept)
+
+        Args:
+            job_id: Job that failed
+            error: Error message
+            publish_unknown: The post may have been published; retry_failed()
+                leaves such jobs alone so they are never published twice
+
+        Returns:
+            bool: True if the job was unfinished
+        """
+        publish = "" if publish_unknown else ", publish_started_at = NULL"
+        return self._update(
+            f"UPDATE jobs SET state = ?, error = ?, updated_at = ?{publish} "
+            "WHERE id = ? AND state NOT IN (?, ?)",
+            (FAILED, error, time.time(), job_id, *FINAL_STATES),
+        )
+
+    def retry_failed(self, batch: str) -> int:
+        """
+        Resume the failed jobs of a batch from their last completed stage
+
+        Jobs whose publish outcome is unknown stay failed.
+
+        Args:
+            batch: Batch name
+
+        Returns:
+            int: Number of jobs resumed
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET error = NULL, updated_at = ?, state = CASE "
+                "WHEN content IS NOT NULL THEN ? WHEN research IS NOT NULL THEN ? ELSE ? END "
+                "WHERE batch = ? AND state = ? AND publish_started_at IS NULL",
+                (time.time(), WRITTEN, RESEARCHED, PENDING, batch, FAILED),
+            )
+            return cursor.rowcount
+
+    def summary(self, batch: str) -> Dict[str, int]:
+        """Number of jobs of a batch in each state"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*) FROM jobs WHERE batch = ? GROUP BY state", (batch,)
+            ).fetchall()
+        counts = {state: 0 for state in (PENDING, RESEARCHED, WRITTEN, PUBLISHED, FAILED)}
+        counts.update({state: count for state, count in rows})
+        return counts
+
+    def _update(self, query: str, params: tuple) -> bool:
+        with self._lock, self._conn:
+            return self._conn.execute(query, params).rowcount == 1
+
+    def run(
+        self,
+        job: Dict[str, Any],
+        research_fn: Callable[[Dict[str, Any]], str],
+        write_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+        publish_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Drive a job through its remaining stages
+
+        Stages that already completed are skipped, so running a job again
+        after a crash repeats no LLM call. A job stopped by a deadline or
+        cancellation keeps its state, so the next run resumes it.
+
+        Args:
+            job: Job dict (from jobs() or unfinished())
+            research_fn: Returns the research for a job
+            write_fn: Returns {'content', 'title', 'review_id'} for a job
+                whose 'research' is set
+            publish_fn: Publishes a written job and returns the publisher
+                result ({'success', 'post_id', 'url', 'message'})
+
+        Returns:
+            Dict: The job in its final state
+        """
+        job_id = job["id"]
+        publishing = False
+        try:
+            if job["state"] == PENDING:
+                research = str(research_fn(job))
+                self.advance(job_id, PENDING, RESEARCHED, research=research)
+                job = self.get(job_id)
+
+            if job["state"] == RESEARCHED:
+                written = write_fn(job)
+                self.advance(
+                    job_id, RESEARCHED, WRITTEN,
+                    content=str(written["content"]),
+                    title=written.get("title"),
+                    review_id=written.get("review_id"),
+                )
+                job = self.get(job_id)
+
+            if job["state"] == WRITTEN:
+                if not self.start_publish(job_id):
+                    logger.warning(
+                        f"⚠️  Publish of '{job['topic']}' was interrupted; check the blog before retrying"
+                    )
+                    self.fail(job_id, "Publish outcome unknown (interrupted)", publish_unknown=True)
+                    return self.get(job_id)
+
+                publishing = True
+                published = publish_fn(job)
+                publishing = False
+                if published.get("success"):
+                    self.advance(
+                        job_id, WRITTEN, PUBLISHED,
+                        post_id=published.get("post_id"), url=published.get("url"),
+                    )
+                else:
+                    self.fail(job_id, published.get("message") or "Publishing failed")
+        except Exception as e:
+            cancelled = find_cancellation(e)
+            if cancelled is not None and not publishing:
+                logger.warning(f"⏱️  Job '{job['topic']}' stopped in state {job['state']}: {cancelled}")
+                return self.get(job_id)
+            logger.error(f"❌ Job '{job['topic']}' failed in state {job['state']}: {str(e)}")
+            # An error while publishing may come after the post went live
+            self.fail(job_id, str(e), publish_unknown=publishing)
+
+        return self.get(job_id)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_queues: Dict[str, PublishJobQueue] = {}
+_queues_lock = threading.Lock()
+
+
+def get_job_queue(db_path: Optional[str] = None) -> PublishJobQueue:
+    """
+    Get the process-wide job queue for a database file
+
+    Args:
+        db_path: SQLite file (default: JOB_QUEUE_PATH)
+
+    Returns:
+        PublishJobQueue: Shared queue
+    """
+    path = db_path or config.jobs.db_path
+    with _queues_lock:
+        if path not in _queues:
+            _queues[path] = PublishJobQueue(path)
+        return _queues[path]
@@ -0,0 +1,77 @@
+"""
+Lazy Imports - Defer heavy third-party modules until first use
+CrewAI, LangChain and the Google API client take seconds to import, so
+status tools, --help and the Streamlit cold start only load them when a
+crew or a publisher actually needs them
+"""
+import importlib
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class LazyImport:
+    """
+    Stand-in for a class or function that is imported on first use
+
+    Calling it or reading an attribute imports the real object. Being a
+    plain module attribute, it can still be patched in tests; it cannot be
+    used with isinstance() or in an except clause.
+    """
+
+    def __init__(self, module: str, name: str):
+        """
+        Initialize the stand-in
+
+        Args:
+            module: Module to import, e.g. 'langchain_openai'
+            name: Attribute of the module, e.g. 'ChatOpenAI'
+        """
+        self._module = module
+        self._name = name
+        self._target: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> Any:
+        """Import (once) and return the real object"""
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    module = importlib.import_module(self._module)
+                    self._target = getattr(module, self._name)
+        return self._target
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not defined on the stand-in itself
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<LazyImport {self._module}.{self._name} ({state})>"
+
+
+def moved_attributes(module_name: str, moved: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module __getattr__ (PEP 562) for names that moved to a heavier module
+
+    ``from src.metrics import MeteredLLM`` keeps working while importing
+    src.metrics itself no longer imports CrewAI.
+
+    Args:
+        module_name: Name of the module the function is installed in
+        moved: Attribute name -> module it now lives in
+
+    Returns:
+        Function to assign to the module's ``__getattr__``
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in moved:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        return getattr(importlib.import_module(moved[name]), name)
+
+    return __getattr__
@@ -0,0 +1,358 @@
+"""
+LLM Response Cache - Persistent, content-addressed cache for agent LLM calls
+Replays identical research/writer/reviewer prompts without a network round trip
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from src.llm_wrappers import DelegatingLLM
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed LLM response cache with TTL and size-bounded LRU eviction
+    """
+
+    def __init__(
+        self,
+        path: str = "./data/llm_cache.sqlite3",
+        ttl_seconds: Optional[int] = 7 * 24 * 3600,
+        max_entries: int = 5000,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Entry lifetime in seconds (None or 0 = never expire)
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total response size in bytes (optional)
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds or None
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stats_lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation keeps the cache safe to
+        # share between worker threads and processes
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        temperature: Optional[float],
+        messages: Any,
+        **context: Any,
+    ) -> str:
+        """
+        Build the content address for a request
+
+        Args:
+            provider: LLM provider name
+            model: Model name
+            temperature: Sampling temperature
+            messages: Full prompt (string or list of message dicts)
+            **context: Any other request parameters that change the output
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "temperature": temperature,
+                "messages": messages,
+                "context": context,
+            },
+            sort_keys=True,
+            default=str,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                row = None
+
+            if row:
+                conn.execute(
+                    "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+
+        with self._stats_lock:
+            if row:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        return row[0] if row else None
+
+    def set(self, key: str, response: str, provider: str = "", model: str = "") -> None:
+        """
+        Store a response and evict least-recently-used entries over the limits
+
+        Args:
+            key: Cache key from make_key()
+            response: Response text
+            provider: Provider name (informational)
+            model: Model name (informational)
+        """
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache
+                    (key, provider, model, response, size, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, provider, model, response, size, now, now),
+            )
+            evicted = self._evict(conn)
+
+        if evicted:
+            with self._stats_lock:
+                self.evictions += evicted
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Evict expired and least-recently-used entries, returns count"""
+        evicted = 0
+
+        if self.ttl_seconds:
+            cursor = conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            evicted += cursor.rowcount
+
+        count, total_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()
+
+        if count > self.max_entries:
+            cursor = conn.execute(
+                """
+                DELETE FROM llm_cache WHERE key IN (
+                    SELECT key FROM llm_cache ORDER BY accessed_at ASC LIMIT ?
+                )
+                """,
+                (count - self.max_entries,),
+            )
+            evicted += cursor.rowcount
+
+        if self.max_bytes and total_bytes > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM llm_cache ORDER BY accessed_at ASC"
+            ).fetchall()
+            to_delete = []
+            for key, size in rows:
+                if total_bytes <= self.max_bytes:
+                    break
+                to_delete.append((key,))
+                total_bytes -= size
+            conn.executemany("DELETE FROM llm_cache WHERE key = ?", to_delete)
+            evicted += len(to_delete)
+
+        return evicted
+
+    def clear(self) -> None:
+        """Remove every cached response"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters
+
+        Returns:
+            Dict with hits, misses, evictions, hit_rate and entries
+        """
+        with self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+            }
+
+
+class CachedLLM(DelegatingLLM):
+    """
+    CrewAI LLM wrapper that serves repeated prompts from an LLMResponseCache
+    """
+
+    def __init__(self, inner: Any, cache: LLMResponseCache, **kwargs: Any):
+        """
+        Initialize the cached LLM
+
+        Args:
+            inner: LLM to call on a cache miss
+            cache: Response cache shared between stages and managers
+            **kwargs: Passed through to DelegatingLLM
+        """
+        super().__init__(inner, **kwargs)
+        self.cache = cache
+
+    def _cache_key(self, messages: Any, tools: Any) -> str:
+        tool_names = [
+            getattr(tool, "name", None) or str(tool) for tool in (tools or [])
+        ]
+        return self.cache.make_key(
+            self.provider,
+            self.model,
+            self.temperature,
+            messages,
+            stop=sorted(self.stop),
+            tools=tool_names,
+        )
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        # Structured outputs are parsed objects, not text - never cache them
+        if response_model is not None:
+            return super().call(messages, tools, callbacks, available_functions,
+                                from_task, from_agent, response_model)
+
+        key = self._cache_key(messages, tools)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = super().call(messages, tools, callbacks, available_functions,
+                                from_task, from_agent, response_model)
+        if isinstance(response, str) and response:
+            self.cache.set(key, response, self.provider, self.model)
+        return response
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        if response_model is not None:
+            return await super().acall(messages, tools, callbacks, available_functions,
+                                       from_task, from_agent, response_model)
+
+        key = self._cache_key(messages, tools)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await super().acall(messages, tools, callbacks, available_functions,
+                                       from_task, from_agent, response_model)
+        if isinstance(response, str) and response:
+            self.cache.set(key, response, self.provider, self.model)
+        return response
+
+    def stream_text(
+        self, messages: Any, usage: Optional[Dict[str, int]] = None
+    ) -> Iterator[str]:
+        key = self._cache_key(messages, None)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        for chunk in super().stream_text(messages, usage=usage):
+            chunks.append(chunk)
+            yield chunk
+
+        # Only a fully consumed stream is a complete response
+        response = "".join(chunks)
+        if response:
+            self.cache.set(key, response, self.provider, self.model)
+
+
+_caches: Dict[str, LLMResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(
+    path: str,
+    ttl_seconds: Optional[int] = None,
+    max_entries: int = 5000,
+    max_bytes: Optional[int] = None,
+) -> LLMResponseCache:
+    """
+    Get the process-wide cache for a database path
+
+    Sharing one instance per path keeps hit/miss counters meaningful across
+    every CrewManager in the process.
+
+    Args:
+        path: SQLite database file
+        ttl_seconds: Entry lifetime in seconds
+        max_entries: Maximum number of cached responses
+        max_bytes: Maximum total response size in bytes
+
+    Returns:
+        LLMResponseCache: Shared cache instance
+    """
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = LLMResponseCache(
+                path=path,
+                ttl_seconds=ttl_seconds,
+                max_entries=max_entries,
+                max_bytes=max_bytes,
+            )
+        return _caches[path]
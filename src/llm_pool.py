@@ -0,0 +1,57 @@
+"""
+LLM Client Pool - Process-wide reuse of LLM clients across CrewManagers
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class LLMClientPool:
+    """
+    Thread-safe pool of LLM clients keyed by their configuration
+
+    Each pooled entry owns one native SDK client, whose HTTP connection pool
+    keeps connections alive between calls. Every CrewManager with the same
+    provider, model, temperature and key shares it instead of paying for a
+    new client (and TLS setup) per topic.
+    """
+
+    def __init__(self):
+        """Initialize an empty pool"""
+        self._clients: Dict[Hashable, Any] = {}
+        # Reentrant: factories may fetch other pooled clients (per-stage LLMs)
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Get the pooled client for a key, creating it on first use
+
+        Args:
+            key: Hashable client configuration
+            factory: Builds the client when the key is not pooled yet
+
+        Returns:
+            The pooled client
+        """
+        with self._lock:
+            if key in self._clients:
+                self.hits += 1
+                return self._clients[key]
+
+            self.misses += 1
+            client = factory()
+            self._clients[key] = client
+            return client
+
+    def clear(self) -> None:
+        """Drop every pooled client"""
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+# Global pool instance
+llm_pool = LLMClientPool()
@@ -0,0 +1,346 @@
+"""
+LLM Wrappers - Composable CrewAI LLM layers around the provider clients
+
+CrewAI converts the LangChain chat models built in CrewManager into its own
+native LLM objects, so cross-cutting behaviour (caching, metrics, limits)
+has to live at the CrewAI ``BaseLLM`` level to see every agent call.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from crewai.llms.base_llm import BaseLLM
+
+from src.deadlines import check_cancelled
+from src.metrics import MetricsCollector, metrics
+
+
+def to_crewai_llm(
+    llm: Any, provider: Optional[str] = None, api_key: Optional[str] = None
+) -> BaseLLM:
+    """
+    Convert a LangChain chat model into the equivalent CrewAI LLM
+
+    Args:
+        llm: LangChain chat model (or an existing CrewAI LLM)
+        provider: Provider name ('anthropic' or 'openai'), inferred if None
+        api_key: API key to hand to the native client
+
+    Returns:
+        BaseLLM: CrewAI LLM instance
+    """
+    if isinstance(llm, BaseLLM):
+        return llm
+
+    from crewai import LLM
+
+    kwargs = {
+        "model": getattr(llm, "model", None) or getattr(llm, "model_name", None),
+        "temperature": getattr(llm, "temperature", None),
+        "max_tokens": getattr(llm, "max_tokens", None),
+        "api_key": api_key,
+    }
+    if provider:
+        kwargs["provider"] = provider
+
+    return LLM(**{k: v for k, v in kwargs.items() if v is not None})
+
+
+# Token usage of the LLM calls made inside the current usage_scope()
+_usage: ContextVar[Optional[Dict[str, int]]] = ContextVar("llm_usage", default=None)
+
+
+@contextmanager
+def usage_scope(detached: bool = False) -> Iterator[Dict[str, int]]:
+    """
+    Collect the token usage of every LLM call made inside the block
+
+    Native LLMs are shared between threads, so their cumulative counters
+    cannot be attributed to a single call; the scope is per thread/task.
+    Nested scopes add their totals to the enclosing scope on exit.
+
+    Args:
+        detached: Keep the totals out of the enclosing scope (the caller
+            decides whether they count, e.g. for hedged duplicate calls)
+
+    Yields:
+        Dict with 'input_tokens', 'output_tokens' and 'cached_tokens'
+    """
+    parent = None if detached else _usage.get()
+    usage = {"input_tokens": 0, "output_tokens": 0, "cached_tokens": 0}
+    token = _usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage.reset(token)
+        if parent is not None:
+            for key, value in usage.items():
+                parent[key] = parent.get(key, 0) + value
+
+
+def add_usage(usage: Dict[str, int], usage_data: Dict[str, Any]) -> None:
+    """
+    Add provider usage data (OpenAI or Anthropic field names) to a usage dict
+
+    Args:
+        usage: Usage dict from usage_scope()
+        usage_data: Usage reported by the provider or LangChain
+    """
+    usage["input_tokens"] += (
+        usage_data.get("prompt_tokens") or usage_data.get("input_tokens") or 0
+    )
+    usage["output_tokens"] += (
+        usage_data.get("completion_tokens") or usage_data.get("output_tokens") or 0
+    )
+    # LangChain reports cache reads under input_token_details
+    details = usage_data.get("input_token_details") or {}
+    usage["cached_tokens"] += (
+        usage_data.get("cached_tokens")
+        or usage_data.get("cached_prompt_tokens")
+        or details.get("cache_read")
+        or 0
+    )
+
+
+def _report_usage(llm: BaseLLM) -> None:
+    """Mirror a native LLM's token accounting into the active usage scope"""
+    track = llm._track_token_usage_internal
+
+    def track_and_report(usage_data: Dict[str, Any]) -> None:
+        track(usage_data)
+        usage = _usage.get()
+        if usage is not None:
+            add_usage(usage, usage_data)
+
+    llm._track_token_usage_internal = track_and_report
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Extract the text from a LangChain message chunk"""
+    content = getattr(chunk, "content", chunk)
+    if isinstance(content, str):
+        return content
+
+    # Anthropic streams a list of content blocks
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content or []
+    )
+
+
+class DelegatingLLM(BaseLLM):
+    """
+    CrewAI LLM that forwards every call to an inner LLM
+
+    The inner LLM is resolved lazily so agents can be built without
+    touching the provider SDK until the first real call.
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        provider: Optional[str] = None,
+        api_key: Optional[str] = None,
+    ):
+        """
+        Initialize the wrapper
+
+        Args:
+            inner: LangChain chat model, CrewAI LLM or another wrapper
+            provider: Provider name used when converting the inner model
+            api_key: API key used when converting the inner model
+        """
+        # BaseLLM.__init__ is intentionally not called: all state lives on
+        # the inner LLM and is read through the properties below.
+        self._source = inner
+        self._inner = inner if isinstance(inner, BaseLLM) else None
+        self._provider = provider or getattr(inner, "provider", None) or "openai"
+        self._api_key = api_key
+        self._stop: list = []
+        self._inner_lock = threading.Lock()
+
+    @property
+    def inner(self) -> BaseLLM:
+        """The wrapped CrewAI LLM, converted on first access"""
+        if self._inner is None:
+            with self._inner_lock:
+                if self._inner is None:
+                    inner = to_crewai_llm(self._source, self._provider, self._api_key)
+                    inner.stop = list(self._stop)
+                    self._prepare_inner(inner)
+                    self._inner = inner
+        return self._inner
+
+    def _prepare_inner(self, inner: BaseLLM) -> None:
+        """Hook for layers that adjust the native LLM once it is created"""
+        _report_usage(inner)
+
+    @property
+    def model(self) -> str:
+        return getattr(self._source, "model", None) or getattr(
+            self._source, "model_name", None
+        )
+
+    @property
+    def temperature(self) -> Optional[float]:
+        return getattr(self._source, "temperature", None)
+
+    @property
+    def stop(self) -> list:
+        return self._stop
+
+    @stop.setter
+    def stop(self, value: list) -> None:
+        # Agent executors push their stop words onto the shared LLM
+        self._stop = list(value or [])
+        if self._inner is not None:
+            self._inner.stop = list(self._stop)
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        return self.inner.call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        )
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        return await self.inner.acall(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        )
+
+    def stream_text(
+        self, messages: Any, usage: Optional[Dict[str, int]] = None
+    ) -> Iterator[str]:
+        """
+        Stream a completion as text chunks
+
+        CrewAI's own streaming flips a flag on the (shared) LLM object, so
+        single-shot stages stream through the underlying LangChain model.
+
+        Args:
+            messages: Prompt string or list of role/content message dicts
+            usage: Optional usage dict (see usage_scope) to add token counts to
+
+        Yields:
+            str: Text chunks in generation order
+        """
+        if isinstance(self._source, DelegatingLLM):
+            yield from self._source.stream_text(messages, usage=usage)
+        elif hasattr(self._source, "stream"):
+            for chunk in self._source.stream(messages):
+                usage_metadata = getattr(chunk, "usage_metadata", None)
+                if usage is not None and isinstance(usage_metadata, dict):
+                    add_usage(usage, usage_metadata)
+
+                text = _chunk_text(chunk)
+                if text:
+                    yield text
+        else:
+            yield self.call(messages)
+
+    def supports_stop_words(self) -> bool:
+        return self.inner.supports_stop_words()
+
+    def supports_function_calling(self) -> bool:
+        supports = getattr(self.inner, "supports_function_calling", None)
+        return bool(supports()) if supports else False
+
+    def get_context_window_size(self) -> int:
+        return self.inner.get_context_window_size()
+
+    def get_token_usage_summary(self):
+        return self.inner.get_token_usage_summary()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not defined on the wrapper itself
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+
+class MeteredLLM(DelegatingLLM):
+    """
+    CrewAI LLM layer that attributes token usage to the calling task
+    """
+
+    def __init__(self, inner: Any, collector: Optional[MetricsCollector] = None, **kwargs):
+        """
+        Initialize the metered LLM
+
+        Args:
+            inner: LLM to meter (usually a CachedLLM)
+            collector: Metrics collector (defaults to the global one)
+            **kwargs: Passed to DelegatingLLM
+        """
+        super().__init__(inner, **kwargs)
+        self._collector = collector
+
+    @property
+    def collector(self) -> MetricsCollector:
+        return self._collector or metrics
+
+    @staticmethod
+    def _task_id(from_task: Any) -> Optional[str]:
+        task_id = getattr(from_task, "id", None)
+        return str(task_id) if task_id is not None else None
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        with usage_scope() as usage:
+            try:
+                return super().call(messages, tools, callbacks, available_functions,
+                                    from_task, from_agent, response_model)
+            finally:
+                self.collector.record_llm_call(self._task_id(from_task), usage, self.model)
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        with usage_scope() as usage:
+            try:
+                return await super().acall(messages, tools, callbacks, available_functions,
+                                           from_task, from_agent, response_model)
+            finally:
+                self.collector.record_llm_call(self._task_id(from_task), usage, self.model)
+
+
+class DeadlineLLM(DelegatingLLM):
+    """
+    CrewAI LLM layer that stops cancelled or overdue work before each call
+
+    Crew tasks are checked against their stage deadline (from the task's
+    start time) even in CrewAI's own worker threads, where the workflow
+    token is not visible.
+    """
+
+    @staticmethod
+    def _check(from_task: Any) -> None:
+        started = getattr(from_task, "start_time", None)
+        check_cancelled(
+            getattr(from_task, "name", None),
+            started.timestamp() if started else None,
+        )
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        self._check(from_task)
+        return super().call(messages, tools, callbacks, available_functions,
+                            from_task, from_agent, response_model)
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        self._check(from_task)
+        return await super().acall(messages, tools, callbacks, available_functions,
+                                   from_task, from_agent, response_model)
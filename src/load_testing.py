@@ -0,0 +1,259 @@
+"""
+Load Testing - Drive ParallelCrewManager with batch and mixed workloads
+Runs workflows against the fake LLM provider while sampling memory, threads
+and in-flight crews, and finds the highest sustainable posts/hour across a
+sweep of worker counts and batch sizes
+"""
+import gc
+import os
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+from src.config import config
+from src.metrics import percentile
+from src.parallel_crew_manager import ParallelCrewManager
+from src.worker_pool import WorkerPool
+
+# Content types of each workload, cycled through for the batch's topics
+WORKLOADS = {
+    # A publishing batch: every post is a blog post
+    "batch": ["blog post"],
+    # Interactive traffic: mostly posts, some articles and presentations
+    "mixed": ["blog post", "blog post", "article", "blog post", "presentation"],
+}
+
+
+def build_tasks(workload: str, batch_size: int) -> List[Dict[str, Any]]:
+    """
+    Build the workflow tasks of a workload
+
+    Args:
+        workload: Key of WORKLOADS
+        batch_size: Number of workflows
+
+    Returns:
+        List of task dicts for execute_parallel_workflows()
+    """
+    content_types = WORKLOADS[workload]
+    return [
+        {"topic": f"Load test topic {i + 1}", "content_type": content_types[i % len(content_types)]}
+        for i in range(batch_size)
+    ]
+
+
+def rss_mb() -> Optional[float]:
+    """Resident memory of this process in MB (None if it cannot be read)"""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / 1024 / 1024
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class ResourceSampler:
+    """
+    Samples memory, thread count and in-flight workflows in the background
+
+    Used as a context manager around a batch; peaks are read afterwards.
+    """
+
+    def __init__(self, pool: WorkerPool, interval: float = 0.1):
+        """
+        Initialize the sampler
+
+        Args:
+            pool: Pool the batch runs on (its queued + running jobs)
+            interval: Seconds between samples
+        """
+        self.pool = pool
+        self.interval = interval
+        self.peak_rss_mb: Optional[float] = None
+        self.peak_threads = 0
+        self.peak_in_flight = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> None:
+        """Take one sample"""
+        rss = rss_mb()
+        if rss is not None:
+            self.peak_rss_mb = max(self.peak_rss_mb or 0.0, rss)
+        self.peak_threads = max(self.peak_threads, threading.active_count())
+        self.peak_in_flight = max(self.peak_in_flight, min(self.pool.pending, self.pool.max_workers))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def __enter__(self) -> "ResourceSampler":
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name="load-test-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+
+def run_load_test(
+    workers: Optional[int],
+    batch_size: int,
+    workload: str = "batch",
+    time_scale: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Run one batch and measure it
+
+    Throughput is measured at the fake provider's (scaled) latency and
+    projected to real latency: a latency-bound batch is 1/time_scale times
+    slower live, but never faster than the CPU time it needed per post
+    allows. Memory is that of this process, so the thread executor is what
+    gets measured.
+
+    Args:
+        workers: Parallel workers (None = shared pool, adaptive with ADAPTIVE_CONCURRENCY)
+        batch_size: Workflows in the batch
+        workload: Key of WORKLOADS
+        time_scale: Latency multiplier of the fake provider (default: FAKE_LLM_TIME_SCALE)
+
+    Returns:
+        Dict with throughput, projected posts/hour, memory, threads and errors
+    """
+    time_scale = config.fake_llm.time_scale if time_scale is None else time_scale
+    pool = WorkerPool(workers, name="load-test") if workers else None
+    tasks = build_tasks(workload, batch_size)
+
+    gc.collect()
+    baseline_rss = rss_mb()
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    # The manager shuts the private pool down when the batch is done
+    with ParallelCrewManager(max_workers=workers, pool=pool) as manager:
+        with ResourceSampler(manager.pool) as sampler:
+            results = manager.execute_parallel_workflows(tasks)
+    elapsed = time.perf_counter() - start
+    cpu_seconds = time.process_time() - cpu_start
+
+    succeeded = sum(1 for result in results if result.get("success"))
+    failed = len(results) - succeeded
+    errors = Counter(
+        (result.get("error") or result.get("message") or "unknown")[:120]
+        for result in results if not result.get("success")
+    )
+    durations = [
+        result.metrics["duration_seconds"] for result in results
+        if "duration_seconds" in getattr(result, "metrics", {})
+    ]
+
+    posts_per_hour = succeeded / elapsed * 3600 if elapsed else 0.0
+    latency_bound = posts_per_hour * time_scale if time_scale else posts_per_hour
+    cpu_bound = succeeded / cpu_seconds * 3600 if cpu_seconds else latency_bound
+    memory_growth = (
+        sampler.peak_rss_mb - baseline_rss
+        if sampler.peak_rss_mb is not None and baseline_rss is not None else None
+    )
+
+    return {
+        "workload": workload,
+        "workers": workers or manager.max_workers,
+        "adaptive": manager.adaptive,
+        "batch_size": batch_size,
+        "succeeded": succeeded,
+        "failed": failed,
+        "error_rate": round(failed / len(results), 4) if results else 0.0,
+        "errors": dict(errors.most_common(5)),
+        "elapsed_seconds": round(elapsed, 3),
+        "cpu_seconds": round(cpu_seconds, 3),
+        "time_scale": time_scale,
+        "posts_per_hour": round(posts_per_hour, 1),
+        "projected_posts_per_hour": round(min(latency_bound, cpu_bound), 1),
+        "cpu_bound_posts_per_hour": round(cpu_bound, 1),
+        "workflow_p50_seconds": percentile(durations, 0.5),
+        "workflow_p95_seconds": percentile(durations, 0.95),
+        "baseline_rss_mb": None if baseline_rss is None else round(baseline_rss, 1),
+        "peak_rss_mb": None if sampler.peak_rss_mb is None else round(sampler.peak_rss_mb, 1),
+        "memory_per_crew_mb": (
+            round(memory_growth / sampler.peak_in_flight, 2)
+            if memory_growth is not None and sampler.peak_in_flight else None
+        ),
+        "peak_threads": sampler.peak_threads,
+        "peak_in_flight": sampler.peak_in_flight,
+    }
+
+
+def sweep(
+    workers: List[Optional[int]],
+    batch_sizes: List[int],
+    workloads: List[str],
+    on_run: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    **kwargs,
+) -> List[Dict[str, Any]]:
+    """
+    Run every combination of workload, batch size and worker count
+
+    Args:
+        workers: Worker counts (None = shared pool)
+        batch_sizes: Batch sizes
+        workloads: Keys of WORKLOADS
+        on_run: Called with each run's report as soon as it finishes
+        **kwargs: Passed to run_load_test()
+
+    Returns:
+        List of run reports
+    """
+    runs = []
+    for workload in workloads:
+        for batch_size in batch_sizes:
+            for count in workers:
+                run = run_load_test(count, batch_size, workload, **kwargs)
+                runs.append(run)
+                if on_run is not None:
+                    on_run(run)
+    return runs
+
+
+def sustainable_throughput(
+    runs: List[Dict[str, Any]],
+    max_error_rate: float = 0.01,
+    memory_limit_mb: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Find the highest posts/hour the machine sustains
+
+    A run counts as sustainable if its error rate and peak memory stay
+    within the limits.
+
+    Args:
+        runs: Reports from run_load_test()
+        max_error_rate: Highest acceptable share of failed workflows
+        memory_limit_mb: Highest acceptable peak memory (None = no limit)
+
+    Returns:
+        Dict with the projected posts/hour and the run that reached it
+        (posts_per_hour is None if no run was sustainable)
+    """
+    sustainable = [
+        run for run in runs
+        if run["error_rate"] <= max_error_rate
+        and (memory_limit_mb is None or (run["peak_rss_mb"] or 0) <= memory_limit_mb)
+    ]
+    best = max(sustainable, key=lambda run: run["projected_posts_per_hour"], default=None)
+    return {
+        "posts_per_hour": best["projected_posts_per_hour"] if best else None,
+        "max_error_rate": max_error_rate,
+        "memory_limit_mb": memory_limit_mb,
+        "rejected_runs": len(runs) - len(sustainable),
+        "best_run": best,
+    }
@@ -1,14 +1,310 @@
 """
 Logging configuration for the application
+Records are handed to a background writer thread through a bounded queue;
+the log file is rotated by size or time with gzip-compressed backups (by the
+parent process only; worker processes write their own file), and chatty loggers can be sampled down to a share of their INFO/DEBUG records
 """
+import atexit
+import gzip
 import logging
+import logging.handlers
 import os
+import queue
+import shutil
+import threading
+from collections import defaultdict
+from multiprocessing import parent_process
 from pathlib import Path
+from typing import Any, Dict, Optional
 from pythonjsonlogger import jsonlogger
 
 from src.config import config
 
 
+class _DeferredOpen:
+    """
+    Opens the log file (and creates the logs directory) on the first record,
+    so importing the logger costs no file system work and commands that
+    never log leave no empty log file behind
+    """
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
+class DeferredFileHandler(_DeferredOpen, logging.FileHandler):
+    """File handler without rotation"""
+
+    def __init__(self, filename: str, **kwargs):
+        super().__init__(filename, delay=True, **kwargs)
+
+
+class DeferredRotatingFileHandler(_DeferredOpen, logging.handlers.RotatingFileHandler):
+    """File handler rotated when it reaches a size"""
+
+    def __init__(self, filename: str, **kwargs):
+        super().__init__(filename, delay=True, **kwargs)
+
+
+class DeferredTimedRotatingFileHandler(_DeferredOpen, logging.handlers.TimedRotatingFileHandler):
+    """File handler rotated at a time interval (e.g. midnight)"""
+
+    def __init__(self, filename: str, **kwargs):
+        super().__init__(filename, delay=True, **kwargs)
+
+
+def _gzip_name(name: str) -> str:
+    return f"{name}.gz"
+
+
+def _gzip_rotate(source: str, dest: str) -> None:
+    """Compress a rotated-out log file (runs on the writer thread)"""
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def create_file_handler(
+    path: str,
+    rotation: str = "size",
+    max_bytes: int = 10 * 1024 * 1024,
+    rotate_when: str = "midnight",
+    backup_count: int = 7,
+    compress: bool = True,
+) -> logging.FileHandler:
+    """
+    Create the log file handler
+
+    Args:
+        path: Log file
+        rotation: 'size', 'time' or 'none'
+        max_bytes: File size that triggers a size rotation
+        rotate_when: Interval of a time rotation (TimedRotatingFileHandler 'when')
+        backup_count: Rotated files kept
+        compress: Gzip rotated files
+
+    Returns:
+        logging.FileHandler: Handler that opens the file on its first record
+    """
+    if rotation == "size":
+        handler = DeferredRotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+    elif rotation == "time":
+        handler = DeferredTimedRotatingFileHandler(
+            path, when=rotate_when, backupCount=backup_count, encoding="utf-8"
+        )
+    elif rotation == "none":
+        return DeferredFileHandler(path, encoding="utf-8")
+    else:
+        raise ValueError(f"Unknown LOG_ROTATION '{rotation}' (use size, time or none)")
+
+    if compress:
+        handler.namer = _gzip_name
+        handler.rotator = _gzip_rotate
+    return handler
+
+
+def worker_log_file(path: str, pid: Optional[int] = None) -> str:
+    """
+    Log file of one worker process (logs/app.log -> logs/app.worker-<pid>.log)
+
+    Args:
+        path: Log file of the parent process
+        pid: Worker process ID (default: the current process)
+
+    Returns:
+        str: Path of the worker's log file
+    """
+    base, ext = os.path.splitext(path)
+    return f"{base}.worker-{pid or os.getpid()}{ext}"
+
+
+def create_worker_file_handler(path: str) -> DeferredFileHandler:
+    """
+    Create the log file handler of a worker process
+
+    Rotating handlers are not multi-process safe (one process renames the
+    file while the others keep writing to the old one), so only the parent
+    rotates; each worker appends to its own file without rotation.
+
+    Args:
+        path: Log file of the parent process
+
+    Returns:
+        DeferredFileHandler: Handler for the worker's own file
+    """
+    return DeferredFileHandler(worker_log_file(path), encoding="utf-8")
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """
+    Parse LOG_SAMPLE_RATES ('name=rate,name=rate')
+
+    Returns:
+        Dict of logger name to the share of its INFO/DEBUG records kept
+    """
+    rates = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, sep, rate = item.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"Invalid LOG_SAMPLE_RATES entry '{item.strip()}' (use name=rate)")
+        rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps one in every N INFO/DEBUG records of chatty loggers
+
+    A rate applies to the named logger and its children (the most specific
+    name wins). Warnings and errors always pass. Sampling is by count
+    rather than random, so a 0.1 rate keeps exactly every tenth record.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        """
+        Initialize the filter
+
+        Args:
+            rates: Logger name -> share of records kept (0.0 - 1.0)
+        """
+        super().__init__()
+        self.rates = dict(rates)
+        self._seen: Dict[str, int] = defaultdict(int)
+        self.sampled_out: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def rate_for(self, name: str) -> float:
+        """Share of records kept for a logger"""
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        # Handlers sharing the filter see the same record: decide once
+        decided = getattr(record, "_sample_keep", None)
+        if decided is not None:
+            return decided
+
+        rate = self.rate_for(record.name)
+        if rate >= 1.0:
+            return True
+
+        with self._lock:
+            seen = self._seen[record.name]
+            self._seen[record.name] = seen + 1
+            keep = rate > 0.0 and seen % max(1, round(1 / rate)) == 0
+            if not keep:
+                self.sampled_out[record.name] += 1
+        record._sample_keep = keep
+        return keep
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never makes a worker wait for the log writer
+
+    When the queue is full, INFO/DEBUG records are dropped (and counted);
+    warnings and errors wait for room, up to a few seconds.
+    """
+
+    # Longest wait for room for a warning or error
+    BLOCK_SECONDS = 5.0
+
+    def __init__(self, record_queue: queue.Queue):
+        super().__init__(record_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=self.BLOCK_SECONDS)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            # Called under the handler lock, so the count is exact
+            self.dropped += 1
+
+
+class LogPipeline:
+    """
+    Queue, background listener and output handlers of the application logger
+    """
+
+    def __init__(
+        self,
+        handlers: list,
+        queue_size: int = 10000,
+        sampler: Optional[SamplingFilter] = None,
+    ):
+        """
+        Initialize and start the pipeline
+
+        Args:
+            handlers: Output handlers, run on the listener thread
+            queue_size: Records buffered before INFO/DEBUG records are dropped
+            sampler: Sampling filter applied before records are queued
+        """
+        self.handlers = handlers
+        self.queue_size = queue_size
+        self.sampler = sampler
+        self.handler = NonBlockingQueueHandler(queue.Queue(queue_size))
+        if sampler is not None:
+            self.handler.addFilter(sampler)
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self.start()
+
+    def start(self) -> None:
+        """Start the writer thread"""
+        self.listener = logging.handlers.QueueListener(
+            self.handler.queue, *self.handlers, respect_handler_level=True
+        )
+        self.listener.start()
+
+    def restart_after_fork(self) -> None:
+        """Give a forked child its own queue and writer thread"""
+        self.handler.queue = queue.Queue(self.queue_size)
+        self.start()
+
+    def flush(self) -> None:
+        """Wait until every queued record has been written"""
+        self.handler.queue.join()
+        for handler in self.handlers:
+            handler.flush()
+
+    def stop(self) -> None:
+        """Write the remaining records and stop the writer thread"""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        for handler in self.handlers:
+            handler.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, dropped and sampled-out record counts"""
+        return {
+            "queued": self.handler.queue.qsize(),
+            "dropped": self.handler.dropped,
+            "sampled_out": dict(self.sampler.sampled_out) if self.sampler else {},
+        }
+
+
+# Pipeline of the application logger (None when LOG_ASYNC=false)
+_pipeline: Optional[LogPipeline] = None
+
+# JSON file handler of the application logger
+_file_handler: Optional[logging.FileHandler] = None
+
+
 def setup_logger(name: str = "ai_multi_agent") -> logging.Logger:
     """
     Set up application logger with JSON formatting
@@ -19,9 +315,7 @@ def setup_logger(name: str = "ai_multi_agent") -> logging.Logger:
     Returns:
         logging.Logger: Configured logger instance
     """
-    # Create logs directory if it doesn't exist
-    log_dir = Path(config.logging.log_file).parent
-    log_dir.mkdir(parents=True, exist_ok=True)
+    global _pipeline, _file_handler
 
     # Create logger
     logger = logging.getLogger(name)
@@ -39,20 +333,110 @@ def setup_logger(name: str = "ai_multi_agent") -> logging.Logger:
     )
     console_handler.setFormatter(console_format)
 
-    # File handler with JSON formatting
-    file_handler = logging.FileHandler(config.logging.log_file)
+    # File handler with JSON formatting (spawned worker processes get their own file)
+    if parent_process() is None:
+        file_handler = create_file_handler(
+            config.logging.log_file,
+            rotation=config.logging.rotation,
+            max_bytes=config.logging.max_bytes,
+            rotate_when=config.logging.rotate_when,
+            backup_count=config.logging.backup_count,
+            compress=config.logging.compress,
+        )
+    else:
+        file_handler = create_worker_file_handler(config.logging.log_file)
     file_handler.setLevel(logging.DEBUG)
     json_format = jsonlogger.JsonFormatter(
         "%(asctime)s %(name)s %(levelname)s %(message)s"
     )
     file_handler.setFormatter(json_format)
+    _file_handler = file_handler
+
+    rates = parse_sample_rates(config.logging.sample_rates)
+    sampler = SamplingFilter(rates) if rates else None
+
+    if config.logging.async_enabled:
+        # Worker threads only enqueue; formatting, console and file writes
+        # and rotation happen on the listener thread
+        _pipeline = LogPipeline(
+            [console_handler, file_handler], config.logging.queue_size, sampler
+        )
+        logger.addHandler(_pipeline.handler)
+        atexit.register(_shutdown)
+    else:
+        # Add handlers
+        for handler in (console_handler, file_handler):
+            if sampler is not None:
+                handler.addFilter(sampler)
+            logger.addHandler(handler)
 
-    # Add handlers
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=_after_fork_in_child)
 
     return logger
 
 
+def _after_fork_in_child() -> None:
+    """Move a forked child to its own log file and (async) writer thread"""
+    global _file_handler
+    if _file_handler is None:
+        return
+
+    worker_handler = create_worker_file_handler(config.logging.log_file)
+    worker_handler.setLevel(_file_handler.level)
+    worker_handler.setFormatter(_file_handler.formatter)
+    for log_filter in _file_handler.filters:
+        worker_handler.addFilter(log_filter)
+
+    if _pipeline is not None:
+        _pipeline.handlers = [
+            worker_handler if handler is _file_handler else handler
+            for handler in _pipeline.handlers
+        ]
+        _pipeline.restart_after_fork()
+    else:
+        logger.removeHandler(_file_handler)
+        logger.addHandler(worker_handler)
+    _file_handler = worker_handler
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Child of the application logger for one component
+
+    Its records go through the application logger's handlers; the name
+    ('ai_multi_agent.<name>') is what LOG_SAMPLE_RATES matches.
+
+    Args:
+        name: Component name, e.g. 'publisher'
+
+    Returns:
+        logging.Logger: Child logger
+    """
+    return logger.getChild(name)
+
+
+def flush_logs() -> None:
+    """Wait until queued log records have been written"""
+    if _pipeline is not None:
+        _pipeline.flush()
+
+
+def logging_stats() -> Dict[str, Any]:
+    """Queue depth, dropped and sampled-out record counts of the pipeline"""
+    if _pipeline is None:
+        return {"async": False}
+    return {"async": True, **_pipeline.stats()}
+
+
+def _shutdown() -> None:
+    """Report dropped records and drain the queue at exit"""
+    if _pipeline is None:
+        return
+    if _pipeline.handler.dropped:
+        logger.warning(f"⚠️  {_pipeline.handler.dropped} log records dropped (log queue full)")
+    _pipeline.stop()
+
+
 # Global logger instance
 logger = setup_logger()
@@ -0,0 +1,594 @@
+"""
+Crew Metrics - Per-stage latency, token and cost instrumentation
+Records every crew task as a structured log event and keeps Prometheus
+text-format aggregates so the dominant stage under load is visible
+"""
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.config import config
+from src.lazy_imports import moved_attributes
+from src.logger import logger
+
+
+# USD per million (input, output) tokens, matched by model name prefix
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    "claude-opus-4": (15.0, 75.0),
+    "claude-sonnet-4": (3.0, 15.0),
+    "claude-sonnet-3-7": (3.0, 15.0),
+    "claude-3-7-sonnet": (3.0, 15.0),
+    "claude-haiku-3-5": (0.8, 4.0),
+    "claude-3-5-haiku": (0.8, 4.0),
+    "gpt-4o-mini": (0.15, 0.6),
+    "gpt-4o": (2.5, 10.0),
+    "gpt-4-turbo": (10.0, 30.0),
+    "gpt-4": (30.0, 60.0),
+    "gpt-3.5-turbo": (0.5, 1.5),
+}
+
+# Stage latency histogram buckets (seconds)
+DURATION_BUCKETS = (1, 5, 10, 30, 60, 120, 300, 600)
+
+# Recent LLM call latencies kept per (stage, model) for tail percentiles
+LATENCY_SAMPLES = 1000
+
+
+def estimate_cost(
+    model: Optional[str], input_tokens: int, output_tokens: int, cached_tokens: int = 0
+) -> float:
+    """
+    Estimate the USD cost of a number of tokens
+
+    Args:
+        model: Model name
+        input_tokens: Prompt tokens
+        output_tokens: Completion tokens
+        cached_tokens: Prompt tokens read from the provider's prompt cache
+
+    Returns:
+        float: Estimated cost in USD (0.0 for unknown models)
+    """
+    if not model:
+        return 0.0
+
+    # Longest prefix wins, so "gpt-4o-mini" is not priced as "gpt-4"
+    for prefix in sorted(MODEL_PRICING, key=len, reverse=True):
+        if model.startswith(prefix):
+            input_price, output_price = MODEL_PRICING[prefix]
+            cost = input_tokens * input_price + output_tokens * output_price
+            if model.startswith("claude"):
+                # Anthropic bills cache reads separately, at 10% of input
+                cost += cached_tokens * input_price * 0.1
+            else:
+                # OpenAI counts cached tokens in the prompt, at half price
+                cost -= cached_tokens * input_price * 0.5
+            return cost / 1_000_000
+    return 0.0
+
+
+def percentile(values: Any, q: float) -> Optional[float]:
+    """
+    Nearest-rank percentile of a collection of numbers
+
+    Args:
+        values: Numbers (any iterable)
+        q: Percentile as a fraction (0.95 = p95)
+
+    Returns:
+        float: The percentile, or None for no values
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+
+def _new_usage() -> Dict[str, int]:
+    return {"llm_calls": 0, "input_tokens": 0, "output_tokens": 0, "cached_tokens": 0}
+
+
+# Stage events recorded during the current workflow (see collect_stage_events)
+_stage_events: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar(
+    "workflow_stage_events", default=None
+)
+
+
+@contextmanager
+def collect_stage_events() -> Iterator[List[Dict[str, Any]]]:
+    """
+    Collect the stage events the metrics collector records inside the block
+
+    The list is shared with asyncio tasks and asyncio.to_thread calls
+    started inside the block, which copy the current context.
+
+    Yields:
+        List the events are appended to
+    """
+    events: List[Dict[str, Any]] = []
+    token = _stage_events.set(events)
+    try:
+        yield events
+    finally:
+        _stage_events.reset(token)
+
+
+def _add_stage_event(event: Dict[str, Any]) -> None:
+    """Hand a recorded stage event to the current workflow, if any"""
+    events = _stage_events.get()
+    if events is not None:
+        events.append(event)
+
+
+def summarize_stages(events: List[Dict[str, Any]], duration: float) -> Dict[str, Any]:
+    """
+    Summarize a workflow's stage events
+
+    Args:
+        events: Events from collect_stage_events()
+        duration: Wall-clock time of the workflow in seconds
+
+    Returns:
+        Dict with duration, per-stage durations, LLM calls, tokens and cost
+    """
+    summary = {
+        "duration_seconds": round(duration, 3),
+        "stage_seconds": {},
+        "llm_calls": 0,
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "cached_tokens": 0,
+        "cost_usd": 0.0,
+    }
+    for event in events:
+        stage_seconds = summary["stage_seconds"]
+        stage_seconds[event["stage"]] = round(
+            stage_seconds.get(event["stage"], 0.0) + event["duration_seconds"], 3
+        )
+        summary["llm_calls"] += event["iterations"]
+        for name in ("input_tokens", "output_tokens", "cached_tokens"):
+            summary[name] += event[name]
+        summary["cost_usd"] = round(summary["cost_usd"] + event["cost_usd"], 6)
+    return summary
+
+
+class MetricsCollector:
+    """
+    Collects per-stage metrics for crew runs
+
+    LLM calls are attributed to the CrewAI task that made them; when a crew
+    finishes, each task is turned into one stage record.
+    """
+
+    def __init__(self, export_path: Optional[str] = None):
+        """
+        Initialize the collector
+
+        Args:
+            export_path: Prometheus text file rewritten after every record (None = no export)
+        """
+        self.export_path = export_path
+        self._lock = threading.Lock()
+        self._task_usage: Dict[str, Dict[str, int]] = defaultdict(_new_usage)
+
+        # Aggregates keyed by (stage, model)
+        self._runs: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self._duration_sum: Dict[Tuple[str, str], float] = defaultdict(float)
+        self._duration_buckets: Dict[Tuple[str, str], List[int]] = defaultdict(
+            lambda: [0] * (len(DURATION_BUCKETS) + 1)
+        )
+        self._tokens: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self._iterations: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._cost: Dict[Tuple[str, str], float] = defaultdict(float)
+
+        # Hedged LLM calls keyed by (stage, model); latency paths are
+        # 'observed' (what callers waited) and 'unhedged' (the first attempt alone)
+        self._hedge_calls: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._hedges: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self._hedge_tokens: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self._hedge_cost: Dict[Tuple[str, str], float] = defaultdict(float)
+        self._call_latency: Dict[Tuple[str, str, str], deque] = defaultdict(
+            lambda: deque(maxlen=LATENCY_SAMPLES)
+        )
+
+    def record_llm_call(
+        self, task_id: Optional[str], usage: Dict[str, int], model: Optional[str] = None
+    ) -> None:
+        """
+        Attribute one LLM call to the task that made it
+
+        Args:
+            task_id: ID of the CrewAI task (None for calls outside a task)
+            usage: Token usage of the call
+            model: Model that served the call (stages may be routed or fall back)
+        """
+        if task_id is None:
+            return
+
+        with self._lock:
+            totals = self._task_usage[task_id]
+            totals["llm_calls"] += 1
+            for name in ("input_tokens", "output_tokens", "cached_tokens"):
+                totals[name] += usage.get(name, 0)
+            if model:
+                totals["model"] = model
+
+    def record_stage(
+        self,
+        stage: str,
+        topic: str,
+        content_type: str,
+        model: Optional[str],
+        duration: float,
+        usage: Dict[str, int],
+        status: str = "success",
+        started_at: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Record one finished stage
+
+        Args:
+            stage: Stage name (research, writing, review, presentation)
+            topic: Workflow topic
+            content_type: Workflow content type
+            model: Model that served the stage
+            duration: Stage latency in seconds
+            usage: Token usage with 'llm_calls' as agent iterations
+            status: 'success' or 'failed'
+            started_at: Unix start time (defaults to now - duration)
+
+        Returns:
+            Dict: The structured stage event
+        """
+        model = model or "unknown"
+        input_tokens = usage.get("input_tokens", 0)
+        output_tokens = usage.get("output_tokens", 0)
+        cached_tokens = usage.get("cached_tokens", 0)
+        started_at = started_at if started_at is not None else time.time() - duration
+
+        event = {
+            "event": "crew_stage",
+            "stage": stage,
+            "topic": topic,
+            "content_type": content_type,
+            "model": model,
+            "status": status,
+            "started_at": started_at,
+            "ended_at": started_at + duration,
+            "duration_seconds": round(duration, 3),
+            "iterations": usage.get("llm_calls", 0),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cached_tokens": cached_tokens,
+            "cost_usd": round(
+                estimate_cost(model, input_tokens, output_tokens, cached_tokens), 6
+            ),
+        }
+
+        key = (stage, model)
+        with self._lock:
+            self._runs[(stage, model, status)] += 1
+            self._duration_sum[key] += duration
+            buckets = self._duration_buckets[key]
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if duration <= bound:
+                    buckets[i] += 1
+            buckets[-1] += 1
+            self._tokens[(stage, model, "input")] += input_tokens
+            self._tokens[(stage, model, "output")] += output_tokens
+            self._tokens[(stage, model, "cache_read")] += cached_tokens
+            self._iterations[key] += event["iterations"]
+            self._cost[key] += event["cost_usd"]
+
+        logger.info(
+            f"📊 {stage} stage for '{topic}': {duration:.1f}s, "
+            f"{event['iterations']} iterations, {input_tokens}+{output_tokens} tokens "
+            f"({cached_tokens} cache reads), "
+            f"${event['cost_usd']:.4f}",
+            extra=event,
+        )
+        _add_stage_event(event)
+        return event
+
+    def record_crew(
+        self, crew: Any, topic: str, content_type: str, model: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Record every task of a finished (or failed) crew as a stage
+
+        Args:
+            crew: Crew that has been kicked off; task names are the stage names
+            topic: Workflow topic
+            content_type: Workflow content type
+            model: Model that served the crew (unless a task recorded its own)
+
+        Returns:
+            List of stage events
+        """
+        tasks = getattr(crew, "tasks", None)
+        if not isinstance(tasks, list):
+            return []
+
+        events = []
+        for task in tasks:
+            with self._lock:
+                usage = self._task_usage.pop(str(task.id), None) or _new_usage()
+
+            # Tasks that never started (an earlier stage failed) are not stages
+            start, end = task.start_time, task.end_time
+            if start is None:
+                continue
+
+            duration = ((end or start).timestamp() - start.timestamp())
+            status = "success" if task.output is not None else "failed"
+            events.append(
+                self.record_stage(
+                    task.name or "task", topic, content_type, usage.pop("model", model),
+                    duration, usage, status, started_at=start.timestamp(),
+                )
+            )
+
+        if events:
+            self.export()
+        return events
+
+    def record_hedged_call(
+        self,
+        stage: str,
+        model: Optional[str],
+        latency: float,
+        hedged: bool = False,
+        won: bool = False,
+    ) -> None:
+        """
+        Record an LLM call made by the hedging layer
+
+        Args:
+            stage: Stage of the calling task
+            model: Model of the call
+            latency: Seconds until the caller got its response
+            hedged: Whether a duplicate request was fired
+            won: Whether the duplicate answered first
+        """
+        key = (stage, model or "unknown")
+        with self._lock:
+            self._hedge_calls[key] += 1
+            self._call_latency[key + ("observed",)].append(latency)
+            if hedged:
+                self._hedges[key + ("fired",)] += 1
+            if won:
+                self._hedges[key + ("won",)] += 1
+
+    def record_unhedged_latency(self, stage: str, model: Optional[str], latency: float) -> None:
+        """
+        Record how long the first attempt of a hedging-layer call took
+
+        For a first attempt that lost and was cancelled this is the time
+        until cancellation, so the unhedged tail is a lower bound.
+
+        Args:
+            stage: Stage of the calling task
+            model: Model of the call
+            latency: Seconds the first attempt took
+        """
+        with self._lock:
+            self._call_latency[(stage, model or "unknown", "unhedged")].append(latency)
+
+    def record_hedge_spend(self, stage: str, model: Optional[str], usage: Dict[str, int]) -> None:
+        """
+        Record the tokens of an attempt whose response was thrown away
+
+        Args:
+            stage: Stage of the calling task
+            model: Model of the call
+            usage: Token usage of the losing attempt
+        """
+        model = model or "unknown"
+        input_tokens = usage.get("input_tokens", 0)
+        output_tokens = usage.get("output_tokens", 0)
+        cached_tokens = usage.get("cached_tokens", 0)
+        with self._lock:
+            self._hedge_tokens[(stage, model, "input")] += input_tokens
+            self._hedge_tokens[(stage, model, "output")] += output_tokens
+            self._hedge_tokens[(stage, model, "cache_read")] += cached_tokens
+            self._hedge_cost[(stage, model)] += estimate_cost(
+                model, input_tokens, output_tokens, cached_tokens
+            )
+
+    def hedge_summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Compare the tail latency hedging removed with the extra spend
+
+        Returns:
+            Dict keyed by 'stage/model' with calls, hedges, wins, p95 latency
+            with and without hedging, and the extra tokens and cost
+        """
+        summary = {}
+        with self._lock:
+            for (stage, model), calls in sorted(self._hedge_calls.items()):
+                key = (stage, model)
+                observed = percentile(self._call_latency.get(key + ("observed",), ()), 0.95)
+                unhedged = percentile(self._call_latency.get(key + ("unhedged",), ()), 0.95)
+                summary[f"{stage}/{model}"] = {
+                    "calls": calls,
+                    "hedges": self._hedges.get(key + ("fired",), 0),
+                    "hedge_wins": self._hedges.get(key + ("won",), 0),
+                    "p95_seconds": observed,
+                    "unhedged_p95_seconds": unhedged,
+                    "tail_reduction": (
+                        1 - observed / unhedged if observed is not None and unhedged else 0.0
+                    ),
+                    "extra_input_tokens": self._hedge_tokens.get((stage, model, "input"), 0),
+                    "extra_output_tokens": self._hedge_tokens.get((stage, model, "output"), 0),
+                    "extra_cost_usd": round(self._hedge_cost.get(key, 0.0), 6),
+                }
+        return summary
+
+    # Aggregates moved between processes by drain() and merge()
+    _AGGREGATES = (
+        "_runs", "_duration_sum", "_tokens", "_iterations", "_cost",
+        "_hedge_calls", "_hedges", "_hedge_tokens", "_hedge_cost",
+    )
+
+    def drain(self) -> Dict[str, Any]:
+        """
+        Take the aggregates recorded since the last drain and reset them
+
+        Worker processes send the snapshot back with their results, so the
+        parent's collector is the only one that exports.
+
+        Returns:
+            Dict: Picklable snapshot for merge()
+        """
+        with self._lock:
+            snapshot = {name: dict(getattr(self, name)) for name in self._AGGREGATES}
+            snapshot["_duration_buckets"] = {
+                key: list(buckets) for key, buckets in self._duration_buckets.items()
+            }
+            snapshot["_call_latency"] = {
+                key: list(samples) for key, samples in self._call_latency.items()
+            }
+            for name in self._AGGREGATES + ("_duration_buckets", "_call_latency"):
+                getattr(self, name).clear()
+        return snapshot
+
+    def merge(self, snapshot: Optional[Dict[str, Any]]) -> None:
+        """
+        Add a snapshot from drain() (e.g. of a worker process) and export
+
+        Args:
+            snapshot: Aggregates of another collector
+        """
+        if not snapshot or not any(snapshot.values()):
+            return
+
+        with self._lock:
+            for name in self._AGGREGATES:
+                totals = getattr(self, name)
+                for key, value in snapshot.get(name, {}).items():
+                    totals[key] += value
+            for key, buckets in snapshot.get("_duration_buckets", {}).items():
+                totals = self._duration_buckets[key]
+                for i, count in enumerate(buckets):
+                    totals[i] += count
+            for key, samples in snapshot.get("_call_latency", {}).items():
+                self._call_latency[key].extend(samples)
+        self.export()
+
+    def render_prometheus(self) -> str:
+        """
+        Render the aggregates in Prometheus text exposition format
+
+        Returns:
+            str: Metrics text
+        """
+        lines = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            family("crew_stage_runs_total", "counter", "Finished crew stages")
+            for (stage, model, status), count in sorted(self._runs.items()):
+                lines.append(
+                    f'crew_stage_runs_total{{stage="{stage}",model="{model}",status="{status}"}} {count}'
+                )
+
+            family("crew_stage_duration_seconds", "histogram", "Crew stage latency")
+            for (stage, model), buckets in sorted(self._duration_buckets.items()):
+                labels = f'stage="{stage}",model="{model}"'
+                for bound, count in zip(DURATION_BUCKETS, buckets):
+                    lines.append(
+                        f'crew_stage_duration_seconds_bucket{{{labels},le="{bound}"}} {count}'
+                    )
+                lines.append(f'crew_stage_duration_seconds_bucket{{{labels},le="+Inf"}} {buckets[-1]}')
+                lines.append(
+                    f"crew_stage_duration_seconds_sum{{{labels}}} {self._duration_sum[(stage, model)]:.3f}"
+                )
+                lines.append(f"crew_stage_duration_seconds_count{{{labels}}} {buckets[-1]}")
+
+            family("crew_stage_tokens_total", "counter", "LLM tokens used by crew stages")
+            for (stage, model, direction), count in sorted(self._tokens.items()):
+                lines.append(
+                    f'crew_stage_tokens_total{{stage="{stage}",model="{model}",direction="{direction}"}} {count}'
+                )
+
+            family("crew_stage_iterations_total", "counter", "Agent iterations (LLM calls) per stage")
+            for (stage, model), count in sorted(self._iterations.items()):
+                lines.append(f'crew_stage_iterations_total{{stage="{stage}",model="{model}"}} {count}')
+
+            family("crew_stage_cost_usd_total", "counter", "Estimated LLM spend per stage")
+            for (stage, model), cost in sorted(self._cost.items()):
+                lines.append(f'crew_stage_cost_usd_total{{stage="{stage}",model="{model}"}} {cost:.6f}')
+
+            if self._hedge_calls:
+                family("crew_llm_hedge_calls_total", "counter", "LLM calls eligible for hedging")
+                for (stage, model), count in sorted(self._hedge_calls.items()):
+                    lines.append(f'crew_llm_hedge_calls_total{{stage="{stage}",model="{model}"}} {count}')
+
+                family("crew_llm_hedges_total", "counter", "Duplicate LLM requests fired and won")
+                for (stage, model, outcome), count in sorted(self._hedges.items()):
+                    lines.append(
+                        f'crew_llm_hedges_total{{stage="{stage}",model="{model}",outcome="{outcome}"}} {count}'
+                    )
+
+                family("crew_llm_hedge_tokens_total", "counter", "Tokens of discarded LLM attempts")
+                for (stage, model, direction), count in sorted(self._hedge_tokens.items()):
+                    lines.append(
+                        f'crew_llm_hedge_tokens_total{{stage="{stage}",model="{model}",direction="{direction}"}} {count}'
+                    )
+
+                family("crew_llm_hedge_cost_usd_total", "counter", "Estimated spend on discarded LLM attempts")
+                for (stage, model), cost in sorted(self._hedge_cost.items()):
+                    lines.append(f'crew_llm_hedge_cost_usd_total{{stage="{stage}",model="{model}"}} {cost:.6f}')
+
+                family("crew_llm_latency_p95_seconds", "gauge", "p95 LLM call latency with and without hedging")
+                for (stage, model, path), samples in sorted(self._call_latency.items()):
+                    value = percentile(samples, 0.95)
+                    if value is not None:
+                        lines.append(
+                            f'crew_llm_latency_p95_seconds{{stage="{stage}",model="{model}",path="{path}"}} {value:.3f}'
+                        )
+
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Write the Prometheus text file atomically
+
+        Args:
+            path: Output path (defaults to export_path)
+
+        Returns:
+            str: Path written, or None if no path is configured
+        """
+        path = path or self.export_path
+        if not path:
+            return None
+
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self.render_prometheus())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️  Could not export metrics: {str(e)}")
+            return None
+        return path
+
+
+# Global metrics collector
+metrics = MetricsCollector(
+    export_path=config.metrics.export_path if config.metrics.enabled else None
+)
+
+# MeteredLLM is defined in src.llm_wrappers, so the collector can be used
+# (and imported by status tools) without loading CrewAI
+__getattr__ = moved_attributes(__name__, {"MeteredLLM": "src.llm_wrappers"})
@@ -0,0 +1,170 @@
+"""
+Model Router - Per-stage model tiers with automatic fallback
+Lets research and review run on a fast model while writing stays on the
+flagship, and falls back to the flagship on errors or latency overruns
+"""
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+from src.deadlines import find_cancellation
+from src.llm_wrappers import DelegatingLLM
+from src.logger import logger
+
+
+# Workflow stages that can be routed to their own model
+STAGES = ("research", "writing", "review", "presentation")
+
+
+def model_matches_provider(model: str, provider: str) -> bool:
+    """
+    Check whether a model name belongs to a provider
+
+    Args:
+        model: Model name
+        provider: 'anthropic' or 'openai'
+
+    Returns:
+        bool: True if the provider serves the model
+    """
+    return model.startswith("claude") == (provider == "anthropic")
+
+
+class FallbackLLM(DelegatingLLM):
+    """
+    Routes calls to a primary (fast) LLM and falls back to a second LLM
+
+    A failed call is retried on the fallback immediately. A failed or slow
+    call (over latency_budget seconds) also puts the primary in a cooldown
+    during which every call goes straight to the fallback, so an overloaded
+    fast tier is not hit again on every agent iteration.
+    """
+
+    def __init__(
+        self,
+        primary: DelegatingLLM,
+        fallback: DelegatingLLM,
+        latency_budget: Optional[float] = 120.0,
+        cooldown_seconds: float = 300.0,
+        **kwargs,
+    ):
+        """
+        Initialize the fallback router
+
+        Args:
+            primary: LLM tried first (the stage's fast tier)
+            fallback: LLM used on errors, overruns and during cooldown
+            latency_budget: Seconds a primary call may take (None = no limit)
+            cooldown_seconds: How long the primary is skipped after a failure
+            **kwargs: Passed to DelegatingLLM
+        """
+        super().__init__(primary, **kwargs)
+        self._fallback = fallback
+        self.latency_budget = latency_budget
+        self.cooldown_seconds = cooldown_seconds
+        self.fallbacks = 0
+        self._degraded_until = 0.0
+        self._state_lock = threading.Lock()
+
+    @property
+    def fallback(self) -> DelegatingLLM:
+        return self._fallback
+
+    @DelegatingLLM.stop.setter
+    def stop(self, value: list) -> None:
+        DelegatingLLM.stop.fset(self, value)
+        self._fallback.stop = value
+
+    @property
+    def degraded(self) -> bool:
+        """Whether calls currently bypass the primary"""
+        return time.monotonic() < self._degraded_until
+
+    def _degrade(self, reason: str) -> None:
+        """Skip the primary for the cooldown period"""
+        with self._state_lock:
+            self._degraded_until = time.monotonic() + self.cooldown_seconds
+        logger.warning(
+            f"⚠️  {self.model} {reason}; routing to {self._fallback.model} "
+            f"for {self.cooldown_seconds:.0f}s"
+        )
+
+    @staticmethod
+    def _raise_if_cancelled(error: Exception) -> None:
+        """
+        Re-raise a workflow's cancellation or timeout
+
+        Those stop one workflow; they say nothing about the primary, which is
+        shared by every workflow, and the fallback call would be wasted.
+        """
+        if find_cancellation(error) is not None:
+            raise error
+
+    def _check_latency(self, start: float) -> None:
+        elapsed = time.monotonic() - start
+        if self.latency_budget is not None and elapsed > self.latency_budget:
+            self._degrade(f"took {elapsed:.1f}s (budget {self.latency_budget:.0f}s)")
+
+    def _count_fallback(self) -> None:
+        with self._state_lock:
+            self.fallbacks += 1
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        args = (messages, tools, callbacks, available_functions,
+                from_task, from_agent, response_model)
+
+        if not self.degraded:
+            start = time.monotonic()
+            try:
+                response = super().call(*args)
+            except Exception as e:
+                self._raise_if_cancelled(e)
+                self._degrade(f"failed ({str(e)[:100]})")
+            else:
+                self._check_latency(start)
+                return response
+
+        self._count_fallback()
+        return self._fallback.call(*args)
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        args = (messages, tools, callbacks, available_functions,
+                from_task, from_agent, response_model)
+
+        if not self.degraded:
+            start = time.monotonic()
+            try:
+                response = await super().acall(*args)
+            except Exception as e:
+                self._raise_if_cancelled(e)
+                self._degrade(f"failed ({str(e)[:100]})")
+            else:
+                self._check_latency(start)
+                return response
+
+        self._count_fallback()
+        return await self._fallback.acall(*args)
+
+    def stream_text(
+        self, messages: Any, usage: Optional[Dict[str, int]] = None
+    ) -> Iterator[str]:
+        if not self.degraded:
+            stream = super().stream_text(messages, usage=usage)
+            start = time.monotonic()
+            try:
+                first = next(stream, None)
+            except Exception as e:
+                self._raise_if_cancelled(e)
+                # Nothing was yielded yet, so the fallback can take over cleanly
+                self._degrade(f"failed ({str(e)[:100]})")
+            else:
+                if first is not None:
+                    yield first
+                yield from stream
+                self._check_latency(start)
+                return
+
+        self._count_fallback()
+        yield from self._fallback.stream_text(messages, usage=usage)
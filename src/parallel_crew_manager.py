@@ -2,13 +2,35 @@
 Parallel Crew Manager - Multiprocessing support for AI agents
 Enables parallel execution of multiple workflows and batch processing
 """
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
-from multiprocessing import cpu_count
+import asyncio
+import inspect
+import queue
+import threading
+import weakref
+from typing import TYPE_CHECKING, List, Dict, Any, AsyncIterator, Callable, Iterator, Optional, Tuple
+from concurrent.futures import Future
 import time
 
-from src.crew_manager import CrewManager
-from src.logger import logger
+from src.concurrency import AIMDController, get_concurrency_controller
+from src.config import config
+from src.deadlines import CancelToken, WorkflowCancelled, cancel_scope
+from src.metrics import metrics
+from src.model_router import STAGES
+from src.process_workers import ProcessWorkerPool, WorkflowSpec
+from src.worker_pool import WorkerPool, worker_pool
+from src.rate_limiter import get_rate_limiter
+from src.workflow_result import WorkflowResult
+from src.logger import get_logger
+
+if TYPE_CHECKING:
+    # Managers come from the worker pool, which builds them on first use
+    from src.crew_manager import CrewManager
+
+logger = get_logger("parallel")
+
+
+# Called with (task, result) as each workflow finishes
+ResultCallback = Callable[[Dict[str, Any], WorkflowResult], Any]
 
 
 class ParallelCrewManager:
@@ -23,7 +45,10 @@ class ParallelCrewManager:
         temperature: float = 0.7,
         api_key: Optional[str] = None,
         use_anthropic: bool = None,
-        max_workers: Optional[int] = None
+        max_workers: Optional[int] = None,
+        max_concurrency: int = 50,
+        executor: Optional[str] = None,
+        pool: Optional[WorkerPool] = None
     ):
         """
         Initialize Parallel Crew Manager
@@ -33,27 +58,58 @@ class ParallelCrewManager:
             temperature: Temperature setting
             api_key: API key (optional)
             use_anthropic: Use Anthropic Claude (auto-detected if None)
-            max_workers: Maximum parallel workers (default: cpu_count)
+            max_workers: Maximum parallel workers (default: the shared worker
+                pool; a different value gets a private persistent pool). Unless
+                set, thread-mode batches adapt how many workflows run at once
+                to the provider (ADAPTIVE_CONCURRENCY)
+            max_concurrency: Maximum in-flight workflows for the async API
+            executor: 'thread' or 'process' (default: PARALLEL_EXECUTOR); in
+                process mode workflows run in warm worker processes
+            pool: Worker pool to run workflows on (default: see max_workers)
         """
         self.model_name = model_name
         self.temperature = temperature
         self.api_key = api_key
         self.use_anthropic = use_anthropic
-        self.max_workers = max_workers or cpu_count()
-
-        logger.info(f"⚡ Parallel Crew Manager initialized with {self.max_workers} workers")
+        self._finalizer: Optional[weakref.finalize] = None
+        if pool is None and max_workers and max_workers != worker_pool.max_workers:
+            pool = WorkerPool(max_workers=max_workers, name="parallel-crew")
+            # Stop the private pool's threads if the manager is dropped without shutdown()
+            self._finalizer = weakref.finalize(self, pool.shutdown, wait=False)
+        self.pool = pool or worker_pool
+        self.max_workers = max_workers or self.pool.max_workers
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self.executor = (executor or config.parallel.executor).lower()
+        # Worker processes report their LLM calls to their own controllers
+        self.adaptive = (
+            config.concurrency.adaptive and max_workers is None and self.executor != "process"
+        )
+        self._process_pool: Optional[ProcessWorkerPool] = None
+        # Tokens of the batches running right now (see cancel())
+        self._batches: set = set()
+
+        logger.info(f"⚡ Parallel Crew Manager initialized with {self.max_workers} workers ({self.executor} mode)")
 
     def execute_batch_research(
         self,
         topics: List[str],
-        content_type: str = "article"
-    ) -> Dict[str, Dict[str, Any]]:
+        content_type: str = "article",
+        on_result: Optional[ResultCallback] = None,
+        timeout: Optional[float] = None,
+        batch_timeout: Optional[float] = None
+    ) -> Dict[str, WorkflowResult]:
         """
         Execute research workflow for multiple topics in parallel
 
         Args:
             topics: List of research topics
             content_type: Type of content to create
+            on_result: Called with (task, result) as soon as each topic
+                finishes, e.g. to save or publish it
+            timeout: Deadline per workflow in seconds (default: WORKFLOW_TIMEOUT_SECONDS)
+            batch_timeout: Deadline of the whole batch (default: BATCH_TIMEOUT_SECONDS);
+                unfinished topics then get a result with status 'timeout'
 
         Returns:
             Dictionary mapping topic to workflow result
@@ -65,49 +121,15 @@ class ParallelCrewManager:
             >>> # All 3 topics processed simultaneously!
         """
         logger.info(f"🚀 Starting batch research for {len(topics)} topics")
-        logger.info(f"⚡ Using {self.max_workers} parallel workers")
+        self._log_workers()
 
-        results = {}
         start_time = time.time()
 
-        # Use ThreadPoolExecutor for API-bound operations
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_topic = {}
-            for topic in topics:
-                # Create separate CrewManager for each task
-                manager = CrewManager(
-                    model_name=self.model_name,
-                    temperature=self.temperature,
-                    api_key=self.api_key,
-                    use_anthropic=self.use_anthropic
-                )
-
-                future = executor.submit(
-                    manager.execute_research_workflow,
-                    topic,
-                    content_type
-                )
-                future_to_topic[future] = topic
-
-            # Collect results as they complete
-            completed = 0
-            for future in as_completed(future_to_topic):
-                topic = future_to_topic[future]
-                completed += 1
-
-                try:
-                    result = future.result()
-                    results[topic] = result
-                    status = "✅" if result['success'] else "❌"
-                    logger.info(f"{status} [{completed}/{len(topics)}] {topic}")
-                except Exception as e:
-                    logger.error(f"❌ Error processing {topic}: {str(e)}")
-                    results[topic] = {
-                        "success": False,
-                        "topic": topic,
-                        "error": str(e)
-                    }
+        tasks = [{'topic': topic, 'content_type': content_type, 'timeout': timeout} for topic in topics]
+        results = {
+            task['topic']: result
+            for task, result in self.iter_workflows(tasks, on_result, batch_timeout)
+        }
 
         elapsed = time.time() - start_time
         success_count = sum(1 for r in results.values() if r.get('success'))
@@ -116,21 +138,30 @@ class ParallelCrewManager:
         logger.info(f"📊 BATCH PROCESSING COMPLETE")
         logger.info(f"{'='*80}")
         logger.info(f"✅ Successful: {success_count}/{len(topics)}")
+        self._log_stopped(results.values())
         logger.info(f"⏱️  Total time: {elapsed:.1f}s")
         logger.info(f"⚡ Avg time per topic: {elapsed/len(topics):.1f}s")
+        self._log_rate_limits()
         logger.info(f"{'='*80}\n")
 
         return results
 
     def execute_batch_presentations(
         self,
-        topics: List[str]
-    ) -> Dict[str, Dict[str, Any]]:
+        topics: List[str],
+        on_result: Optional[ResultCallback] = None,
+        timeout: Optional[float] = None,
+        batch_timeout: Optional[float] = None
+    ) -> Dict[str, WorkflowResult]:
         """
         Generate presentations for multiple topics in parallel
 
         Args:
             topics: List of presentation topics
+            on_result: Called with (task, result) as soon as each presentation
+                finishes, e.g. to export it
+            timeout: Deadline per workflow in seconds (default: WORKFLOW_TIMEOUT_SECONDS)
+            batch_timeout: Deadline of the whole batch (default: BATCH_TIMEOUT_SECONDS)
 
         Returns:
             Dictionary mapping topic to presentation result
@@ -141,44 +172,15 @@ class ParallelCrewManager:
             >>> presentations = manager.execute_batch_presentations(topics)
         """
         logger.info(f"🎨 Starting batch presentation generation for {len(topics)} topics")
-        logger.info(f"⚡ Using {self.max_workers} parallel workers")
+        self._log_workers()
 
-        results = {}
         start_time = time.time()
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_topic = {}
-            for topic in topics:
-                manager = CrewManager(
-                    model_name=self.model_name,
-                    temperature=self.temperature,
-                    api_key=self.api_key,
-                    use_anthropic=self.use_anthropic
-                )
-
-                future = executor.submit(
-                    manager.execute_presentation_workflow,
-                    topic
-                )
-                future_to_topic[future] = topic
-
-            completed = 0
-            for future in as_completed(future_to_topic):
-                topic = future_to_topic[future]
-                completed += 1
-
-                try:
-                    result = future.result()
-                    results[topic] = result
-                    status = "✅" if result['success'] else "❌"
-                    logger.info(f"{status} [{completed}/{len(topics)}] {topic}")
-                except Exception as e:
-                    logger.error(f"❌ Error processing {topic}: {str(e)}")
-                    results[topic] = {
-                        "success": False,
-                        "topic": topic,
-                        "error": str(e)
-                    }
+        tasks = [{'topic': topic, 'content_type': 'presentation', 'timeout': timeout} for topic in topics]
+        results = {
+            task['topic']: result
+            for task, result in self.iter_workflows(tasks, on_result, batch_timeout)
+        }
 
         elapsed = time.time() - start_time
         success_count = sum(1 for r in results.values() if r.get('success'))
@@ -187,16 +189,20 @@ class ParallelCrewManager:
         logger.info(f"🎨 BATCH PRESENTATION GENERATION COMPLETE")
         logger.info(f"{'='*80}")
         logger.info(f"✅ Successful: {success_count}/{len(topics)}")
+        self._log_stopped(results.values())
         logger.info(f"⏱️  Total time: {elapsed:.1f}s")
         logger.info(f"⚡ Avg time per presentation: {elapsed/len(topics):.1f}s")
+        self._log_rate_limits()
         logger.info(f"{'='*80}\n")
 
         return results
 
     def execute_parallel_workflows(
         self,
-        tasks: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+        tasks: List[Dict[str, Any]],
+        on_result: Optional[ResultCallback] = None,
+        batch_timeout: Optional[float] = None
+    ) -> List[WorkflowResult]:
         """
         Execute multiple workflows in parallel with different configurations
 
@@ -206,9 +212,14 @@ class ParallelCrewManager:
                 - 'topic': str
                 - 'content_type': str ('article', 'blog post', 'presentation', etc.)
                 - 'model_name': str (optional, uses default if not specified)
+                - 'research_model', 'writing_model', 'review_model',
+                  'presentation_model': str (optional per-stage models)
+                - 'timeout': float (optional deadline in seconds)
+            on_result: Called with (task, result) as soon as each workflow finishes
+            batch_timeout: Deadline of the whole batch (default: BATCH_TIMEOUT_SECONDS)
 
         Returns:
-            List of workflow results
+            List of workflow results in task order
 
         Example:
             >>> tasks = [
@@ -219,66 +230,622 @@ class ParallelCrewManager:
             >>> results = manager.execute_parallel_workflows(tasks)
         """
         logger.info(f"🔄 Starting parallel execution of {len(tasks)} workflows")
-        logger.info(f"⚡ Using {self.max_workers} parallel workers")
+        self._log_workers()
 
-        results = []
         start_time = time.time()
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
-            for task in tasks:
-                topic = task['topic']
-                content_type = task.get('content_type', 'article')
-                model = task.get('model_name', self.model_name)
-
-                manager = CrewManager(
-                    model_name=model,
-                    temperature=self.temperature,
-                    api_key=self.api_key,
-                    use_anthropic=self.use_anthropic
-                )
+        results: List[Optional[WorkflowResult]] = [None] * len(tasks)
+        for index, result in self._iter_completed(tasks, on_result, batch_timeout):
+            results[index] = result
+
+        elapsed = time.time() - start_time
+        success_count = sum(1 for r in results if r.get('success'))
+
+        logger.info(f"\n{'='*80}")
+        logger.info(f"🔄 PARALLEL WORKFLOWS COMPLETE")
+        logger.info(f"{'='*80}")
+        logger.info(f"✅ Successful: {success_count}/{len(tasks)}")
+        self._log_stopped(results)
+        logger.info(f"⏱️  Total time: {elapsed:.1f}s")
+        logger.info(f"⚡ Avg time per workflow: {elapsed/len(tasks):.1f}s")
+        self._log_rate_limits()
+        logger.info(f"{'='*80}\n")
 
-                if content_type == 'presentation':
-                    future = executor.submit(manager.execute_presentation_workflow, topic)
-                else:
-                    future = executor.submit(manager.execute_research_workflow, topic, content_type)
+        return results
 
-                futures.append((future, task))
+    def iter_workflows(
+        self,
+        tasks: List[Dict[str, Any]],
+        on_result: Optional[ResultCallback] = None,
+        batch_timeout: Optional[float] = None
+    ) -> Iterator[Tuple[Dict[str, Any], WorkflowResult]]:
+        """
+        Run workflows in parallel and yield each result as soon as it finishes
 
-            completed = 0
-            for future, task in futures:
-                completed += 1
+        One slow topic no longer holds back the ones after it, so saving,
+        exporting or publishing can start with the first finished workflow.
+
+        Args:
+            tasks: List of task configurations (same format as execute_parallel_workflows)
+            on_result: Called with (task, result) for every result before it is yielded
+            batch_timeout: Deadline of the whole batch (default: BATCH_TIMEOUT_SECONDS)
+
+        Yields:
+            (task, result) tuples in completion order; failed workflows yield
+            a failed WorkflowResult, and workflows still unfinished at the batch
+            deadline (or after cancel()) one with status 'timeout'/'cancelled'
+
+        Example:
+            >>> for task, result in manager.iter_workflows(tasks):
+            ...     publish(result)
+        """
+        for index, result in self._iter_completed(tasks, on_result, batch_timeout):
+            yield tasks[index], result
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """
+        Cancel every batch this manager is running
+
+        Queued workflows never start and running crews stop at their next
+        LLM call; the batch returns right away with status 'cancelled' for
+        every unfinished workflow.
+
+        Args:
+            reason: Shown in the results' error message
+        """
+        with self._lock:
+            batches = list(self._batches)
+        for batch in batches:
+            batch.cancel(reason)
+        if batches:
+            logger.warning(f"🛑 Cancelling {len(batches)} running batch(es): {reason}")
+
+    def _start_batch(self, batch_timeout: Optional[float]) -> CancelToken:
+        """Create and register the token of a new batch"""
+        timeout = batch_timeout if batch_timeout is not None else config.deadlines.batch_timeout
+        batch = CancelToken(timeout or None, label="batch")
+        with self._lock:
+            self._batches.add(batch)
+        return batch
+
+    def _end_batch(self, batch: CancelToken) -> None:
+        with self._lock:
+            self._batches.discard(batch)
+
+    @staticmethod
+    def _workflow_token(batch: CancelToken, task: Dict[str, Any]) -> CancelToken:
+        """Token of one workflow of a batch"""
+        return batch.child(task.get('timeout') or config.deadlines.workflow_timeout or None)
+
+    def _iter_completed(
+        self,
+        tasks: List[Dict[str, Any]],
+        on_result: Optional[ResultCallback] = None,
+        batch_timeout: Optional[float] = None
+    ) -> Iterator[Tuple[int, WorkflowResult]]:
+        """Yield (task index, result) in completion order"""
+        batch = self._start_batch(batch_timeout)
+        done: "queue.Queue[Tuple[int, Future]]" = queue.Queue()
+        futures: Dict[int, Future] = {}
+        stop = threading.Event()
+
+        def submit_all() -> None:
+            # Submitting may block on the adaptive window, so it runs beside
+            # the consumer instead of delaying the first result
+            for index, task in enumerate(tasks):
+                if stop.is_set() or batch.cancelled:
+                    return
+                try:
+                    future = self._submit_workflow(
+                        task['topic'],
+                        task.get('content_type', 'article'),
+                        task.get('model_name'),
+                        self._task_stage_models(task),
+                        self._workflow_token(batch, task)
+                    )
+                except Exception as e:
+                    future = Future()
+                    future.set_exception(e)
+                futures[index] = future
+                future.add_done_callback(lambda f, index=index: done.put((index, f)))
+
+        submitter = threading.Thread(target=submit_all, name="parallel-crew-submit", daemon=True)
+        submitter.start()
+
+        unfinished = set(range(len(tasks)))
+        completed = 0
+        try:
+            while unfinished:
+                remaining = batch.remaining()
+                try:
+                    # Wake up now and then to notice cancel()
+                    index, future = done.get(timeout=min(0.5, remaining) if remaining is not None else 0.5)
+                except queue.Empty:
+                    if batch.cancelled:
+                        break
+                    continue
+
+                unfinished.discard(index)
+                task = tasks[index]
                 try:
                     result = future.result()
-                    results.append(result)
-                    status = "✅" if result['success'] else "❌"
-                    logger.info(f"{status} [{completed}/{len(tasks)}] {task['topic']} ({task.get('content_type', 'article')})")
                 except Exception as e:
-                    logger.error(f"❌ Error processing {task['topic']}: {str(e)}")
-                    results.append({
-                        "success": False,
-                        "topic": task['topic'],
-                        "error": str(e)
-                    })
+                    result = self._failed_result(task, e)
+                completed += 1
+                self._report_result(task, result, completed, len(tasks), on_result)
+                yield index, result
+
+            # Past the batch deadline (or cancelled): stop waiting; crews still
+            # running stop at their next LLM call and queued ones never start
+            stop.set()
+            for index in sorted(unfinished):
+                future = futures.get(index)
+                if future is not None:
+                    future.cancel()
+                completed += 1
+                result = self._stopped_result(tasks[index], batch)
+                self._report_result(tasks[index], result, completed, len(tasks), on_result)
+                yield index, result
+        finally:
+            # A consumer that stops early leaves unsubmitted topics alone
+            stop.set()
+            self._end_batch(batch)
+
+    @staticmethod
+    def _stopped_result(task: Dict[str, Any], token: CancelToken) -> WorkflowResult:
+        """Result of a workflow abandoned because its batch was cancelled or timed out"""
+        try:
+            token.check()
+            status, error = "cancelled", "Batch stopped"
+        except WorkflowCancelled as e:
+            status, error = e.status, str(e)
+        return WorkflowResult.interrupted(
+            task['topic'], task.get('content_type', 'article'), status, error
+        )
+
+    @staticmethod
+    def _run_in_scope(
+        token: Optional[CancelToken], task: Dict[str, Any], workflow: Callable[..., WorkflowResult], *args
+    ) -> WorkflowResult:
+        """Run a queued workflow under its token, unless it was cancelled while queued"""
+        if token is not None and token.cancelled:
+            return ParallelCrewManager._stopped_result(task, token)
+        with cancel_scope(token):
+            return workflow(*args)
+
+    @staticmethod
+    def _log_stopped(results: Any) -> None:
+        """Log how many workflows were stopped by a deadline or cancel()"""
+        stopped = [r for r in results if r.get('status')]
+        if stopped:
+            timed_out = sum(1 for r in stopped if r.get('status') == 'timeout')
+            logger.info(f"⏱️  Stopped early: {len(stopped)} ({timed_out} timed out)")
+
+    def _failed_result(self, task: Dict[str, Any], error: Exception) -> WorkflowResult:
+        """Build the result of a workflow that raised"""
+        topic = task['topic']
+        logger.error(f"❌ Error processing {topic}: {str(error)}")
+        return WorkflowResult.failed(
+            topic, task.get('content_type', 'article'),
+            f"Error processing {topic}: {str(error)}", error=str(error)
+        )
+
+    def _report_result(
+        self,
+        task: Dict[str, Any],
+        result: WorkflowResult,
+        completed: int,
+        total: int,
+        on_result: Optional[ResultCallback]
+    ) -> Any:
+        """Log a finished workflow and hand it to the result callback"""
+        status = "✅" if result.get('success') else "❌"
+        logger.info(f"{status} [{completed}/{total}] {task['topic']} ({task.get('content_type', 'article')})")
+        if on_result is None:
+            return None
+        try:
+            return on_result(task, result)
+        except Exception as e:
+            # One failing save/publish must not stop the rest of the batch
+            logger.error(f"❌ Result callback failed for {task['topic']}: {str(e)}")
+            return None
+
+    def _get_manager(
+        self,
+        model_name: Optional[str] = None,
+        stage_models: Optional[Dict[str, str]] = None
+    ) -> "CrewManager":
+        """
+        Get the shared CrewManager for a model configuration
+
+        Managers live in the worker pool, so every batch (and every other
+        pool user) with the same configuration reuses one manager and its
+        pooled clients instead of building a new one per topic.
+
+        Args:
+            model_name: Model to use (default: self.model_name)
+            stage_models: Optional model per stage (see CrewManager)
+
+        Returns:
+            CrewManager: Shared manager for the configuration
+        """
+        return self.pool.get_manager(
+            model_name=model_name or self.model_name,
+            temperature=self.temperature,
+            api_key=self.api_key,
+            use_anthropic=self.use_anthropic,
+            stage_models=stage_models
+        )
+
+    def _submit_workflow(
+        self,
+        topic: str,
+        content_type: str,
+        model_name: Optional[str] = None,
+        stage_models: Optional[Dict[str, str]] = None,
+        token: Optional[CancelToken] = None
+    ) -> Future:
+        """
+        Start one workflow on the worker pool or, in process mode, a worker process
+
+        Args:
+            topic: Workflow topic
+            content_type: Type of content ('presentation' runs the presentation workflow)
+            model_name: Model to use (default: self.model_name)
+            stage_models: Optional model per stage (see CrewManager)
+            token: Cancel token of the workflow (worker processes get its
+                nearest deadline as a wall-clock time)
+
+        Returns:
+            Future resolving to the WorkflowResult
+        """
+        if self.executor == "process":
+            if token is not None and token.cancelled:
+                stopped: Future = Future()
+                stopped.set_result(self._stopped_result({'topic': topic, 'content_type': content_type}, token))
+                return stopped
+            remaining = token.remaining() if token else None
+            return self._get_process_pool().submit(
+                self._workflow_spec(
+                    topic, content_type, model_name, stage_models,
+                    time.time() + remaining if remaining is not None else None
+                )
+            )
+
+        manager = self._get_manager(model_name, stage_models)
+        controller = self._get_controller(manager)
+        if controller:
+            # Blocks until the provider's window has room
+            controller.acquire()
+
+        task = {'topic': topic, 'content_type': content_type}
+        try:
+            if content_type == 'presentation':
+                future = self.pool.submit(
+                    self._run_in_scope, token, task, manager.execute_presentation_workflow, topic
+                )
+            else:
+                future = self.pool.submit(
+                    self._run_in_scope, token, task, manager.execute_research_workflow, topic, content_type
+                )
+        except Exception:
+            if controller:
+                controller.release()
+            raise
+
+        if controller:
+            future.add_done_callback(lambda _: controller.release())
+        return future
+
+    def _get_controller(self, manager: "CrewManager") -> Optional[AIMDController]:
+        """Get the adaptive concurrency controller for a manager's provider"""
+        if not self.adaptive:
+            return None
+        return get_concurrency_controller(manager.provider)
+
+    def _log_workers(self) -> None:
+        """Log how many workflows a batch runs at once"""
+        if self.adaptive:
+            window = get_concurrency_controller(self._get_manager().provider).window
+            logger.info(f"⚡ Adaptive concurrency: starting window {window} (max {config.concurrency.max_limit})")
+        else:
+            logger.info(f"⚡ Using {self.max_workers} parallel workers")
+
+    def _workflow_spec(
+        self,
+        topic: str,
+        content_type: str = "article",
+        model_name: Optional[str] = None,
+        stage_models: Optional[Dict[str, str]] = None,
+        deadline: Optional[float] = None
+    ) -> WorkflowSpec:
+        """Build the picklable spec a worker process runs"""
+        return WorkflowSpec(
+            topic=topic,
+            content_type=content_type,
+            model_name=model_name or self.model_name,
+            temperature=self.temperature,
+            use_anthropic=self.use_anthropic,
+            stage_models=tuple(sorted((stage_models or {}).items())),
+            api_key=self.api_key,
+            deadline=deadline,
+        )
+
+    def _get_process_pool(self) -> ProcessWorkerPool:
+        """Get the warm worker pool, starting it on first use"""
+        with self._lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessWorkerPool(
+                    workers=self.max_workers,
+                    warm_spec=self._workflow_spec(""),
+                )
+                logger.info(f"🏭 Started {self._process_pool.workers} worker processes")
+            return self._process_pool
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes of process mode
+
+        The worker pool is left running unless it is private to this
+        manager, since the app, scheduler and scripts share the global one.
+
+        Args:
+            wait: Wait for running workflows to finish
+        """
+        with self._lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+        if self._finalizer is not None:
+            self._finalizer.detach()
+        if self.pool is not worker_pool:
+            self.pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "ParallelCrewManager":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+    def _log_rate_limits(self) -> None:
+        """Log the shared rate limiter utilization, concurrency window and hedging of every provider in use"""
+        if self.adaptive:
+            for provider in self.pool.providers():
+                stats = get_concurrency_controller(provider).stats()
+                logger.info(
+                    f"📶 Concurrency ({provider}): window {stats['window']}, "
+                    f"+{stats['increases']}/-{stats['decreases']} adjustments, "
+                    f"429s {stats['rate_limited']}, errors {stats['errors']}"
+                )
+
+        if config.hedging.enabled:
+            for key, stats in metrics.hedge_summary().items():
+                if not stats["hedges"] or stats["unhedged_p95_seconds"] is None:
+                    continue
+                logger.info(
+                    f"⚡ Hedging ({key}): {stats['hedges']}/{stats['calls']} calls hedged, "
+                    f"{stats['hedge_wins']} won, p95 {stats['unhedged_p95_seconds']:.1f}s -> "
+                    f"{stats['p95_seconds']:.1f}s ({-stats['tail_reduction']:+.0%}), "
+                    f"+{stats['extra_input_tokens'] + stats['extra_output_tokens']} tokens "
+                    f"(${stats['extra_cost_usd']:.4f})"
+                )
+
+        if not config.rate_limit.enabled:
+            return
+
+        for provider in self.pool.providers():
+            stats = get_rate_limiter(provider).stats()
+            logger.info(
+                f"🚦 Rate limit ({provider}): requests {stats['request_utilization']:.0%}, "
+                f"tokens {stats['token_utilization']:.0%}, throttled {stats['throttled_total']}x, "
+                f"429s {stats['rate_limit_errors']}, retries {stats['retries_total']}"
+            )
+
+    @staticmethod
+    def _task_stage_models(task: Dict[str, Any]) -> Dict[str, str]:
+        """Collect the per-stage model keys ('research_model', ...) of a task dict"""
+        return {
+            stage: task[f"{stage}_model"]
+            for stage in STAGES
+            if task.get(f"{stage}_model")
+        }
+
+    async def aexecute_batch_research(
+        self,
+        topics: List[str],
+        content_type: str = "article",
+        max_concurrency: Optional[int] = None,
+        on_result: Optional[ResultCallback] = None,
+        timeout: Optional[float] = None,
+        batch_timeout: Optional[float] = None
+    ) -> Dict[str, WorkflowResult]:
+        """
+        Execute research workflow for multiple topics on one event loop
+
+        Args:
+            topics: List of research topics
+            content_type: Type of content to create
+            max_concurrency: Maximum in-flight workflows (default: self.max_concurrency)
+            on_result: Called (or awaited) with (task, result) as each topic finishes
+            timeout: Deadline per workflow in seconds (default: WORKFLOW_TIMEOUT_SECONDS)
+            batch_timeout: Deadline of the whole batch (default: BATCH_TIMEOUT_SECONDS)
+
+        Returns:
+            Dictionary mapping topic to workflow result
+
+        Example:
+            >>> manager = ParallelCrewManager()
+            >>> results = asyncio.run(manager.aexecute_batch_research(topics))
+        """
+        tasks = [{'topic': topic, 'content_type': content_type, 'timeout': timeout} for topic in topics]
+        results = await self.aexecute_parallel_workflows(tasks, max_concurrency, on_result, batch_timeout)
+        return {task['topic']: result for task, result in zip(tasks, results)}
+
+    async def aexecute_parallel_workflows(
+        self,
+        tasks: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        on_result: Optional[ResultCallback] = None,
+        batch_timeout: Optional[float] = None
+    ) -> List[WorkflowResult]:
+        """
+        Async variant of execute_parallel_workflows
+
+        All workflows share the current event loop; a semaphore bounds how
+        many are in flight so no threads are needed per crew. Workflows past
+        their deadline are cancelled outright.
+
+        Args:
+            tasks: List of task configurations (same format as execute_parallel_workflows)
+            max_concurrency: Maximum in-flight workflows (default: self.max_concurrency)
+            on_result: Called (or awaited, if it is a coroutine function) with
+                (task, result) as soon as each workflow finishes
+            batch_timeout: Deadline of the whole batch (default: BATCH_TIMEOUT_SECONDS)
+
+        Returns:
+            List of workflow results in task order
+        """
+        logger.info(f"🔄 Starting async execution of {len(tasks)} workflows")
+
+        start_time = time.time()
+        results: List[Optional[WorkflowResult]] = [None] * len(tasks)
+        async for index, result in self._aiter_completed(tasks, max_concurrency, on_result, batch_timeout):
+            results[index] = result
 
         elapsed = time.time() - start_time
         success_count = sum(1 for r in results if r.get('success'))
 
         logger.info(f"\n{'='*80}")
-        logger.info(f"🔄 PARALLEL WORKFLOWS COMPLETE")
+        logger.info(f"🔄 ASYNC WORKFLOWS COMPLETE")
         logger.info(f"{'='*80}")
         logger.info(f"✅ Successful: {success_count}/{len(tasks)}")
+        self._log_stopped(results)
         logger.info(f"⏱️  Total time: {elapsed:.1f}s")
-        logger.info(f"⚡ Avg time per workflow: {elapsed/len(tasks):.1f}s")
+        if tasks:
+            logger.info(f"⚡ Avg time per workflow: {elapsed/len(tasks):.1f}s")
+        self._log_rate_limits()
         logger.info(f"{'='*80}\n")
 
         return results
 
+    async def aiter_workflows(
+        self,
+        tasks: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        on_result: Optional[ResultCallback] = None,
+        batch_timeout: Optional[float] = None
+    ) -> AsyncIterator[Tuple[Dict[str, Any], WorkflowResult]]:
+        """
+        Async variant of iter_workflows: yield each result as soon as it finishes
+
+        Args:
+            tasks: List of task configurations (same format as execute_parallel_workflows)
+            max_concurrency: Maximum in-flight workflows (default: self.max_concurrency)
+            on_result: Called (or awaited) with (task, result) before it is yielded
+            batch_timeout: Deadline of the whole batch (default: BATCH_TIMEOUT_SECONDS)
+
+        Yields:
+            (task, result) tuples in completion order
+
+        Example:
+            >>> async for task, result in manager.aiter_workflows(tasks):
+            ...     await publish(result)
+        """
+        async for index, result in self._aiter_completed(tasks, max_concurrency, on_result, batch_timeout):
+            yield tasks[index], result
+
+    async def _aiter_completed(
+        self,
+        tasks: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        on_result: Optional[ResultCallback] = None,
+        batch_timeout: Optional[float] = None
+    ) -> AsyncIterator[Tuple[int, WorkflowResult]]:
+        """Yield (task index, result) in completion order on the current event loop"""
+        batch = self._start_batch(batch_timeout)
+        limit = max_concurrency or self.max_concurrency
+        semaphore = asyncio.Semaphore(limit)
+        logger.info(f"⚡ Up to {limit} concurrent workflows on one event loop")
+
+        async def run(index: int, task: Dict[str, Any]) -> Tuple[int, WorkflowResult]:
+            topic = task['topic']
+            content_type = task.get('content_type', 'article')
+
+            token = self._workflow_token(batch, task)
+            async with semaphore:
+                if token.cancelled:
+                    return index, self._stopped_result(task, token)
+                controller = None
+                try:
+                    model_name, stage_models = task.get('model_name'), self._task_stage_models(task)
+                    if self.executor == "process":
+                        result = await asyncio.wrap_future(self._submit_workflow(
+                            topic, content_type, model_name, stage_models, token
+                        ))
+                    else:
+                        manager = self._get_manager(model_name, stage_models)
+                        controller = self._get_controller(manager)
+                        if controller:
+                            await controller.aacquire()
+                        # The managers' async workflows enforce the token's deadline
+                        with cancel_scope(token):
+                            if content_type == 'presentation':
+                                result = await manager.aexecute_presentation_workflow(topic)
+                            else:
+                                result = await manager.aexecute_research_workflow(topic, content_type)
+                except Exception as e:
+                    result = self._failed_result(task, e)
+                finally:
+                    if controller:
+                        controller.release()
+            return index, result
+
+        futures = {asyncio.ensure_future(run(index, task)): index for index, task in enumerate(tasks)}
+        pending = set(futures)
+        completed = 0
+        try:
+            while pending:
+                remaining = batch.remaining()
+                # Wake up now and then to notice cancel()
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=min(0.5, remaining) if remaining is not None else 0.5,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                finished = [future.result() for future in done]
+                if not done and batch.cancelled:
+                    # Past the batch deadline (or cancelled): stop the rest now
+                    for future in pending:
+                        future.cancel()
+                    finished = [
+                        (futures[future], self._stopped_result(tasks[futures[future]], batch))
+                        for future in pending
+                    ]
+                    pending = set()
+
+                for index, result in sorted(finished, key=lambda item: item[0]):
+                    completed += 1
+                    outcome = self._report_result(tasks[index], result, completed, len(tasks), on_result)
+                    if inspect.isawaitable(outcome):
+                        try:
+                            await outcome
+                        except Exception as e:
+                            logger.error(f"❌ Result callback failed for {tasks[index]['topic']}: {str(e)}")
+                    yield index, result
+        finally:
+            # A consumer that stops early cancels the workflows still running
+            for future in futures:
+                future.cancel()
+            self._end_batch(batch)
+
 
 def benchmark_parallel_vs_sequential(topics: List[str], content_type: str = "article"):
     """
     Benchmark parallel vs sequential processing
 
+    Runs against the live provider unless FAKE_LLM_MODE is 'synthetic' or
+    'replay', which benchmarks the orchestration layer offline.
+
     Args:
         topics: List of topics to process
         content_type: Type of content
@@ -286,6 +853,8 @@ def benchmark_parallel_vs_sequential(topics: List[str], content_type: str = "art
     Returns:
         Dictionary with benchmark results
     """
+    from src.crew_manager import CrewManager
+
     logger.info("📊 Starting benchmark: Parallel vs Sequential")
 
     # Sequential processing
@@ -301,8 +870,8 @@ def benchmark_parallel_vs_sequential(topics: List[str], content_type: str = "art
     # Parallel processing
     logger.info("\n2️⃣ Running parallel processing...")
     parallel_start = time.time()
-    parallel_manager = ParallelCrewManager()
-    parallel_results = parallel_manager.execute_batch_research(topics, content_type)
+    with ParallelCrewManager() as parallel_manager:
+        parallel_results = parallel_manager.execute_batch_research(topics, content_type)
     parallel_time = time.time() - parallel_start
 
     # Calculate speedup
@@ -0,0 +1,204 @@
+"""
+Process Workers - Warm worker processes for CPU-heavy batch orchestration
+Every worker imports CrewAI/LangChain once, keeps its CrewManagers (and their
+pooled LLM clients) between workflows and sends back compact serialized
+results, so prompt templating, parsing and validation scale across cores
+"""
+import multiprocessing
+import time
+import zlib
+from concurrent.futures import Future, InvalidStateError, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import cpu_count
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.config import config
+from src.deadlines import CancelToken, cancel_scope
+from src.metrics import metrics
+from src.workflow_result import WorkflowResult
+
+
+@dataclass(frozen=True)
+class WorkflowSpec:
+    """Picklable description of one workflow to run in a worker process"""
+
+    topic: str
+    content_type: str = "article"
+    model_name: str = "claude-sonnet-4-20250514"
+    temperature: float = 0.7
+    use_anthropic: Optional[bool] = None
+    # Sorted (stage, model) pairs, see CrewManager(stage_models=...)
+    stage_models: Tuple[Tuple[str, str], ...] = ()
+    api_key: Optional[str] = field(default=None, repr=False)
+    # Wall-clock deadline (time.time()) of the workflow and its batch, so
+    # time spent queued for a worker process counts against it
+    deadline: Optional[float] = None
+
+    @property
+    def manager_key(self) -> tuple:
+        """Specs with the same key share one CrewManager in a worker"""
+        return (
+            self.model_name, self.temperature, self.use_anthropic,
+            self.stage_models, self.api_key,
+        )
+
+
+def encode_result(result: WorkflowResult) -> bytes:
+    """Serialize a result for the trip back to the parent process"""
+    return zlib.compress(result.to_json().encode("utf-8"))
+
+
+def decode_result(payload: bytes) -> WorkflowResult:
+    """Inverse of encode_result"""
+    return WorkflowResult.from_json(zlib.decompress(payload).decode("utf-8"))
+
+
+# CrewManagers of the current worker process, by WorkflowSpec.manager_key
+_managers: Dict[tuple, Any] = {}
+
+
+def _init_worker(workers: int, warm_spec: Optional[WorkflowSpec]) -> None:
+    """
+    Prepare a worker process
+
+    Args:
+        workers: Number of workers sharing the provider rate limits
+        warm_spec: Spec whose CrewManager is built up front (imports CrewAI,
+            LangChain and creates the LLM clients once)
+    """
+    # Rate limiters are per process, so each worker gets its share of the budget
+    if config.rate_limit.enabled and workers > 1:
+        for name in ("anthropic_rpm", "anthropic_tpm", "openai_rpm", "openai_tpm"):
+            setattr(config.rate_limit, name, max(1, getattr(config.rate_limit, name) // workers))
+
+    # Workers send their metrics back with each result (see run_workflow);
+    # only the parent writes the export file
+    metrics.export_path = None
+
+    if warm_spec is not None:
+        _get_manager(warm_spec)
+
+
+def _get_manager(spec: WorkflowSpec) -> Any:
+    """Get the worker's CrewManager for a spec"""
+    from src.crew_manager import CrewManager
+
+    key = spec.manager_key
+    if key not in _managers:
+        _managers[key] = CrewManager(
+            model_name=spec.model_name,
+            temperature=spec.temperature,
+            api_key=spec.api_key,
+            use_anthropic=spec.use_anthropic,
+            stage_models=dict(spec.stage_models) or None,
+        )
+    return _managers[key]
+
+
+def run_workflow(spec: WorkflowSpec) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Run one workflow in a worker process
+
+    Args:
+        spec: Workflow to run
+
+    Returns:
+        Tuple of the result serialized with encode_result and the metrics
+        the workflow recorded (MetricsCollector.drain())
+    """
+    token = None
+    if spec.deadline is not None:
+        remaining = spec.deadline - time.time()
+        if remaining <= 0:
+            result = WorkflowResult.interrupted(
+                spec.topic, spec.content_type, "timeout",
+                "Deadline passed while the workflow waited for a worker process",
+            )
+            return encode_result(result), metrics.drain()
+        token = CancelToken(remaining)
+
+    manager = _get_manager(spec)
+    with cancel_scope(token):
+        if spec.content_type == "presentation":
+            result = manager.execute_presentation_workflow(spec.topic)
+        else:
+            result = manager.execute_research_workflow(spec.topic, spec.content_type)
+    return encode_result(result), metrics.drain()
+
+
+class ProcessWorkerPool:
+    """
+    Pool of warm worker processes that run workflows from WorkflowSpecs
+
+    Workers are started with the 'spawn' method (forking a process that
+    runs client and logging threads is unsafe) and live until shutdown(),
+    so the import and client setup cost is paid once per worker.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        warm_spec: Optional[WorkflowSpec] = None,
+        max_tasks_per_worker: Optional[int] = None,
+    ):
+        """
+        Initialize the pool
+
+        Args:
+            workers: Worker processes (default: PARALLEL_PROCESS_WORKERS or CPU count)
+            warm_spec: Spec whose CrewManager every worker builds at start-up
+            max_tasks_per_worker: Restart a worker after this many workflows
+                (default: PARALLEL_WORKER_MAX_TASKS, 0 = never)
+        """
+        self.workers = workers or config.parallel.process_workers or cpu_count()
+        max_tasks = max_tasks_per_worker or config.parallel.worker_max_tasks or None
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.workers, warm_spec),
+            max_tasks_per_child=max_tasks,
+        )
+
+    def submit(self, spec: WorkflowSpec) -> "Future[WorkflowResult]":
+        """
+        Queue a workflow
+
+        Args:
+            spec: Workflow to run
+
+        Returns:
+            Future resolving to the decoded WorkflowResult
+        """
+        result: Future = Future()
+        job = self._executor.submit(run_workflow, spec)
+        # Cancelling the result (batch deadline, cancel()) drops the job while
+        # it is still queued; a workflow already in a worker runs to its deadline
+        result.add_done_callback(lambda f: f.cancelled() and job.cancel())
+
+        def settle(set_outcome: Callable[[Any], None], value: Any) -> None:
+            try:
+                set_outcome(value)
+            except InvalidStateError:
+                # The caller cancelled the result while the workflow ran
+                pass
+
+        def done(job: Future) -> None:
+            if job.cancelled():
+                result.cancel()
+                return
+            try:
+                payload, snapshot = job.result()
+                metrics.merge(snapshot)
+                outcome = decode_result(payload)
+            except BaseException as e:
+                settle(result.set_exception, e)
+                return
+            settle(result.set_result, outcome)
+
+        job.add_done_callback(done)
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers (waits for running workflows by default)"""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
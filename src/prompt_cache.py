@@ -0,0 +1,200 @@
+"""
+Prompt Cache - Provider-side caching of static prompt prefixes
+Marks agent system prompts, static task specs and the growing agent
+conversation as Anthropic cache_control breakpoints, and reports the
+cache-read tokens of both providers
+"""
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+from crewai.llms.base_llm import BaseLLM
+
+from src.llm_wrappers import DelegatingLLM
+
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Static task specs, longest first; registered by whoever builds the prompts
+_static_prompts: List[str] = []
+_static_lock = threading.Lock()
+
+
+def static_prompt(text: str) -> str:
+    """
+    Register prompt text that is identical for every topic
+
+    A user message containing the text gets a cache breakpoint right after
+    it, so the spec is cached once and shared across topics. Specs must
+    come before any per-topic text to form a stable prefix.
+
+    Args:
+        text: Static prompt segment
+
+    Returns:
+        str: The same text, so calls can wrap prompt construction
+    """
+    with _static_lock:
+        if text and text not in _static_prompts:
+            _static_prompts.append(text)
+            _static_prompts.sort(key=len, reverse=True)
+    return text
+
+
+def split_static_prefix(text: str) -> List[Dict[str, Any]]:
+    """
+    Split a prompt into text blocks at the end of its static spec
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        List of Anthropic text blocks; the static prefix block (if any)
+        carries cache_control
+    """
+    with _static_lock:
+        static_prompts = list(_static_prompts)
+
+    for static in static_prompts:
+        start = text.find(static)
+        if start == -1:
+            continue
+
+        end = start + len(static)
+        blocks = [{"type": "text", "text": text[:end], "cache_control": CACHE_CONTROL}]
+        if text[end:]:
+            blocks.append({"type": "text", "text": text[end:]})
+        return blocks
+
+    return [{"type": "text", "text": text}]
+
+
+def mark_cacheable(messages: Any, include_system: bool = False) -> List[Dict[str, Any]]:
+    """
+    Add Anthropic cache breakpoints to a CrewAI message list
+
+    Breakpoints (Anthropic allows four): the system prompt (agent role and
+    backstory), the static task spec in the first user message, and the
+    end of the conversation so the agent's next iteration reads the whole
+    history from cache.
+
+    Args:
+        messages: Prompt string or list of role/content message dicts
+        include_system: Also convert system messages to cached blocks
+            (CrewAI's native client needs a string and is patched instead)
+
+    Returns:
+        New message list; the input is not modified
+    """
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+
+    marked = [dict(message) for message in messages]
+
+    for message in marked:
+        content = message.get("content")
+        if message.get("role") == "system":
+            if include_system and isinstance(content, str) and content:
+                message["content"] = [
+                    {"type": "text", "text": content, "cache_control": CACHE_CONTROL}
+                ]
+        elif message.get("role") == "user" and isinstance(content, str):
+            message["content"] = split_static_prefix(content)
+            break
+
+    last = marked[-1] if marked else None
+    if last and last.get("role") != "system":
+        content = last.get("content")
+        if isinstance(content, str) and content:
+            last["content"] = [{"type": "text", "text": content, "cache_control": CACHE_CONTROL}]
+        elif isinstance(content, list) and content and isinstance(content[-1], dict):
+            content[-1] = {**content[-1], "cache_control": CACHE_CONTROL}
+
+    return marked
+
+
+def _cache_system_prompt(llm: BaseLLM) -> None:
+    """Send the native Anthropic client's system prompt as a cached block"""
+    prepare = getattr(llm, "_prepare_completion_params", None)
+    if prepare is None:
+        return
+
+    def prepare_with_cache(messages, system_message=None, tools=None):
+        params = prepare(messages, system_message, tools)
+        if isinstance(params.get("system"), str):
+            params["system"] = [
+                {"type": "text", "text": params["system"], "cache_control": CACHE_CONTROL}
+            ]
+        return params
+
+    llm._prepare_completion_params = prepare_with_cache
+
+
+def _report_cache_reads(llm: BaseLLM) -> None:
+    """Add cache-read tokens to the usage the native client extracts"""
+    for name in ("_extract_anthropic_token_usage", "_extract_openai_token_usage"):
+        extract = getattr(llm, name, None)
+        if extract is None:
+            continue
+
+        def extract_with_cache(response, extract=extract):
+            usage = extract(response)
+            raw = getattr(response, "usage", None)
+            if raw is None:
+                return usage
+
+            # Anthropic excludes cache reads/writes from input_tokens;
+            # OpenAI includes cached tokens in prompt_tokens
+            details = getattr(raw, "prompt_tokens_details", None)
+            usage["cached_tokens"] = (
+                getattr(raw, "cache_read_input_tokens", None)
+                or getattr(details, "cached_tokens", None)
+                or 0
+            )
+            cache_writes = getattr(raw, "cache_creation_input_tokens", None) or 0
+            if cache_writes:
+                usage["input_tokens"] = usage.get("input_tokens", 0) + cache_writes
+            return usage
+
+        setattr(llm, name, extract_with_cache)
+
+
+class PromptCachingLLM(DelegatingLLM):
+    """
+    CrewAI LLM layer that makes static prompt prefixes cacheable
+
+    Anthropic caches only what is marked with cache_control; OpenAI caches
+    long identical prefixes automatically, so there only the cache-read
+    token counts are collected.
+    """
+
+    @property
+    def _marks_prompts(self) -> bool:
+        return self._provider == "anthropic"
+
+    def _prepare_inner(self, inner: BaseLLM) -> None:
+        super()._prepare_inner(inner)
+        _report_cache_reads(inner)
+        if self._marks_prompts:
+            _cache_system_prompt(inner)
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        if self._marks_prompts:
+            messages = mark_cacheable(messages)
+        return super().call(messages, tools, callbacks, available_functions,
+                            from_task, from_agent, response_model)
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        if self._marks_prompts:
+            messages = mark_cacheable(messages)
+        return await super().acall(messages, tools, callbacks, available_functions,
+                                   from_task, from_agent, response_model)
+
+    def stream_text(
+        self, messages: Any, usage: Optional[Dict[str, int]] = None
+    ) -> Iterator[str]:
+        # Streaming goes through LangChain, which accepts cached system blocks
+        if self._marks_prompts:
+            messages = mark_cacheable(messages, include_system=True)
+        return super().stream_text(messages, usage=usage)
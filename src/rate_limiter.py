@@ -0,0 +1,426 @@
+"""
+Rate Limiter - Process-wide request and token budgets per provider
+Every CrewManager (and every parallel workflow) shares one limiter per
+provider, so a batch paces itself instead of tripping 429 error storms
+"""
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+from src.concurrency import AIMDController
+from src.config import config
+from src.llm_wrappers import DelegatingLLM, usage_scope
+from src.logger import logger
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously up to a per-minute budget
+
+    Not thread-safe on its own; ProviderRateLimiter holds the lock.
+    """
+
+    def __init__(self, per_minute: float):
+        """
+        Initialize a full bucket
+
+        Args:
+            per_minute: Budget per minute (also the burst capacity)
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` can be taken (0.0 = now)"""
+        self._refill(now)
+        # A single request larger than the whole budget waits for a full bucket
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+    def adjust(self, amount: float) -> None:
+        """Debit (or credit, if negative) a correction; may go into debt"""
+        self.level = max(-self.capacity, min(self.capacity, self.level - amount))
+
+    @property
+    def utilization(self) -> float:
+        self._refill(time.monotonic())
+        return max(0.0, 1.0 - self.level / self.capacity)
+
+
+class ProviderRateLimiter:
+    """
+    Requests/min and tokens/min budget for one provider
+
+    Callers reserve one request plus their estimated prompt tokens before a
+    call and settle the real token count afterwards. A 429 pauses every
+    caller until the provider's Retry-After has passed.
+    """
+
+    def __init__(self, provider: str, rpm: Optional[int] = None, tpm: Optional[int] = None):
+        """
+        Initialize the limiter
+
+        Args:
+            provider: Provider name ('anthropic' or 'openai')
+            rpm: Requests per minute (None or 0 = unlimited)
+            tpm: Tokens per minute (None or 0 = unlimited)
+        """
+        self.provider = provider
+        self.rpm = rpm or None
+        self.tpm = tpm or None
+        self._requests = TokenBucket(rpm) if rpm else None
+        self._tokens = TokenBucket(tpm) if tpm else None
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+
+        self.waiting = 0
+        self.in_flight = 0
+        self.throttled_total = 0
+        self.rate_limit_errors = 0
+        self.retries_total = 0
+
+    def _reserve(self, tokens: int) -> float:
+        """Take the budget if available, else return the seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until - now)
+            if self._requests:
+                wait = max(wait, self._requests.wait_time(1, now))
+            if self._tokens:
+                wait = max(wait, self._tokens.wait_time(tokens, now))
+
+            if wait == 0.0:
+                if self._requests:
+                    self._requests.take(1)
+                if self._tokens:
+                    self._tokens.take(tokens)
+                self.in_flight += 1
+            return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until a request with `tokens` prompt tokens fits the budget
+
+        Args:
+            tokens: Estimated tokens of the request
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        start = time.monotonic()
+        wait = self._reserve(tokens)
+        if wait:
+            self._start_waiting()
+            try:
+                while wait:
+                    # Re-check regularly: a Retry-After may extend the wait
+                    time.sleep(min(wait, 1.0))
+                    wait = self._reserve(tokens)
+            finally:
+                self._stop_waiting()
+        return time.monotonic() - start
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """Async variant of acquire() that sleeps without holding a thread"""
+        start = time.monotonic()
+        wait = self._reserve(tokens)
+        if wait:
+            self._start_waiting()
+            try:
+                while wait:
+                    await asyncio.sleep(min(wait, 1.0))
+                    wait = self._reserve(tokens)
+            finally:
+                self._stop_waiting()
+        return time.monotonic() - start
+
+    def _start_waiting(self) -> None:
+        with self._lock:
+            self.waiting += 1
+            self.throttled_total += 1
+
+    def _stop_waiting(self) -> None:
+        with self._lock:
+            self.waiting -= 1
+
+    def release(self, reserved_tokens: int, used_tokens: Optional[int] = None) -> None:
+        """
+        Finish a request and settle its token reservation
+
+        Args:
+            reserved_tokens: Tokens reserved by acquire()
+            used_tokens: Tokens the provider actually counted (None = as reserved)
+        """
+        with self._lock:
+            self.in_flight -= 1
+            if self._tokens and used_tokens is not None:
+                self._tokens.adjust(used_tokens - reserved_tokens)
+
+    def penalize(self, retry_after: float, retrying: bool = False) -> None:
+        """
+        Pause every caller after the provider returned a rate limit error
+
+        Args:
+            retry_after: Seconds to pause
+            retrying: Whether the failed call will be retried
+        """
+        with self._lock:
+            self.rate_limit_errors += 1
+            if retrying:
+                self.retries_total += 1
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get current utilization
+
+        Returns:
+            Dict with limits, bucket utilization (0.0-1.0) and counters
+        """
+        with self._lock:
+            return {
+                "provider": self.provider,
+                "rpm_limit": self.rpm,
+                "tpm_limit": self.tpm,
+                "request_utilization": self._requests.utilization if self._requests else 0.0,
+                "token_utilization": self._tokens.utilization if self._tokens else 0.0,
+                "in_flight": self.in_flight,
+                "waiting": self.waiting,
+                "paused_seconds": max(0.0, self._blocked_until - time.monotonic()),
+                "throttled_total": self.throttled_total,
+                "rate_limit_errors": self.rate_limit_errors,
+                "retries_total": self.retries_total,
+            }
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Check whether an error is a provider rate limit or overload response
+
+    Args:
+        error: Exception raised by an LLM call (causes are inspected too)
+
+    Returns:
+        Seconds from the Retry-After header, 0.0 if retryable without a
+        header, or None if the error is not a rate limit
+    """
+    while error is not None:
+        response = getattr(error, "response", None)
+        status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+        if status in (429, 529) or "rate limit" in str(error).lower():
+            headers = getattr(response, "headers", None) or {}
+            try:
+                return max(0.0, float(headers.get("retry-after", 0)))
+            except (TypeError, ValueError):
+                return 0.0
+        error = error.__cause__
+    return None
+
+
+def estimate_tokens(messages: Any) -> int:
+    """Rough prompt token count (4 characters per token)"""
+    if isinstance(messages, str):
+        return len(messages) // 4
+    return sum(len(str(message.get("content", ""))) for message in messages) // 4
+
+
+class ConcurrencyReportingLLM(DelegatingLLM):
+    """
+    CrewAI LLM layer that reports every call's latency or failure to the
+    provider's adaptive concurrency controller
+
+    It sits below RateLimitedLLM (when rate limiting is on), so each retried
+    attempt is reported and time spent waiting for the budget is not counted
+    as latency.
+    """
+
+    def __init__(self, inner: Any, controller: AIMDController, **kwargs):
+        """
+        Initialize the reporting LLM
+
+        Args:
+            inner: LLM to call
+            controller: Adaptive concurrency controller of the provider
+            **kwargs: Passed to DelegatingLLM
+        """
+        super().__init__(inner, **kwargs)
+        self.controller = controller
+
+    def _report(self, start: float, from_agent: Any = None, error: Optional[Exception] = None) -> None:
+        """Report a finished call to the concurrency controller"""
+        if error is None:
+            # Latencies are only comparable between calls of the same agent
+            key = getattr(from_agent, "role", None) or str(self.model)
+            self.controller.record_success(time.monotonic() - start, key)
+        elif retry_after_seconds(error) is not None:
+            self.controller.record_rate_limit()
+        else:
+            self.controller.record_error()
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        start = time.monotonic()
+        try:
+            response = super().call(messages, tools, callbacks, available_functions,
+                                    from_task, from_agent, response_model)
+        except Exception as e:
+            self._report(start, error=e)
+            raise
+        self._report(start, from_agent)
+        return response
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        start = time.monotonic()
+        try:
+            response = await super().acall(messages, tools, callbacks, available_functions,
+                                           from_task, from_agent, response_model)
+        except Exception as e:
+            self._report(start, error=e)
+            raise
+        self._report(start, from_agent)
+        return response
+
+
+class RateLimitedLLM(DelegatingLLM):
+    """
+    CrewAI LLM layer that waits for the provider budget before each call
+
+    Rate limit errors pause the shared limiter for Retry-After seconds (or
+    an exponential backoff) and the call is retried.
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        limiter: ProviderRateLimiter,
+        max_retries: int = 5,
+        max_backoff: float = 60.0,
+        **kwargs,
+    ):
+        """
+        Initialize the rate limited LLM
+
+        Args:
+            inner: LLM to call
+            limiter: Shared limiter for the provider
+            max_retries: Rate limit retries per call
+            max_backoff: Longest pause between retries in seconds
+            **kwargs: Passed to DelegatingLLM
+        """
+        super().__init__(inner, **kwargs)
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+
+    def _backoff(self, error: Exception, attempt: int) -> Optional[float]:
+        """Seconds to pause before retrying, or None to give up"""
+        retry_after = retry_after_seconds(error)
+        if retry_after is None:
+            return None
+
+        # Without a Retry-After header: exponential backoff with jitter
+        delay = retry_after or min(self.max_backoff, 2 ** attempt) * random.uniform(0.5, 1.0)
+        delay = min(delay, self.max_backoff)
+        retrying = attempt < self.max_retries
+        self.limiter.penalize(delay, retrying=retrying)
+        if not retrying:
+            return None
+        logger.warning(
+            f"🚦 {self.limiter.provider} rate limited; retry {attempt + 1}/{self.max_retries} "
+            f"in {delay:.1f}s"
+        )
+        return delay
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> Any:
+        tokens = estimate_tokens(messages)
+        attempt = 0
+        while True:
+            self.limiter.acquire(tokens)
+            used = None
+            try:
+                with usage_scope() as usage:
+                    response = super().call(messages, tools, callbacks, available_functions,
+                                            from_task, from_agent, response_model)
+                used = usage["input_tokens"] + usage["output_tokens"] or None
+                return response
+            except Exception as e:
+                if self._backoff(e, attempt) is None:
+                    raise
+                attempt += 1
+            finally:
+                self.limiter.release(tokens, used)
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None) -> Any:
+        tokens = estimate_tokens(messages)
+        attempt = 0
+        while True:
+            await self.limiter.aacquire(tokens)
+            used = None
+            try:
+                with usage_scope() as usage:
+                    response = await super().acall(messages, tools, callbacks, available_functions,
+                                                   from_task, from_agent, response_model)
+                used = usage["input_tokens"] + usage["output_tokens"] or None
+                return response
+            except Exception as e:
+                if self._backoff(e, attempt) is None:
+                    raise
+                attempt += 1
+            finally:
+                self.limiter.release(tokens, used)
+
+    def stream_text(
+        self, messages: Any, usage: Optional[Dict[str, int]] = None
+    ) -> Iterator[str]:
+        # Chunks already reached the caller, so a failed stream is not retried
+        tokens = estimate_tokens(messages)
+        usage = usage if usage is not None else {"input_tokens": 0, "output_tokens": 0, "cached_tokens": 0}
+        self.limiter.acquire(tokens)
+        try:
+            yield from super().stream_text(messages, usage=usage)
+        except Exception as e:
+            self._backoff(e, self.max_retries)
+            raise
+        finally:
+            used = usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+            self.limiter.release(tokens, used or None)
+
+
+_limiters: Dict[str, ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> ProviderRateLimiter:
+    """
+    Get the process-wide limiter for a provider
+
+    Args:
+        provider: 'anthropic' or 'openai'
+
+    Returns:
+        ProviderRateLimiter: Limiter configured from RateLimitConfig
+    """
+    with _limiters_lock:
+        if provider not in _limiters:
+            _limiters[provider] = ProviderRateLimiter(
+                provider,
+                rpm=getattr(config.rate_limit, f"{provider}_rpm", None),
+                tpm=getattr(config.rate_limit, f"{provider}_tpm", None),
+            )
+        return _limiters[provider]
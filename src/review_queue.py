@@ -0,0 +1,234 @@
+"""
+Review Queue - Runs the reviewer stage off the critical path
+Writer output is returned immediately; sampled reviews run in background
+threads and their verdicts go to a JSONL side channel and to listeners
+"""
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src.config import config
+from src.logger import logger
+
+
+def parse_review(review: str) -> Dict[str, Any]:
+    """
+    Extract the quality score and final verdict from a review
+
+    Args:
+        review: Reviewer agent output
+
+    Returns:
+        Dict with 'score' (float or None) and 'verdict'
+        ('approve', 'minor_revision', 'major_revision' or None)
+    """
+    score = None
+    # The value after the colon of a 'Score:' line ('Quality score (1-10): 8',
+    # '**Score:** 8/10'), so an echoed rubric range is not read as the score
+    match = re.search(r"\bscore\b[^:\n]*:[\s*]*(\d+(?:\.\d+)?)", review, re.IGNORECASE)
+    if match:
+        score = float(match.group(1))
+
+    verdict = None
+    section = review.lower()
+    if "final verdict" in section:
+        section = section[section.rindex("final verdict"):]
+    if "major revision" in section:
+        verdict = "major_revision"
+    elif "minor revision" in section:
+        verdict = "minor_revision"
+    elif "approve" in section:
+        verdict = "approve"
+
+    return {"score": score, "verdict": verdict}
+
+
+class ReviewQueue:
+    """
+    Background reviewer with a verdict side channel
+
+    Every verdict is appended to a JSONL file and passed to the registered
+    listeners, which can update or unpublish the post it belongs to.
+    """
+
+    def __init__(
+        self,
+        verdicts_path: Optional[str] = None,
+        max_workers: int = 2,
+        sample_rate: float = 1.0,
+    ):
+        """
+        Initialize the review queue
+
+        Args:
+            verdicts_path: JSONL file verdicts are appended to (None = don't persist)
+            max_workers: Number of concurrent background reviews
+            sample_rate: Fraction of posts that get reviewed (0.0-1.0)
+        """
+        self.verdicts_path = verdicts_path
+        self.max_workers = max_workers
+        self.sample_rate = sample_rate
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Register a callback that receives every verdict
+
+        Args:
+            listener: Called with the verdict dict from a background thread
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Unregister a verdict callback"""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def submit(
+        self,
+        review_fn: Callable[[], str],
+        topic: str,
+        content_type: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """
+        Queue a review if the post is sampled
+
+        Args:
+            review_fn: Runs the reviewer and returns its output
+            topic: Topic of the reviewed content
+            content_type: Type of the reviewed content
+            metadata: Extra fields copied into the verdict
+
+        Returns:
+            str: Review ID, or None if the post was not sampled
+        """
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return None
+
+        review_id = uuid.uuid4().hex
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="reviewer"
+                )
+            future = self._executor.submit(
+                self._review, review_id, review_fn, topic, content_type, metadata or {}
+            )
+            self._pending[review_id] = future
+
+        future.add_done_callback(lambda _: self._forget(review_id))
+        logger.info(f"🔍 Review queued for '{topic}' ({review_id[:8]})")
+        return review_id
+
+    def _forget(self, review_id: str) -> None:
+        with self._lock:
+            self._pending.pop(review_id, None)
+
+    def _review(
+        self,
+        review_id: str,
+        review_fn: Callable[[], str],
+        topic: str,
+        content_type: str,
+        metadata: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Run one review and publish its verdict"""
+        start = time.time()
+        try:
+            review = str(review_fn())
+            verdict = {"status": "reviewed", "review": review, **parse_review(review)}
+        except Exception as e:
+            logger.error(f"❌ Review failed for '{topic}': {str(e)}")
+            verdict = {"status": "failed", "review": None, "score": None,
+                       "verdict": None, "error": str(e)}
+
+        verdict.update(
+            {
+                "review_id": review_id,
+                "topic": topic,
+                "content_type": content_type,
+                "reviewed_at": time.time(),
+                "duration_seconds": round(time.time() - start, 3),
+                **metadata,
+            }
+        )
+        logger.info(
+            f"🔍 Review for '{topic}': verdict={verdict['verdict']}, score={verdict['score']}"
+        )
+
+        self._persist(verdict)
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(verdict)
+            except Exception as e:
+                logger.warning(f"⚠️  Review listener failed: {str(e)}")
+
+        return verdict
+
+    def _persist(self, verdict: Dict[str, Any]) -> None:
+        """Append a verdict to the JSONL side channel"""
+        if not self.verdicts_path:
+            return
+
+        try:
+            Path(self.verdicts_path).parent.mkdir(parents=True, exist_ok=True)
+            line = json.dumps(verdict, ensure_ascii=False, default=str)
+            with self._lock:
+                with open(self.verdicts_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except OSError as e:
+            logger.warning(f"⚠️  Could not save review verdict: {str(e)}")
+
+    @property
+    def pending(self) -> int:
+        """Number of queued or running reviews"""
+        with self._lock:
+            return len(self._pending)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every queued review to finish
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            bool: True if all reviews finished
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                futures = list(self._pending.values())
+            if not futures:
+                return True
+
+            remaining = None if deadline is None else deadline - time.time()
+            if remaining is not None and remaining <= 0:
+                return False
+            try:
+                futures[0].result(timeout=remaining)
+            except Exception:
+                # Failures are reported through the verdict, not here
+                pass
+
+
+# Global review queue instance
+review_queue = ReviewQueue(
+    verdicts_path=config.review.verdicts_path,
+    max_workers=config.review.workers,
+    sample_rate=config.review.sample_rate,
+)
@@ -0,0 +1,239 @@
+"""
+Sectioned Writer - Outline first, then write every section concurrently
+Long-form latency drops to one outline call plus the slowest section,
+instead of one long sequential generation
+"""
+import asyncio
+import contextvars
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from agents.writer import WriterAgent
+from src.llm_wrappers import usage_scope
+from src.prompt_cache import static_prompt
+
+
+# Total length the sections share, matching the single-call blog template
+TARGET_WORDS = 2000
+
+
+def parse_outline(outline: str) -> Tuple[Optional[str], List[Dict[str, str]]]:
+    """
+    Parse a Markdown outline into a title and its sections
+
+    Args:
+        outline: "# Title" line followed by "## Heading" lines with bullet notes
+
+    Returns:
+        Tuple of (title or None, list of {'heading', 'notes'} dicts)
+    """
+    title = None
+    sections: List[Dict[str, str]] = []
+
+    for line in outline.replace("\r\n", "\n").split("\n"):
+        stripped = line.strip()
+        if stripped.startswith("## "):
+            sections.append({"heading": stripped[3:].strip(), "notes": ""})
+        elif stripped.startswith("# ") and title is None and not sections:
+            title = stripped[2:].strip()
+        elif stripped and sections:
+            sections[-1]["notes"] += stripped + "\n"
+
+    return title, sections
+
+
+def clean_section(text: str, heading: str) -> str:
+    """
+    Normalize one generated section so the stitched post stays valid Markdown
+
+    Strips code fences wrapping the whole answer and stray H1 titles, and
+    makes sure the section starts with its "## heading" line.
+
+    Args:
+        text: Generated section
+        heading: Heading from the outline
+
+    Returns:
+        str: Section Markdown
+    """
+    text = text.strip()
+    fenced = re.match(r"^```(?:markdown|md)?\n(.*)\n```$", text, re.DOTALL)
+    if fenced:
+        text = fenced.group(1).strip()
+
+    lines = [line for line in text.split("\n") if not re.match(r"^#\s", line)]
+    text = "\n".join(lines).strip()
+
+    if not text.startswith("## "):
+        text = f"## {heading}\n\n{text}"
+    return text
+
+
+def stitch_sections(title: str, sections: List[str]) -> str:
+    """
+    Join sections into the same Markdown structure as a single-call post
+
+    Args:
+        title: Post title
+        sections: Section Markdown in outline order
+
+    Returns:
+        str: Complete post
+    """
+    return f"# {title}\n\n" + "\n\n".join(sections) + "\n"
+
+
+class SectionedWriter:
+    """
+    Writes long posts as an outline plus concurrently generated sections
+
+    Every section prompt carries the same static instructions, topic,
+    outline and research (a shared, cacheable prefix) and ends with the
+    section it has to write.
+    """
+
+    def __init__(self, llm: Any, max_workers: int = 8):
+        """
+        Initialize the writer
+
+        Args:
+            llm: CrewAI LLM of the writing stage
+            max_workers: Sections generated at the same time
+        """
+        self.llm = llm
+        self.max_workers = max_workers
+        # Threads start on the first write(), so async-only use never spawns any
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="section-writer"
+        )
+
+    @staticmethod
+    def _messages(system: str, prompt: str) -> List[Dict[str, str]]:
+        return [{"role": "system", "content": system}, {"role": "user", "content": prompt}]
+
+    @staticmethod
+    def _outline_prompt(topic: str, research: str) -> str:
+        return f"""{static_prompt(WriterAgent.get_outline_task_description())}
+
+Topic: {topic}
+
+Research findings:
+
+{research}"""
+
+    @staticmethod
+    def _section_prompt(
+        topic: str, research: str, outline: str, section: Dict[str, str], words: int
+    ) -> str:
+        return f"""{static_prompt(WriterAgent.get_section_task_description())}
+
+Topic: {topic}
+
+Research findings:
+
+{research}
+
+Outline of the whole post:
+
+{outline}
+
+Write this section (about {words} words):
+
+## {section['heading']}
+{section['notes']}"""
+
+    def _call(self, system: str, prompt: str) -> Tuple[str, Dict[str, int]]:
+        """Make one LLM call and return its text and token usage"""
+        with usage_scope() as usage:
+            text = self.llm.call(self._messages(system, prompt))
+        return str(text), usage
+
+    async def _acall(self, system: str, prompt: str) -> Tuple[str, Dict[str, int]]:
+        with usage_scope() as usage:
+            text = await self.llm.acall(self._messages(system, prompt))
+        return str(text), usage
+
+    @staticmethod
+    def _add_usage(total: Dict[str, int], usage: Dict[str, int]) -> None:
+        total["llm_calls"] += 1
+        for name in ("input_tokens", "output_tokens", "cached_tokens"):
+            total[name] += usage.get(name, 0)
+
+    def _plan(self, topic: str, outline: str) -> Optional[Tuple[str, List[Dict[str, str]], int]]:
+        """Parse the outline; None if it is too thin to write from"""
+        title, sections = parse_outline(outline)
+        if len(sections) < 3:
+            return None
+        return title or topic, sections, max(150, TARGET_WORDS // len(sections))
+
+    def write(
+        self, system: str, topic: str, research: str
+    ) -> Tuple[Optional[str], Dict[str, int]]:
+        """
+        Write a post: outline first, then all sections concurrently
+
+        Args:
+            system: System prompt of the writer agent
+            topic: Topic of the post
+            research: Research findings to write from
+
+        Returns:
+            Tuple of (Markdown post, or None if the outline could not be
+            parsed, and the combined token usage)
+        """
+        total = {"llm_calls": 0, "input_tokens": 0, "output_tokens": 0, "cached_tokens": 0}
+        outline, usage = self._call(system, self._outline_prompt(topic, research))
+        self._add_usage(total, usage)
+
+        plan = self._plan(topic, outline)
+        if plan is None:
+            return None, total
+        title, sections, words = plan
+
+        # Section threads see the workflow's deadline (a context per submit)
+        futures = [
+            self._executor.submit(
+                contextvars.copy_context().run,
+                self._call, system, self._section_prompt(topic, research, outline, section, words)
+            )
+            for section in sections
+        ]
+
+        texts = []
+        for section, future in zip(sections, futures):
+            text, usage = future.result()
+            self._add_usage(total, usage)
+            texts.append(clean_section(text, section["heading"]))
+
+        return stitch_sections(title, texts), total
+
+    async def awrite(
+        self, system: str, topic: str, research: str
+    ) -> Tuple[Optional[str], Dict[str, int]]:
+        """Async variant of write() that gathers the sections on the event loop"""
+        total = {"llm_calls": 0, "input_tokens": 0, "output_tokens": 0, "cached_tokens": 0}
+        outline, usage = await self._acall(system, self._outline_prompt(topic, research))
+        self._add_usage(total, usage)
+
+        plan = self._plan(topic, outline)
+        if plan is None:
+            return None, total
+        title, sections, words = plan
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def write_section(section: Dict[str, str]) -> Tuple[str, Dict[str, int]]:
+            async with semaphore:
+                return await self._acall(
+                    system, self._section_prompt(topic, research, outline, section, words)
+                )
+
+        results = await asyncio.gather(*(write_section(section) for section in sections))
+
+        texts = []
+        for section, (text, usage) in zip(sections, results):
+            self._add_usage(total, usage)
+            texts.append(clean_section(text, section["heading"]))
+
+        return stitch_sections(title, texts), total
@@ -0,0 +1,302 @@
+"""
+Semantic Research Cache - Reuse research for near-duplicate topics
+Matches new topics against prior research by embedding cosine similarity;
+the on-disk index is shared by every process and merged under a file lock
+"""
+import contextlib
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from filelock import FileLock
+
+from src.logger import logger
+
+
+class SemanticResearchCache:
+    """
+    Second-tier cache that maps topics to research output by meaning
+
+    "Complete Guide to X 2026" and "Mastering X 2026" never share an exact
+    prompt, but their embeddings are close enough to reuse the research stage.
+    """
+
+    INDEX_DIR = "research_cache"
+
+    def __init__(
+        self,
+        persist_directory: str,
+        model_name: str = "all-MiniLM-L6-v2",
+        threshold: float = 0.85,
+        max_age_seconds: Optional[int] = 3 * 24 * 3600,
+        max_entries: Optional[int] = 2000,
+        embedder: Optional[Callable[[List[str]], Any]] = None,
+    ):
+        """
+        Initialize the semantic cache
+
+        Args:
+            persist_directory: Base directory (VectorDBConfig.persist_directory)
+            model_name: sentence-transformers model used for embeddings
+            threshold: Minimum cosine similarity for a cache hit
+            max_age_seconds: Ignore (and drop) research older than this (None = no limit)
+            max_entries: Newest entries kept in the index (None = no limit)
+            embedder: Optional callable mapping texts to vectors (overrides the model)
+        """
+        self.index_dir = Path(persist_directory) / self.INDEX_DIR
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+        self._embedder = embedder
+        self._lock = threading.Lock()
+        self._model_lock = threading.Lock()
+
+        self._embeddings: Optional[np.ndarray] = None
+        self._entries: List[Dict[str, Any]] = []
+        # mtime of the index files when this process last read or wrote them
+        self._loaded_mtime: Optional[int] = None
+        self._load()
+
+    @property
+    def _embeddings_path(self) -> Path:
+        return self.index_dir / "embeddings.npy"
+
+    @property
+    def _entries_path(self) -> Path:
+        return self.index_dir / "entries.json"
+
+    @property
+    def _lock_path(self) -> Path:
+        return self.index_dir / "index.lock"
+
+    def _index_mtime(self) -> Optional[int]:
+        try:
+            return self._entries_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _read_index(self) -> Tuple[List[Dict[str, Any]], Optional[np.ndarray]]:
+        """Read the persisted index ([] and None if missing or unreadable)"""
+        if not (self._embeddings_path.exists() and self._entries_path.exists()):
+            return [], None
+
+        try:
+            embeddings = np.load(self._embeddings_path)
+            with open(self._entries_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Could not load semantic research cache: {str(e)}")
+            return [], None
+
+        if len(entries) != len(embeddings):
+            return [], None
+        return entries, embeddings
+
+    def _load(self) -> None:
+        """Load the persisted index, if any"""
+        self._loaded_mtime = self._index_mtime()
+        entries, embeddings = self._read_index()
+        if embeddings is not None:
+            self._entries, self._embeddings = entries, embeddings
+
+    def _refresh(self) -> None:
+        """Reload the index if another process has saved it since"""
+        mtime = self._index_mtime()
+        if mtime is not None and mtime != self._loaded_mtime:
+            self._load()
+
+    def _merge(
+        self, entries: List[Dict[str, Any]], embeddings: Optional[np.ndarray]
+    ) -> None:
+        """
+        Merge another copy of the index into this one
+
+        The newest entry per topic wins; expired entries and everything past
+        max_entries (oldest first) are dropped.
+        """
+        newest: Dict[str, Tuple[Dict[str, Any], np.ndarray]] = {}
+        sources = [(self._entries, self._embeddings)]
+        if embeddings is not None and (
+            self._embeddings is None or embeddings.shape[1:] == self._embeddings.shape[1:]
+        ):
+            sources.append((entries, embeddings))
+
+        for source_entries, source_embeddings in sources:
+            if source_embeddings is None:
+                continue
+            for entry, vector in zip(source_entries, source_embeddings):
+                current = newest.get(entry["topic"])
+                if current is None or entry["created_at"] > current[0]["created_at"]:
+                    newest[entry["topic"]] = (entry, vector)
+
+        kept = sorted(newest.values(), key=lambda item: item[0]["created_at"], reverse=True)
+        if self.max_age_seconds:
+            cutoff = time.time() - self.max_age_seconds
+            kept = [item for item in kept if item[0]["created_at"] >= cutoff]
+        if self.max_entries:
+            kept = kept[:self.max_entries]
+
+        self._entries = [entry for entry, _ in kept]
+        self._embeddings = np.stack([vector for _, vector in kept]) if kept else None
+
+    def _write(self, path: Path, write: Callable[[Any], None]) -> None:
+        """Write a file through a uniquely named temporary file and rename it"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.index_dir, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    def _save(self) -> None:
+        """
+        Persist the index atomically
+
+        Other processes (worker processes, other runs) write the same index,
+        so their entries are merged in under a file lock before it is
+        replaced.
+        """
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+
+        with FileLock(str(self._lock_path)):
+            self._merge(*self._read_index())
+            if self._embeddings is None:
+                return
+
+            embeddings, entries = self._embeddings, self._entries
+            self._write(self._embeddings_path, lambda f: np.save(f, embeddings))
+            self._write(
+                self._entries_path,
+                lambda f: f.write(json.dumps(entries, ensure_ascii=False).encode("utf-8")),
+            )
+            self._loaded_mtime = self._index_mtime()
+
+    def _embed(self, text: str) -> np.ndarray:
+        """Embed and L2-normalize a text"""
+        if self._embedder is None:
+            with self._model_lock:
+                if self._embedder is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    self._embedder = SentenceTransformer(self.model_name).encode
+
+        vector = np.asarray(self._embedder([text])[0], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, topic: str) -> Optional[Dict[str, Any]]:
+        """
+        Find prior research for the most similar topic
+
+        Args:
+            topic: New research topic
+
+        Returns:
+            Dict with 'topic', 'research' and 'similarity', or None on a miss
+        """
+        query = self._embed(topic)
+
+        with self._lock:
+            self._refresh()
+            if self._embeddings is None or not len(self._entries):
+                return None
+
+            similarities = self._embeddings @ query
+            if self.max_age_seconds:
+                cutoff = time.time() - self.max_age_seconds
+                for i, entry in enumerate(self._entries):
+                    if entry["created_at"] < cutoff:
+                        similarities[i] = -1.0
+
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            if similarity < self.threshold:
+                return None
+
+            entry = self._entries[best]
+            return {
+                "topic": entry["topic"],
+                "research": entry["research"],
+                "similarity": similarity,
+            }
+
+    def store(self, topic: str, research: str) -> None:
+        """
+        Add research output for a topic to the index
+
+        Args:
+            topic: Research topic
+            research: Research stage output
+        """
+        vector = self._embed(topic)
+
+        with self._lock:
+            entry = {"topic": topic, "research": research, "created_at": time.time()}
+
+            # Re-researching the same topic replaces the previous entry
+            for i, existing in enumerate(self._entries):
+                if existing["topic"] == topic:
+                    self._entries[i] = entry
+                    self._embeddings[i] = vector
+                    break
+            else:
+                self._entries.append(entry)
+                if self._embeddings is None:
+                    self._embeddings = vector[np.newaxis, :]
+                else:
+                    self._embeddings = np.vstack([self._embeddings, vector])
+
+            self._save()
+
+
+_caches: Dict[str, Optional[SemanticResearchCache]] = {}
+_caches_lock = threading.Lock()
+
+
+def get_semantic_cache(
+    persist_directory: str,
+    model_name: str = "all-MiniLM-L6-v2",
+    threshold: float = 0.85,
+    max_age_seconds: Optional[int] = 3 * 24 * 3600,
+    max_entries: Optional[int] = 2000,
+) -> Optional[SemanticResearchCache]:
+    """
+    Get the process-wide semantic cache for a directory
+
+    Args:
+        persist_directory: Base directory for the index
+        model_name: sentence-transformers model name
+        threshold: Minimum cosine similarity for a hit
+        max_age_seconds: Research older than this is not reused (None = no limit)
+        max_entries: Newest entries kept in the index (None = no limit)
+
+    Returns:
+        SemanticResearchCache, or None if sentence-transformers is unavailable
+    """
+    with _caches_lock:
+        if persist_directory not in _caches:
+            # The model itself is loaded on first lookup, not here
+            if importlib.util.find_spec("sentence_transformers") is None:
+                logger.warning(
+                    "⚠️  sentence-transformers not installed. Semantic research cache disabled."
+                )
+                _caches[persist_directory] = None
+            else:
+                _caches[persist_directory] = SemanticResearchCache(
+                    persist_directory,
+                    model_name=model_name,
+                    threshold=threshold,
+                    max_age_seconds=max_age_seconds,
+                    max_entries=max_entries,
+                )
+        return _caches[persist_directory]
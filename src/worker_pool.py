@@ -0,0 +1,225 @@
+"""
+Worker Pool - Long-lived workflow pool shared by the app, scheduler and scripts
+Keeps its threads and CrewManagers (with their pooled LLM clients) warm
+between batches; submissions return futures and shutdown drains in-flight work
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from multiprocessing import cpu_count
+from typing import Any, Callable, Dict, List, Optional
+
+from src.config import config
+from src.logger import logger
+
+
+class WorkerPool:
+    """
+    Persistent pool that runs workflows and other jobs in background threads
+
+    submit() only enqueues the job on the executor's queue and returns a
+    Future; threads are started on demand up to max_workers and reused for
+    the lifetime of the pool.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, name: str = "workflow"):
+        """
+        Initialize the pool
+
+        Args:
+            max_workers: Jobs running at the same time (default: PARALLEL_WORKERS, else
+                CONCURRENCY_MAX with adaptive concurrency or the CPU count)
+            name: Thread name prefix
+        """
+        self.max_workers = max_workers or config.parallel.workers or (
+            config.concurrency.max_limit if config.concurrency.adaptive else cpu_count()
+        )
+        self.name = name
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._submitted = 0
+        self._closed = False
+        self._managers: Dict[tuple, Any] = {}
+        # One lock per manager configuration, held while the manager is built
+        self._manager_locks: Dict[tuple, threading.Lock] = {}
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Queue a job
+
+        Args:
+            fn: Callable to run in a worker thread
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future: Resolves to fn's return value
+
+        Raises:
+            RuntimeError: If the pool is shut down
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"{self.name} pool is shut down")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=self.name
+                )
+            self._pending += 1
+            self._submitted += 1
+            future = self._executor.submit(fn, *args, **kwargs)
+
+        future.add_done_callback(self._job_done)
+        return future
+
+    def _job_done(self, _: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            if self._pending == 0:
+                self._idle.notify_all()
+
+    def get_manager(
+        self,
+        model_name: str = "claude-sonnet-4-20250514",
+        temperature: float = 0.7,
+        api_key: Optional[str] = None,
+        use_anthropic: Optional[bool] = None,
+        stage_models: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """
+        Get the pool's CrewManager for a model configuration
+
+        Managers hold no per-run state (every crew gets cloned agents), so
+        every caller with the same configuration shares one manager.
+
+        Args:
+            model_name: Main model
+            temperature: Temperature setting
+            api_key: API key (optional)
+            use_anthropic: Use Anthropic Claude (auto-detected if None)
+            stage_models: Optional model per stage (see CrewManager)
+
+        Returns:
+            CrewManager: Shared manager for the configuration
+        """
+        from src.crew_manager import CrewManager
+
+        key = (
+            model_name, temperature, api_key, use_anthropic,
+            tuple(sorted((stage_models or {}).items())),
+        )
+        with self._lock:
+            manager = self._managers.get(key)
+            if manager is not None:
+                return manager
+            build_lock = self._manager_locks.setdefault(key, threading.Lock())
+
+        # Building a manager takes seconds (CrewAI imports, LLM clients), so it
+        # happens outside the pool lock: submissions and finished jobs are not
+        # held up, and only callers wanting the same configuration wait
+        with build_lock:
+            with self._lock:
+                manager = self._managers.get(key)
+            if manager is None:
+                manager = CrewManager(
+                    model_name=model_name,
+                    temperature=temperature,
+                    api_key=api_key,
+                    use_anthropic=use_anthropic,
+                    stage_models=stage_models,
+                )
+                with self._lock:
+                    self._managers[key] = manager
+        return manager
+
+    def submit_workflow(
+        self, topic: str, content_type: str = "article", **manager_kwargs
+    ) -> Future:
+        """
+        Queue a research/writing or presentation workflow
+
+        Args:
+            topic: Workflow topic
+            content_type: Type of content ('presentation' runs the presentation workflow)
+            **manager_kwargs: Model configuration passed to get_manager()
+
+        Returns:
+            Future: Resolves to the WorkflowResult
+        """
+        manager = self.get_manager(**manager_kwargs)
+        if content_type == "presentation":
+            return self.submit(manager.execute_presentation_workflow, topic)
+        return self.submit(manager.execute_research_workflow, topic, content_type)
+
+    def providers(self) -> List[str]:
+        """LLM providers of the managers created so far"""
+        with self._lock:
+            return sorted({manager.provider for manager in self._managers.values()})
+
+    @property
+    def pending(self) -> int:
+        """Number of queued or running jobs"""
+        with self._lock:
+            return self._pending
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, load and lifetime submissions"""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "pending": self._pending,
+                "submitted": self._submitted,
+                "managers": len(self._managers),
+                "closed": self._closed,
+            }
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued job has finished
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            bool: True if the pool is idle
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        with self._lock:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+            return True
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Stop accepting jobs and drain the queue
+
+        Args:
+            wait: Wait for queued and running jobs to finish; if False,
+                queued jobs are cancelled and running ones finish in the background
+            timeout: Maximum seconds to wait for the drain (None = no limit);
+                jobs still queued afterwards are cancelled
+
+        Returns:
+            bool: True if every job finished
+        """
+        with self._lock:
+            self._closed = True
+            executor = self._executor
+
+        if executor is None:
+            return True
+
+        drained = self.drain(timeout) if wait else False
+        if not drained:
+            logger.warning(f"⚠️  Shutting down {self.name} pool with {self.pending} unfinished jobs")
+        executor.shutdown(wait=drained, cancel_futures=not drained)
+        return drained
+
+
+# Global worker pool instance
+worker_pool = WorkerPool()
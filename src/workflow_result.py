@@ -0,0 +1,233 @@
+"""
+Workflow Result - Compact, immutable result of a content workflow
+Keeps the final text and a small metrics summary instead of the raw
+CrewOutput and task transcripts, so batches of results stay small and can
+be pickled or serialized between processes
+"""
+import base64
+import json
+import sys
+import zlib
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Keys every result has; review_id, error and status only when they are set
+_KEYS = ("success", "topic", "content_type", "result", "message")
+_OPTIONAL_KEYS = ("review_id", "error", "status")
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowResult:
+    """
+    Result of one research, writing or presentation workflow
+
+    Supports the dict-style access the workflow dicts had
+    (``result["success"]``, ``result.get("review_id")``, ``"error" in result``).
+    Per-stage texts are stored zlib-compressed and decoded on demand.
+    """
+
+    success: bool
+    topic: str
+    content_type: str
+    result: Optional[str] = None
+    message: str = ""
+    review_id: Optional[str] = None
+    error: Optional[str] = None
+    # 'timeout' or 'cancelled' when the workflow was stopped before it finished
+    status: Optional[str] = None
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    _stages: bytes = b""
+
+    @classmethod
+    def create(
+        cls,
+        success: bool,
+        topic: str,
+        content_type: str,
+        result: Any = None,
+        message: str = "",
+        stages: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> "WorkflowResult":
+        """
+        Build a result, reducing the crew output to its text
+
+        Args:
+            success: Whether the workflow succeeded
+            topic: Workflow topic
+            content_type: Workflow content type
+            result: Final content (CrewOutput, task output or string)
+            message: Human-readable status
+            stages: Text of each named stage ('research', 'writing', ...)
+            **kwargs: review_id, error or metrics
+
+        Returns:
+            WorkflowResult: The result
+        """
+        return cls(
+            success=success,
+            topic=topic,
+            content_type=content_type,
+            result=None if result is None else str(result),
+            message=message,
+            _stages=_pack_stages(stages) if stages else b"",
+            **kwargs,
+        )
+
+    @classmethod
+    def failed(
+        cls, topic: str, content_type: str, message: str, error: Optional[str] = None
+    ) -> "WorkflowResult":
+        """Build a failed result"""
+        return cls(
+            success=False, topic=topic, content_type=content_type,
+            message=message, error=error,
+        )
+
+    @classmethod
+    def interrupted(
+        cls,
+        topic: str,
+        content_type: str,
+        status: str,
+        error: str,
+        stages: Optional[Dict[str, Any]] = None,
+    ) -> "WorkflowResult":
+        """
+        Build the result of a workflow stopped by a deadline or cancellation
+
+        Args:
+            topic: Workflow topic
+            content_type: Workflow content type
+            status: 'timeout' or 'cancelled'
+            error: What stopped the workflow
+            stages: Text of the stages that finished before it stopped
+
+        Returns:
+            WorkflowResult: Unsuccessful result with the partial stage texts
+        """
+        label = "timed out" if status == "timeout" else "was cancelled"
+        return cls(
+            success=False,
+            topic=topic,
+            content_type=content_type,
+            message=f"Workflow {label}: {error}",
+            error=error,
+            status=status,
+            _stages=_pack_stages(stages) if stages else b"",
+        )
+
+    @property
+    def timed_out(self) -> bool:
+        return self.status == "timeout"
+
+    # Dict-style access
+
+    def keys(self) -> List[str]:
+        return list(_KEYS) + [key for key in _OPTIONAL_KEYS if getattr(self, key) is not None]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self.keys() else default
+
+    def items(self) -> List[tuple]:
+        return [(key, getattr(self, key)) for key in self.keys()]
+
+    # Stages and metrics
+
+    @property
+    def stages(self) -> Dict[str, str]:
+        """Text of every recorded stage (decompressed on each access)"""
+        if not self._stages:
+            return {}
+        return json.loads(zlib.decompress(self._stages).decode("utf-8"))
+
+    def stage_text(self, stage: str) -> Optional[str]:
+        """
+        Get the text one stage produced
+
+        Args:
+            stage: Stage name ('research', 'writing', 'review', 'presentation')
+
+        Returns:
+            str: Stage output, or None if the stage did not run
+        """
+        return self.stages.get(stage)
+
+    def with_metrics(self, metrics: Dict[str, Any]) -> "WorkflowResult":
+        """Copy of the result with a metrics summary attached"""
+        return replace(self, metrics=metrics)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the result and its fields"""
+        size = sys.getsizeof(self)
+        for f in fields(self):
+            value = getattr(self, f.name)
+            size += sys.getsizeof(value)
+            if isinstance(value, dict):
+                size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+        return size
+
+    # Serialization
+
+    def to_dict(self, include_stages: bool = False) -> Dict[str, Any]:
+        """
+        Convert to a plain dict
+
+        Args:
+            include_stages: Add the decompressed stage texts under 'stages'
+
+        Returns:
+            Dict with the workflow keys and 'metrics'
+        """
+        data = dict(self.items())
+        data["metrics"] = dict(self.metrics)
+        if include_stages:
+            data["stages"] = self.stages
+        return data
+
+    def to_json(self) -> str:
+        """Serialize to compact JSON (stage texts stay compressed)"""
+        data = self.to_dict()
+        if self._stages:
+            data["_stages"] = base64.b64encode(self._stages).decode("ascii")
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+    @classmethod
+    def from_json(cls, text: str) -> "WorkflowResult":
+        data = json.loads(text)
+        stages = data.pop("_stages", None)
+        return cls(**data, _stages=base64.b64decode(stages) if stages else b"")
+
+    def to_msgpack(self) -> bytes:
+        """Serialize to msgpack (requires the optional msgpack package)"""
+        import msgpack
+
+        data = self.to_dict()
+        data["_stages"] = self._stages
+        return msgpack.packb(data, use_bin_type=True, default=str)
+
+    @classmethod
+    def from_msgpack(cls, payload: bytes) -> "WorkflowResult":
+        import msgpack
+
+        return cls(**msgpack.unpackb(payload, raw=False))
+
+
+def _pack_stages(stages: Dict[str, Any]) -> bytes:
+    """Compress stage texts for storage on a result"""
+    texts = {name: str(text) for name, text in stages.items() if text is not None}
+    return zlib.compress(json.dumps(texts, ensure_ascii=False).encode("utf-8"))
+
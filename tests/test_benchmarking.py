@@ -0,0 +1,62 @@
+"""
+Unit tests for the micro-benchmark helpers
+"""
+import json
+
+from src.benchmarking import compare_reports, run_benchmark, time_callable, write_report
+
+
+class TestTimeCallable:
+    """Test cases for time_callable"""
+
+    def test_reports_percentiles_and_throughput(self):
+        calls = []
+        result = time_callable(lambda: calls.append(1), iterations=50, warmup=3)
+
+        assert len(calls) == 53
+        assert result["iterations"] == 50
+        assert result["min_ms"] <= result["p50_ms"] <= result["p95_ms"] <= result["max_ms"]
+        assert result["ops_per_sec"] > 0
+
+    def test_runs_until_min_seconds(self):
+        result = time_callable(lambda: sum(range(1000)), iterations=1, warmup=0, min_seconds=0.02)
+
+        assert result["iterations"] > 1
+
+
+class TestRunBenchmark:
+    """Test cases for run_benchmark"""
+
+    def test_missing_optional_dependency_is_skipped(self):
+        def setup():
+            import not_installed_exporter  # noqa: F401
+
+        result = run_benchmark("export", setup, iterations=5)
+
+        assert "not_installed_exporter" in result["skipped"]
+        assert "p50_ms" not in result
+
+    def test_failing_setup_is_reported(self):
+        def setup():
+            raise ValueError("bad fixture")
+
+        assert run_benchmark("parse", setup)["error"] == "ValueError: bad fixture"
+
+
+class TestReports:
+    """Test cases for JSON reports and comparisons"""
+
+    def test_report_round_trip_and_compare(self, tmp_path):
+        path = write_report(
+            {"parse": {"name": "parse", "p50_ms": 2.0}, "export": {"name": "export", "skipped": "no pptx"}},
+            str(tmp_path / "nested" / "baseline.json"),
+            suite="hot_paths",
+        )
+        with open(path, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        assert baseline["suite"] == "hot_paths"
+        assert baseline["environment"]["python"]
+
+        current = {"results": {"parse": {"p50_ms": 1.0}, "export": {"p50_ms": 5.0}}}
+        assert compare_reports(baseline, current) == {"parse": 0.5, "export": None}
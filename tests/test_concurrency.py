@@ -0,0 +1,144 @@
+"""
+Unit tests for the adaptive concurrency controller
+"""
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.concurrency import AIMDController
+from src.llm_wrappers import DelegatingLLM
+from src.rate_limiter import ConcurrencyReportingLLM, ProviderRateLimiter, RateLimitedLLM
+from tests.test_rate_limiter import RateLimitError, ThrottledLLM
+
+
+def saturate(controller):
+    """Take every slot of the current window"""
+    while controller.try_acquire():
+        pass
+
+
+class TestAIMDController:
+    """Test cases for AIMDController"""
+
+    def test_window_grows_while_saturated_and_healthy(self):
+        """Test about one extra slot per round of fast calls"""
+        controller = AIMDController("test", initial=2, max_limit=8)
+        saturate(controller)
+
+        for _ in range(20):
+            controller.record_success(1.0)
+            saturate(controller)
+
+        assert controller.window > 2
+        assert controller.window <= 8
+        assert controller.stats()["increases"] >= 1
+
+    def test_idle_window_does_not_grow(self):
+        """Test successes without a full window leave it alone"""
+        controller = AIMDController("test", initial=4)
+        controller.try_acquire()
+
+        for _ in range(20):
+            controller.record_success(1.0)
+
+        assert controller.window == 4
+
+    def test_rate_limit_halves_window_once_per_cooldown(self):
+        controller = AIMDController("test", initial=16)
+
+        controller.record_rate_limit()
+        controller.record_rate_limit()
+
+        assert controller.window == 8
+        assert controller.stats()["rate_limited"] == 2
+        assert controller.stats()["decreases"] == 1
+
+        with patch("src.concurrency.time.monotonic", return_value=time.monotonic() + 5):
+            controller.record_rate_limit()
+        assert controller.window == 4
+
+    def test_latency_inflation_cuts_window(self):
+        """Test smoothed latency far above the baseline counts as congestion"""
+        controller = AIMDController("test", initial=8, latency_tolerance=2.0)
+        for _ in range(10):
+            controller.record_success(1.0)
+
+        for _ in range(10):
+            controller.record_success(10.0)
+
+        assert controller.window == 4
+        assert controller.stats()["decreases"] == 1
+
+    def test_slow_kinds_of_calls_are_not_inflation(self):
+        """Test latencies are only compared between calls of the same kind"""
+        controller = AIMDController("test", initial=8)
+        for _ in range(10):
+            controller.record_success(1.0, "Researcher")
+            controller.record_success(20.0, "Writer")
+
+        assert controller.window == 8
+        assert controller.stats()["decreases"] == 0
+
+    def test_error_burst_cuts_window(self):
+        controller = AIMDController("test", initial=8, max_error_rate=0.2)
+        for _ in range(7):
+            controller.record_success(1.0)
+
+        for _ in range(3):
+            controller.record_error()
+
+        assert controller.window == 4
+
+    def test_window_never_below_minimum(self):
+        controller = AIMDController("test", initial=2, min_limit=1)
+        for offset in range(5):
+            with patch("src.concurrency.time.monotonic", return_value=time.monotonic() + 10 * offset):
+                controller.record_rate_limit()
+
+        assert controller.window == 1
+
+    def test_acquire_blocks_at_window(self):
+        """Test a full window admits the next caller only after a release"""
+        controller = AIMDController("test", initial=1)
+        assert controller.acquire()
+        assert controller.acquire(timeout=0.05) is False
+
+        threading.Timer(0.05, controller.release).start()
+        assert controller.acquire(timeout=2)
+        assert controller.in_flight == 1
+
+
+class TestConcurrencyReportingLLM:
+    """Test cases for ConcurrencyReportingLLM"""
+
+    def test_signals_are_reported_without_rate_limiting(self):
+        inner = ThrottledLLM(failures=1, retry_after=1)
+        controller = AIMDController("openai", initial=8)
+        llm = ConcurrencyReportingLLM(DelegatingLLM(inner), controller)
+
+        with pytest.raises(RateLimitError):
+            llm.call("hello")
+        assert llm.call("hello") == "ok"
+
+        stats = controller.stats()
+        assert stats["rate_limited"] == 1
+        assert stats["successes"] == 1
+
+    def test_each_rate_limited_attempt_is_reported(self):
+        inner = ThrottledLLM(failures=1, retry_after=1)
+        limiter = ProviderRateLimiter("openai", rpm=100)
+        controller = AIMDController("openai", initial=8)
+        llm = RateLimitedLLM(
+            ConcurrencyReportingLLM(DelegatingLLM(inner), controller), limiter, max_retries=2
+        )
+
+        with patch("src.rate_limiter.time.sleep") as sleep:
+            sleep.side_effect = lambda seconds: limiter.__setattr__("_blocked_until", 0.0)
+            assert llm.call("hello") == "ok"
+
+        stats = controller.stats()
+        assert stats["rate_limited"] == 1
+        assert stats["successes"] == 1
+        assert stats["window"] == 4
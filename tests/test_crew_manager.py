@@ -1,8 +1,9 @@
 """
 Unit tests for CrewManager
 """
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from src.crew_manager import CrewManager
 
 
@@ -36,6 +37,46 @@ class TestCrewManager:
             assert len(crew.agents) == 3
             assert len(crew.tasks) == 3
 
+    @patch("src.crew_manager.ChatOpenAI")
+    def test_map_reduce_research_crew(self, mock_llm):
+        """Test map-reduce research fans facets out and merges them for the writer"""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            manager = CrewManager(api_key="test-key", research_mode="map_reduce")
+            crew = manager.create_research_crew(
+                topic="Test Topic", content_type="article", include_review=False
+            )
+
+        facets = [task for task in crew.tasks if task.name == "research_facet"]
+        research_task, writing_task = crew.tasks[-2:]
+        assert len(facets) == 7
+        assert all(task.async_execution for task in facets)
+        assert research_task.name == "research"
+        assert research_task.context == facets
+        assert writing_task.context == [research_task]
+        assert research_task.agent.tools == []
+
+    @patch("src.crew_manager.review_queue")
+    @patch("src.crew_manager.ChatOpenAI")
+    def test_async_review_mode(self, mock_llm, mock_review_queue):
+        """Test async review mode leaves the reviewer out of the crew"""
+        mock_review_queue.submit.return_value = "review-1"
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            manager = CrewManager(api_key="test-key", review_mode="async")
+            crew = manager.create_research_crew(
+                topic="Test Topic", content_type="article", include_review=False
+            )
+            assert len(crew.tasks) == 2
+
+            with patch.object(manager, "create_research_crew") as mock_create:
+                mock_create.return_value.kickoff.return_value = "Post"
+                result = manager.execute_research_workflow("Test Topic", "article")
+
+        assert mock_create.call_args.kwargs["include_review"] is False
+        assert result["success"] is True
+        assert result["result"] == "Post"
+        assert result["review_id"] == "review-1"
+
     @patch("src.crew_manager.Crew")
     @patch("src.crew_manager.ChatOpenAI")
     def test_execute_research_workflow_success(self, mock_llm, mock_crew):
@@ -71,3 +112,86 @@ class TestCrewManager:
 
             assert result["success"] is False
             assert "Test Error" in result["message"]
+
+    @patch("src.crew_manager.Crew")
+    @patch("src.crew_manager.ChatOpenAI")
+    def test_stream_research_workflow(self, mock_llm, mock_crew):
+        """Test the writer's content is streamed chunk by chunk"""
+        mock_crew.return_value.kickoff.return_value = "Research findings"
+        mock_llm.return_value.stream.return_value = [
+            Mock(content="# Title"), Mock(content="\n\nBody")
+        ]
+        received = []
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            manager = CrewManager(
+                api_key="test-key", use_cache=False, use_semantic_cache=False
+            )
+            chunks = list(
+                manager.stream_research_workflow(
+                    "Test Topic", "article", on_chunk=received.append
+                )
+            )
+
+        assert chunks == ["# Title", "\n\nBody"]
+        assert received == chunks
+        messages = mock_llm.return_value.stream.call_args[0][0]
+        assert "Research findings" in messages[-1]["content"]
+
+    @patch("src.crew_manager.Crew")
+    @patch("src.crew_manager.ChatOpenAI")
+    def test_aexecute_research_workflow_success(self, mock_llm, mock_crew):
+        """Test async workflow execution uses the native async kickoff"""
+        mock_crew_instance = Mock()
+        mock_crew_instance.akickoff = AsyncMock(return_value="Async Result")
+        mock_crew.return_value = mock_crew_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            manager = CrewManager(api_key="test-key")
+            result = asyncio.run(
+                manager.aexecute_research_workflow(
+                    topic="Test Topic", content_type="article"
+                )
+            )
+
+            assert result["success"] is True
+            assert result["result"] == "Async Result"
+            mock_crew_instance.akickoff.assert_awaited_once()
+            mock_crew_instance.kickoff.assert_not_called()
+
+    @patch("src.crew_manager.Crew")
+    @patch("src.crew_manager.ChatOpenAI")
+    def test_aexecute_research_workflow_with_research(self, mock_llm, mock_crew):
+        """Test async workflow execution writes from the given research"""
+        mock_crew.return_value.akickoff = AsyncMock(return_value="Async Result")
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            manager = CrewManager(api_key="test-key")
+            with patch.object(manager, "create_research_crew", wraps=manager.create_research_crew) as create, \
+                    patch.object(manager, "_lookup_cached_research") as lookup:
+                result = asyncio.run(
+                    manager.aexecute_research_workflow(
+                        "Test Topic", "article", research="Known findings"
+                    )
+                )
+
+            assert result["success"] is True
+            assert create.call_args.kwargs["research"] == "Known findings"
+            lookup.assert_not_called()
+
+    @patch("src.crew_manager.ChatOpenAI")
+    def test_managers_share_pooled_clients(self, mock_llm):
+        """Test managers with the same configuration reuse clients and templates"""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            first = CrewManager(api_key="test-key")
+            second = CrewManager(api_key="test-key")
+
+            assert first.llm is second.llm
+            assert first.researcher is second.researcher
+            assert mock_llm.call_count == 1
+
+            agent_a = first.researcher.create_agent()
+            agent_b = first.researcher.create_agent()
+            assert agent_a is not agent_b
+            assert agent_a.id != agent_b.id
+            assert agent_a.llm is agent_b.llm
@@ -0,0 +1,125 @@
+"""
+Unit tests for workflow deadlines and cooperative cancellation
+"""
+import datetime
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from crewai.llms.base_llm import BaseLLM
+
+from src.crew_manager import CrewManager
+from src.deadlines import (
+    CancelToken,
+    DeadlineLLM,
+    WorkflowCancelled,
+    WorkflowTimeout,
+    cancel_scope,
+    find_cancellation,
+    workflow_token,
+)
+
+
+class CountingLLM(BaseLLM):
+    """CrewAI LLM that counts its calls"""
+
+    def __init__(self):
+        super().__init__(model="gpt-4o", provider="openai")
+        self.calls = 0
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        self.calls += 1
+        return "ok"
+
+
+class TestCancelToken:
+    """Test cases for CancelToken"""
+
+    def test_child_stops_with_parent(self):
+        batch = CancelToken(label="batch")
+        workflow = batch.child(60)
+
+        assert not workflow.cancelled
+        batch.cancel("shutting down")
+
+        assert workflow.cancelled
+        with pytest.raises(WorkflowCancelled, match="Batch shutting down"):
+            workflow.check()
+
+    def test_deadline_raises_timeout(self):
+        token = CancelToken(0.01)
+        time.sleep(0.02)
+
+        with pytest.raises(WorkflowTimeout, match="Workflow deadline of 0.01s exceeded"):
+            token.check()
+
+    def test_remaining_is_nearest_deadline(self):
+        token = CancelToken(10, parent=CancelToken(2, label="batch"))
+
+        assert token.remaining() == pytest.approx(2, abs=0.1)
+        assert CancelToken().remaining() is None
+
+    def test_workflow_inside_batch_uses_its_token(self):
+        token = CancelToken(5)
+        with cancel_scope(token):
+            assert workflow_token() is token
+            assert workflow_token(1).parent is token
+
+    def test_find_cancellation_follows_wrapped_errors(self):
+        try:
+            try:
+                raise WorkflowTimeout("Workflow deadline of 1s exceeded")
+            except WorkflowTimeout as e:
+                raise RuntimeError("Task execution failed") from e
+        except RuntimeError as e:
+            error = e
+
+        assert isinstance(find_cancellation(error), WorkflowTimeout)
+        assert find_cancellation(ValueError("boom")) is None
+
+
+class TestDeadlineLLM:
+    """Test cases for DeadlineLLM"""
+
+    def test_cancelled_workflow_makes_no_call(self):
+        inner = CountingLLM()
+        llm = DeadlineLLM(inner)
+        token = CancelToken()
+        token.cancel()
+
+        with cancel_scope(token), pytest.raises(WorkflowCancelled):
+            llm.call("hello")
+        assert llm.call("hello") == "ok"
+        assert inner.calls == 1
+
+    def test_stage_deadline_from_task_start(self):
+        llm = DeadlineLLM(CountingLLM())
+        task = SimpleNamespace(
+            name="research",
+            start_time=datetime.datetime.now() - datetime.timedelta(seconds=120),
+        )
+
+        with patch("src.deadlines.config.deadlines.research_timeout", 60):
+            with pytest.raises(WorkflowTimeout, match="Research stage"):
+                llm.call("hello", from_task=task)
+        with patch("src.deadlines.config.deadlines.research_timeout", 0):
+            assert llm.call("hello", from_task=task) == "ok"
+
+
+class TestWorkflowTimeoutResult:
+    """Test cases for the results of stopped workflows"""
+
+    def test_timeout_result_keeps_finished_stages(self):
+        crew = SimpleNamespace(tasks=[SimpleNamespace(name="research"), SimpleNamespace(name="writing")])
+        error = RuntimeError("crew failed")
+        error.__cause__ = WorkflowTimeout("Workflow deadline of 5s exceeded")
+
+        with patch.object(CrewManager, "_get_task_output", side_effect=["notes", None]):
+            result = CrewManager._research_error("Edge AI", "article", error, crew)
+
+        assert result["success"] is False
+        assert result["status"] == "timeout" and result.timed_out
+        assert result.stages == {"research": "notes"}
+        assert "timed out" in result["message"]
@@ -0,0 +1,94 @@
+"""
+Unit tests for the offline fake LLM provider
+"""
+import statistics
+from unittest.mock import patch
+
+import pytest
+
+from src.config import config
+from src.crew_manager import CrewManager
+from src.fake_llm import Cassette, FakeLLM, LatencyModel, RecordingLLM, prompt_key
+from src.llm_wrappers import DelegatingLLM
+from src.prompt_cache import mark_cacheable
+from src.rate_limiter import ProviderRateLimiter, RateLimitedLLM, retry_after_seconds
+
+
+class TestLatencyModel:
+    """Test cases for LatencyModel"""
+
+    def test_percentiles_match_configuration(self):
+        """Test samples follow the configured p50 and p99"""
+        model = LatencyModel(p50=2.0, p99=20.0)
+        samples = sorted(model.sample() for _ in range(20000))
+
+        assert statistics.median(samples) == pytest.approx(2.0, rel=0.1)
+        assert samples[int(len(samples) * 0.99)] == pytest.approx(20.0, rel=0.25)
+
+    def test_time_scale(self):
+        """Test a zero time scale makes calls instant"""
+        assert LatencyModel(p50=5.0, p99=50.0, time_scale=0).sample() == 0.0
+
+
+class TestFakeLLM:
+    """Test cases for FakeLLM"""
+
+    def test_injected_rate_limit_is_retryable(self):
+        """Test injected 429s carry Retry-After and go through the limiter retries"""
+        fake = FakeLLM(time_scale=0, rate_limit_rate=1.0, retry_after=0)
+        with pytest.raises(Exception) as error:
+            fake.call("hello")
+        assert retry_after_seconds(error.value) == 0.0
+
+        limiter = ProviderRateLimiter("openai")
+        llm = RateLimitedLLM(DelegatingLLM(fake), limiter, max_retries=2, max_backoff=0)
+        with pytest.raises(Exception):
+            llm.call("hello")
+        assert limiter.stats()["retries_total"] == 2
+
+    def test_concurrency_limit(self):
+        """Test calls above the simulated concurrency limit get a 429"""
+        fake = FakeLLM(time_scale=0, max_concurrency=1, provider="anthropic")
+        stream = fake.stream("hello")
+        next(stream)
+
+        with pytest.raises(Exception) as error:
+            fake.call("hello")
+        assert error.value.status_code == 429
+
+        list(stream)
+        assert fake.call("hello")
+
+    def test_record_and_replay(self, tmp_path):
+        """Test recorded responses are replayed, even for cache-marked prompts"""
+        path = str(tmp_path / "cassette.jsonl")
+        live = FakeLLM(time_scale=0, output_words=10)
+        recorder = RecordingLLM(DelegatingLLM(live), Cassette(path))
+
+        messages = [{"role": "system", "content": "You are a writer"},
+                    {"role": "user", "content": "Topic: Edge AI"}]
+        recorded = recorder.call(messages)
+
+        replay = FakeLLM(time_scale=0, cassette_path=path, strict=True)
+        assert replay.call(mark_cacheable(messages)) == recorded
+        assert replay.stats()["cassette_hits"] == 1
+        assert prompt_key(messages) == prompt_key(mark_cacheable(messages))
+
+        with pytest.raises(KeyError):
+            replay.call("unknown prompt")
+
+
+class TestOfflineCrew:
+    """Test cases for running crews against the fake provider"""
+
+    def test_research_workflow_without_network(self):
+        """Test a full crew runs offline with no API key"""
+        with patch.object(config.fake_llm, "mode", "synthetic"), \
+                patch.object(config.fake_llm, "time_scale", 0), \
+                patch.object(config.metrics, "enabled", False), \
+                patch.dict("os.environ", {"OTEL_SDK_DISABLED": "true"}, clear=True):
+            manager = CrewManager(model_name="gpt-4o", review_mode="off")
+            result = manager.execute_research_workflow("Edge AI", "blog post")
+
+        assert result["success"] is True
+        assert "## Introduction" in str(result["result"])
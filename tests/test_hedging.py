@@ -0,0 +1,197 @@
+"""
+Unit tests for hedged LLM requests
+"""
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+from crewai.llms.base_llm import BaseLLM
+
+from src.hedging import HedgedLLM, HedgePolicy
+from src.llm_wrappers import DelegatingLLM, _report_usage, usage_scope
+from src.metrics import MetricsCollector
+from src.rate_limiter import ProviderRateLimiter, RateLimitedLLM
+from src.worker_pool import WorkerPool
+
+
+class SlowLLM(BaseLLM):
+    """CrewAI LLM whose n-th call takes delays[n] seconds"""
+
+    def __init__(self, *delays):
+        super().__init__(model="gpt-4o", provider="openai")
+        self.delays = list(delays)
+        self.calls = 0
+        self.cancelled = 0
+        self._lock = threading.Lock()
+        _report_usage(self)
+
+    def _next_delay(self):
+        with self._lock:
+            delay = self.delays[min(self.calls, len(self.delays) - 1)]
+            self.calls += 1
+        return delay
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        delay = self._next_delay()
+        time.sleep(delay)
+        self._track_token_usage_internal({"prompt_tokens": 900, "completion_tokens": 100})
+        return f"answer after {delay}s"
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None):
+        delay = self._next_delay()
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        self._track_token_usage_internal({"prompt_tokens": 900, "completion_tokens": 100})
+        return f"answer after {delay}s"
+
+
+def make_llm(inner, samples=20, latency=0.05, max_ratio=1.0):
+    """Hedged LLM whose policy has already seen `samples` calls of `latency` seconds"""
+    policy = HedgePolicy(min_samples=20, min_delay=0.01, max_ratio=max_ratio)
+    for _ in range(samples):
+        policy.record_latency(("default", "gpt-4o"), latency)
+    collector = MetricsCollector()
+    llm = HedgedLLM(inner, policy=policy, pool=WorkerPool(4, name="test-hedge"), collector=collector)
+    return llm, collector
+
+
+class TestHedgedLLM:
+    """Test cases for HedgedLLM"""
+
+    def test_slow_call_is_hedged_and_fast_duplicate_wins(self):
+        """Test the caller returns at the duplicate's latency, not the slow attempt's"""
+        inner = SlowLLM(3.0, 0.2)
+        threads = []
+        original = inner.call
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return original(*args, **kwargs)
+
+        llm, collector = make_llm(inner, latency=0.3)
+        start = time.perf_counter()
+        with patch.object(inner, "call", side_effect=record_thread):
+            with usage_scope() as usage:
+                assert llm.call("hello") == "answer after 0.2s"
+
+        assert time.perf_counter() - start < 1.0
+        # The first attempt has a thread of its own; only the duplicate uses the pool
+        assert threads[0] == "llm-attempt"
+        assert threads[1].startswith("test-hedge")
+        assert llm.pool.stats()["submitted"] == 1
+        # Only the winning attempt's tokens belong to the caller
+        assert usage["input_tokens"] == 900
+
+        summary = collector.hedge_summary()["default/gpt-4o"]
+        assert summary["hedges"] == 1
+        assert summary["hedge_wins"] == 1
+        assert summary["p95_seconds"] < 1.0
+
+    def test_no_samples_are_never_hedged(self):
+        """Test HEDGE_MIN_SAMPLES=0 makes plain calls until a latency is known"""
+        policy = HedgePolicy(min_samples=0)
+
+        assert policy.start_call(("default", "gpt-4o")) is None
+        policy.record_latency(("default", "gpt-4o"), 5.0)
+        assert policy.start_call(("default", "gpt-4o")) == 5.0
+
+    def test_unhedged_calls_never_use_the_pool(self):
+        inner = SlowLLM(0.01)
+        llm, _ = make_llm(inner, latency=0.2)
+
+        llm.call("hello")
+
+        assert llm.pool.stats()["submitted"] == 0
+
+    def test_failed_slow_attempt_uses_the_duplicate_in_flight(self):
+        inner = SlowLLM(0.3, 0.1)
+        llm, collector = make_llm(inner)
+        original = inner.call
+
+        def fail_slow(*args, **kwargs):
+            response = original(*args, **kwargs)
+            if response.endswith("0.3s"):
+                raise RuntimeError("upstream timeout")
+            return response
+
+        start = time.perf_counter()
+        with patch.object(inner, "call", side_effect=fail_slow):
+            assert llm.call("hello") == "answer after 0.1s"
+
+        # The duplicate started at the hedge delay, not after the failure
+        assert time.perf_counter() - start < 0.3 + 0.1
+        assert collector.hedge_summary()["default/gpt-4o"]["hedge_wins"] == 1
+
+    def test_fast_call_is_not_hedged(self):
+        inner = SlowLLM(0.01)
+        llm, collector = make_llm(inner, latency=0.2)
+
+        llm.call("hello")
+
+        assert inner.calls == 1
+        assert collector.hedge_summary()["default/gpt-4o"]["hedges"] == 0
+
+    def test_no_hedging_before_enough_samples(self):
+        inner = SlowLLM(0.1, 0.01)
+        llm, _ = make_llm(inner, samples=5)
+
+        assert llm.call("hello") == "answer after 0.1s"
+        assert inner.calls == 1
+
+    def test_hedge_budget_caps_duplicates(self):
+        inner = SlowLLM(0.1, 0.01)
+        llm, _ = make_llm(inner, max_ratio=0.0)
+
+        assert llm.call("hello") == "answer after 0.1s"
+        assert inner.calls == 1
+
+    def test_tool_calls_are_never_duplicated(self):
+        inner = SlowLLM(0.1, 0.01)
+        llm, _ = make_llm(inner)
+
+        llm.call("hello", available_functions={"search": lambda query: query})
+
+        assert inner.calls == 1
+
+    def test_failed_attempt_falls_back_to_the_other(self):
+        inner = SlowLLM(0.1, 0.01)
+        llm, _ = make_llm(inner)
+        original = inner.call
+
+        def fail_fast(*args, **kwargs):
+            response = original(*args, **kwargs)
+            if response.endswith("0.01s"):
+                raise RuntimeError("overloaded")
+            return response
+
+        with patch.object(inner, "call", side_effect=fail_fast):
+            assert llm.call("hello") == "answer after 0.1s"
+
+    def test_hedges_take_from_the_shared_rate_budget(self):
+        inner = SlowLLM(0.3, 0.01)
+        limiter = ProviderRateLimiter("openai", rpm=1000)
+        llm, _ = make_llm(RateLimitedLLM(DelegatingLLM(inner), limiter))
+
+        with patch.object(limiter, "acquire", wraps=limiter.acquire) as acquire:
+            llm.call("hello")
+
+        assert acquire.call_count == 2
+
+    def test_async_loser_is_cancelled(self):
+        inner = SlowLLM(0.5, 0.01)
+        llm, collector = make_llm(inner)
+
+        async def run():
+            response = await llm.acall("hello")
+            await asyncio.sleep(0)
+            return response
+
+        assert asyncio.run(run()) == "answer after 0.01s"
+        assert inner.cancelled == 1
+        assert collector.hedge_summary()["default/gpt-4o"]["hedge_wins"] == 1
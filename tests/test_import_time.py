@@ -0,0 +1,79 @@
+"""
+Unit tests for lazy imports and the start-up time check
+"""
+from unittest.mock import patch
+
+from src.import_time import check_profile, heavy_imports, parse_import_time, profile_command
+from src.lazy_imports import LazyImport
+
+
+IMPORT_TIME_REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      1314 |      43243 | src.logger
+import time:       900 |       1500 |     crewai.llms.base_llm
+import time:      2256 |    2233380 |   crewai
+import time:       800 |    2240000 | src.job_queue
+"""
+
+
+class TestImportTimeReport:
+    """Test cases for parsing and checking -X importtime output"""
+
+    def test_parse_depth_and_timings(self):
+        entries = parse_import_time(IMPORT_TIME_REPORT)
+
+        assert [entry["module"] for entry in entries] == [
+            "_io", "src.logger", "crewai.llms.base_llm", "crewai", "src.job_queue"
+        ]
+        assert [entry["depth"] for entry in entries] == [1, 0, 2, 1, 0]
+        assert entries[3]["cumulative_us"] == 2233380
+        assert heavy_imports(entries) == ["crewai"]
+
+    def test_check_reports_heavy_imports_and_budget(self):
+        profile = {"returncode": 0, "heavy": ["crewai"], "wall_ms": 2500.0}
+
+        problems = check_profile(profile, budget_ms=200)
+
+        assert problems == ["imports crewai", "took 2500 ms (budget 200 ms)"]
+        assert check_profile({"returncode": 0, "heavy": [], "wall_ms": 150.0}, 200) == []
+
+
+class TestColdStart:
+    """Status code paths must not load CrewAI, LangChain or the Google client"""
+
+    def test_job_queue_and_metrics_skip_crewai(self):
+        profile = profile_command(["-c", "import src.job_queue, src.metrics, src.deadlines"], repeat=1)
+
+        assert profile["returncode"] == 0
+        assert profile["heavy"] == []
+
+    def test_script_help_skips_heavy_imports(self):
+        profile = profile_command(["scripts/benchmark_hot_paths.py", "--help"], repeat=1)
+
+        assert profile["returncode"] == 0
+        assert profile["heavy"] == []
+
+
+class TestLazyImport:
+    """Test cases for LazyImport and the moved LLM layers"""
+
+    def test_resolves_on_first_call_and_can_be_patched(self):
+        lazy = LazyImport("collections", "OrderedDict")
+        assert "not loaded" in repr(lazy)
+
+        assert lazy(a=1) == {"a": 1}
+        assert lazy.fromkeys("ab") == {"a": None, "b": None}
+
+        with patch("src.crew_manager.ChatOpenAI") as mock_openai:
+            from src import crew_manager
+            assert crew_manager.ChatOpenAI is mock_openai
+        assert isinstance(crew_manager.ChatOpenAI, LazyImport)
+
+    def test_moved_llm_layers_still_importable(self):
+        from src.deadlines import DeadlineLLM
+        from src.llm_wrappers import DeadlineLLM as WrapperDeadlineLLM, MeteredLLM
+        from src.metrics import MeteredLLM as MetricsMeteredLLM
+
+        assert DeadlineLLM is WrapperDeadlineLLM
+        assert MetricsMeteredLLM is MeteredLLM
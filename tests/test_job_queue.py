@@ -0,0 +1,129 @@
+"""
+Unit tests for the durable publishing job queue
+"""
+import pytest
+
+from src.deadlines import WorkflowTimeout
+from src.job_queue import (
+    FAILED, PENDING, PUBLISHED, RESEARCHED, WRITTEN, PublishJobQueue,
+)
+
+
+class Stages:
+    """Stage callables that count calls and can crash once"""
+
+    def __init__(self, crash_in=None):
+        self.calls = {"research": 0, "write": 0, "publish": 0}
+        self.crash_in = crash_in
+
+    def _call(self, stage):
+        self.calls[stage] += 1
+        if stage == self.crash_in:
+            self.crash_in = None
+            raise KeyboardInterrupt(f"crash during {stage}")
+
+    def research(self, job):
+        self._call("research")
+        return f"Research on {job['topic']}"
+
+    def write(self, job):
+        self._call("write")
+        assert job["research"] == f"Research on {job['topic']}"
+        return {"content": f"# {job['topic']}\n\nPost", "title": job["topic"], "review_id": "r-1"}
+
+    def publish(self, job):
+        self._call("publish")
+        return {"success": True, "post_id": f"p-{job['id']}", "url": f"https://blog/{job['id']}"}
+
+
+def run_batch(queue, stages, batch="b"):
+    for job in queue.unfinished(batch):
+        queue.run(job, stages.research, stages.write, stages.publish)
+
+
+class TestPublishJobQueue:
+    """Test cases for PublishJobQueue"""
+
+    def test_enqueue_is_idempotent(self, tmp_path):
+        queue = PublishJobQueue(str(tmp_path / "jobs.sqlite3"))
+        queue.enqueue("b", ["A", "B"], payloads=[{"tags": ["x"]}, {"tags": ["y"]}])
+        jobs = queue.enqueue("b", ["B", "C"])
+
+        assert [job["topic"] for job in jobs] == ["A", "B", "C"]
+        assert jobs[1]["payload"] == {"tags": ["y"]}
+        assert all(job["state"] == PENDING for job in jobs)
+
+    def test_transitions_are_compare_and_set(self):
+        queue = PublishJobQueue(":memory:")
+        job_id = queue.enqueue("b", ["A"])[0]["id"]
+
+        assert queue.advance(job_id, PENDING, RESEARCHED, research="notes")
+        assert not queue.advance(job_id, PENDING, RESEARCHED, research="again")
+        assert queue.get(job_id)["research"] == "notes"
+        with pytest.raises(ValueError):
+            queue.advance(job_id, RESEARCHED, PUBLISHED)
+
+    def test_resume_after_crash_repeats_no_stage(self, tmp_path):
+        """Test a batch interrupted mid-write resumes from its stored research"""
+        path = str(tmp_path / "jobs.sqlite3")
+        queue = PublishJobQueue(path)
+        queue.enqueue("b", ["A", "B", "C"])
+        stages = Stages(crash_in="write")
+
+        with pytest.raises(KeyboardInterrupt):
+            run_batch(queue, stages)
+        queue.close()
+
+        # A new process opens the same database and reruns the batch
+        queue = PublishJobQueue(path)
+        assert queue.summary("b")[RESEARCHED] == 1
+        run_batch(queue, stages)
+        run_batch(queue, stages)
+
+        assert stages.calls == {"research": 3, "write": 4, "publish": 3}
+        assert queue.summary("b")[PUBLISHED] == 3
+        assert queue.jobs("b")[0]["review_id"] == "r-1"
+
+    def test_interrupted_publish_is_not_repeated(self):
+        queue = PublishJobQueue(":memory:")
+        queue.enqueue("b", ["A"])
+        stages = Stages(crash_in="publish")
+
+        with pytest.raises(KeyboardInterrupt):
+            run_batch(queue, stages)
+        run_batch(queue, stages)
+
+        job = queue.jobs("b")[0]
+        assert job["state"] == FAILED and "unknown" in job["error"]
+        assert queue.retry_failed("b") == 0
+        assert stages.calls["publish"] == 1
+
+    def test_retry_failed_resumes_from_last_stage(self):
+        queue = PublishJobQueue(":memory:")
+        queue.enqueue("b", ["A"])
+        stages = Stages()
+        stages.publish = lambda job: {"success": False, "message": "quota exceeded"}
+
+        run_batch(queue, stages)
+        assert queue.jobs("b")[0]["error"] == "quota exceeded"
+
+        assert queue.retry_failed("b") == 1
+        assert queue.jobs("b")[0]["state"] == WRITTEN
+        run_batch(queue, Stages())
+        assert queue.summary("b")[PUBLISHED] == 1
+
+    def test_deadline_keeps_job_resumable(self):
+        """Test a job stopped by its deadline keeps its state instead of failing"""
+        queue = PublishJobQueue(":memory:")
+        queue.enqueue("b", ["A"])
+        stages = Stages()
+
+        def write(job):
+            raise RuntimeError("crew failed") from WorkflowTimeout("Batch deadline of 60s exceeded")
+
+        job = queue.run(queue.unfinished("b")[0], stages.research, write, stages.publish)
+        assert job["state"] == RESEARCHED and job["error"] is None
+
+        run_batch(queue, stages)
+        assert queue.summary("b")[PUBLISHED] == 1
+        assert stages.calls["research"] == 1
@@ -0,0 +1,107 @@
+"""
+Unit tests for the LLM response cache
+"""
+from unittest.mock import Mock, patch
+
+from crewai.llms.base_llm import BaseLLM
+
+from src.llm_cache import CachedLLM, LLMResponseCache
+
+
+class EchoLLM(BaseLLM):
+    """Minimal CrewAI LLM that counts calls"""
+
+    def __init__(self):
+        super().__init__(model="echo-model", temperature=0.7, provider="openai")
+        self.calls = 0
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        self.calls += 1
+        return f"response #{self.calls}"
+
+
+class TestLLMResponseCache:
+    """Test cases for LLMResponseCache"""
+
+    def test_hit_and_miss_counters(self, tmp_path):
+        """Test lookups are counted as hits or misses"""
+        cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"))
+        key = cache.make_key("openai", "gpt", 0.7, "prompt")
+
+        assert cache.get(key) is None
+        cache.set(key, "answer")
+        assert cache.get(key) == "answer"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_key_depends_on_model_and_temperature(self):
+        """Test keys differ when any request parameter differs"""
+        base = LLMResponseCache.make_key("openai", "gpt", 0.7, "prompt")
+        assert base == LLMResponseCache.make_key("openai", "gpt", 0.7, "prompt")
+        assert base != LLMResponseCache.make_key("anthropic", "gpt", 0.7, "prompt")
+        assert base != LLMResponseCache.make_key("openai", "gpt", 0.2, "prompt")
+        assert base != LLMResponseCache.make_key("openai", "gpt", 0.7, "other")
+
+    def test_ttl_expiry(self, tmp_path):
+        """Test expired entries are treated as misses"""
+        cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=60)
+        key = cache.make_key("openai", "gpt", 0.7, "prompt")
+
+        with patch("src.llm_cache.time.time", return_value=1000.0):
+            cache.set(key, "answer")
+        with patch("src.llm_cache.time.time", return_value=1061.0):
+            assert cache.get(key) is None
+
+    def test_lru_eviction(self, tmp_path):
+        """Test least recently used entries are evicted over max_entries"""
+        cache = LLMResponseCache(
+            path=str(tmp_path / "cache.sqlite3"), ttl_seconds=None, max_entries=2
+        )
+
+        with patch("src.llm_cache.time.time", return_value=1.0):
+            cache.set("a", "A")
+        with patch("src.llm_cache.time.time", return_value=2.0):
+            cache.set("b", "B")
+        with patch("src.llm_cache.time.time", return_value=3.0):
+            cache.get("a")
+        with patch("src.llm_cache.time.time", return_value=4.0):
+            cache.set("c", "C")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+        assert cache.stats()["evictions"] == 1
+
+
+class TestCachedLLM:
+    """Test cases for CachedLLM"""
+
+    def test_repeated_prompt_is_replayed(self, tmp_path):
+        """Test a repeated prompt does not reach the inner LLM"""
+        inner = EchoLLM()
+        llm = CachedLLM(inner, LLMResponseCache(path=str(tmp_path / "cache.sqlite3")))
+        messages = [{"role": "user", "content": "Research AI"}]
+
+        assert llm.call(messages) == "response #1"
+        assert llm.call(messages) == "response #1"
+        assert inner.calls == 1
+
+        llm.call([{"role": "user", "content": "Research ML"}])
+        assert inner.calls == 2
+
+    def test_stream_is_cached_once_complete(self, tmp_path):
+        """Test a fully streamed response is replayed in one chunk"""
+        source = Mock(model="gpt-test", temperature=0.7)
+        source.stream.return_value = [Mock(content="Hello "), Mock(content="world")]
+        llm = CachedLLM(
+            source, LLMResponseCache(path=str(tmp_path / "cache.sqlite3")), provider="openai"
+        )
+        messages = [{"role": "user", "content": "Write a post"}]
+
+        assert list(llm.stream_text(messages)) == ["Hello ", "world"]
+        assert list(llm.stream_text(messages)) == ["Hello world"]
+        assert source.stream.call_count == 1
@@ -0,0 +1,73 @@
+"""
+Unit tests for the load-test harness
+"""
+import time
+from unittest.mock import patch
+
+from src.load_testing import build_tasks, run_load_test, sustainable_throughput
+from src.workflow_result import WorkflowResult
+
+
+def fake_workflow(topic, content_type="article", research=None):
+    time.sleep(0.05)
+    if topic.endswith(" 3"):
+        return WorkflowResult.failed(topic, content_type, "Error", error="injected 500")
+    return WorkflowResult.create(
+        True, topic, content_type, f"# {topic}", metrics={"duration_seconds": 0.05}
+    )
+
+
+def make_run(projected, error_rate=0.0, peak_rss_mb=500.0, workers=4):
+    return {
+        "workload": "batch", "workers": workers, "batch_size": 10,
+        "projected_posts_per_hour": projected, "error_rate": error_rate, "peak_rss_mb": peak_rss_mb,
+    }
+
+
+class TestLoadTest:
+    """Test cases for run_load_test and the workload builders"""
+
+    def test_mixed_workload_cycles_content_types(self):
+        tasks = build_tasks("mixed", 10)
+
+        assert len(tasks) == 10
+        assert {task["content_type"] for task in tasks} == {"blog post", "article", "presentation"}
+        assert len({task["topic"] for task in tasks}) == 10
+
+    @patch("src.crew_manager.CrewManager")
+    def test_run_reports_throughput_errors_and_resources(self, mock_manager_class):
+        manager = mock_manager_class.return_value
+        manager.execute_research_workflow.side_effect = fake_workflow
+        manager.execute_presentation_workflow.side_effect = fake_workflow
+
+        run = run_load_test(2, 6, "batch", time_scale=0.01)
+
+        assert run["succeeded"] == 5
+        assert run["error_rate"] == round(1 / 6, 4)
+        assert run["errors"] == {"injected 500": 1}
+        assert run["peak_in_flight"] == 2
+        assert run["peak_threads"] >= 3
+        assert run["workflow_p50_seconds"] == 0.05
+        # Latency-bound: 100x slower at real latency
+        assert run["projected_posts_per_hour"] <= run["posts_per_hour"] * 0.01 + 0.1
+
+
+class TestSustainableThroughput:
+    """Test cases for sustainable_throughput"""
+
+    def test_best_run_within_error_budget(self):
+        runs = [make_run(900), make_run(1500, error_rate=0.2, workers=16), make_run(1200, workers=8)]
+
+        summary = sustainable_throughput(runs, max_error_rate=0.01)
+
+        assert summary["posts_per_hour"] == 1200
+        assert summary["best_run"]["workers"] == 8
+        assert summary["rejected_runs"] == 1
+
+    def test_memory_limit_and_no_sustainable_run(self):
+        runs = [make_run(900, peak_rss_mb=4000), make_run(600, error_rate=0.5)]
+
+        summary = sustainable_throughput(runs, memory_limit_mb=2048)
+
+        assert summary["posts_per_hour"] is None
+        assert summary["best_run"] is None
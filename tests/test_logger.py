@@ -0,0 +1,142 @@
+"""
+Unit tests for the queue-based logging pipeline
+"""
+import gzip
+import logging
+import multiprocessing
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.logger import (
+    LogPipeline, SamplingFilter, create_file_handler, parse_sample_rates, worker_log_file,
+)
+
+
+class RecordingHandler(logging.Handler):
+    """Keeps emitted messages and the thread that emitted them"""
+
+    def __init__(self, gate: threading.Event = None):
+        super().__init__()
+        self.gate = gate
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.current_thread().name)
+
+
+def log_in_worker() -> int:
+    """Log one record from a spawned worker process"""
+    from src.logger import flush_logs, logger
+
+    logger.info("from worker")
+    flush_logs()
+    return os.getpid()
+
+
+def make_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+class TestSampling:
+    """Test cases for SamplingFilter and LOG_SAMPLE_RATES"""
+
+    def test_keeps_every_nth_info_record_of_sampled_loggers(self):
+        sampler = SamplingFilter({"app.publisher": 0.25})
+        handler = RecordingHandler()
+        handler.addFilter(sampler)
+        publisher = make_logger("app.publisher.blogger", handler)
+        other = logging.getLogger("app.other")
+        other.handlers = [handler]
+        other.propagate = False
+        other.setLevel(logging.DEBUG)
+
+        for i in range(8):
+            publisher.info(f"post {i}")
+        publisher.warning("quota low")
+        other.info("kept")
+
+        assert handler.messages == ["post 0", "post 4", "quota low", "kept"]
+        assert sampler.sampled_out == {"app.publisher.blogger": 6}
+
+    def test_parse_sample_rates(self):
+        assert parse_sample_rates("a.b=0.1, c=2") == {"a.b": 0.1, "c": 1.0}
+        assert parse_sample_rates("") == {}
+        with pytest.raises(ValueError):
+            parse_sample_rates("publisher")
+
+
+class TestRotation:
+    """Test cases for the rotating file handlers"""
+
+    def test_size_rotation_compresses_backups(self, tmp_path):
+        path = tmp_path / "logs" / "app.log"
+        handler = create_file_handler(str(path), rotation="size", max_bytes=200, backup_count=2)
+        logger = make_logger("test_rotation", handler)
+
+        assert not path.parent.exists()
+        for i in range(30):
+            logger.info(f"line {i:02d} " + "x" * 40)
+        handler.close()
+
+        backups = sorted(p.name for p in path.parent.iterdir() if p.name != "app.log")
+        assert backups == ["app.log.1.gz", "app.log.2.gz"]
+        with gzip.open(path.parent / "app.log.1.gz", "rt") as f:
+            assert "line" in f.read()
+
+    def test_worker_processes_write_their_own_file(self, tmp_path):
+        log_file = str(tmp_path / "app.log")
+        context = multiprocessing.get_context("spawn")
+        with patch.dict("os.environ", {"LOG_FILE": log_file, "LOG_ROTATION": "size"}):
+            with context.Pool(1) as pool:
+                pid = pool.apply(log_in_worker)
+
+        assert worker_log_file(log_file, pid) == str(tmp_path / f"app.worker-{pid}.log")
+        assert "from worker" in (tmp_path / f"app.worker-{pid}.log").read_text()
+        assert not (tmp_path / "app.log").exists()
+
+
+class TestLogPipeline:
+    """Test cases for the queue handler and background listener"""
+
+    def test_records_are_written_on_the_listener_thread(self):
+        handler = RecordingHandler()
+        pipeline = LogPipeline([handler], queue_size=100)
+        logger = make_logger("test_pipeline", pipeline.handler)
+        try:
+            for i in range(5):
+                logger.info(f"record {i}")
+            pipeline.flush()
+        finally:
+            pipeline.stop()
+
+        assert handler.messages == [f"record {i}" for i in range(5)]
+        assert threading.current_thread().name not in handler.threads
+
+    def test_full_queue_drops_info_without_blocking(self):
+        release = threading.Event()
+        handler = RecordingHandler(release)
+        pipeline = LogPipeline([handler], queue_size=2)
+        logger = make_logger("test_pipeline_full", pipeline.handler)
+        try:
+            for i in range(20):
+                logger.info(f"record {i}")
+            dropped = pipeline.stats()["dropped"]
+            release.set()
+            logger.error("still written")
+            pipeline.flush()
+        finally:
+            pipeline.stop()
+
+        assert dropped >= 17
+        assert handler.messages[-1] == "still written"
@@ -0,0 +1,111 @@
+"""
+Unit tests for per-stage crew metrics
+"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from crewai.llms.base_llm import BaseLLM
+
+from src.llm_wrappers import _report_usage
+from src.metrics import MeteredLLM, MetricsCollector, estimate_cost
+
+
+class UsageLLM(BaseLLM):
+    """Minimal CrewAI LLM that reports fixed token usage"""
+
+    def __init__(self):
+        super().__init__(model="claude-sonnet-4-20250514", provider="anthropic")
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        self._track_token_usage_internal({"input_tokens": 1000, "output_tokens": 200})
+        return "ok"
+
+
+def make_task(task_id: str, name: str, seconds: float, output="done"):
+    start = datetime(2026, 1, 1, 12, 0, 0)
+    return SimpleNamespace(
+        id=task_id,
+        name=name,
+        start_time=start,
+        end_time=start + timedelta(seconds=seconds),
+        output=output,
+    )
+
+
+class TestEstimateCost:
+    """Test cases for estimate_cost"""
+
+    def test_longest_prefix_wins(self):
+        """Test gpt-4o-mini is not priced as gpt-4"""
+        assert estimate_cost("gpt-4o-mini", 1_000_000, 0) == 0.15
+        assert estimate_cost("gpt-4", 1_000_000, 0) == 30.0
+
+    def test_unknown_model_is_free(self):
+        """Test unknown models are estimated at zero"""
+        assert estimate_cost("local-model", 1000, 1000) == 0.0
+
+
+class TestMetricsCollector:
+    """Test cases for MetricsCollector"""
+
+    def test_llm_calls_are_attributed_to_tasks(self, tmp_path):
+        """Test a crew's tasks become stage events with their own usage"""
+        collector = MetricsCollector(export_path=str(tmp_path / "metrics.prom"))
+        llm = MeteredLLM(UsageLLM(), collector=collector)
+        _report_usage(llm.inner)
+
+        research = make_task("t1", "research", 12.0)
+        writing = make_task("t2", "writing", 3.0)
+        review = make_task("t3", "review", 0.0, output=None)
+        review.start_time = None
+
+        llm.call("research", from_task=research)
+        llm.call("research again", from_task=research)
+        llm.call("write", from_task=writing)
+
+        crew = SimpleNamespace(tasks=[research, writing, review])
+        events = collector.record_crew(crew, "AI", "blog post", model="claude-sonnet-4-20250514")
+
+        assert [e["stage"] for e in events] == ["research", "writing"]
+        assert events[0]["iterations"] == 2
+        assert events[0]["input_tokens"] == 2000
+        assert events[0]["duration_seconds"] == 12.0
+        assert events[0]["topic"] == "AI"
+        assert events[0]["content_type"] == "blog post"
+        assert events[1]["cost_usd"] == estimate_cost("claude-sonnet-4", 1000, 200)
+
+    def test_prometheus_export(self, tmp_path):
+        """Test the text file contains histograms and counters per stage"""
+        path = tmp_path / "metrics.prom"
+        collector = MetricsCollector(export_path=str(path))
+        usage = {"llm_calls": 3, "input_tokens": 500, "output_tokens": 100}
+
+        collector.record_stage("research", "AI", "article", "gpt-4o", 7.0, usage)
+        collector.export()
+
+        text = path.read_text()
+        assert "# TYPE crew_stage_duration_seconds histogram" in text
+        assert 'crew_stage_duration_seconds_bucket{stage="research",model="gpt-4o",le="5"} 0' in text
+        assert 'crew_stage_duration_seconds_bucket{stage="research",model="gpt-4o",le="10"} 1' in text
+        assert 'crew_stage_tokens_total{stage="research",model="gpt-4o",direction="input"} 500' in text
+        assert 'crew_stage_iterations_total{stage="research",model="gpt-4o"} 3' in text
+
+    def test_worker_snapshots_merge_into_one_export(self, tmp_path):
+        """Test drained worker metrics add up in the parent's export"""
+        path = tmp_path / "metrics.prom"
+        parent = MetricsCollector(export_path=str(path))
+        usage = {"llm_calls": 1, "input_tokens": 100, "output_tokens": 10}
+
+        for duration in (2.0, 20.0):
+            worker = MetricsCollector()
+            worker.record_stage("research", "AI", "article", "gpt-4o", duration, usage)
+            worker.record_hedged_call("research", "gpt-4o", duration, hedged=True)
+            parent.merge(worker.drain())
+            assert worker.drain()["_runs"] == {}
+
+        text = path.read_text()
+        assert 'crew_stage_runs_total{stage="research",model="gpt-4o",status="success"} 2' in text
+        assert 'crew_stage_duration_seconds_bucket{stage="research",model="gpt-4o",le="5"} 1' in text
+        assert 'crew_stage_tokens_total{stage="research",model="gpt-4o",direction="input"} 200' in text
+        assert parent.hedge_summary()["research/gpt-4o"]["hedges"] == 2
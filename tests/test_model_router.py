@@ -0,0 +1,113 @@
+"""
+Unit tests for per-stage model routing
+"""
+from unittest.mock import patch
+
+import pytest
+from crewai.llms.base_llm import BaseLLM
+
+from src.crew_manager import CrewManager
+from src.deadlines import CancelToken, WorkflowCancelled, cancel_scope
+from src.llm_wrappers import DeadlineLLM, DelegatingLLM
+from src.model_router import FallbackLLM
+from src.parallel_crew_manager import ParallelCrewManager
+
+
+class ScriptedLLM(BaseLLM):
+    """CrewAI LLM that fails a given number of times, then answers"""
+
+    def __init__(self, model, failures=0):
+        super().__init__(model=model, provider="openai")
+        self.failures = failures
+        self.calls = 0
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("overloaded")
+        return f"{self.model} answer"
+
+
+def make_router(primary, fallback, **kwargs):
+    return FallbackLLM(DelegatingLLM(primary), DelegatingLLM(fallback), **kwargs)
+
+
+class TestFallbackLLM:
+    """Test cases for FallbackLLM"""
+
+    def test_primary_serves_calls(self):
+        """Test the fast tier answers while healthy"""
+        router = make_router(ScriptedLLM("fast"), ScriptedLLM("main"))
+        assert router.call("hi") == "fast answer"
+        assert router.fallbacks == 0
+
+    def test_error_falls_back_and_cools_down(self):
+        """Test a failure is retried on the fallback and the primary is skipped"""
+        primary = ScriptedLLM("fast", failures=1)
+        router = make_router(primary, ScriptedLLM("main"), cooldown_seconds=60)
+
+        assert router.call("hi") == "main answer"
+        assert router.call("hi") == "main answer"
+        assert primary.calls == 1
+        assert router.fallbacks == 2
+
+    def test_latency_overrun_degrades(self):
+        """Test a slow primary call is used but later calls fall back"""
+        router = make_router(ScriptedLLM("fast"), ScriptedLLM("main"), latency_budget=0.0)
+
+        assert router.call("hi") == "fast answer"
+        assert router.degraded
+        assert router.call("hi") == "main answer"
+
+    def test_cancelled_workflow_leaves_primary_healthy(self):
+        """Test a cancellation is re-raised without degrading the shared tier"""
+        primary, fallback = ScriptedLLM("fast"), ScriptedLLM("main")
+        router = FallbackLLM(DeadlineLLM(primary), DelegatingLLM(fallback), cooldown_seconds=60)
+        token = CancelToken()
+        token.cancel()
+
+        with cancel_scope(token), pytest.raises(WorkflowCancelled):
+            router.call("hi")
+
+        assert not router.degraded
+        assert router.fallbacks == 0
+        assert fallback.calls == 0
+        assert router.call("hi") == "fast answer"
+
+    def test_stop_words_reach_both_tiers(self):
+        """Test executor stop words are applied to the fallback too"""
+        router = make_router(ScriptedLLM("fast"), ScriptedLLM("main"))
+        router.stop = ["\nObservation:"]
+        assert router.fallback.stop == ["\nObservation:"]
+
+
+class TestStageRouting:
+    """Test cases for per-stage model configuration"""
+
+    @patch("src.crew_manager.ChatOpenAI")
+    def test_routed_stage_gets_fallback(self, mock_llm):
+        """Test research runs on its own model, writing on the main one"""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            manager = CrewManager(
+                model_name="gpt-4o", api_key="test-key",
+                stage_models={"research": "gpt-4o-mini"},
+            )
+
+        assert manager.stage_models["research"] == "gpt-4o-mini"
+        assert manager.stage_models["writing"] == "gpt-4o"
+        assert isinstance(manager.researcher.llm, FallbackLLM)
+        assert not isinstance(manager.writer.llm, FallbackLLM)
+        assert {call.kwargs["model"] for call in mock_llm.call_args_list} == {"gpt-4o", "gpt-4o-mini"}
+
+    @patch("src.crew_manager.ChatOpenAI")
+    def test_unknown_stage(self, mock_llm):
+        """Test a typo in a stage name is rejected"""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            with pytest.raises(ValueError, match="researh"):
+                CrewManager(api_key="test-key", stage_models={"researh": "gpt-4o-mini"})
+
+    def test_task_dict_stage_models(self):
+        """Test per-stage models are read from parallel task dicts"""
+        task = {"topic": "AI", "model_name": "gpt-4o", "review_model": "gpt-4o-mini"}
+        assert ParallelCrewManager._task_stage_models(task) == {"review": "gpt-4o-mini"}
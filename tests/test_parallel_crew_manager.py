@@ -0,0 +1,179 @@
+"""
+Unit tests for streaming results from ParallelCrewManager
+"""
+import asyncio
+import gc
+import threading
+import time
+from unittest.mock import patch
+
+from src.parallel_crew_manager import ParallelCrewManager
+from src.worker_pool import WorkerPool
+from src.workflow_result import WorkflowResult
+
+# Seconds each fake workflow takes
+DURATIONS = {"slow": 0.3, "fast": 0.01, "medium": 0.1}
+
+
+def fake_workflow(topic, content_type="article", research=None):
+    time.sleep(DURATIONS[topic])
+    if topic == "medium" and content_type == "broken":
+        raise RuntimeError("crew crashed")
+    return WorkflowResult.create(True, topic, content_type, f"# {topic}")
+
+
+async def afake_workflow(topic, content_type="article"):
+    await asyncio.sleep(DURATIONS[topic])
+    return WorkflowResult.create(True, topic, content_type, f"# {topic}")
+
+
+def make_manager(mock_manager_class):
+    mock_manager_class.return_value.execute_research_workflow.side_effect = fake_workflow
+    mock_manager_class.return_value.aexecute_research_workflow.side_effect = afake_workflow
+    return ParallelCrewManager(max_workers=3, pool=WorkerPool(3))
+
+
+class TestStreamingResults:
+    """Test cases for iter_workflows, aiter_workflows and result callbacks"""
+
+    @patch("src.crew_manager.CrewManager")
+    def test_iter_workflows_yields_in_completion_order(self, mock_manager_class):
+        manager = make_manager(mock_manager_class)
+        tasks = [{"topic": topic} for topic in ("slow", "fast", "medium")]
+
+        start = time.perf_counter()
+        first_task, first_result = next(iter(manager.iter_workflows(tasks)))
+
+        assert first_task["topic"] == "fast"
+        assert first_result["result"] == "# fast"
+        assert time.perf_counter() - start < DURATIONS["slow"]
+
+    @patch("src.crew_manager.CrewManager")
+    def test_callbacks_run_as_results_finish(self, mock_manager_class):
+        """Test on_result sees every result in completion order, results stay in task order"""
+        manager = make_manager(mock_manager_class)
+        tasks = [{"topic": topic} for topic in ("slow", "fast", "medium")]
+        seen = []
+
+        results = manager.execute_parallel_workflows(
+            tasks, on_result=lambda task, result: seen.append(task["topic"])
+        )
+
+        assert seen == ["fast", "medium", "slow"]
+        assert [result["topic"] for result in results] == ["slow", "fast", "medium"]
+
+    @patch("src.crew_manager.CrewManager")
+    def test_failures_and_callback_errors_do_not_stop_batch(self, mock_manager_class):
+        manager = make_manager(mock_manager_class)
+        tasks = [{"topic": "medium", "content_type": "broken"}, {"topic": "fast"}]
+
+        def callback(task, result):
+            raise OSError("disk full")
+
+        results = dict(
+            (task["topic"], result) for task, result in manager.iter_workflows(tasks, callback)
+        )
+
+        assert results["fast"]["success"] is True
+        assert results["medium"]["success"] is False
+        assert "crew crashed" in results["medium"]["error"]
+
+    @patch("src.crew_manager.CrewManager")
+    def test_aiter_workflows_awaits_async_callbacks(self, mock_manager_class):
+        manager = make_manager(mock_manager_class)
+        tasks = [{"topic": topic} for topic in ("slow", "fast", "medium")]
+        published = []
+
+        async def publish(task, result):
+            published.append(task["topic"])
+
+        async def consume():
+            return [task["topic"] async for task, _ in manager.aiter_workflows(tasks, on_result=publish)]
+
+        order = asyncio.run(consume())
+
+        assert order == ["fast", "medium", "slow"]
+        assert published == order
+
+
+class TestBatchDeadlines:
+    """Test cases for batch deadlines and cancel()"""
+
+    @patch("src.crew_manager.CrewManager")
+    def test_batch_deadline_returns_partial_results(self, mock_manager_class):
+        manager = make_manager(mock_manager_class)
+        tasks = [{"topic": topic} for topic in ("slow", "fast")]
+
+        start = time.perf_counter()
+        results = manager.execute_parallel_workflows(tasks, batch_timeout=0.1)
+
+        assert time.perf_counter() - start < DURATIONS["slow"]
+        assert results[1]["success"] is True
+        assert results[0]["status"] == "timeout"
+        assert "Batch deadline" in results[0]["error"]
+
+    @patch("src.crew_manager.CrewManager")
+    def test_cancel_stops_queued_workflows(self, mock_manager_class):
+        mock_manager_class.return_value.execute_research_workflow.side_effect = fake_workflow
+        manager = ParallelCrewManager(max_workers=1, pool=WorkerPool(1))
+        tasks = [{"topic": "slow"}] + [{"topic": "fast"}] * 3
+        threading.Timer(0.05, manager.cancel).start()
+
+        results = manager.execute_parallel_workflows(tasks)
+
+        assert all(result["status"] == "cancelled" for result in results[1:])
+        time.sleep(DURATIONS["slow"])
+        # The queued workflows never started
+        assert mock_manager_class.return_value.execute_research_workflow.call_count == 1
+
+    @patch("src.crew_manager.CrewManager")
+    def test_async_batch_deadline(self, mock_manager_class):
+        manager = make_manager(mock_manager_class)
+        tasks = [{"topic": topic} for topic in ("slow", "fast")]
+
+        results = asyncio.run(manager.aexecute_parallel_workflows(tasks, batch_timeout=0.1))
+
+        assert results[1]["success"] is True
+        assert results[0]["status"] == "timeout"
+
+
+class TestPrivatePool:
+    """Test cases for the pool a ParallelCrewManager(max_workers=N) creates"""
+
+    @patch("src.crew_manager.CrewManager")
+    def test_context_manager_stops_private_pool(self, mock_manager_class):
+        mock_manager_class.return_value.execute_research_workflow.side_effect = fake_workflow
+
+        with ParallelCrewManager(max_workers=3) as manager:
+            pool = manager.pool
+            manager.execute_parallel_workflows([{"topic": "fast"}])
+
+        assert pool.stats()["closed"]
+
+    def test_dropped_manager_stops_private_pool(self):
+        manager = ParallelCrewManager(max_workers=3)
+        pool = manager.pool
+
+        del manager
+        gc.collect()
+
+        assert pool.stats()["closed"]
+
+
+class TestBenchmark:
+    """Test cases for benchmark_parallel_vs_sequential"""
+
+    def test_benchmark_runs_against_fake_provider(self):
+        from src.config import config
+        from src.parallel_crew_manager import benchmark_parallel_vs_sequential
+
+        with patch.object(config.fake_llm, "mode", "synthetic"), \
+                patch.object(config.fake_llm, "time_scale", 0), \
+                patch.object(config.metrics, "enabled", False), \
+                patch.object(config.review, "mode", "off"), \
+                patch.dict("os.environ", {"OTEL_SDK_DISABLED": "true"}):
+            results = benchmark_parallel_vs_sequential(["Edge AI", "Rust"], content_type="blog post")
+
+        assert results["topics"] == 2
+        assert results["sequential_time"] > 0
+        assert results["parallel_time"] > 0
@@ -0,0 +1,132 @@
+"""
+Unit tests for process-pool batch execution
+"""
+import pickle
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from src.deadlines import WorkflowCancelled, check_cancelled
+from src.parallel_crew_manager import ParallelCrewManager
+from src.process_workers import (
+    ProcessWorkerPool, WorkflowSpec, decode_result, encode_result, run_workflow,
+)
+from src.worker_pool import WorkerPool
+from src.workflow_result import WorkflowResult
+
+
+class TestWorkflowSpec:
+    """Test cases for WorkflowSpec and result serialization"""
+
+    def test_spec_pickles_without_leaking_key_in_repr(self):
+        spec = WorkflowSpec("Edge AI", stage_models=(("research", "gpt-4o-mini"),), api_key="sk-secret")
+        assert pickle.loads(pickle.dumps(spec)) == spec
+        assert "sk-secret" not in repr(spec)
+
+    def test_result_roundtrip(self):
+        result = WorkflowResult.create(
+            True, "Edge AI", "article", "Post " * 500, "ok",
+            stages={"research": "notes"}, metrics={"llm_calls": 2},
+        )
+        payload = encode_result(result)
+        assert decode_result(payload) == result
+        assert len(payload) < len(result.result) / 10
+
+    @patch("src.process_workers._managers", {})
+    @patch("src.crew_manager.CrewManager")
+    def test_worker_reuses_manager(self, mock_manager_class):
+        """Test a worker builds one CrewManager per configuration"""
+        manager = mock_manager_class.return_value
+        manager.execute_research_workflow.return_value = WorkflowResult.create(
+            True, "Edge AI", "article", "Post", "ok"
+        )
+
+        for topic in ("Edge AI", "Rust"):
+            payload, snapshot = run_workflow(WorkflowSpec(topic, stage_models=(("review", "gpt-4o-mini"),)))
+            decode_result(payload)
+            assert set(snapshot) >= {"_runs", "_duration_buckets", "_call_latency"}
+
+        mock_manager_class.assert_called_once()
+        assert mock_manager_class.call_args.kwargs["stage_models"] == {"review": "gpt-4o-mini"}
+        assert manager.execute_research_workflow.call_count == 2
+
+
+class TestProcessWorkerPool:
+    """Test cases for the futures ProcessWorkerPool hands out"""
+
+    @patch("src.process_workers.ProcessPoolExecutor")
+    def test_cancelling_a_result_cancels_the_queued_job(self, mock_executor_class, caplog):
+        jobs = []
+        mock_executor_class.return_value.submit.side_effect = lambda *args: jobs.append(Future()) or jobs[-1]
+        pool = ProcessWorkerPool(workers=1)
+
+        queued = pool.submit(WorkflowSpec("Edge AI"))
+        running = pool.submit(WorkflowSpec("Rust"))
+        jobs[1].set_running_or_notify_cancel()
+
+        assert queued.cancel() and jobs[0].cancelled()
+        assert running.cancel() and not jobs[1].cancelled()
+        # A workflow that finishes after its result was cancelled is dropped quietly
+        result = WorkflowResult.create(True, "Rust", "article", "Post", "ok")
+        jobs[1].set_result((encode_result(result), {}))
+        assert running.cancelled()
+        assert "exception calling callback" not in caplog.text
+
+
+    """Test cases for ParallelCrewManager in process mode"""
+
+    @patch("src.parallel_crew_manager.ProcessWorkerPool")
+    def test_workflows_are_sent_as_specs(self, mock_pool_class):
+        pool = mock_pool_class.return_value
+
+        def submit(spec):
+            future = Future()
+            future.set_result(WorkflowResult.create(True, spec.topic, spec.content_type, "Post", "ok"))
+            return future
+
+        pool.submit.side_effect = submit
+        manager = ParallelCrewManager(max_workers=2, executor="process", pool=WorkerPool(2))
+        results = manager.execute_parallel_workflows([
+            {"topic": "Edge AI", "content_type": "blog post", "research_model": "gpt-4o-mini"},
+            {"topic": "Slides", "content_type": "presentation"},
+        ])
+
+        assert [r["success"] for r in results] == [True, True]
+        specs = [call.args[0] for call in pool.submit.call_args_list]
+        assert specs[0].stage_models == (("research", "gpt-4o-mini"),)
+        assert specs[1].content_type == "presentation"
+        mock_pool_class.assert_called_once()
+        assert manager.pool.stats()["managers"] == 0
+
+        manager.shutdown()
+        pool.shutdown.assert_called_once_with(wait=True)
+
+    @patch("src.process_workers._managers", {})
+    @patch("src.crew_manager.CrewManager")
+    @patch("src.process_workers.ProcessPoolExecutor")
+    def test_batch_deadline_counts_time_queued_for_a_worker(self, mock_executor_class, mock_manager_class):
+        """Test workflows waiting for the only worker stop at the batch deadline"""
+        # One worker thread stands in for the worker process
+        mock_executor_class.side_effect = lambda max_workers, **kwargs: ThreadPoolExecutor(max_workers)
+        finished = []
+
+        def workflow(topic, content_type="article"):
+            for _ in range(20):
+                time.sleep(0.02)
+                try:
+                    check_cancelled()
+                except WorkflowCancelled as e:
+                    return WorkflowResult.interrupted(topic, content_type, e.status, str(e))
+            finished.append(topic)
+            return WorkflowResult.create(True, topic, content_type, "Post", "ok")
+
+        mock_manager_class.return_value.execute_research_workflow.side_effect = workflow
+        manager = ParallelCrewManager(max_workers=1, executor="process", pool=WorkerPool(1))
+        results = manager.execute_parallel_workflows(
+            [{"topic": f"topic {i}"} for i in range(3)], batch_timeout=0.6
+        )
+        manager.shutdown()
+
+        assert [r["success"] for r in results] == [True, False, False]
+        assert [r.get("status") for r in results[1:]] == ["timeout", "timeout"]
+        assert finished == ["topic 0"]
@@ -0,0 +1,59 @@
+"""
+Unit tests for provider-side prompt caching
+"""
+from unittest.mock import patch
+
+from src.crew_manager import CrewManager
+from src.prompt_cache import mark_cacheable, split_static_prefix, static_prompt
+
+
+def count_breakpoints(messages):
+    return sum(
+        1
+        for message in messages
+        if isinstance(message["content"], list)
+        for block in message["content"]
+        if "cache_control" in block
+    )
+
+
+class TestPromptCache:
+    """Test cases for cache breakpoint placement"""
+
+    def test_static_spec_is_split_off(self):
+        """Test the registered spec becomes its own cached block"""
+        static_prompt("Write a detailed report.")
+        blocks = split_static_prefix("\nCurrent Task: Write a detailed report.\n\nTopic: AI")
+
+        assert blocks[0]["text"] == "\nCurrent Task: Write a detailed report."
+        assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+        assert blocks[1] == {"type": "text", "text": "\n\nTopic: AI"}
+
+    def test_conversation_breakpoints(self):
+        """Test system, task spec and conversation end are marked without mutating input"""
+        static_prompt("Review the provided content.")
+        messages = [
+            {"role": "system", "content": "You are a reviewer."},
+            {"role": "user", "content": "Review the provided content.\n\nPost: ..."},
+            {"role": "assistant", "content": "Thought: ..."},
+            {"role": "user", "content": "Observation: ..."},
+        ]
+
+        marked = mark_cacheable(messages, include_system=True)
+
+        assert count_breakpoints(marked) == 3
+        assert marked[1]["content"][0]["text"] == "Review the provided content."
+        assert isinstance(messages[1]["content"], str)
+
+    @patch("src.crew_manager.ChatOpenAI")
+    def test_presentation_spec_sent_once(self, mock_llm):
+        """Test the slide format is no longer repeated in expected_output"""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            manager = CrewManager(api_key="test-key")
+            crew = manager.create_presentation_crew("AI", text_content="Some content")
+
+        task = crew.tasks[0]
+        spec = manager._get_presentation_task_description()
+        assert task.description.startswith(spec)
+        assert task.description.endswith("Some content")
+        assert len(task.expected_output) < 300
@@ -0,0 +1,179 @@
+"""
+Unit tests for the shared provider rate limiter
+"""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from crewai.llms.base_llm import BaseLLM
+
+from src.llm_wrappers import DelegatingLLM, _report_usage, usage_scope
+from src.rate_limiter import (
+    ProviderRateLimiter,
+    RateLimitedLLM,
+    TokenBucket,
+    get_rate_limiter,
+    retry_after_seconds,
+)
+
+
+class RateLimitError(Exception):
+    """Provider 429 shaped like the OpenAI/Anthropic SDK errors"""
+
+    def __init__(self, retry_after=None):
+        super().__init__("Error code: 429")
+        self.status_code = 429
+        headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+        self.response = SimpleNamespace(status_code=429, headers=headers)
+
+
+class ThrottledLLM(BaseLLM):
+    """CrewAI LLM that returns 429 a given number of times, then answers"""
+
+    def __init__(self, failures=0, retry_after=None):
+        super().__init__(model="gpt-4o", provider="openai")
+        self.failures = failures
+        self.retry_after = retry_after
+        self.calls = 0
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RateLimitError(self.retry_after)
+        self._track_token_usage_internal({"prompt_tokens": 900, "completion_tokens": 100})
+        return "ok"
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket"""
+
+    def test_wait_time_follows_refill_rate(self):
+        """Test an empty bucket refills at capacity per minute"""
+        bucket = TokenBucket(60)
+        now = bucket._updated
+        bucket.take(60)
+
+        assert bucket.wait_time(1, now) == pytest.approx(1.0)
+        assert bucket.wait_time(1, now + 1.0) == 0.0
+
+    def test_oversized_request_waits_for_full_bucket(self):
+        """Test a request above capacity is not blocked forever"""
+        bucket = TokenBucket(100)
+        assert bucket.wait_time(500, bucket._updated) == 0.0
+
+
+class TestProviderRateLimiter:
+    """Test cases for ProviderRateLimiter"""
+
+    def test_reserve_blocks_when_budget_is_spent(self):
+        """Test the request budget is shared by every caller"""
+        limiter = ProviderRateLimiter("openai", rpm=2)
+        assert limiter._reserve(0) == 0.0
+        assert limiter._reserve(0) == 0.0
+        assert limiter._reserve(0) > 0.0
+        assert limiter.stats()["in_flight"] == 2
+
+    def test_release_settles_actual_tokens(self):
+        """Test under-estimated requests are debited afterwards"""
+        limiter = ProviderRateLimiter("openai", tpm=1000)
+        limiter._reserve(100)
+        limiter.release(100, used_tokens=600)
+
+        assert limiter.stats()["token_utilization"] == pytest.approx(0.6, abs=0.01)
+
+    def test_penalize_pauses_every_caller(self):
+        """Test a Retry-After blocks new reservations"""
+        limiter = ProviderRateLimiter("anthropic", rpm=100)
+        limiter.penalize(30)
+
+        assert limiter._reserve(0) == pytest.approx(30, abs=0.1)
+        assert limiter.stats()["rate_limit_errors"] == 1
+
+    def test_limiters_are_process_wide(self):
+        """Test every caller gets the same limiter per provider"""
+        assert get_rate_limiter("openai") is get_rate_limiter("openai")
+        assert get_rate_limiter("openai") is not get_rate_limiter("anthropic")
+
+
+class TestRetryAfter:
+    """Test cases for retry_after_seconds"""
+
+    def test_reads_header(self):
+        assert retry_after_seconds(RateLimitError(retry_after=7)) == 7.0
+
+    def test_rate_limit_without_header(self):
+        assert retry_after_seconds(RateLimitError()) == 0.0
+
+    def test_wrapped_error(self):
+        """Test a rate limit re-raised by CrewAI is still recognized"""
+        try:
+            try:
+                raise RateLimitError(retry_after=3)
+            except RateLimitError as e:
+                raise RuntimeError("LLM call failed") from e
+        except RuntimeError as wrapped:
+            assert retry_after_seconds(wrapped) == 3.0
+
+    def test_other_errors(self):
+        assert retry_after_seconds(ValueError("bad request")) is None
+
+
+class TestRateLimitedLLM:
+    """Test cases for RateLimitedLLM"""
+
+    def test_retries_after_rate_limit(self):
+        """Test a 429 pauses the limiter for Retry-After and the call is retried"""
+        inner = ThrottledLLM(failures=2, retry_after=2)
+        limiter = ProviderRateLimiter("openai", rpm=100)
+        llm = RateLimitedLLM(DelegatingLLM(inner), limiter, max_retries=3)
+
+        with patch("src.rate_limiter.time.sleep") as sleep:
+            sleep.side_effect = lambda seconds: limiter.__setattr__("_blocked_until", 0.0)
+            assert llm.call("hello") == "ok"
+
+        assert inner.calls == 3
+        stats = limiter.stats()
+        assert stats["rate_limit_errors"] == 2
+        assert stats["retries_total"] == 2
+        assert stats["in_flight"] == 0
+
+    def test_gives_up_after_max_retries(self):
+        """Test persistent 429s are raised to the caller"""
+        inner = ThrottledLLM(failures=10, retry_after=1)
+        limiter = ProviderRateLimiter("openai")
+        llm = RateLimitedLLM(DelegatingLLM(inner), limiter, max_retries=1)
+
+        with patch("src.rate_limiter.time.sleep") as sleep:
+            sleep.side_effect = lambda seconds: limiter.__setattr__("_blocked_until", 0.0)
+            with pytest.raises(RateLimitError):
+                llm.call("hello")
+
+        assert inner.calls == 2
+
+    def test_actual_usage_reaches_outer_scope(self):
+        """Test token usage is settled and still visible to outer layers"""
+        inner = ThrottledLLM()
+        limiter = ProviderRateLimiter("openai", tpm=10000)
+        llm = RateLimitedLLM(DelegatingLLM(inner), limiter)
+        _report_usage(inner)
+
+        with usage_scope() as usage:
+            llm.call("short prompt")
+
+        assert usage["input_tokens"] == 900
+        assert limiter.stats()["token_utilization"] == pytest.approx(0.1, abs=0.01)
+
+    def test_stream_without_usage_dict_settles_tokens(self):
+        """Test a stream called without a usage dict still counts the reported tokens"""
+        chunks = [
+            SimpleNamespace(content="Hello ", usage_metadata=None),
+            SimpleNamespace(content="world", usage_metadata={"input_tokens": 800, "output_tokens": 200}),
+        ]
+        source = SimpleNamespace(model_name="gpt-4o", stream=lambda messages: iter(chunks))
+        limiter = ProviderRateLimiter("openai", tpm=10000)
+        llm = RateLimitedLLM(DelegatingLLM(source), limiter)
+
+        assert "".join(llm.stream_text("short prompt")) == "Hello world"
+        assert limiter.stats()["in_flight"] == 0
+        assert limiter.stats()["token_utilization"] == pytest.approx(0.1, abs=0.01)
@@ -0,0 +1,78 @@
+"""
+Unit tests for the background review queue
+"""
+import json
+
+from src.review_queue import ReviewQueue, parse_review
+
+
+class TestParseReview:
+    """Test cases for parse_review"""
+
+    def test_score_and_verdict(self):
+        """Test the score and final verdict are extracted"""
+        review = """**Overall quality score:** 8/10
+
+        Strengths: approved structure...
+
+        **Final verdict**: Needs Minor Revision"""
+
+        parsed = parse_review(review)
+        assert parsed["score"] == 8.0
+        assert parsed["verdict"] == "minor_revision"
+
+    def test_rubric_range_is_not_the_score(self):
+        """Test an echoed '(1-10)' rubric is skipped for the value of the Score line"""
+        review = """- **Overall quality score (1-10)** with justification
+
+        Overall quality score (1-10): 7.5/10"""
+
+        assert parse_review(review)["score"] == 7.5
+        assert parse_review("Score (1-10) pending")["score"] is None
+
+    def test_unparseable_review(self):
+        """Test free-form text yields no score or verdict"""
+        assert parse_review("Looks fine.") == {"score": None, "verdict": None}
+
+
+class TestReviewQueue:
+    """Test cases for ReviewQueue"""
+
+    def test_verdict_is_persisted_and_broadcast(self, tmp_path):
+        """Test a verdict reaches the JSONL side channel and listeners"""
+        path = tmp_path / "verdicts.jsonl"
+        queue = ReviewQueue(verdicts_path=str(path))
+        received = []
+        queue.add_listener(received.append)
+
+        review_id = queue.submit(
+            lambda: "Score: 4/10. Final verdict: Needs Major Revision",
+            "AI", "blog post", metadata={"source": "test"},
+        )
+        assert queue.drain(timeout=5)
+
+        assert received[0]["review_id"] == review_id
+        assert received[0]["verdict"] == "major_revision"
+        assert received[0]["source"] == "test"
+        saved = json.loads(path.read_text().splitlines()[0])
+        assert saved["score"] == 4.0
+
+    def test_failed_review_is_reported(self, tmp_path):
+        """Test reviewer errors become failed verdicts"""
+        queue = ReviewQueue(verdicts_path=None)
+        received = []
+        queue.add_listener(received.append)
+
+        def fail():
+            raise RuntimeError("rate limited")
+
+        queue.submit(fail, "AI", "article")
+        assert queue.drain(timeout=5)
+        assert received[0]["status"] == "failed"
+        assert "rate limited" in received[0]["error"]
+
+    def test_sampling(self):
+        """Test unsampled posts are not reviewed"""
+        queue = ReviewQueue(verdicts_path=None, sample_rate=0.0)
+        assert queue.submit(lambda: "review", "AI", "article") is None
+        assert queue.pending == 0
@@ -0,0 +1,110 @@
+"""
+Unit tests for the outline-then-sections writer
+"""
+import asyncio
+import threading
+import time
+
+from crewai.llms.base_llm import BaseLLM
+
+from src.sectioned_writer import SectionedWriter, clean_section, parse_outline
+
+
+OUTLINE = """# Edge AI in Practice
+
+## Introduction
+- Why inference moves to the edge
+
+## Background
+- Latency and privacy constraints
+
+## How-To Guide
+- Quantize and deploy a model
+
+## Conclusion
+- Key takeaways
+"""
+
+
+class OutlineLLM(BaseLLM):
+    """CrewAI LLM that returns an outline, then one section per call"""
+
+    def __init__(self, outline=OUTLINE, delay=0.0):
+        super().__init__(model="gpt-4o", provider="openai")
+        self.outline = outline
+        self.delay = delay
+        self.threads = set()
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        prompt = messages[-1]["content"]
+        if "Write this section" not in prompt:
+            return self.outline
+
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        heading = prompt.rsplit("## ", 1)[1].split("\n")[0]
+        # Writers sometimes wrap the answer in a fence or repeat the title
+        return f"```markdown\n# Edge AI\n## {heading}\n\nBody of {heading}.\n```"
+
+    async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                    from_task=None, from_agent=None, response_model=None):
+        return self.call(messages)
+
+
+class TestOutlineParsing:
+    """Test cases for parse_outline and clean_section"""
+
+    def test_parse_outline(self):
+        title, sections = parse_outline(OUTLINE)
+        assert title == "Edge AI in Practice"
+        assert [s["heading"] for s in sections] == [
+            "Introduction", "Background", "How-To Guide", "Conclusion"
+        ]
+        assert sections[2]["notes"] == "- Quantize and deploy a model\n"
+
+    def test_clean_section_adds_missing_heading(self):
+        assert clean_section("Just text.", "Background") == "## Background\n\nJust text."
+
+
+class TestSectionedWriter:
+    """Test cases for SectionedWriter"""
+
+    def test_sections_are_written_concurrently_in_order(self):
+        """Test sections run in parallel and are stitched in outline order"""
+        llm = OutlineLLM(delay=0.2)
+        writer = SectionedWriter(llm, max_workers=4)
+
+        start = time.monotonic()
+        content, usage = writer.write("system", "Edge AI", "research notes")
+
+        assert time.monotonic() - start < 0.6
+        assert len(llm.threads) == 4
+        assert usage["llm_calls"] == 5
+        assert content.startswith("# Edge AI in Practice\n\n## Introduction\n\nBody of Introduction.")
+        assert content.index("## Background") < content.index("## Conclusion")
+        assert "```" not in content and content.count("\n# ") == 0
+
+    def test_output_converts_like_single_call_posts(self):
+        """Test the stitched post renders with the publisher's Markdown extensions"""
+        import markdown
+
+        content, _ = SectionedWriter(OutlineLLM()).write("system", "Edge AI", "notes")
+        html = markdown.markdown(content, extensions=["fenced_code", "codehilite", "tables", "nl2br"])
+
+        assert html.count("<h1>") == 1
+        assert html.count("<h2>") == 4
+
+    def test_thin_outline_is_rejected(self):
+        """Test an unusable outline returns None so the caller writes in one pass"""
+        writer = SectionedWriter(OutlineLLM(outline="# Title\n\n## Only one section"))
+        content, usage = writer.write("system", "Edge AI", "notes")
+        assert content is None
+        assert usage["llm_calls"] == 1
+
+    def test_async_write(self):
+        content, usage = asyncio.run(
+            SectionedWriter(OutlineLLM()).awrite("system", "Edge AI", "notes")
+        )
+        assert content.count("\n## ") == 4
+        assert usage["llm_calls"] == 5
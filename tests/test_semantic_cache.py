@@ -0,0 +1,74 @@
+"""
+Unit tests for the semantic research cache
+"""
+import numpy as np
+
+from src.semantic_cache import SemanticResearchCache
+
+VOCABULARY = ["complete", "guide", "mastering", "kubernetes", "python", "testing", "2026"]
+
+
+def bag_of_words(texts):
+    """Deterministic stand-in for a sentence-transformers model"""
+    return [
+        np.array([text.lower().split().count(word) for word in VOCABULARY], dtype=float)
+        for text in texts
+    ]
+
+
+class TestSemanticResearchCache:
+    """Test cases for SemanticResearchCache"""
+
+    def test_near_duplicate_topic_hits(self, tmp_path):
+        """Test a reworded topic reuses the stored research"""
+        cache = SemanticResearchCache(str(tmp_path), threshold=0.5, embedder=bag_of_words)
+        cache.store("Complete Guide to Kubernetes 2026", "k8s research")
+
+        match = cache.lookup("Mastering Kubernetes 2026")
+        assert match is not None
+        assert match["research"] == "k8s research"
+        assert match["topic"] == "Complete Guide to Kubernetes 2026"
+
+    def test_unrelated_topic_misses(self, tmp_path):
+        """Test a different topic stays below the threshold"""
+        cache = SemanticResearchCache(str(tmp_path), threshold=0.5, embedder=bag_of_words)
+        cache.store("Complete Guide to Kubernetes 2026", "k8s research")
+
+        assert cache.lookup("Python Testing") is None
+
+    def test_index_is_persisted(self, tmp_path):
+        """Test a new instance loads the index from persist_directory"""
+        cache = SemanticResearchCache(str(tmp_path), embedder=bag_of_words)
+        cache.store("Python Testing 2026", "pytest research")
+
+        reloaded = SemanticResearchCache(str(tmp_path), embedder=bag_of_words)
+        assert reloaded.lookup("Python Testing 2026")["research"] == "pytest research"
+
+    def test_concurrent_writers_merge_their_entries(self, tmp_path):
+        """Test two processes' caches writing one index keep each other's entries"""
+        first = SemanticResearchCache(str(tmp_path), embedder=bag_of_words)
+        second = SemanticResearchCache(str(tmp_path), embedder=bag_of_words)
+        first.store("Python Testing 2026", "pytest research")
+        second.store("Mastering Kubernetes", "k8s research")
+
+        reloaded = SemanticResearchCache(str(tmp_path), embedder=bag_of_words)
+        assert {entry["topic"] for entry in reloaded._entries} == {
+            "Python Testing 2026", "Mastering Kubernetes"
+        }
+        # The first cache picks up the other writer's entry on lookup
+        assert first.lookup("Mastering Kubernetes")["research"] == "k8s research"
+        assert not list(tmp_path.glob("research_cache/*.tmp"))
+
+    def test_expired_and_excess_entries_are_dropped(self, tmp_path):
+        """Test stale research is not served and the index is capped"""
+        cache = SemanticResearchCache(
+            str(tmp_path), max_age_seconds=3600, max_entries=2, embedder=bag_of_words
+        )
+        cache.store("Python Testing", "old research")
+        cache._entries[0]["created_at"] -= 7200
+        assert cache.lookup("Python Testing") is None
+
+        for topic in ("Complete Guide", "Mastering Kubernetes", "Python 2026"):
+            cache.store(topic, f"{topic} research")
+
+        assert [entry["topic"] for entry in cache._entries] == ["Python 2026", "Mastering Kubernetes"]
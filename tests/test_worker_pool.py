@@ -0,0 +1,95 @@
+"""
+Unit tests for the persistent worker pool
+"""
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.worker_pool import WorkerPool
+
+
+class TestWorkerPool:
+    """Test cases for WorkerPool"""
+
+    def test_threads_stay_warm_across_batches(self):
+        """Test later batches reuse the threads of earlier ones"""
+        pool = WorkerPool(max_workers=2, name="test-pool")
+
+        def batch():
+            futures = [pool.submit(lambda: (time.sleep(0.01), threading.current_thread().name)[1])
+                       for _ in range(6)]
+            return {future.result() for future in futures}
+
+        first, second = batch(), batch()
+        assert len(first | second) <= 2
+        assert pool.stats()["submitted"] == 12
+        pool.shutdown()
+
+    def test_submit_overhead_is_small(self):
+        pool = WorkerPool(max_workers=4)
+        start = time.perf_counter()
+        futures = [pool.submit(int) for _ in range(2000)]
+        per_submit = (time.perf_counter() - start) / len(futures)
+
+        assert per_submit < 0.001
+        assert pool.drain(timeout=5)
+        assert pool.pending == 0
+        pool.shutdown()
+
+    def test_shutdown_drains_and_rejects_new_jobs(self):
+        pool = WorkerPool(max_workers=1)
+        futures = [pool.submit(time.sleep, 0.05) for _ in range(3)]
+
+        assert pool.shutdown() is True
+        assert all(future.done() and not future.cancelled() for future in futures)
+        with pytest.raises(RuntimeError):
+            pool.submit(int)
+
+    def test_shutdown_timeout_cancels_queued_jobs(self):
+        pool = WorkerPool(max_workers=1)
+        futures = [pool.submit(time.sleep, 0.2) for _ in range(3)]
+
+        assert pool.shutdown(timeout=0.05) is False
+        assert futures[-1].cancelled()
+
+    @patch("src.crew_manager.CrewManager")
+    def test_managers_are_shared_by_configuration(self, mock_manager_class):
+        pool = WorkerPool(max_workers=2)
+        mock_manager_class.return_value.execute_research_workflow.return_value = {"success": True}
+
+        first = pool.submit_workflow("Edge AI", model_name="gpt-4o", use_anthropic=False)
+        second = pool.submit_workflow("Rust", model_name="gpt-4o", use_anthropic=False)
+
+        assert first.result()["success"] and second.result()["success"]
+        mock_manager_class.assert_called_once()
+        assert pool.stats()["managers"] == 1
+        pool.shutdown()
+
+    @patch("src.crew_manager.CrewManager")
+    def test_building_a_manager_does_not_block_submit(self, mock_manager_class):
+        """Test jobs can be queued while a slow manager is being built"""
+        pool = WorkerPool(max_workers=2)
+        building, finish = threading.Event(), threading.Event()
+
+        def build(**kwargs):
+            building.set()
+            finish.wait(5)
+            return object()
+
+        mock_manager_class.side_effect = build
+        getters = [threading.Thread(target=pool.get_manager, kwargs={"model_name": "gpt-4o"})
+                   for _ in range(2)]
+        for getter in getters:
+            getter.start()
+        assert building.wait(5)
+
+        assert pool.submit(int, 7).result(timeout=1) == 7
+        finish.set()
+        for getter in getters:
+            getter.join(5)
+
+        mock_manager_class.assert_called_once()
+        assert pool.stats()["managers"] == 1
+        pool.shutdown()
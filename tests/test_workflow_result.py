@@ -0,0 +1,89 @@
+"""
+Unit tests for compact workflow results
+"""
+import json
+import pickle
+
+import pytest
+
+from src.metrics import MetricsCollector, collect_stage_events, summarize_stages
+from src.workflow_result import WorkflowResult
+
+
+RESEARCH = "## Current trends\n" + "Findings about edge inference. " * 200
+POST = "# Edge AI\n\n## Introduction\n\n" + "Body text of the post. " * 300
+
+
+def make_result(**kwargs):
+    return WorkflowResult.create(
+        True, "Edge AI", "blog post", POST, "Workflow completed successfully",
+        stages={"research": RESEARCH, "writing": POST}, **kwargs,
+    )
+
+
+class TestWorkflowResult:
+    """Test cases for WorkflowResult"""
+
+    def test_dict_style_access(self):
+        """Test results read like the workflow dicts they replace"""
+        result = make_result(review_id="review-1")
+
+        assert result["success"] is True
+        assert result["result"] == POST
+        assert result.get("review_id") == "review-1"
+        assert "error" not in result and result.get("error") is None
+        assert list(result) == ["success", "topic", "content_type", "result", "message", "review_id"]
+        with pytest.raises(KeyError):
+            result["error"]
+
+    def test_failed_result(self):
+        result = WorkflowResult.failed("Edge AI", "article", "Error: boom", error="boom")
+        assert result["success"] is False
+        assert result["result"] is None
+        assert result["error"] == "boom"
+
+    def test_result_is_immutable(self):
+        with pytest.raises(AttributeError):
+            make_result().success = False
+
+    def test_pickle_roundtrip(self):
+        """Test results can cross process boundaries"""
+        result = make_result(metrics={"llm_calls": 3})
+        restored = pickle.loads(pickle.dumps(result))
+
+        assert restored == result
+        assert restored.stage_text("research") == RESEARCH
+
+    def test_json_roundtrip(self):
+        result = make_result(review_id="review-1", metrics={"cost_usd": 0.01})
+        restored = WorkflowResult.from_json(result.to_json())
+
+        assert restored == result
+        assert restored.stages == {"research": RESEARCH, "writing": POST}
+        assert "stages" not in json.loads(result.to_json())
+
+    def test_stage_texts_are_compressed(self):
+        """Test the stage transcripts add little to the size of a result"""
+        result = make_result()
+
+        assert result.stage_text("review") is None
+        assert len(pickle.dumps(result)) < len(POST) + len(RESEARCH)
+
+
+class TestStageSummary:
+    """Test cases for collecting a workflow's stage metrics"""
+
+    def test_events_inside_block_are_summarized(self):
+        collector = MetricsCollector()
+        usage = {"llm_calls": 2, "input_tokens": 1000, "output_tokens": 200, "cached_tokens": 0}
+
+        collector.record_stage("research", "Edge AI", "article", "gpt-4o", 1.0, usage)
+        with collect_stage_events() as events:
+            collector.record_stage("research", "Edge AI", "article", "gpt-4o", 1.5, usage)
+            collector.record_stage("writing", "Edge AI", "article", "gpt-4o", 2.0, usage)
+
+        summary = summarize_stages(events, 3.6)
+        assert summary["stage_seconds"] == {"research": 1.5, "writing": 2.0}
+        assert summary["llm_calls"] == 4
+        assert summary["input_tokens"] == 2000
+        assert summary["duration_seconds"] == 3.6
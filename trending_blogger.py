@@ -3,22 +3,29 @@ Trending Topics Automated Blog Publisher
 Automatically finds hot/trending topics and publishes SEO-optimized blog posts daily
 """
 import sys
-import io
 import time
 import schedule
 import os
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 import random
 import requests
 from bs4 import BeautifulSoup
 
-# Fix Windows console encoding issues
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+# Fix Windows console encoding issues (in place: replacing the stream on
+# import would close stdout once another module does the same)
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
-from src.crew_manager import CrewManager
 from src.blogger_publisher import BloggerPublisher
-from src.logger import logger
+from src.config import config
+from src.deadlines import CancelToken, cancel_scope, interruption
+from src.job_queue import FAILED, PUBLISHED, get_job_queue
+from src.review_queue import review_queue
+from src.worker_pool import worker_pool
+from src.logger import get_logger
+
+logger = get_logger("trending")
 
 
 class TrendingTopicsFinder:
@@ -39,30 +46,43 @@ class TrendingTopicsFinder:
         try:
             url = "https://github.com/trending"
             response = requests.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            trending_repos = []
-            repos = soup.find_all('article', class_='Box-row')[:10]
-
-            for repo in repos:
-                try:
-                    title_elem = repo.find('h2', class_='h3')
-                    if title_elem:
-                        repo_name = title_elem.get_text().strip().replace('\n', ' ')
-                        desc_elem = repo.find('p', class_='col-9')
-                        desc = desc_elem.get_text().strip() if desc_elem else ""
-
-                        # Create topic from repo name and description
-                        topic = f"{repo_name}: {desc}" if desc else repo_name
-                        trending_repos.append(topic)
-                except Exception as e:
-                    continue
-
-            return trending_repos[:5]
+            return self.parse_github_trending(response.content)
         except Exception as e:
             logger.warning(f"⚠️  Error fetching GitHub trends: {str(e)}")
             return []
 
+    @staticmethod
+    def parse_github_trending(html: bytes) -> List[str]:
+        """
+        Extract topics from the GitHub trending page
+
+        Args:
+            html: Page HTML
+
+        Returns:
+            Up to 5 topics ("owner / repo: description")
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+
+        trending_repos = []
+        repos = soup.find_all('article', class_='Box-row')[:10]
+
+        for repo in repos:
+            try:
+                title_elem = repo.find('h2', class_='h3')
+                if title_elem:
+                    repo_name = title_elem.get_text().strip().replace('\n', ' ')
+                    desc_elem = repo.find('p', class_='col-9')
+                    desc = desc_elem.get_text().strip() if desc_elem else ""
+
+                    # Create topic from repo name and description
+                    topic = f"{repo_name}: {desc}" if desc else repo_name
+                    trending_repos.append(topic)
+            except Exception as e:
+                continue
+
+        return trending_repos[:5]
+
     def get_hackernews_trending(self) -> List[str]:
         """Get trending stories from Hacker News"""
         try:
@@ -170,7 +190,9 @@ class TrendingBlogger:
             model_name: Model to use for content generation
         """
         self.blog_id = blog_id
-        self.crew_manager = CrewManager(
+        # Shared with every other blogger run in this process, so scheduled
+        # batches reuse a warm manager and its LLM clients
+        self.crew_manager = worker_pool.get_manager(
             model_name=model_name,
             use_anthropic=use_anthropic,
             temperature=0.7
@@ -180,6 +202,79 @@ class TrendingBlogger:
         self.trending_finder = TrendingTopicsFinder()
         self.unsplash_api_key = os.getenv('UNSPLASH_ACCESS_KEY')
 
+        # Posts are published before their (async) review finishes; whichever
+        # of post ID and verdict arrives second decides whether to unpublish.
+        # The queue broadcasts every verdict, so only reviews of this
+        # blogger's own posts are kept, and each entry is popped once handled
+        self._expected_reviews: Set[str] = set()
+        self._review_posts: Dict[str, str] = {}
+        self._review_verdicts: Dict[str, Dict] = {}
+        self._review_lock = threading.Lock()
+        if self.crew_manager.review_mode == "async":
+            review_queue.add_listener(self._on_review_verdict)
+
+    def _expect_review(self, review_id: Optional[str]):
+        """Remember a review queued for a post this blogger is about to publish"""
+        if review_id:
+            with self._review_lock:
+                self._expected_reviews.add(review_id)
+
+    def _drop_review(self, review_id: Optional[str]):
+        """Forget a review whose post was not published"""
+        with self._review_lock:
+            self._expected_reviews.discard(review_id)
+            self._review_verdicts.pop(review_id, None)
+
+    def _on_review_verdict(self, verdict: Dict):
+        """Handle a background review verdict"""
+        review_id = verdict['review_id']
+        with self._review_lock:
+            if review_id not in self._expected_reviews:
+                return
+            post_id = self._review_posts.pop(review_id, None)
+            if post_id is None:
+                self._review_verdicts[review_id] = verdict
+                return
+            self._expected_reviews.discard(review_id)
+
+        self._apply_review(post_id, verdict)
+
+    def _link_review(self, review_id: str, post_id: str):
+        """Associate a queued review with the post it belongs to"""
+        with self._review_lock:
+            # Reviews queued by an earlier run never report back to this one
+            if review_id not in self._expected_reviews:
+                return
+            verdict = self._review_verdicts.pop(review_id, None)
+            if verdict is None:
+                self._review_posts[review_id] = post_id
+                return
+            self._expected_reviews.discard(review_id)
+
+        self._apply_review(post_id, verdict)
+
+    def _apply_review(self, post_id: str, verdict: Dict):
+        """
+        Unpublish a post whose review failed the quality bar
+
+        Args:
+            post_id: Published post ID
+            verdict: Verdict from the review queue
+        """
+        score = verdict.get('score')
+        rejected = verdict.get('verdict') == 'major_revision' or (
+            score is not None and score < config.review.unpublish_below
+        )
+
+        if not rejected:
+            logger.info(f"✅ Review passed for '{verdict['topic']}' (score: {score})")
+            return
+
+        logger.warning(f"↩️  Review rejected '{verdict['topic']}' (score: {score}), reverting to draft")
+        revert_result = self.blogger_publisher.revert_post(self.blog_id, post_id)
+        if not revert_result['success']:
+            logger.error(f"❌ Could not unpublish post {post_id}: {revert_result['message']}")
+
     def get_topic_image(self, topic: str) -> Optional[str]:
         """
         Fetch a relevant image from Unsplash based on topic
@@ -371,6 +466,7 @@ class TrendingBlogger:
                 return False
 
             logger.info("✅ Content generated successfully!")
+            self._expect_review(result.get('review_id'))
 
             # Extract title from content
             content = str(result['result'])
@@ -397,11 +493,14 @@ class TrendingBlogger:
             if publish_result['success']:
                 logger.info(f"✅ Published successfully!")
                 logger.info(f"🔗 URL: {publish_result['url']}")
+                if result.get('review_id'):
+                    self._link_review(result['review_id'], publish_result['post_id'])
                 logger.info(f"Published trending post #{post_number}: {title} - {publish_result['url']}")
                 return True
             else:
                 logger.error(f"❌ Publishing failed: {publish_result['message']}")
                 logger.error(f"Failed to publish trending post #{post_number}: {publish_result['message']}")
+                self._drop_review(result.get('review_id'))
                 return False
 
         except Exception as e:
@@ -409,55 +508,161 @@ class TrendingBlogger:
             logger.error(f"Error with trending post #{post_number}: {str(e)}")
             return False
 
+    def _research_job(self, job: Dict) -> str:
+        """Research stage of a publishing job"""
+        logger.info(f"🔬 Researching: {job['payload']['blog_topic']}")
+        return self.crew_manager.run_research_stage(job['payload']['blog_topic'], job['content_type'])
+
+    def _write_job(self, job: Dict) -> Dict:
+        """Writing (and review) stage of a publishing job, from its stored research"""
+        blog_topic = job['payload']['blog_topic']
+        logger.info(f"✍️  Writing: {blog_topic}")
+        result = self.crew_manager.execute_research_workflow(
+            topic=blog_topic,
+            content_type=job['content_type'],
+            research=job['research']
+        )
+        if result.get('status'):
+            raise interruption(result['status'], result['error'])
+        if not result['success']:
+            raise RuntimeError(f"Content generation failed: {result['message']}")
+
+        self._expect_review(result.get('review_id'))
+        content = str(result['result'])
+        lines = content.split('\n')
+        title = lines[0].replace('#', '').strip() if lines else blog_topic
+        return {"content": content, "title": title or blog_topic, "review_id": result.get('review_id')}
+
+    def _publish_job(self, job: Dict) -> Dict:
+        """Publishing stage of a publishing job"""
+        logger.info(f"🚀 Publishing: {job['title']}")
+        publish_result = self.blogger_publisher.publish_post(
+            blog_id=self.blog_id,
+            title=job['title'],
+            content=job['content'],
+            labels=job['payload']['tags'],
+            image_url=None,
+            is_draft=False
+        )
+        if publish_result['success']:
+            logger.info(f"🔗 URL: {publish_result['url']}")
+            if job.get('review_id'):
+                self._link_review(job['review_id'], publish_result['post_id'])
+        return publish_result
+
+    def run_publish_batch(
+        self,
+        batch: str,
+        topics: List[str],
+        delay_seconds: float = 30,
+        retry_failed: bool = False,
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, int]:
+        """
+        Publish a batch of topics through the durable job queue
+
+        Rerunning a batch with the same name resumes it: published posts
+        are skipped and unfinished ones continue from their last completed
+        stage, so no research or writing is generated twice.
+
+        Args:
+            batch: Batch name (e.g. 'trending-2026-01-31')
+            topics: Raw topics; ignored for topics already in the batch
+            delay_seconds: Pause between posts
+            retry_failed: Also resume failed posts (except ones whose
+                publish outcome is unknown)
+            deadline_seconds: Stop the batch after this long (default:
+                BATCH_TIMEOUT_SECONDS); the running post stops at its next LLM
+                call and unfinished posts are resumed by the next run
+
+        Returns:
+            Dict with the number of jobs in each state
+        """
+        queue = get_job_queue()
+        queue.enqueue(
+            batch,
+            topics,
+            content_type="blog post",
+            payloads=[
+                {"blog_topic": self.refine_topic_for_blog(topic), "tags": self.generate_seo_tags(topic)}
+                for topic in topics
+            ]
+        )
+        if retry_failed:
+            queue.retry_failed(batch)
+
+        jobs = queue.unfinished(batch)
+        total = len(queue.jobs(batch))
+        logger.info(f"📋 Batch '{batch}': {len(jobs)} of {total} posts left to publish")
+
+        timeout = deadline_seconds if deadline_seconds is not None else config.deadlines.batch_timeout
+        deadline = CancelToken(timeout or None, label="batch")
+        for i, job in enumerate(jobs, 1):
+            if deadline.cancelled:
+                logger.warning(f"⏱️  Batch deadline reached; {len(jobs) - i + 1} posts left for the next run")
+                break
+            if i > 1 and delay_seconds:
+                logger.info(f"\n⏳ Waiting {delay_seconds:.0f} seconds before next post...")
+                time.sleep(delay_seconds)
+
+            logger.info(f"\n{'='*80}")
+            logger.info(f"[{i}/{len(jobs)}] {job['topic'][:80]} (resuming from '{job['state']}')")
+            logger.info(f"🏷️  Tags: {', '.join(job['payload']['tags'])}")
+            with cancel_scope(deadline):
+                job = queue.run(job, self._research_job, self._write_job, self._publish_job)
+
+            if job['state'] == PUBLISHED:
+                logger.info(f"Published trending post: {job['title']} - {job['url']}")
+            elif job['state'] == FAILED:
+                logger.error(f"Failed trending post '{job['topic']}': {job['error']}")
+                self._drop_review(job.get('review_id'))
+
+        return queue.summary(batch)
+
     def run_daily_batch(self, num_posts: int = 5):
         """
         Find trending topics and publish blog posts
 
+        Today's batch is kept in the job queue, so running this again
+        after a crash resumes it instead of starting over.
+
         Args:
             num_posts: Number of posts to publish (default: 5)
         """
         start_time = datetime.now()
+        batch = f"trending-{start_time.strftime('%Y-%m-%d')}"
         logger.info("="*80)
         logger.info(f"🔥 TRENDING TOPICS BLOG PUBLISHER - Daily Batch Started")
         logger.info(f"⏰ Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info("="*80)
 
-        # Find trending topics
-        trending_topics = self.trending_finder.get_all_trending_topics()
-
-        if not trending_topics:
-            logger.warning("⚠️  No trending topics found. Using fallback topics.")
-            trending_topics = [
-                "Latest AI Development Tools and Frameworks",
-                "Modern Web Development Best Practices",
-                "Python Data Analysis Techniques",
-                "Cloud Computing Trends 2026",
-                "DevOps Automation Strategies"
-            ]
-
-        # Select topics for today
-        selected_topics = random.sample(trending_topics, min(num_posts, len(trending_topics)))
-
-        logger.info(f"\n📋 Selected {len(selected_topics)} topics for today:")
-        for i, topic in enumerate(selected_topics, 1):
-            logger.info(f"  {i}. {topic[:80]}...")
-
-        success_count = 0
-        failed_count = 0
-
-        # Generate and publish each post
-        for i, topic in enumerate(selected_topics, 1):
-            # Add delay between posts (30 seconds for faster batch publishing)
-            if i > 1:
-                logger.info(f"\n⏳ Waiting 30 seconds before next post...")
-                time.sleep(30)
-
-            success = self.generate_and_publish_post(topic, i)
-
-            if success:
-                success_count += 1
-            else:
-                failed_count += 1
+        selected_topics = []
+        if get_job_queue().jobs(batch):
+            logger.info(f"♻️  Resuming today's batch '{batch}'")
+        else:
+            # Find trending topics
+            trending_topics = self.trending_finder.get_all_trending_topics()
+
+            if not trending_topics:
+                logger.warning("⚠️  No trending topics found. Using fallback topics.")
+                trending_topics = [
+                    "Latest AI Development Tools and Frameworks",
+                    "Modern Web Development Best Practices",
+                    "Python Data Analysis Techniques",
+                    "Cloud Computing Trends 2026",
+                    "DevOps Automation Strategies"
+                ]
+
+            # Select topics for today
+            selected_topics = random.sample(trending_topics, min(num_posts, len(trending_topics)))
+
+            logger.info(f"\n📋 Selected {len(selected_topics)} topics for today:")
+            for i, topic in enumerate(selected_topics, 1):
+                logger.info(f"  {i}. {topic[:80]}...")
+
+        # Generate and publish each post (30 seconds apart for faster batch publishing)
+        summary = self.run_publish_batch(batch, selected_topics, delay_seconds=30)
+        total = sum(summary.values())
 
         # Summary
         end_time = datetime.now()
@@ -466,13 +671,18 @@ class TrendingBlogger:
         logger.info("\n" + "="*80)
         logger.info(f"📊 DAILY BATCH SUMMARY")
         logger.info("="*80)
-        logger.info(f"✅ Successfully published: {success_count}/{num_posts}")
-        logger.info(f"❌ Failed: {failed_count}/{num_posts}")
+        logger.info(f"✅ Successfully published: {summary[PUBLISHED]}/{total}")
+        logger.info(f"❌ Failed: {summary[FAILED]}/{total}")
+        unfinished = total - summary[PUBLISHED] - summary[FAILED]
+        if unfinished:
+            logger.info(f"⏸️  Left for the next run: {unfinished}/{total}")
         logger.info(f"⏱️  Total time: {duration:.1f} minutes")
         logger.info(f"🕐 Completed at: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        if review_queue.pending:
+            logger.info(f"🔍 Reviews still running in background: {review_queue.pending}")
         logger.info("="*80 + "\n")
 
-        logger.info(f"Trending batch completed: {success_count} successful, {failed_count} failed, {duration:.1f} minutes")
+        logger.info(f"Trending batch completed: {summary[PUBLISHED]} successful, {summary[FAILED]} failed, {duration:.1f} minutes")
 
     def schedule_daily_posts(self, time_str: str = "09:00", num_posts: int = 5):
         """
@@ -496,6 +706,8 @@ class TrendingBlogger:
                 time.sleep(60)
         except KeyboardInterrupt:
             print("\n\n👋 Scheduler stopped by user")
+        finally:
+            worker_pool.shutdown()
 
 
 def main():
@@ -16,6 +16,7 @@ sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='repla
 
 from src.blogger_publisher import BloggerPublisher
 from trending_blogger import TrendingBlogger
+from src.worker_pool import worker_pool
 
 # Set up logging
 logging.basicConfig(
@@ -133,6 +134,8 @@ def main():
         logging.error(f"Service crashed: {str(e)}")
         logging.exception("Full traceback:")
     finally:
+        if not worker_pool.shutdown(timeout=300):
+            logging.warning("Stopped with workflows still running")
         logging.info("="*80)
         logging.info("BACKGROUND SERVICE STOPPED")
         logging.info(f"Stopped at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")